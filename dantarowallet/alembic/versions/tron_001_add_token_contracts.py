@@ -0,0 +1,42 @@
+"""Add token contract metadata table
+
+Revision ID: tron_001
+Revises: doc29_001
+Create Date: 2026-10-17 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'tron_001'
+down_revision: Union[str, None] = 'doc29_001'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add token_contracts table"""
+    op.create_table('token_contracts',
+        sa.Column('id', sa.Integer(), primary_key=True),
+        sa.Column('network', sa.String(length=20), nullable=False),
+        sa.Column('address', sa.String(length=42), nullable=False),
+        sa.Column('symbol', sa.String(length=20), nullable=False),
+        sa.Column('name', sa.String(length=100), nullable=True),
+        sa.Column('decimals', sa.Integer(), nullable=False),
+        sa.Column('abi', sa.JSON(), nullable=True),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('(CURRENT_TIMESTAMP)'), nullable=False),
+        sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('(CURRENT_TIMESTAMP)'), nullable=False),
+        sa.UniqueConstraint('network', 'address', name='uq_token_contract_address')
+    )
+
+    op.create_index('ix_token_contracts_id', 'token_contracts', ['id'])
+    op.create_index('ix_token_contracts_network', 'token_contracts', ['network'])
+    op.create_index('ix_token_contracts_address', 'token_contracts', ['address'])
+
+
+def downgrade() -> None:
+    """Remove token_contracts table"""
+    op.drop_table('token_contracts')
@@ -0,0 +1,39 @@
+"""Add deposit scan cursor table
+
+Revision ID: tron_002
+Revises: tron_001
+Create Date: 2026-10-17 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'tron_002'
+down_revision: Union[str, None] = 'tron_001'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add deposit_scan_cursors table"""
+    op.create_table('deposit_scan_cursors',
+        sa.Column('id', sa.Integer(), primary_key=True),
+        sa.Column('network', sa.String(length=20), nullable=False),
+        sa.Column('token', sa.String(length=20), nullable=False),
+        sa.Column('last_block', sa.BigInteger(), nullable=False),
+        sa.Column('last_block_hash', sa.String(length=64), nullable=True),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('(CURRENT_TIMESTAMP)'), nullable=False),
+        sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('(CURRENT_TIMESTAMP)'), nullable=False),
+        sa.UniqueConstraint('network', 'token', name='uq_deposit_scan_cursor')
+    )
+
+    op.create_index('ix_deposit_scan_cursors_id', 'deposit_scan_cursors', ['id'])
+    op.create_index('ix_deposit_scan_cursors_network', 'deposit_scan_cursors', ['network'])
+
+
+def downgrade() -> None:
+    """Remove deposit_scan_cursors table"""
+    op.drop_table('deposit_scan_cursors')
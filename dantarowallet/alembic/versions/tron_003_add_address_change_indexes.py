@@ -0,0 +1,30 @@
+"""Add change-feed indexes for monitored address index
+
+Revision ID: tron_003
+Revises: tron_002
+Create Date: 2026-10-17 14:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = 'tron_003'
+down_revision: Union[str, None] = 'tron_002'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Index updated_at/created_at columns used for incremental address refresh"""
+    op.create_index('idx_wallet_updated_at', 'wallets', ['updated_at'])
+    op.create_index('ix_user_deposit_addresses_created_at', 'user_deposit_addresses', ['created_at'])
+    op.create_index('ix_user_deposit_addresses_updated_at', 'user_deposit_addresses', ['updated_at'])
+
+
+def downgrade() -> None:
+    """Drop change-feed indexes"""
+    op.drop_index('ix_user_deposit_addresses_updated_at', table_name='user_deposit_addresses')
+    op.drop_index('ix_user_deposit_addresses_created_at', table_name='user_deposit_addresses')
+    op.drop_index('idx_wallet_updated_at', table_name='wallets')
@@ -0,0 +1,40 @@
+"""Add service leases table
+
+Revision ID: tron_004
+Revises: tron_003
+Create Date: 2026-10-17 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'tron_004'
+down_revision: Union[str, None] = 'tron_003'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add service_leases table"""
+    op.create_table('service_leases',
+        sa.Column('id', sa.Integer(), primary_key=True),
+        sa.Column('name', sa.String(length=64), nullable=False),
+        sa.Column('holder', sa.String(length=128), nullable=False),
+        sa.Column('fencing_token', sa.Integer(), nullable=False),
+        sa.Column('acquired_at', sa.DateTime(timezone=True), nullable=False),
+        sa.Column('renewed_at', sa.DateTime(timezone=True), nullable=False),
+        sa.Column('expires_at', sa.DateTime(timezone=True), nullable=False),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('(CURRENT_TIMESTAMP)'), nullable=False),
+        sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('(CURRENT_TIMESTAMP)'), nullable=False),
+    )
+
+    op.create_index('ix_service_leases_id', 'service_leases', ['id'])
+    op.create_index('ix_service_leases_name', 'service_leases', ['name'], unique=True)
+
+
+def downgrade() -> None:
+    """Remove service_leases table"""
+    op.drop_table('service_leases')
@@ -0,0 +1,34 @@
+"""Add shard key to deposit scan cursors
+
+Revision ID: tron_005
+Revises: tron_004
+Create Date: 2026-10-17 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'tron_005'
+down_revision: Union[str, None] = 'tron_004'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add shard column and make it part of the cursor key"""
+    with op.batch_alter_table('deposit_scan_cursors') as batch_op:
+        batch_op.add_column(sa.Column('shard', sa.String(length=16), server_default='', nullable=False))
+        batch_op.drop_constraint('uq_deposit_scan_cursor', type_='unique')
+        batch_op.create_unique_constraint('uq_deposit_scan_cursor', ['network', 'token', 'shard'])
+
+
+def downgrade() -> None:
+    """Remove shard cursors and the shard column"""
+    op.execute("DELETE FROM deposit_scan_cursors WHERE shard != ''")
+    with op.batch_alter_table('deposit_scan_cursors') as batch_op:
+        batch_op.drop_constraint('uq_deposit_scan_cursor', type_='unique')
+        batch_op.create_unique_constraint('uq_deposit_scan_cursor', ['network', 'token'])
+        batch_op.drop_column('shard')
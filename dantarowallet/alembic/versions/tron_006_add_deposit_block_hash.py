@@ -0,0 +1,28 @@
+"""Add block hash to deposits for reorg detection
+
+Revision ID: tron_006
+Revises: tron_005
+Create Date: 2026-10-17 15:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'tron_006'
+down_revision: Union[str, None] = 'tron_005'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add block_hash column to deposits"""
+    op.add_column('deposits', sa.Column('block_hash', sa.String(length=64), nullable=True))
+
+
+def downgrade() -> None:
+    """Remove block_hash column from deposits"""
+    with op.batch_alter_table('deposits') as batch_op:
+        batch_op.drop_column('block_hash')
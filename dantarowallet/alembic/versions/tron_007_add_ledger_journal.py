@@ -0,0 +1,81 @@
+"""Add double-entry ledger journal and daily balance snapshots
+
+Revision ID: tron_007
+Revises: tron_006
+Create Date: 2026-10-17 16:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'tron_007'
+down_revision: Union[str, None] = 'tron_006'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add ledger_entries and balance_snapshots tables, backfill from transactions"""
+    op.create_table('ledger_entries',
+        sa.Column('id', sa.Integer(), primary_key=True),
+        sa.Column('journal_id', sa.String(length=64), nullable=False),
+        sa.Column('entry_type', sa.String(length=20), nullable=False),
+        sa.Column('account', sa.String(length=32), nullable=False),
+        sa.Column('user_id', sa.Integer(), sa.ForeignKey('users.id'), nullable=True),
+        sa.Column('asset', sa.String(length=10), nullable=False),
+        sa.Column('amount', sa.Numeric(precision=28, scale=8), nullable=False),
+        sa.Column('reference', sa.String(length=100), nullable=True),
+        sa.Column('posted_at', sa.DateTime(timezone=True), nullable=False),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('(CURRENT_TIMESTAMP)'), nullable=False),
+        sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('(CURRENT_TIMESTAMP)'), nullable=False),
+    )
+
+    op.create_index('ix_ledger_entries_id', 'ledger_entries', ['id'])
+    op.create_index('ix_ledger_entries_journal_id', 'ledger_entries', ['journal_id'])
+    op.create_index('idx_ledger_user_asset_posted', 'ledger_entries', ['user_id', 'asset', 'posted_at'])
+    op.create_index('idx_ledger_posted', 'ledger_entries', ['posted_at'])
+
+    op.create_table('balance_snapshots',
+        sa.Column('id', sa.Integer(), primary_key=True),
+        sa.Column('user_id', sa.Integer(), sa.ForeignKey('users.id'), nullable=False),
+        sa.Column('asset', sa.String(length=10), nullable=False),
+        sa.Column('snapshot_date', sa.Date(), nullable=False),
+        sa.Column('balance', sa.Numeric(precision=28, scale=8), nullable=False),
+        sa.Column('total_in', sa.Numeric(precision=28, scale=8), nullable=False),
+        sa.Column('total_out', sa.Numeric(precision=28, scale=8), nullable=False),
+        sa.Column('last_entry_id', sa.Integer(), nullable=False),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('(CURRENT_TIMESTAMP)'), nullable=False),
+        sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('(CURRENT_TIMESTAMP)'), nullable=False),
+        sa.UniqueConstraint('user_id', 'asset', 'snapshot_date', name='uq_balance_snapshot'),
+    )
+
+    op.create_index('ix_balance_snapshots_id', 'balance_snapshots', ['id'])
+    op.create_index('ix_balance_snapshots_snapshot_date', 'balance_snapshots', ['snapshot_date'])
+
+    # 기존 완료 거래를 분개로 이관 (사용자 항목 + 같은 금액의 이관 상대 항목)
+    # 스냅샷은 배포 후 백그라운드 작업이 처음부터 생성
+    op.execute("""
+        INSERT INTO ledger_entries
+            (journal_id, entry_type, account, user_id, asset, amount, reference, posted_at)
+        SELECT 'tx-' || id, lower(CAST(type AS VARCHAR(20))), 'user', user_id, asset,
+               CASE WHEN direction = 'OUT' THEN -(amount + COALESCE(fee, 0)) ELSE amount END,
+               'TX-' || id, created_at
+        FROM transactions
+        WHERE status = 'COMPLETED' AND direction IN ('IN', 'OUT')
+    """)
+    op.execute("""
+        INSERT INTO ledger_entries
+            (journal_id, entry_type, account, user_id, asset, amount, reference, posted_at)
+        SELECT journal_id, entry_type, 'backfill', NULL, asset, -amount, reference, posted_at
+        FROM ledger_entries
+        WHERE account = 'user'
+    """)
+
+
+def downgrade() -> None:
+    """Remove ledger_entries and balance_snapshots tables"""
+    op.drop_table('balance_snapshots')
+    op.drop_table('ledger_entries')
@@ -0,0 +1,51 @@
+"""Add per-user transaction flow counters
+
+Revision ID: tron_008
+Revises: tron_007
+Create Date: 2026-10-17 17:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'tron_008'
+down_revision: Union[str, None] = 'tron_007'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add transaction_flow_counters table and backfill from completed transactions"""
+    op.create_table('transaction_flow_counters',
+        sa.Column('id', sa.Integer(), primary_key=True),
+        sa.Column('user_id', sa.Integer(), sa.ForeignKey('users.id'), nullable=False),
+        sa.Column('asset', sa.String(length=10), nullable=False),
+        sa.Column('direction', sa.String(length=10), nullable=False),
+        sa.Column('tx_count', sa.Integer(), nullable=False),
+        sa.Column('amount_total', sa.Numeric(precision=28, scale=8), nullable=False),
+        sa.Column('fee_total', sa.Numeric(precision=28, scale=8), nullable=False),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('(CURRENT_TIMESTAMP)'), nullable=False),
+        sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('(CURRENT_TIMESTAMP)'), nullable=False),
+        sa.UniqueConstraint('user_id', 'asset', 'direction', name='uq_transaction_flow_counter'),
+    )
+
+    op.create_index('ix_transaction_flow_counters_id', 'transaction_flow_counters', ['id'])
+
+    # 기존 완료 거래 집계 (이후 불일치는 백그라운드 대사 작업이 교정)
+    op.execute("""
+        INSERT INTO transaction_flow_counters
+            (user_id, asset, direction, tx_count, amount_total, fee_total)
+        SELECT user_id, asset, lower(CAST(direction AS VARCHAR(10))), COUNT(id),
+               SUM(amount), SUM(COALESCE(fee, 0))
+        FROM transactions
+        WHERE status = 'COMPLETED' AND direction IN ('IN', 'OUT')
+        GROUP BY user_id, asset, direction
+    """)
+
+
+def downgrade() -> None:
+    """Remove transaction_flow_counters table"""
+    op.drop_table('transaction_flow_counters')
@@ -0,0 +1,36 @@
+"""Identify deposits by transaction hash and event log index
+
+Revision ID: tron_009
+Revises: tron_008
+Create Date: 2026-10-17 18:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'tron_009'
+down_revision: Union[str, None] = 'tron_008'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add log_index to deposits and make (tx_hash, log_index) unique"""
+    # 기존 입금은 트랜잭션당 한 건이므로 0으로 채움 (TRX 전송은 항상 0)
+    op.add_column('deposits', sa.Column('log_index', sa.Integer(), server_default='0', nullable=False))
+    op.drop_index('ix_deposits_tx_hash', table_name='deposits')
+    op.create_index('ix_deposits_tx_hash', 'deposits', ['tx_hash'], unique=False)
+    with op.batch_alter_table('deposits') as batch_op:
+        batch_op.create_unique_constraint('uq_deposit_tx_log', ['tx_hash', 'log_index'])
+
+
+def downgrade() -> None:
+    """Restore unique tx_hash and remove log_index from deposits"""
+    with op.batch_alter_table('deposits') as batch_op:
+        batch_op.drop_constraint('uq_deposit_tx_log', type_='unique')
+        batch_op.drop_index('ix_deposits_tx_hash')
+        batch_op.create_index('ix_deposits_tx_hash', ['tx_hash'], unique=True)
+        batch_op.drop_column('log_index')
@@ -0,0 +1,28 @@
+"""Add leader fencing token to deposit scan cursors
+
+Revision ID: tron_010
+Revises: tron_009
+Create Date: 2026-10-17 19:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'tron_010'
+down_revision: Union[str, None] = 'tron_009'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add fencing_token column to deposit_scan_cursors"""
+    op.add_column('deposit_scan_cursors', sa.Column('fencing_token', sa.Integer(), server_default='0', nullable=False))
+
+
+def downgrade() -> None:
+    """Remove fencing_token column from deposit_scan_cursors"""
+    with op.batch_alter_table('deposit_scan_cursors') as batch_op:
+        batch_op.drop_column('fencing_token')
@@ -6,10 +6,12 @@ from datetime import datetime, timedelta
 from typing import List, Optional
 
 from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from app.core.auth import get_current_super_admin
 from app.core.database import get_db
+from app.core.leader_election import get_leases
 from app.schemas.monitoring import (
     Alert,
     PartnerRanking,
@@ -17,6 +19,9 @@ from app.schemas.monitoring import (
     SystemHealth,
     SystemMetrics,
 )
+from app.services.balance.flow_service import flow_reconciler_leader
+from app.services.balance.snapshot_service import balance_snapshot_leader
+from app.services.deposit_monitoring_service import deposit_monitor_leader
 from app.services.monitoring.system_monitor_service import SystemMonitorService
 
 router = APIRouter(prefix="/admin/monitoring", tags=["Super Admin Monitoring"])
@@ -97,6 +102,29 @@ async def get_system_health(
         )
 
 
+@router.get("/leader")
+async def get_background_leaders(
+    db: AsyncSession = Depends(get_db), current_admin=Depends(get_current_super_admin)
+):
+    """백그라운드 작업 리더 리스 및 이 워커의 작업별 선출 상태 조회"""
+    try:
+        return {
+            "leases": await get_leases(db),
+            "this_worker": {
+                leader.name: leader.status()
+                for leader in (
+                    deposit_monitor_leader,
+                    balance_snapshot_leader,
+                    flow_reconciler_leader,
+                )
+            },
+        }
+    except Exception as e:
+        raise HTTPException(
+            status_code=500, detail=f"Failed to get leader status: {str(e)}"
+        )
+
+
 @router.get("/alerts", response_model=List[Alert])
 async def get_system_alerts(
     severity: Optional[str] = Query(None, description="알림 심각도"),
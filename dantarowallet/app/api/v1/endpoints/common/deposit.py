@@ -10,10 +10,15 @@ from fastapi import APIRouter, BackgroundTasks, Depends, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api import deps
+from app.core.config import settings
 from app.core.database import get_db
 from app.models.user import User
 from app.schemas.auth import UserResponse
-from app.services.deposit_monitoring_service import deposit_monitor
+from app.services.deposit_monitoring_service import (
+    deposit_monitor,
+    deposit_monitor_leader,
+    start_deposit_monitor_election,
+)
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
@@ -46,6 +51,22 @@ async def start_monitoring(
     Returns:
         Dict: 모니터링 시작 결과
     """
+    if settings.LEADER_ELECTION_ENABLED:
+        # 이 워커를 리더 선출에 참여시킴 (리더 워커 하나만 모니터링 실행)
+        if deposit_monitor_leader.is_running:
+            return {
+                "message": "입금 모니터링 리더 선출이 이미 실행 중입니다",
+                "status": "already_running",
+                "leader": deposit_monitor_leader.status(),
+            }
+        start_deposit_monitor_election()
+        logger.info(f"관리자 {current_user.email}가 입금 모니터링 리더 선출을 시작했습니다")
+        return {
+            "message": "입금 모니터링 리더 선출이 시작되었습니다",
+            "status": "started",
+            "leader": deposit_monitor_leader.status(),
+        }
+
     if not deposit_monitor.is_monitoring:
         background_tasks.add_task(deposit_monitor.start_monitoring)
         logger.info(f"관리자 {current_user.email}가 입금 모니터링을 시작했습니다")
@@ -65,8 +86,18 @@ async def stop_monitoring(current_user: User = Depends(deps.get_current_admin_us
     Returns:
         Dict: 모니터링 중지 결과
     """
+    if deposit_monitor_leader.is_running:
+        # 이 워커만 선출에서 빠지며, 리더였다면 다른 워커가 리스를 인수
+        await deposit_monitor_leader.stop()
+        logger.info(f"관리자 {current_user.email}가 입금 모니터링 리더 선출을 중지했습니다")
+        return {
+            "message": "이 워커의 입금 모니터링 리더 선출이 중지되었습니다",
+            "status": "stopped",
+            "leader": deposit_monitor_leader.status(),
+        }
+
     if deposit_monitor.is_monitoring:
-        deposit_monitor.stop_monitoring()
+        await deposit_monitor.stop_monitoring()
         logger.info(f"관리자 {current_user.email}가 입금 모니터링을 중지했습니다")
         return {"message": "입금 모니터링이 중지되었습니다", "status": "stopped"}
     else:
@@ -90,4 +121,14 @@ async def get_monitoring_info(
         "is_monitoring": deposit_monitor.is_monitoring,
         "monitoring_interval": deposit_monitor.monitoring_interval,
         "last_checked_block": deposit_monitor.last_checked_block,
+        "is_backfilling": deposit_monitor.is_backfilling,
+        "shard": f"{deposit_monitor.shard_index}/{deposit_monitor.shard_count}",
+        "address_index": deposit_monitor.address_index.stats(),
+        "recent_hashes": deposit_monitor.recent_hashes.stats(),
+        "pipeline": deposit_monitor.pipeline.stats(),
+        "confirmations": deposit_monitor.confirmation_tracker.stats(),
+        "transfer_archive": deposit_monitor.tron.get_transfer_archive_stats(
+            deposit_monitor.shard_key
+        ),
+        "leader": deposit_monitor_leader.status(),
     }
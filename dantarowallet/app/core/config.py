@@ -76,10 +76,65 @@ class Settings(BaseSettings):
     TRON_SCAN_URL: str = "https://nile.tronscan.org"
     TRON_DEFAULT_FEE_LIMIT: int = 100000000  # 100 TRX default
 
+    # TRON HTTP Client Configuration
+    TRON_HTTP_TIMEOUT: float = 10.0  # seconds, 호출별 기본 타임아웃
+    TRON_HTTP_MAX_CONNECTIONS: int = 100  # 동시 연결 상한
+    TRON_HTTP_MAX_KEEPALIVE: int = 20  # 유지할 keep-alive 연결 수
+    TRON_NODE_RATE_LIMIT: float = 0  # 노드별 초당 요청 수 상한 (0이면 제한 없음)
+    TRON_BULK_BALANCE_CONCURRENCY: int = 50  # 대량 잔고 조회 동시 요청 수
+    TRON_BLOCK_CACHE_SIZE: int = 2000  # 블록 캐시 최대 항목 수
+    TRON_BLOCK_CACHE_HEAD_TTL: float = 3.0  # 미확정(헤드 근처) 블록 캐시 TTL (초)
+    TRON_HEARTBEAT_INTERVAL: float = 15.0  # 노드 헬스 체크 주기 (초)
+    TRON_FAILURE_THRESHOLD: int = 3  # 연속 실패 시 비정상 판정 기준
+    TRON_FULL_NODE_URLS: str = ""  # 추가 풀노드 URL (콤마 구분)
+    TRON_SOLIDITY_NODE_URLS: str = ""  # 추가 솔리디티 노드 URL (콤마 구분)
+    TRON_HEDGE_DELAY: float = 0.5  # 헤지 요청 최소 대기 시간 (초, 0이면 비활성)
+    TRON_ADDRESS_CACHE_SIZE: int = 100000  # 주소 변환 메모이제이션 항목 수
+    TRON_SINGLE_FLIGHT_TTL: float = 3.0  # 최신 블록/체인 파라미터 캐시 TTL (블록 주기)
+    TRON_RANGE_FETCH_CONCURRENCY: int = 32  # 블록 범위 병렬 조회 최대 창 크기
+    TRON_RANGE_FETCH_TARGET_LATENCY: float = 1.0  # 창 크기를 늘리는 기준 응답 시간 (초)
+    TRON_ADDRESS_SCAN_MAX_BLOCKS: int = 1200  # 단일 주소 트랜잭션 조회 최대 블록 수
+    TRON_TRANSFER_ARCHIVE_DIR: str = ""  # 디코딩된 전송 아카이브 경로 (비어 있으면 비활성)
+    TRON_TRANSFER_ARCHIVE_SCOPE: str = "monitored"  # monitored | all
+    TRON_ARCHIVE_SEGMENT_BLOCKS: int = 100000  # 아카이브 세그먼트당 블록 수
+    TRON_REF_BLOCK_REFRESH_INTERVAL: float = 6.0  # 로컬 트랜잭션 참조 블록 갱신 주기 (초)
+    TRON_TX_EXPIRATION: float = 60.0  # 로컬 생성 트랜잭션 만료 시간 (초)
+    TRON_SIGNER_WORKERS: int = 0  # 배치 서명 워커 프로세스 수 (0이면 CPU 코어 수)
+    TRON_SIGNER_CHUNK_SIZE: int = 256  # 워커에 한 번에 보내는 서명 건수
+    TRON_SIGNER_KEY_CACHE_SIZE: int = 10000  # 워커별 복호화 키 캐시 항목 수
+
     # TRON Monitoring Configuration
+    TRC20_INGESTION_MODE: str = "event_log"  # event_log | calldata
     BLOCKS_TO_CHECK_ON_START: int = 10
     BLOCK_CONFIRMATION_COUNT: int = 19
     DEPOSIT_CHECK_INTERVAL: int = 30  # seconds
+    DEPOSIT_BACKFILL_THRESHOLD: int = 100  # 커서 지연이 이 블록 수를 넘으면 백필 모드
+    DEPOSIT_BACKFILL_BATCH_BLOCKS: int = 200  # 백필 모드 커밋 단위 (블록)
+    DEPOSIT_RECENT_HASH_CACHE_SIZE: int = 100000  # 중복 확인용 최근 입금 해시 수
+    DEPOSIT_BATCH_MIN_SIZE: int = 20  # 구간 내 새 입금이 이 수 이상이면 일괄 처리
+    DEPOSIT_PIPELINE_ENABLED: bool = True  # 조회/디코딩/매칭/기록 단계 파이프라인 사용
+    DEPOSIT_PIPELINE_QUEUE_SIZE: int = 64  # 단계 사이 큐 크기 (가득 차면 앞 단계 대기)
+    DEPOSIT_PIPELINE_COMMIT_BLOCKS: int = 50  # 기록 단계 커밋 단위 (블록)
+    DEPOSIT_REORG_DEPTH: int = 20  # 재편성 감지 시 대기 입금 재확인/커서 되감기 범위 (블록)
+    DEPOSIT_ADDRESS_INDEX_FULL_REFRESH: int = 3600  # 감시 주소 인덱스 전체 재적재 주기 (초)
+    DEPOSIT_ADDRESS_INDEX_OVERLAP: float = 5.0  # 증분 조회 시 변경 시각 겹침 구간 (초)
+    DEPOSIT_MONITOR_SHARD_COUNT: int = 1  # 감시 주소 해시 파티션 수 (프로세스/호스트별 분산)
+    DEPOSIT_MONITOR_SHARD_INDEX: int = 0  # 이 프로세스가 담당하는 샤드 번호 (0부터)
+
+    # Balance Journal Snapshots
+    BALANCE_SNAPSHOT_ENABLED: bool = True  # 원장 분개 일 마감 잔고 스냅샷 생성
+    BALANCE_SNAPSHOT_INTERVAL: int = 3600  # 스냅샷 생성 확인 주기 (초)
+    BALANCE_SNAPSHOT_LAG: int = 300  # 자정 후 하루를 마감으로 보기까지 대기 (초)
+
+    # Transaction Flow Counters
+    FLOW_RECONCILE_ENABLED: bool = True  # 거래 흐름 카운터와 거래 내역 주기 대사
+    FLOW_RECONCILE_INTERVAL: int = 3600  # 대사 주기 (초)
+    FLOW_RECONCILE_BATCH_SIZE: int = 500  # 대사 배치당 사용자 수
+
+    # Background Job Leader Election
+    LEADER_ELECTION_ENABLED: bool = True  # 워커 중 리스를 보유한 하나만 백그라운드 작업 실행
+    LEADER_LEASE_TTL: float = 10.0  # 리더 리스 유효 시간 (초, 장애 시 인수까지 걸리는 최대 시간)
+    LEADER_RENEW_INTERVAL: float = 3.0  # 리스 갱신/인수 시도 주기 (초, TTL의 1/3 이하 권장)
 
     # TRON Token Contract Addresses
     @property
@@ -0,0 +1,349 @@
+"""
+백그라운드 작업 리더 선출.
+여러 워커 프로세스가 DB 리스 행을 두고 경쟁하여, 리스를 보유한 하나의 워커만
+작업을 실행합니다. 리더가 죽으면 리스 만료 후 다른 워커가 자동으로 인수합니다.
+"""
+
+import asyncio
+import logging
+import os
+import socket
+import time
+import uuid
+from datetime import datetime, timezone
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from sqlalchemy import DateTime, literal_column, select, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.functions import FunctionElement
+
+from app.core.config import settings
+from app.models.service_lease import ServiceLease
+
+logger = logging.getLogger(__name__)
+
+
+def _utcnow() -> datetime:
+    """워커 로컬 시각 (UTC, 상태 표시용)"""
+    return datetime.now(timezone.utc)
+
+
+class _db_now(FunctionElement):
+    """
+    DB 서버 기준 현재 시각 + seconds초
+
+    리스 시각은 워커마다 다른 로컬 시계 대신 DB 시계 하나로 기록/비교합니다.
+    """
+
+    type = DateTime(timezone=True)
+    inherit_cache = True
+
+    def __init__(self, seconds: float = 0.0):
+        super().__init__(literal_column(repr(float(seconds))))
+
+
+@compiles(_db_now)
+def _compile__db_now(element, compiler, **kw):
+    return f"(now() + {compiler.process(element.clauses, **kw)} * INTERVAL '1 second')"
+
+
+@compiles(_db_now, "sqlite")
+def _compile__db_now_sqlite(element, compiler, **kw):
+    # CURRENT_TIMESTAMP는 초 단위이므로 밀리초까지 기록
+    seconds = compiler.process(element.clauses, **kw)
+    return f"strftime('%Y-%m-%d %H:%M:%f', 'now', {seconds} || ' seconds')"
+
+
+class LeaderElection:
+    """
+    리스 기반 리더 선출
+
+    renew_interval마다 리스를 갱신하거나 만료된 리스를 인수합니다.
+    갱신에 실패하면 DB의 리스가 만료되기 전에 스스로 작업을 중지하므로
+    인수한 워커와 작업이 겹치지 않습니다.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        holder_id: Optional[str] = None,
+        ttl: Optional[float] = None,
+        renew_interval: Optional[float] = None,
+        session_factory: Optional[Callable[[], AsyncSession]] = None,
+    ):
+        self.name = name
+        self.holder_id = holder_id or (
+            f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        )
+        self.ttl = ttl or settings.LEADER_LEASE_TTL
+        self.renew_interval = renew_interval or settings.LEADER_RENEW_INTERVAL
+        self._session_factory = session_factory
+        self.is_leader = False
+        self.fencing_token: Optional[int] = None
+        self.leader_since: Optional[datetime] = None
+        self.elections = 0
+        self.renew_failures = 0
+        self.last_error: Optional[str] = None
+        self._lease_deadline = 0.0  # 리스 만료 시각 (monotonic)
+        self._on_elected: Optional[Callable[[], Awaitable[Any]]] = None
+        self._on_revoked: Optional[Callable[[], Awaitable[Any]]] = None
+        self._loop_task: Optional[asyncio.Task] = None
+        self._work_task: Optional[asyncio.Task] = None
+
+    @property
+    def session_factory(self) -> Callable[[], AsyncSession]:
+        """세션 팩토리 (미지정 시 기본 세션)"""
+        if self._session_factory is None:
+            from app.core.database import AsyncSessionLocal
+
+            return AsyncSessionLocal
+        return self._session_factory
+
+    @property
+    def is_running(self) -> bool:
+        """선출 루프 실행 여부"""
+        return self._loop_task is not None and not self._loop_task.done()
+
+    # =============================================================================
+    # 리스
+    # =============================================================================
+
+    async def try_acquire(self) -> bool:
+        """
+        리스 갱신 또는 인수 (한 번)
+
+        보유 중인 리스는 만료 시각만 연장하고, 만료된 리스는 조건부 UPDATE로
+        하나의 워커만 인수합니다. 인수할 때마다 fencing_token이 증가합니다.
+
+        Returns:
+            리스 보유 여부
+        """
+        now = _db_now()
+        expires_at = _db_now(self.ttl)
+
+        async with self.session_factory() as db:
+            renewed = await db.execute(
+                update(ServiceLease)
+                .where(
+                    ServiceLease.name == self.name,
+                    ServiceLease.holder == self.holder_id,
+                )
+                .values(renewed_at=now, expires_at=expires_at)
+            )
+            if renewed.rowcount == 0:
+                taken = await db.execute(
+                    update(ServiceLease)
+                    .where(
+                        ServiceLease.name == self.name,
+                        ServiceLease.expires_at < now,
+                    )
+                    .values(
+                        holder=self.holder_id,
+                        fencing_token=ServiceLease.fencing_token + 1,
+                        acquired_at=now,
+                        renewed_at=now,
+                        expires_at=expires_at,
+                    )
+                )
+                if taken.rowcount == 0:
+                    exists = await db.scalar(
+                        select(ServiceLease.id).where(ServiceLease.name == self.name)
+                    )
+                    if exists is not None:
+                        await db.rollback()
+                        return False
+                    db.add(
+                        ServiceLease(
+                            name=self.name,
+                            holder=self.holder_id,
+                            fencing_token=1,
+                            acquired_at=now,
+                            renewed_at=now,
+                            expires_at=expires_at,
+                        )
+                    )
+                    try:
+                        await db.flush()
+                    except IntegrityError:
+                        # 다른 워커가 동시에 최초 리스를 생성
+                        await db.rollback()
+                        return False
+
+            self.fencing_token = await db.scalar(
+                select(ServiceLease.fencing_token).where(
+                    ServiceLease.name == self.name,
+                    ServiceLease.holder == self.holder_id,
+                )
+            )
+            await db.commit()
+        return True
+
+    async def release(self) -> None:
+        """보유 중인 리스 즉시 만료 (다른 워커가 다음 주기에 인수)"""
+        async with self.session_factory() as db:
+            await db.execute(
+                update(ServiceLease)
+                .where(
+                    ServiceLease.name == self.name,
+                    ServiceLease.holder == self.holder_id,
+                )
+                .values(expires_at=_db_now())
+            )
+            await db.commit()
+
+    # =============================================================================
+    # 선출 루프
+    # =============================================================================
+
+    def start(
+        self,
+        on_elected: Callable[[], Awaitable[Any]],
+        on_revoked: Optional[Callable[[], Awaitable[Any]]] = None,
+    ) -> None:
+        """
+        선출 루프 시작
+
+        Args:
+            on_elected: 리더인 동안 실행할 작업 (코루틴 함수, 종료되면 다시 실행)
+            on_revoked: 리더를 잃었을 때 작업 취소 전에 호출할 정리 함수
+        """
+        if self.is_running:
+            return
+        self._on_elected = on_elected
+        self._on_revoked = on_revoked
+        self._loop_task = asyncio.create_task(self._run())
+        logger.info(f"리더 선출 시작: {self.name} ({self.holder_id})")
+
+    async def stop(self) -> None:
+        """선출 루프 중지 (리더였다면 작업을 멈추고 리스 반납)"""
+        if self._loop_task is not None:
+            self._loop_task.cancel()
+            try:
+                await self._loop_task
+            except asyncio.CancelledError:
+                pass
+            self._loop_task = None
+
+        if self.is_leader:
+            await self._step_down("stopped")
+            try:
+                await self.release()
+            except Exception as e:
+                logger.warning(f"리더 리스 반납 실패 ({self.name}): {e}")
+
+    async def _run(self) -> None:
+        """리스 갱신/인수 루프"""
+        while True:
+            started = time.monotonic()
+            try:
+                acquired: Optional[bool] = await asyncio.wait_for(
+                    self.try_acquire(), timeout=self.renew_interval
+                )
+                self.last_error = None
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                acquired = None
+                self.renew_failures += 1
+                self.last_error = str(e)
+                logger.warning(f"리더 리스 갱신 실패 ({self.name}): {e}")
+
+            if acquired:
+                self._lease_deadline = started + self.ttl
+                if not self.is_leader:
+                    self._become_leader()
+                elif self._work_task is None or self._work_task.done():
+                    logger.warning(f"리더 작업 재시작: {self.name}")
+                    self._start_work()
+            elif self.is_leader and (
+                acquired is False
+                # 다음 갱신 시도가 끝나기 전에 리스가 만료될 수 있으면 미리 중지
+                or time.monotonic() + 2 * self.renew_interval >= self._lease_deadline
+            ):
+                await self._step_down("lease lost")
+
+            await asyncio.sleep(self.renew_interval)
+
+    def _become_leader(self) -> None:
+        """리더 전환 및 작업 시작"""
+        self.is_leader = True
+        self.leader_since = _utcnow()
+        self.elections += 1
+        logger.info(
+            f"👑 리더 선출: {self.name} ({self.holder_id}, "
+            f"fencing_token={self.fencing_token})"
+        )
+        self._start_work()
+
+    def _start_work(self) -> None:
+        """리더 작업 태스크 시작"""
+        if self._on_elected is not None:
+            self._work_task = asyncio.create_task(self._on_elected())
+
+    async def _step_down(self, reason: str) -> None:
+        """리더 해제 및 작업 중지"""
+        self.is_leader = False
+        self.leader_since = None
+        logger.warning(f"리더 해제: {self.name} ({self.holder_id}, {reason})")
+
+        if self._on_revoked is not None:
+            try:
+                await self._on_revoked()
+            except Exception as e:
+                logger.error(f"리더 해제 처리 실패 ({self.name}): {e}")
+
+        if self._work_task is not None:
+            self._work_task.cancel()
+            try:
+                await self._work_task
+            except asyncio.CancelledError:
+                pass
+            except Exception as e:
+                logger.error(f"리더 작업 종료 중 오류 ({self.name}): {e}")
+            self._work_task = None
+
+    def status(self) -> Dict[str, Any]:
+        """이 워커의 선출 상태"""
+        return {
+            "name": self.name,
+            "holder_id": self.holder_id,
+            "running": self.is_running,
+            "is_leader": self.is_leader,
+            "fencing_token": self.fencing_token if self.is_leader else None,
+            "leader_since": self.leader_since,
+            "elections": self.elections,
+            "renew_failures": self.renew_failures,
+            "last_error": self.last_error,
+            "lease_ttl": self.ttl,
+            "renew_interval": self.renew_interval,
+        }
+
+
+async def get_leases(db: AsyncSession) -> List[Dict[str, Any]]:
+    """
+    전체 서비스 리스 조회 (관리자 상태 표시용)
+
+    Returns:
+        작업별 현재 리더와 리스 만료 여부
+    """
+    rows = await db.execute(
+        select(
+            ServiceLease, (ServiceLease.expires_at < _db_now()).label("expired")
+        ).order_by(ServiceLease.name)
+    )
+    result = []
+    for lease, expired in rows.all():
+        result.append(
+            {
+                "name": lease.name,
+                "holder": lease.holder,
+                "fencing_token": lease.fencing_token,
+                "acquired_at": lease.acquired_at,
+                "renewed_at": lease.renewed_at,
+                "expires_at": lease.expires_at,
+                "expired": bool(expired),
+            }
+        )
+    return result
@@ -5,24 +5,63 @@ TRON 블록체인 통합 모듈.
 클린 아키텍처 원칙에 따라 기능별로 모듈화되어 있습니다.
 """
 
+from app.core.tron.archive import TransferArchive, get_transfer_archive
 from app.core.tron.balance import TronBalanceService
+from app.core.tron.cache import TronBlockCache, block_cache
 from app.core.tron.constants import TronAddressValidator, TronConstants, TronNetwork
+from app.core.tron.contracts import (
+    ContractMetadata,
+    ContractMetadataCache,
+    contract_metadata_cache,
+)
+from app.core.tron.http_client import TronHttpClient, TronHttpError
 from app.core.tron.network import TronNetworkClient, TronNetworkService
+from app.core.tron.node_pool import TronNodePool
+from app.core.tron.range_fetcher import BlockRangeFetcher, block_range_fetcher
 from app.core.tron.service import TronService
+from app.core.tron.signer import BatchSigner, batch_signer, key_reference
+from app.core.tron.singleflight import SingleFlight, single_flight
 from app.core.tron.stats import TronNetworkStatsService
-from app.core.tron.transaction import TronTransactionService
+from app.core.tron.transaction import (
+    BlockRangeScan,
+    ReferenceBlock,
+    TronTransactionBuilder,
+    TronTransactionService,
+    transaction_builder,
+)
 from app.core.tron.wallet import TronWalletManager
 
 # 기존 호환성을 위한 메인 클래스 노출
 __all__ = [
     "TronService",
+    "BatchSigner",
+    "batch_signer",
+    "key_reference",
+    "SingleFlight",
+    "single_flight",
     "TronBalanceService",
     "TronConstants",
     "TronNetwork",
     "TronAddressValidator",
+    "TronBlockCache",
+    "block_cache",
+    "ContractMetadata",
+    "ContractMetadataCache",
+    "contract_metadata_cache",
+    "TronHttpClient",
+    "TronHttpError",
+    "TronNodePool",
+    "BlockRangeFetcher",
+    "block_range_fetcher",
     "TronNetworkService",
     "TronNetworkClient",
     "TronNetworkStatsService",
     "TronTransactionService",
+    "BlockRangeScan",
+    "ReferenceBlock",
+    "TronTransactionBuilder",
+    "transaction_builder",
+    "TransferArchive",
+    "get_transfer_archive",
     "TronWalletManager",
 ]
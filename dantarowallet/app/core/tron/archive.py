@@ -0,0 +1,351 @@
+"""
+TRON 전송 아카이브.
+디코딩된 전송을 블록 번호로 색인된 추가 전용 세그먼트 파일에 저장하고,
+메모리 맵으로 노드 조회 없이 과거 구간을 재생합니다.
+"""
+
+import fcntl
+import json
+import logging
+import mmap
+import os
+import struct
+from collections import OrderedDict
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from decimal import Decimal
+from pathlib import Path
+from typing import Any, BinaryIO, Dict, Iterator, List, Optional, Tuple
+
+from app.core.config import settings
+from app.core.tron.constants import TronConstants, TronNetwork
+
+logger = logging.getLogger(__name__)
+
+# 전송 레코드: txid, from, to, 토큰 코드, 트랜잭션 인덱스, 로그 인덱스(-1: 없음),
+# 금액(uint256), 타임스탬프(ms)
+RECORD = struct.Struct("<32s21s21sBIh32sQ")
+# 블록 슬롯: 레코드 시작 위치, 블록 타임스탬프, 레코드 수, 기록 여부, 블록 ID
+SLOT = struct.Struct("<QQI?3x32s")
+# 열어 두는 세그먼트 파일 수 (현재 세그먼트와 재스캔이 닿는 직전 세그먼트)
+MAX_OPEN_SEGMENTS = 2
+
+
+@dataclass
+class ArchivedBlock:
+    """아카이브된 블록 (전송 주소는 hex 형식)"""
+
+    number: int
+    block_id: Optional[str]
+    timestamp: int
+    transfers: List[Dict[str, Any]] = field(default_factory=list)
+
+
+class TransferArchive:
+    """
+    디코딩된 전송 세그먼트 아카이브
+
+    세그먼트마다 고정 크기 레코드를 이어 붙이는 데이터 파일(.dat)과
+    블록 번호 위치에 고정 크기 슬롯을 두는 색인 파일(.idx)을 사용합니다.
+    같은 블록을 다시 기록하면 슬롯이 새 레코드를 가리키므로 재스캔에도 안전합니다.
+    """
+
+    def __init__(self, directory: str, segment_blocks: Optional[int] = None):
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.segment_blocks = segment_blocks or settings.TRON_ARCHIVE_SEGMENT_BLOCKS
+        self._writers: "OrderedDict[int, Tuple[BinaryIO, BinaryIO]]" = OrderedDict()
+        self._tokens_path = self.directory / "tokens.json"
+        self._tokens_lock_path = self.directory / "tokens.lock"
+        self._tokens: List[str] = []
+        self._token_codes: Dict[str, int] = {}
+        self._load_tokens()
+        self.appended_blocks = 0
+        self.appended_transfers = 0
+
+    # =============================================================================
+    # 기록
+    # =============================================================================
+
+    def _segment(self, block_num: int) -> int:
+        """블록이 속한 세그먼트 시작 블록"""
+        return block_num - block_num % self.segment_blocks
+
+    def _paths(self, base: int) -> Tuple[Path, Path]:
+        """세그먼트 데이터/색인 파일 경로"""
+        stem = self.directory / f"transfers-{base:012d}"
+        return stem.with_suffix(".dat"), stem.with_suffix(".idx")
+
+    def _writer(self, base: int) -> Tuple[BinaryIO, BinaryIO]:
+        """세그먼트 파일 핸들 (없으면 생성, 오래된 세그먼트 핸들은 동기화 후 종료)"""
+        handles = self._writers.get(base)
+        if handles is not None:
+            self._writers.move_to_end(base)
+            return handles
+
+        data_path, index_path = self._paths(base)
+        index_path.touch(exist_ok=True)
+        handles = (open(data_path, "ab"), open(index_path, "r+b"))
+        self._writers[base] = handles
+        while len(self._writers) > MAX_OPEN_SEGMENTS:
+            _, old_handles = self._writers.popitem(last=False)
+            for handle in old_handles:
+                handle.flush()
+                os.fsync(handle.fileno())
+                handle.close()
+        return handles
+
+    def _load_tokens(self) -> None:
+        """토큰 목록 파일 읽기 (다른 프로세스가 추가한 토큰 반영)"""
+        if self._tokens_path.exists():
+            self._tokens = json.loads(self._tokens_path.read_text())
+            self._token_codes = {token: code for code, token in enumerate(self._tokens)}
+
+    @contextmanager
+    def _tokens_lock(self) -> Iterator[None]:
+        """토큰 목록 파일 잠금 (같은 디렉터리를 쓰는 프로세스 간 배타)"""
+        with open(self._tokens_lock_path, "a") as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def _token_code(self, token: str) -> int:
+        """
+        토큰 심볼 → 코드 (새 토큰은 토큰 목록 파일에 추가)
+
+        새 토큰은 잠금을 잡고 파일을 다시 읽은 뒤 추가하므로, 여러 프로세스가
+        같은 토큰에 서로 다른 코드를 주지 않습니다. 파일은 임시 파일을
+        교체하는 방식으로 기록하여 읽는 쪽이 쓰다 만 목록을 보지 않습니다.
+        """
+        code = self._token_codes.get(token)
+        if code is not None:
+            return code
+
+        with self._tokens_lock():
+            self._load_tokens()
+            code = self._token_codes.get(token)
+            if code is None:
+                code = len(self._tokens)
+                tokens = self._tokens + [token]
+                temp_path = self._tokens_path.with_name(
+                    f"tokens.json.{os.getpid()}.tmp"
+                )
+                with open(temp_path, "w") as f:
+                    f.write(json.dumps(tokens))
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(temp_path, self._tokens_path)
+                self._tokens = tokens
+                self._token_codes[token] = code
+        return code
+
+    def append_block(
+        self,
+        block_num: int,
+        block_id: Optional[str],
+        timestamp: int,
+        transfers: List[Dict[str, Any]],
+    ) -> None:
+        """
+        블록의 전송 기록 (전송이 없는 블록도 스캔 완료로 기록)
+
+        Args:
+            block_num: 블록 번호
+            block_id: 블록 ID (hex)
+            timestamp: 블록 타임스탬프 (ms)
+            transfers: 디코딩된 전송 목록 (주소는 hex 형식)
+        """
+        data_file, index_file = self._writer(self._segment(block_num))
+        offset = data_file.tell()
+        records = b"".join(
+            RECORD.pack(
+                bytes.fromhex(transfer["txID"]),
+                bytes.fromhex(transfer["from"]),
+                bytes.fromhex(transfer["to"]),
+                self._token_code(transfer["token"]),
+                transfer.get("transaction_index", 0),
+                transfer.get("log_index", -1),
+                int(transfer["value"]).to_bytes(32, "big"),
+                transfer.get("timestamp") or timestamp,
+            )
+            for transfer in transfers
+        )
+        data_file.write(records)
+        index_file.seek((block_num - self._segment(block_num)) * SLOT.size)
+        index_file.write(
+            SLOT.pack(
+                offset,
+                timestamp,
+                len(transfers),
+                True,
+                bytes.fromhex(block_id) if block_id else b"",
+            )
+        )
+        self.appended_blocks += 1
+        self.appended_transfers += len(transfers)
+
+    def flush(self) -> None:
+        """버퍼 기록"""
+        for data_file, index_file in self._writers.values():
+            data_file.flush()
+            index_file.flush()
+
+    def sync(self) -> None:
+        """디스크 동기화 (스캔 커서 커밋 후 호출)"""
+        self.flush()
+        for data_file, index_file in self._writers.values():
+            os.fsync(data_file.fileno())
+            os.fsync(index_file.fileno())
+
+    def close(self) -> None:
+        """파일 핸들 종료"""
+        self.flush()
+        for data_file, index_file in self._writers.values():
+            data_file.close()
+            index_file.close()
+        self._writers.clear()
+
+    # =============================================================================
+    # 재생
+    # =============================================================================
+
+    @staticmethod
+    def _map(path: Path) -> Optional[mmap.mmap]:
+        """읽기 전용 메모리 맵 (파일이 없거나 비어 있으면 None)"""
+        if not path.exists() or path.stat().st_size == 0:
+            return None
+        with open(path, "rb") as f:
+            return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def replay(
+        self,
+        start_block: int,
+        end_block: int,
+        contracts: Optional[Dict[str, str]] = None,
+    ) -> Iterator[ArchivedBlock]:
+        """
+        아카이브 구간 재생 (기록되지 않은 블록에서 중단)
+
+        Args:
+            start_block: 시작 블록 번호 (포함)
+            end_block: 종료 블록 번호 (포함)
+            contracts: 토큰 심볼 → 컨트랙트 주소 매핑 (전송 dict의 contract_address)
+
+        Yields:
+            블록 번호 순서의 아카이브 블록
+        """
+        self.flush()
+        contracts = contracts or {}
+        block_num = start_block
+
+        while block_num <= end_block:
+            base = self._segment(block_num)
+            data_path, index_path = self._paths(base)
+            index_map = self._map(index_path)
+            if index_map is None:
+                return
+            data_map = self._map(data_path)
+            data = memoryview(data_map) if data_map is not None else memoryview(b"")
+            segment_end = min(end_block, base + self.segment_blocks - 1)
+
+            try:
+                for block_num in range(block_num, segment_end + 1):
+                    position = (block_num - base) * SLOT.size
+                    if position + SLOT.size > len(index_map):
+                        return
+                    offset, timestamp, count, present, block_id = SLOT.unpack_from(
+                        index_map, position
+                    )
+                    if not present:
+                        return
+                    end = offset + count * RECORD.size
+                    yield ArchivedBlock(
+                        number=block_num,
+                        block_id=block_id.hex() if any(block_id) else None,
+                        timestamp=timestamp,
+                        transfers=[
+                            self._to_transfer(record, block_num, contracts)
+                            for record in RECORD.iter_unpack(data[offset:end])
+                        ],
+                    )
+            finally:
+                data.release()
+                index_map.close()
+                if data_map is not None:
+                    data_map.close()
+            block_num = segment_end + 1
+
+    def _to_transfer(
+        self, record: Tuple, block_num: int, contracts: Dict[str, str]
+    ) -> Dict[str, Any]:
+        """레코드 → 입금 스캐너 전송 dict (주소는 hex 형식)"""
+        txid, from_raw, to_raw, code, tx_index, log_index, value, timestamp = record
+        if code >= len(self._tokens):
+            # 다른 프로세스가 기록 중 추가한 토큰
+            self._load_tokens()
+        token = self._tokens[code]
+        value = int.from_bytes(value, "big")
+        decimals = TronConstants.TOKEN_DECIMALS.get(token, 6)
+        transfer = {
+            "txID": txid.hex(),
+            "hash": txid.hex(),
+            "from": from_raw.hex(),
+            "to": to_raw.hex(),
+            "value": value,
+            "amount": Decimal(value) / (10**decimals),
+            "token": token,
+            "contract_address": contracts.get(token),
+            "block_number": block_num,
+            "timestamp": timestamp,
+            "transaction_index": tx_index,
+        }
+        if log_index >= 0:
+            transfer["log_index"] = log_index
+        return transfer
+
+    def last_contiguous_block(self, start_block: int, end_block: int) -> int:
+        """start_block부터 빠짐없이 기록된 마지막 블록 (없으면 start_block - 1)"""
+        last = start_block - 1
+        for block in self.replay(start_block, end_block):
+            last = block.number
+        return last
+
+    def stats(self) -> Dict[str, Any]:
+        """아카이브 통계"""
+        segments = sorted(self.directory.glob("transfers-*.dat"))
+        return {
+            "directory": str(self.directory),
+            "segments": len(segments),
+            "bytes": sum(path.stat().st_size for path in segments),
+            "appended_blocks": self.appended_blocks,
+            "appended_transfers": self.appended_transfers,
+        }
+
+
+_archives: Dict[str, TransferArchive] = {}
+
+
+def get_transfer_archive(
+    network: TronNetwork, shard: str = ""
+) -> Optional[TransferArchive]:
+    """
+    네트워크/샤드별 전송 아카이브 (TRON_TRANSFER_ARCHIVE_DIR 미설정 시 None)
+
+    샤드 모니터는 담당 주소의 전송만 같은 블록 슬롯에 기록하므로, 샤드마다
+    별도 디렉터리를 사용하여 다른 샤드의 기록을 덮어쓰지 않습니다.
+
+    Args:
+        network: TRON 네트워크
+        shard: 입금 모니터 샤드 키 ("0/4" 형식, 비샤드는 빈 문자열)
+    """
+    if not settings.TRON_TRANSFER_ARCHIVE_DIR:
+        return None
+    path = os.path.join(settings.TRON_TRANSFER_ARCHIVE_DIR, network.value)
+    if shard:
+        index, count = shard.split("/")
+        path = os.path.join(path, f"shard-{index}-of-{count}")
+    if path not in _archives:
+        _archives[path] = TransferArchive(path)
+    return _archives[path]
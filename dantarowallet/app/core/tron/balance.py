@@ -3,11 +3,18 @@ TRON 잔고 조회 서비스.
 TRX 및 TRC20 토큰 잔고 조회를 담당합니다.
 """
 
+import asyncio
 import logging
-from typing import Any, Dict, List, Optional
+from decimal import Decimal
+from typing import Any, Dict, List, Optional, Tuple
 
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
 from app.core.tron.constants import TronConstants, TronNetwork
+from app.core.tron.contracts import contract_metadata_cache
 from app.core.tron.network import TronNetworkService
+from app.core.tron.wallet import address_codec
 
 logger = logging.getLogger(__name__)
 
@@ -15,11 +22,58 @@ logger = logging.getLogger(__name__)
 class TronBalanceService(TronNetworkService):
     """TRON 잔고 조회 서비스"""
 
+    async def _fetch_trx_balance(self, address: str) -> int:
+        """TRX 잔고 조회 (SUN 단위, 실패 시 예외 발생)"""
+        account = await self.http.get_account(address)
+        return account.get("balance", 0)  # 미활성 계정은 0
+
+    async def _fetch_trc20_balance(
+        self, address: str, contract_address: str
+    ) -> Tuple[int, int]:
+        """TRC20 잔고 및 소수점 조회 (실패 시 예외 발생)"""
+        # 소수점은 메타데이터 캐시에서 조회 (워밍업 이후 네트워크 호출 없음)
+        metadata = await contract_metadata_cache.get_or_load(
+            self.http, contract_address
+        )
+        parameter = address_codec.to_hex(address)[2:].rjust(64, "0")
+        balance_result = await self.http.trigger_constant_contract(
+            address, contract_address, "balanceOf(address)", parameter
+        )
+        balance = int(balance_result[0], 16) if balance_result else 0
+        return balance, metadata.decimals
+
+    async def warm_up_contract_metadata(self, db: Optional[AsyncSession] = None) -> int:
+        """
+        지원 토큰 컨트랙트 메타데이터 캐시 워밍업
+
+        DB에 저장된 메타데이터를 먼저 적재하고, 없는 컨트랙트만 노드에서
+        조회한 뒤 DB에 저장합니다.
+
+        Returns:
+            캐시된 컨트랙트 수
+        """
+        network = self.network.value
+        if db is not None:
+            loaded = await contract_metadata_cache.load_from_db(db, network)
+            logger.info(f"DB에서 컨트랙트 메타데이터 {loaded}건 적재")
+
+        for symbol, contract_address in TronConstants.get_contracts(
+            self.network
+        ).items():
+            try:
+                await contract_metadata_cache.get_or_load(self.http, contract_address)
+            except Exception as e:
+                logger.warning(f"{symbol} 컨트랙트 메타데이터 로딩 실패: {e}")
+
+        if db is not None:
+            await contract_metadata_cache.save_to_db(db, network)
+
+        return len(contract_metadata_cache)
+
     async def get_trx_balance(self, address: str) -> Dict[str, Any]:
         """TRX 잔고 조회"""
         try:
-            self.ensure_connection()
-            balance = self.client.get_account_balance(address)
+            balance = await self._fetch_trx_balance(address)
 
             return {
                 "token": "TRX",
@@ -45,8 +99,6 @@ class TronBalanceService(TronNetworkService):
     ) -> Dict[str, Any]:
         """TRC20 토큰 잔고 조회"""
         try:
-            self.ensure_connection()
-
             # 토큰 계약 주소 가져오기
             contracts = TronConstants.get_contracts(self.network)
             contract_address = contracts.get(token.upper())
@@ -54,12 +106,10 @@ class TronBalanceService(TronNetworkService):
             if not contract_address:
                 raise ValueError(f"Unsupported token: {token}")
 
-            # 스마트 컨트랙트 인스턴스 생성
-            contract = self.client.get_contract(contract_address)
-
-            # 잔고 및 소수점 조회
-            balance = contract.functions.balanceOf(address)
-            decimals = contract.functions.decimals()
+            # 잔고 및 소수점 조회 (상수 호출)
+            balance, decimals = await self._fetch_trc20_balance(
+                address, contract_address
+            )
 
             return {
                 "token": token.upper(),
@@ -105,3 +155,62 @@ class TronBalanceService(TronNetworkService):
                 results[token] = {"token": token, "balance": 0, "error": str(e)}
 
         return results
+
+    async def get_balances_bulk(
+        self,
+        addresses: List[str],
+        tokens: Optional[List[str]] = None,
+        max_in_flight: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        """
+        여러 주소의 잔고를 동시에 조회
+
+        (주소, 토큰) 조회를 동시 요청 수 상한 내에서 병렬로 실행합니다.
+        노드별 초당 요청 수 제한은 HTTP 클라이언트에서 적용됩니다.
+        일부 조회가 실패해도 전체 배치는 실패하지 않습니다.
+
+        Args:
+            addresses: 조회할 주소 목록
+            tokens: 조회할 토큰 목록 (기본값: TRX, USDT)
+            max_in_flight: 동시 요청 수 상한
+
+        Returns:
+            {"balances": {주소: {토큰: 잔고}}, "errors": {주소: {토큰: 오류}}}
+        """
+        tokens = [token.upper() for token in (tokens or ["TRX", "USDT"])]
+        contracts = TronConstants.get_contracts(self.network)
+        semaphore = asyncio.Semaphore(
+            max_in_flight or settings.TRON_BULK_BALANCE_CONCURRENCY
+        )
+
+        balances: Dict[str, Dict[str, Decimal]] = {}
+        errors: Dict[str, Dict[str, str]] = {}
+
+        async def fetch(address: str, token: str) -> None:
+            async with semaphore:
+                try:
+                    if token == "TRX":
+                        raw = await self._fetch_trx_balance(address)
+                        decimals = TronConstants.TOKEN_DECIMALS["TRX"]
+                    else:
+                        contract_address = contracts.get(token)
+                        if not contract_address:
+                            raise ValueError(f"Unsupported token: {token}")
+                        raw, decimals = await self._fetch_trc20_balance(
+                            address, contract_address
+                        )
+                    balances.setdefault(address, {})[token] = Decimal(raw) / (
+                        10**decimals
+                    )
+                except Exception as e:
+                    errors.setdefault(address, {})[token] = str(e)
+
+        unique_addresses = list(dict.fromkeys(addresses))
+        await asyncio.gather(
+            *(fetch(address, token) for address in unique_addresses for token in tokens)
+        )
+
+        if errors:
+            logger.warning(f"대량 잔고 조회 일부 실패: {sum(len(e) for e in errors.values())}건")
+
+        return {"balances": balances, "errors": errors}
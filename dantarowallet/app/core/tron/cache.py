@@ -0,0 +1,137 @@
+"""
+TRON 블록 캐시.
+블록 번호를 키로 하는 프로세스 공용 LRU 캐시로 동일 블록의 중복 조회를 줄입니다.
+"""
+
+import logging
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+from app.core.config import settings
+from app.core.tron.constants import TronConstants
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class BlockCacheEntry:
+    """블록 캐시 항목"""
+
+    block: Dict[str, Any]
+    expires_at: Optional[float] = None  # None이면 확정 블록 (만료 없음)
+    transfers: Optional[List[Dict[str, Any]]] = field(default=None, repr=False)
+
+    @property
+    def is_confirmed(self) -> bool:
+        """확정(불변) 블록 여부"""
+        return self.expires_at is None
+
+
+class TronBlockCache:
+    """블록 번호 기반 LRU 블록 캐시"""
+
+    def __init__(
+        self,
+        max_size: Optional[int] = None,
+        head_ttl: Optional[float] = None,
+        confirmation_blocks: int = TronConstants.CONFIRMATION_BLOCKS,
+    ):
+        self.max_size = max_size or settings.TRON_BLOCK_CACHE_SIZE
+        self.head_ttl = (
+            head_ttl if head_ttl is not None else settings.TRON_BLOCK_CACHE_HEAD_TTL
+        )
+        self.confirmation_blocks = confirmation_blocks
+        self.head_block = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: "OrderedDict[int, BlockCacheEntry]" = OrderedDict()
+
+    def observe_head(self, block_num: int) -> None:
+        """관측된 최신 블록 번호 갱신"""
+        if block_num > self.head_block:
+            self.head_block = block_num
+
+    def is_confirmed(self, block_num: int) -> bool:
+        """헤드 기준 확정 블록 여부"""
+        return 0 < block_num <= self.head_block - self.confirmation_blocks
+
+    def get_entry(self, block_num: int) -> Optional[BlockCacheEntry]:
+        """캐시 항목 조회 (만료 항목은 제거)"""
+        entry = self._entries.get(block_num)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        if entry.expires_at is not None and entry.expires_at <= time.monotonic():
+            del self._entries[block_num]
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(block_num)
+        self.hits += 1
+        return entry
+
+    def get(self, block_num: int) -> Optional[Dict[str, Any]]:
+        """블록 조회"""
+        entry = self.get_entry(block_num)
+        return entry.block if entry else None
+
+    def put(self, block_num: int, block: Dict[str, Any]) -> BlockCacheEntry:
+        """
+        블록 저장
+
+        확정 블록은 만료 없이, 헤드 근처 블록은 짧은 TTL로 저장합니다.
+        """
+        block_header = block.get("block_header", {}).get("raw_data", {})
+        self.observe_head(block_header.get("number", block_num))
+
+        expires_at = None
+        if not self.is_confirmed(block_num):
+            expires_at = time.monotonic() + self.head_ttl
+
+        entry = BlockCacheEntry(block=block, expires_at=expires_at)
+        self._entries[block_num] = entry
+        self._entries.move_to_end(block_num)
+
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+        return entry
+
+    def discard_from(self, block_num: int) -> int:
+        """
+        해당 블록 이후 항목 제거 (체인 재편성 시 다른 포크의 블록 폐기)
+
+        Returns:
+            제거된 항목 수
+        """
+        stale = [number for number in self._entries if number >= block_num]
+        for number in stale:
+            del self._entries[number]
+        return len(stale)
+
+    def clear(self) -> None:
+        """캐시 비우기"""
+        self._entries.clear()
+        self.hits = self.misses = self.evictions = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """캐시 통계"""
+        total = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "max_size": self.max_size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": round(self.hits / total, 4) if total else 0.0,
+            "head_block": self.head_block,
+        }
+
+
+# 프로세스 공용 블록 캐시
+block_cache = TronBlockCache()
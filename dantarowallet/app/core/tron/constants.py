@@ -31,6 +31,12 @@ class TronConstants:
     BLOCK_TIME_SECONDS = 3  # TRON 블록 생성 시간
     CONFIRMATION_BLOCKS = 19  # 권장 확인 블록 수
 
+    # 토큰 소수점 자릿수
+    TOKEN_DECIMALS = {"TRX": 6, "USDT": 6, "USDC": 6}
+
+    # TRC20 transfer(address,uint256) 함수 선택자
+    TRC20_TRANSFER_SELECTOR = "a9059cbb"
+
     # 주소 검증
     ADDRESS_LENGTH = 34
     HEX_ADDRESS_LENGTH = 42
@@ -0,0 +1,168 @@
+"""
+TRC20 컨트랙트 메타데이터 캐시.
+ABI, 소수점, 심볼처럼 변하지 않는 값을 프로세스당 한 번만 조회합니다.
+"""
+
+import asyncio
+import logging
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.tron.http_client import TronHttpClient
+from app.models.token_contract import TokenContract
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class ContractMetadata:
+    """컨트랙트 메타데이터"""
+
+    address: str
+    symbol: str
+    decimals: int
+    name: Optional[str] = None
+    abi: List[Dict[str, Any]] = field(default_factory=list)
+
+
+def decode_abi_string(result: str) -> str:
+    """ABI 인코딩된 string(또는 bytes32) 반환값 디코딩"""
+    if not result:
+        return ""
+    raw = bytes.fromhex(result)
+    if len(raw) >= 64:
+        offset = int.from_bytes(raw[:32], "big")
+        if offset + 32 <= len(raw):
+            length = int.from_bytes(raw[offset : offset + 32], "big")
+            data = raw[offset + 32 : offset + 32 + length]
+            if len(data) == length:
+                return data.decode("utf-8", errors="ignore")
+    # 일부 구형 토큰은 bytes32 고정 길이로 반환
+    return raw[:32].rstrip(b"\x00").decode("utf-8", errors="ignore")
+
+
+class ContractMetadataCache:
+    """
+    프로세스 단위 컨트랙트 메타데이터 캐시
+
+    같은 컨트랙트에 대한 동시 조회는 주소별 락으로 한 번의 로딩으로 합칩니다.
+    DB에 저장된 메타데이터로 시작 시 미리 채울 수 있습니다.
+    """
+
+    def __init__(self):
+        self._entries: Dict[str, ContractMetadata] = {}
+        self._locks: Dict[str, asyncio.Lock] = {}
+        self.loads = 0
+
+    def get(self, address: str) -> Optional[ContractMetadata]:
+        """캐시된 메타데이터 조회 (네트워크 호출 없음)"""
+        return self._entries.get(address)
+
+    def put(self, metadata: ContractMetadata) -> None:
+        """메타데이터 저장"""
+        self._entries[metadata.address] = metadata
+
+    def clear(self) -> None:
+        """캐시 비우기"""
+        self._entries.clear()
+        self._locks.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    async def get_or_load(self, http: TronHttpClient, address: str) -> ContractMetadata:
+        """
+        메타데이터 조회 (없으면 노드에서 로딩)
+
+        Args:
+            http: 노드 HTTP 클라이언트
+            address: 컨트랙트 주소 (base58)
+
+        Returns:
+            컨트랙트 메타데이터
+        """
+        metadata = self._entries.get(address)
+        if metadata is not None:
+            return metadata
+
+        lock = self._locks.setdefault(address, asyncio.Lock())
+        async with lock:
+            metadata = self._entries.get(address)
+            if metadata is None:
+                metadata = await self._load(http, address)
+                self._entries[address] = metadata
+        return metadata
+
+    async def _load(self, http: TronHttpClient, address: str) -> ContractMetadata:
+        """노드에서 ABI, 소수점, 심볼 조회"""
+        contract, decimals_result, symbol_result = await asyncio.gather(
+            http.get_contract(address),
+            http.trigger_constant_contract(address, address, "decimals()"),
+            http.trigger_constant_contract(address, address, "symbol()"),
+        )
+        self.loads += 1
+
+        metadata = ContractMetadata(
+            address=address,
+            symbol=decode_abi_string(symbol_result[0]) if symbol_result else "",
+            decimals=int(decimals_result[0], 16) if decimals_result else 6,
+            name=contract.get("name"),
+            abi=contract.get("abi", {}).get("entrys", []),
+        )
+        logger.info(
+            f"컨트랙트 메타데이터 로딩: {metadata.symbol} "
+            f"({address}, decimals={metadata.decimals})"
+        )
+        return metadata
+
+    async def load_from_db(self, db: AsyncSession, network: str) -> int:
+        """DB에 저장된 메타데이터로 캐시 채우기"""
+        result = await db.execute(
+            select(TokenContract).where(TokenContract.network == network)
+        )
+        rows = result.scalars().all()
+        for row in rows:
+            self.put(
+                ContractMetadata(
+                    address=row.address,
+                    symbol=row.symbol,
+                    decimals=row.decimals,
+                    name=row.name,
+                    abi=row.abi or [],
+                )
+            )
+        return len(rows)
+
+    async def save_to_db(self, db: AsyncSession, network: str) -> int:
+        """캐시된 메타데이터 중 DB에 없는 항목 저장"""
+        result = await db.execute(
+            select(TokenContract.address).where(TokenContract.network == network)
+        )
+        stored = set(result.scalars().all())
+
+        added = 0
+        for metadata in self._entries.values():
+            if metadata.address in stored:
+                continue
+            db.add(
+                TokenContract(
+                    network=network,
+                    address=metadata.address,
+                    symbol=metadata.symbol,
+                    name=metadata.name,
+                    decimals=metadata.decimals,
+                    abi=metadata.abi,
+                )
+            )
+            added += 1
+
+        if added:
+            await db.commit()
+        return added
+
+
+# 프로세스 공유 컨트랙트 메타데이터 캐시
+contract_metadata_cache = ContractMetadataCache()
@@ -0,0 +1,151 @@
+"""
+TRC20 이벤트 로그 디코더.
+블록 단위 트랜잭션 영수증에서 Transfer 이벤트를 컬럼형 배치로 추출합니다.
+"""
+
+import logging
+from dataclasses import dataclass, field
+from decimal import Decimal
+from typing import Any, Dict, Iterator, List, Optional
+
+from app.core.tron.constants import TronConstants
+from app.core.tron.wallet import address_codec
+
+logger = logging.getLogger(__name__)
+
+# keccak256("Transfer(address,address,uint256)")
+TRANSFER_EVENT_TOPIC = (
+    "ddf252ad1be2c89b69c2b068fc378daa952ba7f163c4a11628f55a4df523b3ef"
+)
+
+
+@dataclass
+class TransferBatch:
+    """
+    Transfer 이벤트 컬럼형 배치.
+    주소는 '41' 접두사가 붙은 hex 형식으로 저장합니다.
+    """
+
+    block_number: int
+    block_timestamp: int = 0
+    txids: List[str] = field(default_factory=list)
+    from_addresses: List[str] = field(default_factory=list)
+    to_addresses: List[str] = field(default_factory=list)
+    amounts: List[int] = field(default_factory=list)
+    log_indexes: List[int] = field(default_factory=list)
+    tokens: List[str] = field(default_factory=list)
+    tx_indexes: List[int] = field(default_factory=list)
+
+    def __len__(self) -> int:
+        return len(self.txids)
+
+    def append(
+        self,
+        txid: str,
+        from_address: str,
+        to_address: str,
+        amount: int,
+        log_index: int,
+        token: str,
+        tx_index: int,
+    ) -> None:
+        """이벤트 한 건 추가"""
+        self.txids.append(txid)
+        self.from_addresses.append(from_address)
+        self.to_addresses.append(to_address)
+        self.amounts.append(amount)
+        self.log_indexes.append(log_index)
+        self.tokens.append(token)
+        self.tx_indexes.append(tx_index)
+
+    def to_transfers(
+        self, contracts: Dict[str, str], rows: Optional[List[int]] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        배치를 입금 스캐너 전송 dict 형식으로 변환 (주소는 hex 형식)
+
+        Args:
+            contracts: 토큰 심볼 → 컨트랙트 주소 매핑
+            rows: 변환할 행 인덱스 (None이면 전체)
+        """
+        for i in range(len(self)) if rows is None else rows:
+            token = self.tokens[i]
+            decimals = TronConstants.TOKEN_DECIMALS.get(token, 6)
+            yield {
+                "txID": self.txids[i],
+                "hash": self.txids[i],
+                "from": self.from_addresses[i],
+                "to": self.to_addresses[i],
+                "value": self.amounts[i],
+                "amount": Decimal(self.amounts[i]) / (10**decimals),
+                "token": token,
+                "contract_address": contracts.get(token),
+                "block_number": self.block_number,
+                "timestamp": self.block_timestamp,
+                "transaction_index": self.tx_indexes[i],
+                "log_index": self.log_indexes[i],
+            }
+
+
+def contract_log_addresses(contracts: Dict[str, str]) -> Dict[str, str]:
+    """토큰 심볼 → 컨트랙트 매핑을 로그 주소(20바이트 hex) → 심볼로 변환"""
+    return {
+        address_codec.to_hex(address)[2:]: symbol
+        for symbol, address in contracts.items()
+    }
+
+
+def decode_transfer_logs(
+    block_num: int, tx_infos: List[Dict[str, Any]], contracts: Dict[str, str]
+) -> TransferBatch:
+    """
+    블록의 트랜잭션 영수증에서 Transfer 이벤트 디코딩
+
+    실행 실패 트랜잭션은 제외하며, transferFrom 및 컨트랙트 지갑을
+    경유한 전송도 이벤트 기준으로 모두 포함됩니다.
+
+    Args:
+        block_num: 블록 번호
+        tx_infos: gettransactioninfobyblocknum 응답
+        contracts: 토큰 심볼 → 컨트랙트 주소 매핑
+
+    Returns:
+        Transfer 이벤트 배치
+    """
+    token_by_log_address = contract_log_addresses(contracts)
+    batch = TransferBatch(block_number=block_num)
+
+    for tx_index, info in enumerate(tx_infos):
+        if not batch.block_timestamp:
+            batch.block_timestamp = info.get("blockTimeStamp", 0)
+        if info.get("result") == "FAILED":
+            continue
+        if info.get("receipt", {}).get("result", "SUCCESS") != "SUCCESS":
+            continue
+
+        for log_index, log in enumerate(info.get("log") or []):
+            token = token_by_log_address.get(log.get("address", "").lower())
+            topics = log.get("topics") or []
+            if token is None or len(topics) != 3:
+                continue
+            if topics[0].lower() != TRANSFER_EVENT_TOPIC:
+                continue
+
+            try:
+                amount = int(log.get("data") or "0", 16)
+            except ValueError:
+                continue
+            if amount <= 0:
+                continue
+
+            batch.append(
+                txid=info["id"],
+                from_address="41" + topics[1][-40:].lower(),
+                to_address="41" + topics[2][-40:].lower(),
+                amount=amount,
+                log_index=log_index,
+                token=token,
+                tx_index=tx_index,
+            )
+
+    return batch
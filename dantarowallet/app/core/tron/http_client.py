@@ -0,0 +1,345 @@
+"""
+TRON 풀노드 HTTP API 비동기 클라이언트.
+keep-alive 연결 풀을 공유하여 이벤트 루프를 막지 않고 노드를 호출합니다.
+"""
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+
+import httpx
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class TronHttpError(Exception):
+    """TRON 노드 HTTP 호출 실패"""
+
+
+class TronNodeResponseError(TronHttpError):
+    """노드가 정상 응답했으나 요청 자체가 거부됨 (다른 노드로 재시도 불필요)"""
+
+
+class TronRateLimitedError(TronHttpError):
+    """노드 요청 한도 초과 (HTTP 429)"""
+
+    def __init__(self, message: str, retry_after: Optional[float] = None):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Retry-After 헤더(초) 파싱"""
+    try:
+        return max(0.0, float(value)) if value else None
+    except ValueError:
+        return None
+
+
+class AsyncRateLimiter:
+    """토큰 버킷 기반 비동기 요청 속도 제한기"""
+
+    def __init__(self, rate: float, burst: Optional[int] = None):
+        self.rate = rate
+        self.burst = burst or max(1, int(rate))
+        self._tokens = float(self.burst)
+        self._updated_at = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        """요청 1회분 토큰 획득 (부족하면 대기)"""
+        if self.rate <= 0:
+            return
+
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(
+                    self.burst, self._tokens + (now - self._updated_at) * self.rate
+                )
+                self._updated_at = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
+
+@dataclass
+class NodeHealth:
+    """
+    노드 상태 추적
+
+    실제 요청 결과로 상태를 갱신하므로 별도의 확인 호출이 필요 없습니다.
+    """
+
+    failure_threshold: int = 3
+    alpha: float = 0.2  # EWMA 가중치
+    ewma_latency: Optional[float] = None  # 초
+    error_rate: float = 0.0  # 실패율 EWMA
+    consecutive_failures: int = 0
+    total_requests: int = 0
+    total_failures: int = 0
+    last_success_at: Optional[float] = None
+    last_failure_at: Optional[float] = None
+    last_error: Optional[str] = None
+
+    @property
+    def healthy(self) -> bool:
+        """연속 실패가 기준 미만이면 정상"""
+        return self.consecutive_failures < self.failure_threshold
+
+    def record_latency(self, latency: float) -> None:
+        """지연 시간 표본 반영"""
+        self.ewma_latency = (
+            latency
+            if self.ewma_latency is None
+            else self.alpha * latency + (1 - self.alpha) * self.ewma_latency
+        )
+
+    def record_success(self, latency: Optional[float] = None) -> None:
+        """요청 성공 기록"""
+        self.total_requests += 1
+        self.consecutive_failures = 0
+        self.last_success_at = time.time()
+        self.error_rate *= 1 - self.alpha
+        if latency is not None:
+            self.record_latency(latency)
+
+    def record_failure(self, error: str) -> None:
+        """요청 실패 기록"""
+        self.error_rate = self.alpha + (1 - self.alpha) * self.error_rate
+        self.total_requests += 1
+        self.total_failures += 1
+        self.consecutive_failures += 1
+        self.last_failure_at = time.time()
+        self.last_error = error
+
+    def to_dict(self) -> Dict[str, Any]:
+        """상태 요약 반환"""
+        return {
+            "healthy": self.healthy,
+            "ewma_latency_ms": (
+                round(self.ewma_latency * 1000, 1)
+                if self.ewma_latency is not None
+                else None
+            ),
+            "error_rate": round(self.error_rate, 4),
+            "consecutive_failures": self.consecutive_failures,
+            "total_requests": self.total_requests,
+            "total_failures": self.total_failures,
+            "last_success_at": self.last_success_at,
+            "last_failure_at": self.last_failure_at,
+            "last_error": self.last_error,
+        }
+
+
+class TronHttpClient:
+    """TRON 풀노드 HTTP API 비동기 클라이언트"""
+
+    def __init__(
+        self,
+        base_url: str,
+        api_key: str = "",
+        timeout: Optional[float] = None,
+        max_connections: Optional[int] = None,
+        max_keepalive: Optional[int] = None,
+        rate_limit: Optional[float] = None,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ):
+        self.base_url = base_url.rstrip("/")
+        self._transport = transport
+        self._api_key = api_key
+        self._timeout = timeout or settings.TRON_HTTP_TIMEOUT
+        self._limits = httpx.Limits(
+            max_connections=max_connections or settings.TRON_HTTP_MAX_CONNECTIONS,
+            max_keepalive_connections=max_keepalive or settings.TRON_HTTP_MAX_KEEPALIVE,
+        )
+        self._client: Optional[httpx.AsyncClient] = None
+        self.rate_limiter = AsyncRateLimiter(
+            rate_limit if rate_limit is not None else settings.TRON_NODE_RATE_LIMIT
+        )
+        self.health = NodeHealth(failure_threshold=settings.TRON_FAILURE_THRESHOLD)
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """공유 httpx 클라이언트 반환 (지연 생성)"""
+        if self._client is None or self._client.is_closed:
+            headers = {"Content-Type": "application/json"}
+            if self._api_key:
+                headers["TRON-PRO-API-KEY"] = self._api_key
+            self._client = httpx.AsyncClient(
+                base_url=self.base_url,
+                headers=headers,
+                limits=self._limits,
+                timeout=self._timeout,
+                transport=self._transport,
+            )
+        return self._client
+
+    async def post(
+        self,
+        path: str,
+        payload: Optional[Dict[str, Any]] = None,
+        timeout: Optional[float] = None,
+    ) -> Any:
+        """
+        노드 API POST 호출
+
+        Args:
+            path: API 경로 (예: /wallet/getnowblock)
+            payload: 요청 본문
+            timeout: 호출별 타임아웃 (초)
+
+        Returns:
+            응답 JSON
+        """
+        await self.rate_limiter.acquire()
+        started = time.monotonic()
+        try:
+            response = await self.client.post(
+                path,
+                json=payload or {},
+                timeout=timeout if timeout is not None else self._timeout,
+            )
+            if response.status_code == 429:
+                self.health.record_failure("429 Too Many Requests")
+                raise TronRateLimitedError(
+                    f"{path} 호출 제한 (429)",
+                    retry_after=_parse_retry_after(response.headers.get("Retry-After")),
+                )
+            response.raise_for_status()
+            data = response.json()
+        except (httpx.HTTPError, ValueError) as e:
+            self.health.record_failure(str(e))
+            raise TronHttpError(f"{path} 호출 실패: {e}") from e
+
+        # 노드가 응답했으면 연결은 정상 (오류 응답은 요청 자체의 문제)
+        self.health.record_success(time.monotonic() - started)
+        if isinstance(data, dict) and "Error" in data:
+            raise TronNodeResponseError(f"{path} 오류 응답: {data['Error']}")
+        return data
+
+    @property
+    def healthy(self) -> bool:
+        """노드 정상 여부"""
+        return self.health.healthy
+
+    async def heartbeat(self) -> Dict[str, Any]:
+        """헬스 체크용 최신 블록 조회"""
+        return await self.get_now_block()
+
+    def stats(self) -> Dict[str, Any]:
+        """노드 상태 요약"""
+        return {"node": self.base_url, **self.health.to_dict()}
+
+    async def close(self) -> None:
+        """연결 풀 종료"""
+        if self._client is not None and not self._client.is_closed:
+            await self._client.aclose()
+        self._client = None
+
+    # =============================================================================
+    # 블록 / 트랜잭션
+    # =============================================================================
+
+    async def get_now_block(self) -> Dict[str, Any]:
+        """최신 블록 조회 (주소는 hex 형식)"""
+        return await self.post("/wallet/getnowblock")
+
+    async def get_block_by_num(self, block_num: int) -> Dict[str, Any]:
+        """블록 번호로 블록 조회 (주소는 hex 형식)"""
+        return await self.post("/wallet/getblockbynum", {"num": block_num})
+
+    async def get_transaction_by_id(self, tx_hash: str) -> Dict[str, Any]:
+        """트랜잭션 해시로 트랜잭션 조회"""
+        return await self.post(
+            "/wallet/gettransactionbyid", {"value": tx_hash, "visible": True}
+        )
+
+    async def get_transaction_info_by_id(
+        self, tx_hash: str, solidified: bool = False
+    ) -> Dict[str, Any]:
+        """
+        트랜잭션 실행 결과 조회
+
+        Args:
+            tx_hash: 트랜잭션 해시
+            solidified: True면 솔리디티 노드(확정 블록)에서 조회
+
+        Returns:
+            실행 결과 (아직 포함/확정되지 않았으면 빈 dict)
+        """
+        prefix = "/walletsolidity" if solidified else "/wallet"
+        return await self.post(f"{prefix}/gettransactioninfobyid", {"value": tx_hash})
+
+    async def get_transaction_info_by_block_num(
+        self, block_num: int
+    ) -> List[Dict[str, Any]]:
+        """블록 내 모든 트랜잭션 실행 결과(영수증) 조회"""
+        data = await self.post(
+            "/wallet/gettransactioninfobyblocknum", {"num": block_num}
+        )
+        return data if isinstance(data, list) else []
+
+    # =============================================================================
+    # 계정 / 컨트랙트
+    # =============================================================================
+
+    async def get_account(self, address: str) -> Dict[str, Any]:
+        """계정 정보 조회 (미활성 계정은 빈 dict)"""
+        return await self.post(
+            "/wallet/getaccount", {"address": address, "visible": True}
+        )
+
+    async def get_contract(self, contract_address: str) -> Dict[str, Any]:
+        """스마트 컨트랙트 정보(ABI 포함) 조회"""
+        return await self.post(
+            "/wallet/getcontract", {"value": contract_address, "visible": True}
+        )
+
+    async def trigger_constant_contract(
+        self,
+        owner_address: str,
+        contract_address: str,
+        function_selector: str,
+        parameter: str = "",
+    ) -> List[str]:
+        """
+        상수(view) 컨트랙트 함수 호출
+
+        Returns:
+            constant_result 목록 (hex 문자열)
+        """
+        data = await self.post(
+            "/wallet/triggerconstantcontract",
+            {
+                "owner_address": owner_address,
+                "contract_address": contract_address,
+                "function_selector": function_selector,
+                "parameter": parameter,
+                "visible": True,
+            },
+        )
+        result = data.get("result", {})
+        if result and not result.get("result", False):
+            raise TronHttpError(
+                f"{function_selector} 호출 실패: {result.get('message', result)}"
+            )
+        return data.get("constant_result", [])
+
+    # =============================================================================
+    # 네트워크 정보
+    # =============================================================================
+
+    async def get_chain_parameters(self) -> List[Dict[str, Any]]:
+        """체인 파라미터 목록 조회"""
+        data = await self.post("/wallet/getchainparameters")
+        return data.get("chainParameter", [])
+
+    async def get_node_info(self) -> Dict[str, Any]:
+        """노드 정보 조회"""
+        return await self.post("/wallet/getnodeinfo")
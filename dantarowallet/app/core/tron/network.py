@@ -3,13 +3,19 @@ TRON 네트워크 연결 및 기본 클라이언트 관리.
 네트워크 연결의 단일 책임을 담당합니다.
 """
 
+import asyncio
 import logging
-from typing import Optional
+from typing import Any, Dict, List, Optional
 
+import httpx
 from tronpy import Tron
 
 from app.core.config import settings
+from app.core.tron.cache import block_cache
 from app.core.tron.constants import TronNetwork
+from app.core.tron.http_client import TronHttpClient
+from app.core.tron.node_pool import TronNodePool, parse_node_urls
+from app.core.tron.singleflight import block_ttl, single_flight
 
 logger = logging.getLogger(__name__)
 
@@ -19,6 +25,8 @@ class TronNetworkClient:
 
     _instance: Optional["TronNetworkClient"] = None
     _client: Optional[Tron] = None
+    _http: Optional[TronHttpClient] = None
+    _heartbeat_task: Optional[asyncio.Task] = None
 
     def __new__(cls):
         """싱글톤 패턴 구현"""
@@ -31,6 +39,17 @@ class TronNetworkClient:
             self._network = TronNetwork(settings.TRON_NETWORK)
             self._api_key = settings.TRON_API_KEY
             self._node_url = settings.TRON_NODE_URL
+            self._http = TronNodePool(
+                parse_node_urls(
+                    settings.TRON_FULL_NODE_URL,
+                    settings.TRON_FULL_NODE_URLS,
+                    settings.TRON_NODE_URL,
+                ),
+                parse_node_urls(
+                    settings.TRON_SOLIDITY_NODE_URL, settings.TRON_SOLIDITY_NODE_URLS
+                ),
+                self._api_key,
+            )
             self._initialized = True
             self._connect()
 
@@ -66,24 +85,56 @@ class TronNetworkClient:
 
         return self._client
 
+    @property
+    def http(self) -> TronHttpClient:
+        """비동기 HTTP 클라이언트 반환 (다중 노드 풀)"""
+        if self._http is None:
+            raise RuntimeError("TRON HTTP client is not initialized")
+        return self._http
+
     @property
     def network(self) -> TronNetwork:
         """현재 네트워크 반환"""
         return self._network
 
     def is_connected(self) -> bool:
-        """네트워크 연결 상태 확인"""
-        try:
-            if self._client is None:
-                return False
+        """
+        네트워크 연결 상태 확인
 
-            # 간단한 네트워크 상태 확인
-            self._client.get_latest_block_number()
-            return True
+        네트워크 호출 없이 하트비트와 실제 요청 결과로 추적한 상태를 반환합니다.
+        """
+        return self._client is not None and self.http.healthy
 
-        except Exception as e:
-            logger.warning(f"Network connection check failed: {e}")
-            return False
+    def get_health(self) -> Dict[str, Any]:
+        """연결 상태 요약 반환"""
+        return {
+            "connected": self.is_connected(),
+            "heartbeat_running": self.heartbeat_running,
+            **self.http.stats(),
+        }
+
+    async def configure_nodes(
+        self,
+        full_node_urls: List[str],
+        solidity_node_urls: Optional[List[str]] = None,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ) -> None:
+        """
+        노드 풀 교체 (로컬 시뮬레이터, 벤치마크 등)
+
+        Args:
+            full_node_urls: 풀노드 URL 목록
+            solidity_node_urls: 솔리디티 노드 URL 목록
+            transport: httpx 전송 계층 (예: 인프로세스 ASGITransport)
+        """
+        if self._http is not None:
+            await self._http.close()
+        self._http = TronNodePool(
+            full_node_urls, solidity_node_urls, self._api_key, transport=transport
+        )
+        block_cache.clear()
+        single_flight.invalidate()
+        logger.info(f"TRON node pool configured: {', '.join(full_node_urls)}")
 
     def reconnect(self) -> None:
         """네트워크 재연결"""
@@ -91,6 +142,75 @@ class TronNetworkClient:
         self._client = None
         self._connect()
 
+    async def recover(self) -> None:
+        """연결 복구 (HTTP 연결 풀 재생성 및 tronpy 클라이언트 재연결)"""
+        await self.http.close()  # 다음 요청 시 새 연결 풀 생성
+        self.reconnect()
+
+    # =============================================================================
+    # 하트비트
+    # =============================================================================
+
+    @property
+    def heartbeat_running(self) -> bool:
+        """하트비트 실행 여부"""
+        return self._heartbeat_task is not None and not self._heartbeat_task.done()
+
+    async def heartbeat_once(self) -> bool:
+        """
+        헬스 체크 1회 실행
+
+        최신 블록을 조회하여 상태를 갱신하고, 비정상이면 재연결합니다.
+        조회한 블록은 블록 캐시에 저장되어 요청 경로에서 재사용됩니다.
+
+        Returns:
+            정상 여부
+        """
+        try:
+            block = await self.http.heartbeat()
+            block_num = block.get("block_header", {}).get("raw_data", {}).get("number")
+            if block_num:
+                block_cache.put(block_num, block)
+                single_flight.put("latest_block", block, block_ttl(block))
+        except Exception as e:
+            logger.warning(f"TRON heartbeat failed: {e}")
+
+        if not self.http.healthy:
+            logger.warning("TRON nodes unhealthy, reconnecting...")
+            try:
+                await self.recover()
+            except Exception as e:
+                logger.error(f"TRON reconnect failed: {e}")
+            return False
+        return True
+
+    async def _heartbeat_loop(self, interval: float) -> None:
+        """하트비트 루프"""
+        while True:
+            await self.heartbeat_once()
+            await asyncio.sleep(interval)
+
+    def start_heartbeat(self, interval: Optional[float] = None) -> None:
+        """백그라운드 하트비트 시작"""
+        if self.heartbeat_running:
+            return
+        self._heartbeat_task = asyncio.create_task(
+            self._heartbeat_loop(interval or settings.TRON_HEARTBEAT_INTERVAL)
+        )
+        logger.info("TRON heartbeat started")
+
+    async def stop_heartbeat(self) -> None:
+        """백그라운드 하트비트 중지"""
+        if self._heartbeat_task is None:
+            return
+        self._heartbeat_task.cancel()
+        try:
+            await self._heartbeat_task
+        except asyncio.CancelledError:
+            pass
+        self._heartbeat_task = None
+        logger.info("TRON heartbeat stopped")
+
 
 class TronNetworkService:
     """TRON 네트워크 서비스 기본 클래스"""
@@ -103,31 +223,45 @@ class TronNetworkService:
         """TRON 클라이언트 반환"""
         return self._network_client.client
 
+    @property
+    def http(self) -> TronHttpClient:
+        """비동기 TRON HTTP 클라이언트 반환"""
+        return self._network_client.http
+
     @property
     def network(self) -> TronNetwork:
         """현재 네트워크 반환"""
         return self._network_client.network
 
     def ensure_connection(self) -> None:
-        """연결 상태 확인 및 재연결"""
-        if not self._network_client.is_connected():
+        """
+        클라이언트 초기화 확인
+
+        네트워크 확인 호출은 하지 않습니다. 연결 상태는 하트비트와
+        실제 요청 결과로 추적되며 재연결도 하트비트가 담당합니다.
+        """
+        if self._network_client._client is None:
             self._network_client.reconnect()
 
     async def get_latest_block_number(self) -> int:
         """최신 블록 번호 조회"""
-        self.ensure_connection()
-        try:
-            return self.client.get_latest_block_number()
-        except Exception as e:
-            logger.error(f"Failed to get latest block number: {e}")
-            raise
+        block = await self.get_latest_block()
+        return block.get("block_header", {}).get("raw_data", {}).get("number", 0)
 
     async def get_latest_block(self) -> dict:
-        """최신 블록 정보 조회"""
-        self.ensure_connection()
+        """최신 블록 정보 조회 (동시 요청 병합, 다음 블록 전까지 캐시)"""
         try:
-            block_number = await self.get_latest_block_number()
-            return self.client.get_block(block_number)
+            return await single_flight.do(
+                "latest_block", self._fetch_latest_block, ttl=block_ttl
+            )
         except Exception as e:
             logger.error(f"Failed to get latest block: {e}")
             raise
+
+    async def _fetch_latest_block(self) -> dict:
+        """노드에서 최신 블록 조회 후 블록 캐시에 저장"""
+        block = await self.http.get_now_block()
+        block_num = block.get("block_header", {}).get("raw_data", {}).get("number")
+        if block_num:
+            block_cache.put(block_num, block)
+        return block
@@ -0,0 +1,221 @@
+"""
+TRON 다중 노드 풀.
+노드별 지연 시간/실패율을 추적하여 가장 빠른 정상 노드로 요청을 보내고,
+응답이 늦으면 두 번째 노드로 헤지 요청을 보냅니다.
+"""
+
+import asyncio
+import logging
+import time
+from typing import Any, Dict, List, Optional
+
+import httpx
+
+from app.core.config import settings
+from app.core.tron.http_client import (
+    TronHttpClient,
+    TronHttpError,
+    TronNodeResponseError,
+)
+
+logger = logging.getLogger(__name__)
+
+# 중복 실행되면 안 되는 요청 (헤지/장애 조치 재전송 금지)
+NON_IDEMPOTENT_PATHS = {"/wallet/broadcasttransaction", "/wallet/broadcasthex"}
+
+
+def parse_node_urls(*values: str) -> List[str]:
+    """콤마 구분 노드 URL 목록 파싱 (순서 유지, 중복 제거)"""
+    urls: List[str] = []
+    for value in values:
+        for url in (value or "").split(","):
+            url = url.strip().rstrip("/")
+            if url and url not in urls:
+                urls.append(url)
+    return urls
+
+
+class TronNodePool(TronHttpClient):
+    """
+    TRON 다중 노드 HTTP 클라이언트
+
+    TronHttpClient와 같은 인터페이스를 제공하며 요청마다 노드를 선택합니다.
+    /walletsolidity 경로는 솔리디티 노드를 우선 사용합니다.
+    """
+
+    def __init__(
+        self,
+        full_node_urls: List[str],
+        solidity_node_urls: Optional[List[str]] = None,
+        api_key: str = "",
+        hedge_delay: Optional[float] = None,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ):
+        if not full_node_urls:
+            raise ValueError("At least one TRON full node URL is required")
+        super().__init__(full_node_urls[0], api_key, transport=transport)
+
+        # 같은 URL은 하나의 클라이언트(연결 풀, 속도 제한)를 공유
+        self._nodes: Dict[str, TronHttpClient] = {}
+        self.full_nodes = [self._node(url, api_key) for url in full_node_urls]
+        self.solidity_nodes = [
+            self._node(url, api_key) for url in (solidity_node_urls or [])
+        ]
+        self.hedge_delay = (
+            hedge_delay if hedge_delay is not None else settings.TRON_HEDGE_DELAY
+        )
+        self.hedged_requests = 0
+        self.failovers = 0
+
+    def _node(self, url: str, api_key: str) -> TronHttpClient:
+        """URL별 노드 클라이언트 반환 (없으면 생성)"""
+        url = url.rstrip("/")
+        if url not in self._nodes:
+            self._nodes[url] = TronHttpClient(url, api_key, transport=self._transport)
+        return self._nodes[url]
+
+    @staticmethod
+    def _score(node: TronHttpClient) -> float:
+        """노드 점수 (낮을수록 우선, 측정 전 노드는 먼저 시도)"""
+        latency = node.health.ewma_latency or 0.0
+        error_rate = node.health.error_rate
+        # 실패율은 지연 시간 가중치와 함께 실패율 1당 1초의 고정 패널티로 반영
+        return latency * (1 + 10 * error_rate) + error_rate
+
+    def ranked_nodes(self, solidified: bool = False) -> List[TronHttpClient]:
+        """요청 우선순위대로 정렬된 노드 목록"""
+        candidates = list(self.solidity_nodes) if solidified else []
+        candidates += [node for node in self.full_nodes if node not in candidates]
+        return sorted(
+            candidates,
+            key=lambda node: (
+                not node.healthy,
+                # 솔리디티 요청은 솔리디티 노드를 먼저 사용
+                solidified and node not in self.solidity_nodes,
+                self._score(node),
+            ),
+        )
+
+    def _hedge_delay_for(self, node: TronHttpClient) -> float:
+        """헤지 요청 대기 시간 (평소 지연 시간의 2배, 최소 설정값)"""
+        latency = node.health.ewma_latency
+        if latency is None:
+            return self.hedge_delay
+        return max(self.hedge_delay, latency * 2)
+
+    async def post(
+        self,
+        path: str,
+        payload: Optional[Dict[str, Any]] = None,
+        timeout: Optional[float] = None,
+    ) -> Any:
+        """
+        노드 API POST 호출 (노드 선택, 헤지, 장애 조치)
+
+        가장 우선순위가 높은 노드로 요청하고, 응답이 늦으면 다음 노드로
+        같은 요청을 보내 먼저 성공한 응답을 사용합니다. 모두 실패하면
+        남은 노드로 장애 조치합니다.
+        """
+        nodes = self.ranked_nodes(solidified=path.startswith("/walletsolidity/"))
+        if path in NON_IDEMPOTENT_PATHS:
+            return await nodes[0].post(path, payload, timeout)
+
+        hedge = self.hedge_delay > 0
+        last_error: Optional[BaseException] = None
+        index = 0
+
+        while index < len(nodes):
+            if index > 0:
+                self.failovers += 1
+            primary = nodes[index]
+            index += 1
+            task = asyncio.create_task(primary.post(path, payload, timeout))
+            started = {task: (primary, time.monotonic())}
+            pending = {task}
+
+            if hedge and index < len(nodes):
+                done, _ = await asyncio.wait(
+                    pending, timeout=self._hedge_delay_for(primary)
+                )
+                if not done:
+                    backup = nodes[index]
+                    index += 1
+                    self.hedged_requests += 1
+                    task = asyncio.create_task(backup.post(path, payload, timeout))
+                    started[task] = (backup, time.monotonic())
+                    pending.add(task)
+
+            try:
+                while pending:
+                    done, pending = await asyncio.wait(
+                        pending, return_when=asyncio.FIRST_COMPLETED
+                    )
+                    for task in done:
+                        error = task.exception()
+                        if error is None:
+                            return task.result()
+                        if isinstance(error, TronNodeResponseError):
+                            raise error
+                        last_error = error
+            finally:
+                # 경쟁에서 진 요청은 취소하고 경과 시간을 지연 시간 하한으로 반영
+                now = time.monotonic()
+                for task in pending:
+                    task.cancel()
+                    node, started_at = started[task]
+                    node.health.record_latency(now - started_at)
+
+            logger.warning(f"TRON node request {path} failed, trying next node")
+
+        if last_error is not None:
+            raise last_error
+        raise TronHttpError(f"{path} 호출 실패: 사용 가능한 노드 없음")
+
+    @property
+    def healthy(self) -> bool:
+        """정상 풀노드가 하나라도 있으면 정상"""
+        return any(node.healthy for node in self.full_nodes)
+
+    async def heartbeat(self) -> Dict[str, Any]:
+        """
+        모든 노드 헬스 체크
+
+        요청이 가지 않는 노드도 상태가 갱신되도록 전체 노드를 확인합니다.
+
+        Returns:
+            가장 높은 최신 블록
+        """
+        full = list(self.full_nodes)
+        solidity = [node for node in self.solidity_nodes if node not in full]
+        results = await asyncio.gather(
+            *(node.get_now_block() for node in full),
+            *(node.post("/walletsolidity/getnowblock") for node in solidity),
+            return_exceptions=True,
+        )
+
+        blocks = [block for block in results[: len(full)] if isinstance(block, dict)]
+        if not blocks:
+            raise TronHttpError("모든 TRON 풀노드 헬스 체크 실패")
+        return max(
+            blocks,
+            key=lambda block: block.get("block_header", {})
+            .get("raw_data", {})
+            .get("number", 0),
+        )
+
+    def stats(self) -> Dict[str, Any]:
+        """노드 풀 상태 요약"""
+        primary = self.ranked_nodes()[0]
+        return {
+            "node": primary.base_url,
+            "healthy": self.healthy,
+            "hedged_requests": self.hedged_requests,
+            "failovers": self.failovers,
+            "full_nodes": [node.stats() for node in self.full_nodes],
+            "solidity_nodes": [node.stats() for node in self.solidity_nodes],
+        }
+
+    async def close(self) -> None:
+        """모든 노드 연결 풀 종료"""
+        await asyncio.gather(*(node.close() for node in self._nodes.values()))
+        await super().close()
@@ -0,0 +1,188 @@
+"""
+TRON 블록 범위 병렬 조회.
+블록을 동시에 조회하되 블록 번호 순서대로 전달하고,
+노드 지연 시간과 429 응답에 맞춰 동시 조회 창 크기를 조정합니다.
+"""
+
+import asyncio
+import logging
+import time
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Optional, Tuple
+
+from app.core.config import settings
+from app.core.tron.http_client import TronRateLimitedError
+
+logger = logging.getLogger(__name__)
+
+
+class AdaptiveWindow:
+    """
+    동시 조회 창 크기 조절기 (AIMD)
+
+    목표 지연 시간 이내로 응답하면 창을 1씩 키우고, 느려지면 1씩 줄이며,
+    429 응답이나 오류가 나면 절반으로 줄입니다.
+    """
+
+    def __init__(
+        self,
+        min_size: int = 1,
+        max_size: Optional[int] = None,
+        initial: Optional[int] = None,
+        target_latency: Optional[float] = None,
+    ):
+        self.min_size = max(1, min_size)
+        self.max_size = max(
+            self.min_size, max_size or settings.TRON_RANGE_FETCH_CONCURRENCY
+        )
+        self.target_latency = (
+            target_latency
+            if target_latency is not None
+            else settings.TRON_RANGE_FETCH_TARGET_LATENCY
+        )
+        self._size = float(initial or max(self.min_size, self.max_size // 4))
+        self._size = min(max(self._size, self.min_size), self.max_size)
+
+    @property
+    def size(self) -> int:
+        """현재 창 크기"""
+        return int(self._size)
+
+    def on_success(self, latency: float) -> None:
+        """응답 지연 시간 반영"""
+        if latency <= self.target_latency:
+            self._size = min(self.max_size, self._size + 1)
+        else:
+            self._size = max(self.min_size, self._size - 1)
+
+    def on_throttled(self) -> None:
+        """429 응답 반영"""
+        self._size = max(self.min_size, self._size / 2)
+
+    def on_error(self) -> None:
+        """조회 오류 반영"""
+        self._size = max(self.min_size, self._size / 2)
+
+
+class BlockRangeFetcher:
+    """
+    블록 범위 병렬 조회기
+
+    조회 중인 요청 수를 창 크기 이하로 유지하면서 앞선 블록을 미리 조회하고,
+    결과는 항상 블록 번호 순서대로 전달합니다. 창 상태는 호출 간에 유지되어
+    관측된 노드 상태가 다음 조회에도 반영됩니다.
+    """
+
+    def __init__(
+        self,
+        window: Optional[AdaptiveWindow] = None,
+        max_retries: int = 3,
+        retry_delay: float = 0.5,
+    ):
+        self.window = window or AdaptiveWindow()
+        self.max_retries = max_retries
+        self.retry_delay = retry_delay
+        self.fetched = 0
+        self.throttled = 0
+        self.errors = 0
+
+    def _max_buffered(self) -> int:
+        """전달 대기 결과를 포함한 최대 선조회 블록 수"""
+        return self.window.max_size * 4
+
+    async def _fetch(self, fetch: Callable[[int], Awaitable[Any]], block_num: int):
+        """단일 블록 조회 (429 응답은 창을 줄이고 재시도)"""
+        for attempt in range(self.max_retries + 1):
+            started = time.monotonic()
+            try:
+                result = await fetch(block_num)
+            except TronRateLimitedError as e:
+                self.throttled += 1
+                self.window.on_throttled()
+                if attempt == self.max_retries:
+                    self.errors += 1
+                    raise
+                delay = e.retry_after or self.retry_delay * (2**attempt)
+                logger.debug(f"블록 {block_num} 조회 제한(429), {delay:.2f}초 후 재시도")
+                await asyncio.sleep(delay)
+            except Exception:
+                self.errors += 1
+                self.window.on_error()
+                raise
+            else:
+                self.fetched += 1
+                self.window.on_success(time.monotonic() - started)
+                return result
+
+    async def iter_range(
+        self,
+        start_block: int,
+        end_block: int,
+        fetch: Callable[[int], Awaitable[Any]],
+        return_exceptions: bool = False,
+    ) -> AsyncIterator[Tuple[int, Any]]:
+        """
+        블록 범위를 병렬 조회하여 번호 순서대로 전달
+
+        Args:
+            start_block: 시작 블록 번호 (포함)
+            end_block: 종료 블록 번호 (포함)
+            fetch: 블록 번호 → 조회 결과 코루틴 함수
+            return_exceptions: True면 조회 실패를 예외 객체로 전달,
+                False면 실패한 블록 차례에 예외 발생
+
+        Yields:
+            (블록 번호, 조회 결과)
+        """
+        tasks: Dict[int, asyncio.Task] = {}
+        next_launch = start_block
+
+        def fill(head: int) -> None:
+            nonlocal next_launch
+            in_flight = sum(1 for task in tasks.values() if not task.done())
+            while (
+                next_launch <= end_block
+                and in_flight < self.window.size
+                and next_launch - head < self._max_buffered()
+            ):
+                tasks[next_launch] = asyncio.create_task(
+                    self._fetch(fetch, next_launch)
+                )
+                next_launch += 1
+                in_flight += 1
+
+        try:
+            for block_num in range(start_block, end_block + 1):
+                fill(block_num)
+                # 현재 블록을 기다리는 동안 먼저 끝난 조회 자리에 다음 블록 투입
+                while not tasks[block_num].done():
+                    pending = [task for task in tasks.values() if not task.done()]
+                    await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                    fill(block_num)
+
+                task = tasks.pop(block_num)
+                error = task.exception()
+                if error is not None:
+                    if not return_exceptions:
+                        raise error
+                    yield block_num, error
+                else:
+                    yield block_num, task.result()
+        finally:
+            for task in tasks.values():
+                task.cancel()
+            if tasks:
+                await asyncio.gather(*tasks.values(), return_exceptions=True)
+
+    def stats(self) -> Dict[str, Any]:
+        """조회 통계"""
+        return {
+            "window": self.window.size,
+            "max_window": self.window.max_size,
+            "fetched": self.fetched,
+            "throttled": self.throttled,
+            "errors": self.errors,
+        }
+
+
+# 프로세스 공유 블록 범위 조회기
+block_range_fetcher = BlockRangeFetcher()
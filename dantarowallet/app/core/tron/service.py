@@ -4,12 +4,18 @@ TRON 통합 서비스.
 """
 
 import logging
-from typing import Any, Dict, List, Optional
+from typing import Any, Collection, Dict, List, Optional, Tuple
 
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.tron.archive import get_transfer_archive
 from app.core.tron.balance import TronBalanceService
+from app.core.tron.cache import block_cache
 from app.core.tron.network import TronNetworkService
+from app.core.tron.range_fetcher import block_range_fetcher
+from app.core.tron.singleflight import single_flight
 from app.core.tron.stats import TronNetworkStatsService
-from app.core.tron.transaction import TronTransactionService
+from app.core.tron.transaction import BlockRangeScan, TronTransactionService
 from app.core.tron.wallet import TronWalletManager
 
 logger = logging.getLogger(__name__)
@@ -88,6 +94,21 @@ class TronService:
         """여러 토큰 잔고 한번에 조회"""
         return await self._balance_service.get_multiple_balances(address, tokens)
 
+    async def get_balances_bulk(
+        self,
+        addresses: List[str],
+        tokens: Optional[List[str]] = None,
+        max_in_flight: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        """여러 주소의 잔고 동시 조회 (부분 실패 허용)"""
+        return await self._balance_service.get_balances_bulk(
+            addresses, tokens, max_in_flight
+        )
+
+    async def warm_up_contract_metadata(self, db: Optional[AsyncSession] = None) -> int:
+        """토큰 컨트랙트 메타데이터 캐시 워밍업"""
+        return await self._balance_service.warm_up_contract_metadata(db)
+
     # =============================================================================
     # 트랜잭션 관련 메서드
     # =============================================================================
@@ -100,6 +121,10 @@ class TronService:
         """트랜잭션 정보 조회 (별칭 메서드)"""
         return await self.get_transaction(tx_hash)
 
+    async def get_transaction_block_number(self, tx_hash: str) -> Optional[int]:
+        """트랜잭션 포함 블록 번호 조회 (현재 정식 체인 기준)"""
+        return await self._transaction_service.get_transaction_block_number(tx_hash)
+
     async def get_transactions_for_address(
         self,
         address: str,
@@ -112,12 +137,12 @@ class TronService:
         try:
             # 블록 범위 설정
             if end_block is None:
-                end_block = self.get_block_number()
+                end_block = await self.get_block_number()
             if start_block is None:
                 start_block = max(0, end_block - 1000)  # 최근 1000블록
 
             if token.upper() == "TRX":
-                return self.get_trx_transactions(address, start_block, end_block)
+                return await self.get_trx_transactions(address, start_block, end_block)
             else:
                 # TRC20 토큰의 경우 컨트랙트 주소 필요
                 from app.core.tron.constants import TronConstants
@@ -129,7 +154,7 @@ class TronService:
                     logger.warning(f"Unsupported token: {token}")
                     return []
 
-                return self.get_trc20_transactions(
+                return await self.get_trc20_transactions(
                     address, contract_address, start_block, end_block
                 )
 
@@ -137,26 +162,73 @@ class TronService:
             logger.error(f"Error getting transactions for address {address}: {e}")
             return []
 
-    def get_block_number(self) -> int:
+    async def get_block_number(self) -> int:
         """현재 블록 번호 조회"""
-        return self._transaction_service.get_block_number()
+        return await self._transaction_service.get_block_number()
 
-    def get_trx_transactions(
+    async def get_trx_transactions(
         self, address: str, start_block: int, end_block: int
     ) -> List[Dict[str, Any]]:
         """TRX 트랜잭션 조회"""
-        return self._transaction_service.get_trx_transactions(
+        return await self._transaction_service.get_trx_transactions(
             address, start_block, end_block
         )
 
-    def get_trc20_transactions(
+    async def get_trc20_transactions(
         self, address: str, contract_address: str, start_block: int, end_block: int
     ) -> List[Dict[str, Any]]:
         """TRC20 토큰 트랜잭션 조회"""
-        return self._transaction_service.get_trc20_transactions(
+        return await self._transaction_service.get_trc20_transactions(
             address, contract_address, start_block, end_block
         )
 
+    async def scan_range(
+        self,
+        addresses: Collection[str],
+        start_block: int,
+        end_block: int,
+        archive_shard: str = "",
+    ) -> BlockRangeScan:
+        """블록 범위 연속 스캔 (실패 블록에서 중단, 스캔 커서용)"""
+        return await self._transaction_service.scan_range(
+            addresses, start_block, end_block, archive_shard
+        )
+
+    async def fetch_block_data(self, block_num: int) -> Optional[Tuple[Any, Any]]:
+        """블록 조회 단계 (블록 캐시 항목, 영수증 목록) - 블록이 없으면 None"""
+        return await self._transaction_service._fetch_block_data(block_num)
+
+    async def get_canonical_block_id(self, block_num: int) -> Optional[str]:
+        """노드의 현재 정식 블록 ID 조회 (캐시 우회, 재편성 감지용)"""
+        return await self._transaction_service.get_canonical_block_id(block_num)
+
+    def discard_cached_blocks(self, from_block: int) -> int:
+        """해당 블록 이후 캐시 블록 폐기 (체인 재편성 시)"""
+        return block_cache.discard_from(from_block)
+
+    def decode_block_data(self, data: Tuple[Any, Any]) -> List[Dict[str, Any]]:
+        """디코딩 단계 (fetch_block_data 결과 → 전송 목록, 주소는 hex 형식)"""
+        return self._transaction_service._decode_block_data(*data)
+
+    def scan_archive(
+        self,
+        addresses: Collection[str],
+        start_block: int,
+        end_block: int,
+        archive_shard: str = "",
+    ) -> BlockRangeScan:
+        """로컬 전송 아카이브에서 블록 범위 재생 (노드 조회 없음)"""
+        return self._transaction_service.scan_archive(
+            addresses, start_block, end_block, archive_shard
+        )
+
+    def get_transfer_archive_stats(
+        self, archive_shard: str = ""
+    ) -> Optional[Dict[str, Any]]:
+        """전송 아카이브 통계 (미설정 시 None)"""
+        archive = get_transfer_archive(self.network, archive_shard)
+        return archive.stats() if archive else None
+
     # =============================================================================
     # 네트워크 상태 및 통계 메서드
     # =============================================================================
@@ -195,14 +267,34 @@ class TronService:
     # 유틸리티 메서드
     # =============================================================================
 
+    def get_block_cache_stats(self) -> Dict[str, Any]:
+        """블록 캐시 적중/미스 통계"""
+        return block_cache.stats()
+
+    def get_single_flight_stats(self) -> Dict[str, Any]:
+        """최신 블록/체인 파라미터 요청 병합 통계"""
+        return single_flight.stats()
+
+    def get_range_fetcher_stats(self) -> Dict[str, Any]:
+        """블록 범위 병렬 조회 통계 (창 크기, 429 횟수 등)"""
+        return block_range_fetcher.stats()
+
     def is_connected(self) -> bool:
-        """네트워크 연결 상태 확인"""
+        """네트워크 연결 상태 확인 (네트워크 호출 없음)"""
         return self._network_service._network_client.is_connected()
 
+    def get_connection_health(self) -> Dict[str, Any]:
+        """하트비트 및 요청 결과로 추적한 노드 상태"""
+        return self._network_service._network_client.get_health()
+
     def reconnect(self) -> None:
         """네트워크 재연결"""
         self._network_service._network_client.reconnect()
 
+    async def close(self) -> None:
+        """비동기 HTTP 연결 풀 종료"""
+        await self._network_service.http.close()
+
     @property
     def network(self):
         """현재 네트워크 반환"""
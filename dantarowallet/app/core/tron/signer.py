@@ -0,0 +1,203 @@
+"""
+TRON 배치 서명기.
+secp256k1 서명을 프로세스 풀에서 수행하여 이벤트 루프를 막지 않고
+여러 코어로 처리량을 늘립니다. 키는 워커 프로세스에서 복호화하여 보관합니다.
+"""
+
+import asyncio
+import logging
+import multiprocessing
+import os
+import time
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from coincurve import PrivateKey as CoincurvePrivateKey
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+def key_reference(encrypted_key: str, salt: str) -> str:
+    """
+    서명 키 참조 생성 ("암호문:salt", HD 입금 주소 저장 형식과 동일)
+
+    평문 키 대신 참조만 워커로 전달하고, 복호화는 워커에서 수행합니다.
+    """
+    return f"{encrypted_key}:{salt}"
+
+
+# =============================================================================
+# 워커 프로세스
+# =============================================================================
+
+# 워커별 복호화 키 캐시 (키 참조 → 서명 키)
+_worker_keys: "OrderedDict[str, CoincurvePrivateKey]" = OrderedDict()
+
+
+def _load_key(reference: str) -> CoincurvePrivateKey:
+    """키 참조 → 서명 키 (워커 LRU 캐시, 미스 시 복호화)"""
+    key = _worker_keys.get(reference)
+    if key is not None:
+        _worker_keys.move_to_end(reference)
+        return key
+
+    from app.core.encryption import EncryptionService
+
+    encrypted_key, salt = reference.rsplit(":", 1)
+    key = CoincurvePrivateKey(
+        bytes.fromhex(EncryptionService.decrypt(encrypted_key, salt))
+    )
+    _worker_keys[reference] = key
+    if len(_worker_keys) > settings.TRON_SIGNER_KEY_CACHE_SIZE:
+        _worker_keys.popitem(last=False)
+    return key
+
+
+def _sign_chunk(items: Sequence[Tuple[bytes, str]]) -> List[str]:
+    """워커: (다이제스트, 키 참조) 묶음 서명 (65바이트 r||s||v, hex)"""
+    return [
+        _load_key(reference).sign_recoverable(digest, hasher=None).hex()
+        for digest, reference in items
+    ]
+
+
+# =============================================================================
+# 배치 서명기
+# =============================================================================
+
+
+class BatchSigner:
+    """
+    프로세스 풀 배치 서명기
+
+    배치를 키 참조 순으로 묶어 청크 단위로 워커에 보내므로 키 복호화는
+    워커당 키마다 한 번만 일어납니다. 결과는 입력 순서대로 반환합니다.
+    """
+
+    def __init__(
+        self,
+        workers: Optional[int] = None,
+        chunk_size: Optional[int] = None,
+    ):
+        self.workers = workers or settings.TRON_SIGNER_WORKERS or os.cpu_count() or 1
+        self.chunk_size = max(1, chunk_size or settings.TRON_SIGNER_CHUNK_SIZE)
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self.batches = 0
+        self.signatures = 0
+        self.failures = 0
+        self.total_seconds = 0.0
+        self.last_batch: Optional[Dict[str, Any]] = None
+
+    @property
+    def executor(self) -> ProcessPoolExecutor:
+        """프로세스 풀 (최초 사용 시 생성, 스레드 안전한 spawn 방식)"""
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+            logger.info(f"배치 서명 프로세스 풀 시작: {self.workers}개 워커")
+        return self._executor
+
+    async def sign_digests(self, items: Sequence[Tuple[bytes, str]]) -> List[str]:
+        """
+        다이제스트 배치 서명
+
+        Args:
+            items: (트랜잭션 다이제스트 32바이트, 키 참조) 목록
+
+        Returns:
+            입력 순서대로 서명 목록 (hex)
+        """
+        if not items:
+            return []
+
+        started = time.monotonic()
+        order = sorted(range(len(items)), key=lambda index: items[index][1])
+        # 워커가 고르게 쓰이도록 청크 수를 워커 수 이상으로 유지
+        chunk_size = min(self.chunk_size, -(-len(items) // self.workers))
+        chunks = [order[i : i + chunk_size] for i in range(0, len(order), chunk_size)]
+
+        loop = asyncio.get_running_loop()
+        try:
+            results = await asyncio.gather(
+                *(
+                    loop.run_in_executor(
+                        self.executor, _sign_chunk, [items[index] for index in chunk]
+                    )
+                    for chunk in chunks
+                )
+            )
+        except Exception as e:
+            self.failures += 1
+            logger.error(f"배치 서명 실패 ({len(items)}건): {e}")
+            raise
+
+        signatures: List[str] = [""] * len(items)
+        for chunk, chunk_signatures in zip(chunks, results):
+            for index, signature in zip(chunk, chunk_signatures):
+                signatures[index] = signature
+
+        elapsed = time.monotonic() - started
+        self.batches += 1
+        self.signatures += len(items)
+        self.total_seconds += elapsed
+        self.last_batch = {
+            "size": len(items),
+            "chunks": len(chunks),
+            "seconds": elapsed,
+            "signatures_per_second": len(items) / elapsed if elapsed else None,
+        }
+        return signatures
+
+    async def sign_transactions(
+        self, transactions: List[Dict[str, Any]], key_references: Sequence[str]
+    ) -> List[Dict[str, Any]]:
+        """
+        트랜잭션 배치 서명 (txID 서명을 signature 필드에 추가)
+
+        Args:
+            transactions: 서명 전 트랜잭션 목록 (txID 포함)
+            key_references: 트랜잭션별 키 참조
+
+        Returns:
+            서명된 트랜잭션 목록 (입력 객체를 갱신하여 반환)
+        """
+        if len(transactions) != len(key_references):
+            raise ValueError("transactions and key_references must have same length")
+        signatures = await self.sign_digests(
+            [
+                (bytes.fromhex(tx["txID"]), reference)
+                for tx, reference in zip(transactions, key_references)
+            ]
+        )
+        for tx, signature in zip(transactions, signatures):
+            tx["signature"] = [signature]
+        return transactions
+
+    def stats(self) -> Dict[str, Any]:
+        """서명 통계"""
+        return {
+            "workers": self.workers,
+            "running": self._executor is not None,
+            "batches": self.batches,
+            "signatures": self.signatures,
+            "failures": self.failures,
+            "signatures_per_second": (
+                self.signatures / self.total_seconds if self.total_seconds else None
+            ),
+            "last_batch": self.last_batch,
+        }
+
+    def shutdown(self) -> None:
+        """프로세스 풀 종료"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
+
+
+# 프로세스 공유 배치 서명기
+batch_signer = BatchSigner()
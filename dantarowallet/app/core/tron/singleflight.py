@@ -0,0 +1,121 @@
+"""
+TRON 요청 병합 (single-flight).
+동시에 들어온 동일 요청을 하나의 노드 호출로 합치고,
+결과를 블록 생성 주기(3초)에 맞춘 짧은 TTL 동안 재사용합니다.
+"""
+
+import asyncio
+import logging
+import time
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+from app.core.config import settings
+from app.core.tron.constants import TronConstants
+
+logger = logging.getLogger(__name__)
+
+
+class SingleFlight:
+    """동일 키 동시 요청 병합 및 단기 결과 캐시"""
+
+    def __init__(self, ttl: Optional[float] = None):
+        self.ttl = ttl if ttl is not None else settings.TRON_SINGLE_FLIGHT_TTL
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self._results: Dict[str, Tuple[float, Any]] = {}
+        self.calls = 0
+        self.coalesced = 0
+        self.hits = 0
+
+    def get(self, key: str) -> Optional[Any]:
+        """유효한 캐시 결과 반환 (없으면 None)"""
+        cached = self._results.get(key)
+        if cached is None:
+            return None
+        expires_at, value = cached
+        if time.monotonic() >= expires_at:
+            self._results.pop(key, None)
+            return None
+        return value
+
+    def put(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        """결과 저장 (다른 경로에서 얻은 최신 값 공유용)"""
+        ttl = self.ttl if ttl is None else ttl
+        if ttl > 0:
+            self._results[key] = (time.monotonic() + ttl, value)
+
+    def invalidate(self, key: Optional[str] = None) -> None:
+        """캐시 무효화 (키 미지정 시 전체)"""
+        if key is None:
+            self._results.clear()
+        else:
+            self._results.pop(key, None)
+
+    async def do(
+        self,
+        key: str,
+        fn: Callable[[], Awaitable[Any]],
+        ttl: Optional[Callable[[Any], float]] = None,
+    ) -> Any:
+        """
+        요청 실행 (캐시 적중 또는 진행 중인 요청이 있으면 합류)
+
+        Args:
+            key: 요청 식별 키
+            fn: 실제 노드 호출 함수
+            ttl: 결과별 캐시 TTL 계산 함수 (기본값: 고정 TTL)
+
+        Returns:
+            요청 결과
+        """
+        cached = self.get(key)
+        if cached is not None:
+            self.hits += 1
+            return cached
+
+        future = self._inflight.get(key)
+        if future is not None:
+            self.coalesced += 1
+            # 대기자가 취소되어도 공유 요청은 계속 진행
+            return await asyncio.shield(future)
+
+        self.calls += 1
+        future = asyncio.ensure_future(fn())
+        self._inflight[key] = future
+        try:
+            result = await asyncio.shield(future)
+        finally:
+            if future.done():
+                self._inflight.pop(key, None)
+            else:
+                future.add_done_callback(lambda _: self._inflight.pop(key, None))
+
+        self.put(key, result, ttl(result) if ttl else None)
+        return result
+
+    def stats(self) -> Dict[str, Any]:
+        """병합/캐시 통계"""
+        return {
+            "upstream_calls": self.calls,
+            "coalesced": self.coalesced,
+            "cache_hits": self.hits,
+            "inflight": len(self._inflight),
+        }
+
+
+def block_ttl(block: Dict[str, Any]) -> float:
+    """
+    최신 블록 캐시 TTL (다음 블록 예상 시각까지)
+
+    블록 타임스탬프 기준으로 남은 블록 주기만큼만 캐시하여
+    새 블록이 나올 시점에 만료되도록 합니다.
+    """
+    timestamp = block.get("block_header", {}).get("raw_data", {}).get("timestamp")
+    interval = float(TronConstants.BLOCK_TIME_SECONDS)
+    if not timestamp:
+        return min(interval, single_flight.ttl)
+    remaining = timestamp / 1000 + interval - time.time()
+    return max(0.0, min(remaining, single_flight.ttl))
+
+
+# 프로세스 공유 요청 병합기
+single_flight = SingleFlight()
@@ -3,12 +3,14 @@ TRON 네트워크 통계 및 정보 서비스.
 네트워크 상태, 블록 정보, 시스템 통계를 담당합니다.
 """
 
+import asyncio
 import logging
 from datetime import datetime
-from typing import Any, Dict
+from typing import Any, Dict, List
 
 from app.core.config import settings
 from app.core.tron.network import TronNetworkService
+from app.core.tron.singleflight import single_flight
 
 logger = logging.getLogger(__name__)
 
@@ -16,19 +18,25 @@ logger = logging.getLogger(__name__)
 class TronNetworkStatsService(TronNetworkService):
     """TRON 네트워크 통계 서비스"""
 
+    async def _get_chain_parameter_list(self) -> List[Dict[str, Any]]:
+        """체인 파라미터 목록 조회 (동시 요청 병합 및 단기 캐시)"""
+        return await single_flight.do(
+            "chain_parameters", self.http.get_chain_parameters
+        )
+
+    async def _get_node_info(self) -> Dict[str, Any]:
+        """노드 정보 조회 (동시 요청 병합 및 단기 캐시)"""
+        return await single_flight.do("node_info", self.http.get_node_info)
+
     async def get_network_stats(self) -> Dict[str, Any]:
         """TRON 네트워크 전체 통계 정보"""
         try:
-            self.ensure_connection()
-
-            # 노드 정보
-            node_info = self.client.get_node_info()
-
-            # 체인 파라미터
-            chain_parameters = self.client.get_chain_parameters()
-
-            # 최신 블록 정보
-            latest_block = self.client.get_latest_block()
+            # 노드 정보, 체인 파라미터, 최신 블록 정보 동시 조회
+            node_info, chain_parameters, latest_block = await asyncio.gather(
+                self._get_node_info(),
+                self._get_chain_parameter_list(),
+                self.get_latest_block(),
+            )
 
             network_stats = {
                 "block_height": latest_block.get("block_header", {})
@@ -76,9 +84,7 @@ class TronNetworkStatsService(TronNetworkService):
     async def get_chain_parameters(self) -> Dict[str, Any]:
         """TRON 체인 파라미터 조회"""
         try:
-            self.ensure_connection()
-
-            chain_parameters = self.client.get_chain_parameters()
+            chain_parameters = await self._get_chain_parameter_list()
 
             # 파라미터를 딕셔너리로 변환
             params_dict = {}
@@ -104,9 +110,7 @@ class TronNetworkStatsService(TronNetworkService):
     async def get_node_info(self) -> Dict[str, Any]:
         """노드 정보 조회"""
         try:
-            self.ensure_connection()
-
-            node_info = self.client.get_node_info()
+            node_info = await self._get_node_info()
 
             return {
                 "node_info": node_info,
@@ -3,165 +3,813 @@ TRON 트랜잭션 조회 및 관리 서비스.
 트랜잭션 조회, 블록 스캔 등의 기능을 담당합니다.
 """
 
+import asyncio
+import hashlib
 import logging
+import time
+from contextlib import aclosing
+from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from decimal import Decimal
+from typing import Any, Collection, Container, Dict, List, Optional, Tuple
 
+from app.core.config import settings
+from app.core.tron.archive import get_transfer_archive
+from app.core.tron.cache import BlockCacheEntry, block_cache
 from app.core.tron.constants import TronConstants
+from app.core.tron.events import TransferBatch, decode_transfer_logs
 from app.core.tron.network import TronNetworkService
+from app.core.tron.range_fetcher import block_range_fetcher
+from app.core.tron.wallet import address_codec
 
 logger = logging.getLogger(__name__)
 
 
+def _hex_targets(addresses: Collection[str]) -> Container[str]:
+    """
+    블록 매칭용 hex 주소 컨테이너
+
+    주소 집합/목록(Base58)은 hex 집합으로 변환하고, 그 외 컨테이너
+    (감시 주소 인덱스 등)는 hex 주소 조회를 지원하므로 그대로 사용합니다.
+    """
+    if isinstance(addresses, (set, frozenset, list, tuple)):
+        return address_codec.hex_set(addresses)
+    return addresses
+
+
+@dataclass
+class BlockRangeScan:
+    """
+    연속 블록 스캔 결과.
+    last_block은 빠짐없이 스캔된 마지막 블록 번호입니다.
+    """
+
+    start_block: int
+    last_block: int
+    last_block_hash: Optional[str] = None
+    transfers: List[Dict[str, Any]] = field(default_factory=list)
+
+    @property
+    def scanned_blocks(self) -> int:
+        return max(0, self.last_block - self.start_block + 1)
+
+
 class TronTransactionService(TronNetworkService):
     """TRON 트랜잭션 서비스"""
 
     async def get_transaction(self, tx_hash: str) -> Optional[Dict[str, Any]]:
         """트랜잭션 정보 조회"""
         try:
-            self.ensure_connection()
-            tx = self.client.get_transaction(tx_hash)
-            return tx
+            tx = await self.http.get_transaction_by_id(tx_hash)
+            return tx or None
         except Exception as e:
             logger.error(f"Error getting transaction {tx_hash}: {e}")
             return None
 
-    def get_block_number(self) -> int:
+    async def get_transaction_block_number(self, tx_hash: str) -> Optional[int]:
+        """트랜잭션이 포함된 블록 번호 조회 (현재 정식 체인 기준, 없으면 None)"""
+        info = await self.http.get_transaction_info_by_id(tx_hash)
+        if not info or not info.get("blockNumber"):
+            return None
+        return info["blockNumber"]
+
+    async def get_block_number(self) -> int:
         """현재 블록 번호 조회"""
         try:
-            self.ensure_connection()
-            block = self.client.get_latest_block()
-            return block["block_header"]["raw_data"]["number"]
+            return await self.get_latest_block_number()
         except Exception as e:
             logger.error(f"Error getting block number: {e}")
             return 0
 
-    def get_trx_transactions(
-        self, address: str, start_block: int, end_block: int
+    async def _get_block_entry(self, block_num: int) -> Optional[BlockCacheEntry]:
+        """블록 캐시 항목 조회 (캐시 미스 시 노드에서 조회 후 저장)"""
+        entry = block_cache.get_entry(block_num)
+        if entry is None:
+            block = await self.http.get_block_by_num(block_num)
+            if not block:
+                return None
+            entry = block_cache.put(block_num, block)
+        return entry
+
+    async def get_canonical_block_id(self, block_num: int) -> Optional[str]:
+        """
+        노드의 현재 정식 블록 ID 조회 (재편성 감지용)
+
+        캐시를 거치지 않고 노드에서 조회하며, 조회한 블록으로 캐시를 갱신합니다.
+
+        Returns:
+            블록 ID (블록이 없으면 None)
+        """
+        block = await self.http.get_block_by_num(block_num)
+        if not block:
+            return None
+        block_cache.put(block_num, block)
+        return block.get("blockID")
+
+    async def get_block(self, block_num: int) -> Optional[Dict[str, Any]]:
+        """블록 번호로 블록 조회 (공용 블록 캐시 사용)"""
+        entry = await self._get_block_entry(block_num)
+        return entry.block if entry else None
+
+    async def get_block_transfers(self, block_num: int) -> List[Dict[str, Any]]:
+        """
+        블록의 디코딩된 전송 목록 조회 (블록당 한 번만 디코딩)
+
+        주소는 hex 형식이며, base58 변환은 매칭된 전송에만 수행합니다.
+        """
+        data = await self._fetch_block_data(block_num)
+        if data is None:
+            return []
+        return self._decode_block_data(*data)
+
+    async def _fetch_block_data(
+        self, block_num: int
+    ) -> Optional[Tuple[BlockCacheEntry, Optional[List[Dict[str, Any]]]]]:
+        """
+        블록 조회 단계 (블록과 필요한 경우 트랜잭션 영수증)
+
+        이미 디코딩된 블록이나 컨트랙트 호출이 없는 블록은 영수증을 조회하지 않습니다.
+
+        Returns:
+            (블록 캐시 항목, 영수증 목록) 또는 블록이 없으면 None
+        """
+        entry = await self._get_block_entry(block_num)
+        if entry is None:
+            return None
+        tx_infos = None
+        if (
+            entry.transfers is None
+            and settings.TRC20_INGESTION_MODE == "event_log"
+            and self._has_contract_calls(entry.block)
+        ):
+            tx_infos = await self.http.get_transaction_info_by_block_num(block_num)
+        return entry, tx_infos
+
+    def _decode_block_data(
+        self, entry: BlockCacheEntry, tx_infos: Optional[List[Dict[str, Any]]]
     ) -> List[Dict[str, Any]]:
-        """TRX 트랜잭션 조회"""
-        try:
-            self.ensure_connection()
-            transactions = []
+        """디코딩 단계 (결과는 블록 캐시 항목에 저장)"""
+        if entry.transfers is None:
+            contracts = TronConstants.get_contracts(self.network)
+            if settings.TRC20_INGESTION_MODE == "event_log":
+                # TRX는 블록에서, TRC20은 이벤트 로그에서 디코딩
+                transfers = self.decode_block_transfers(
+                    entry.block, contracts, include_trc20=False
+                )
+                if tx_infos:
+                    block_num = (
+                        entry.block.get("block_header", {})
+                        .get("raw_data", {})
+                        .get("number", 0)
+                    )
+                    batch = decode_transfer_logs(block_num, tx_infos, contracts)
+                    transfers.extend(batch.to_transfers(contracts))
+                entry.transfers = transfers
+            else:
+                entry.transfers = self.decode_block_transfers(entry.block, contracts)
+        return entry.transfers
 
-            # TronGrid API를 사용하여 트랜잭션 조회
-            for block_num in range(
-                start_block, min(end_block + 1, start_block + 50)
-            ):  # 한번에 최대 50블록
-                try:
-                    block = self.client.get_block(block_num)
-                    if not block or "transactions" not in block:
-                        continue
+    async def get_transfer_events(self, block_num: int) -> TransferBatch:
+        """
+        블록의 TRC20 Transfer 이벤트 조회
+
+        블록 내 모든 트랜잭션 영수증을 한 번에 조회하여
+        설정된 토큰 컨트랙트의 Transfer 이벤트를 컬럼형 배치로 반환합니다.
+        """
+        tx_infos = await self.http.get_transaction_info_by_block_num(block_num)
+        contracts = TronConstants.get_contracts(self.network)
+        return decode_transfer_logs(block_num, tx_infos, contracts)
 
-                    for tx in block["transactions"]:
-                        if "raw_data" not in tx or "contract" not in tx["raw_data"]:
+    @staticmethod
+    def _has_contract_calls(block: Dict[str, Any]) -> bool:
+        """블록에 스마트 컨트랙트 호출이 있는지 확인"""
+        for tx in block.get("transactions") or []:
+            for contract in (tx.get("raw_data") or {}).get("contract") or []:
+                if contract.get("type") == "TriggerSmartContract":
+                    return True
+        return False
+
+    @staticmethod
+    def decode_block_transfers(
+        block: Dict[str, Any], contracts: Dict[str, str], include_trc20: bool = True
+    ) -> List[Dict[str, Any]]:
+        """
+        블록 내 TRX 및 TRC20 전송을 한 번에 디코딩
+
+        주소는 hex 형식('41' 접두사, 소문자)으로 반환하여
+        디코딩 중에는 base58 인코딩을 하지 않습니다.
+
+        Args:
+            block: 블록 데이터
+            contracts: 토큰 심볼 → 컨트랙트 주소 매핑
+            include_trc20: TRC20 transfer 호출 데이터도 디코딩할지 여부
+
+        Returns:
+            전송 목록 (수신 주소 필터링 전)
+        """
+        to_hex = address_codec.to_hex
+        token_by_contract = {
+            to_hex(address): symbol for symbol, address in contracts.items()
+        }
+        header = block.get("block_header", {}).get("raw_data", {})
+        block_num = header.get("number", 0)
+        transfers = []
+
+        for tx_index, tx in enumerate(block.get("transactions") or []):
+            raw_data = tx.get("raw_data") or {}
+            ret = tx.get("ret") or [{}]
+            if ret[0].get("contractRet", "SUCCESS") != "SUCCESS":
+                continue  # 실행 실패 트랜잭션 제외
+
+            for contract in raw_data.get("contract") or []:
+                param = contract.get("parameter", {}).get("value", {})
+                contract_type = contract.get("type")
+
+                try:
+                    if contract_type == "TransferContract":
+                        token = "TRX"
+                        to_addr = param.get("to_address")
+                        value = param.get("amount", 0)
+                        if not to_addr:
                             continue
+                        to_addr = to_hex(to_addr)
+                    elif contract_type == "TriggerSmartContract" and include_trc20:
+                        token = token_by_contract.get(
+                            to_hex(param.get("contract_address", ""))
+                        )
+                        data = param.get("data", "")
+                        if (
+                            token is None
+                            or len(data) < 136
+                            or not data.startswith(
+                                TronConstants.TRC20_TRANSFER_SELECTOR
+                            )
+                        ):
+                            continue
+                        to_addr = "41" + data[32:72].lower()
+                        value = int(data[72:136], 16)
+                    else:
+                        continue
+                    from_addr = to_hex(param.get("owner_address", ""))
+                except ValueError:
+                    continue
 
-                        for contract in tx["raw_data"]["contract"]:
-                            if contract["type"] == "TransferContract":
-                                param = contract["parameter"]["value"]
-                                if param.get("to_address") and param.get("amount"):
-                                    # 주소 변환 (hex to base58)
-                                    to_addr = self.client.to_base58check_address(
-                                        param["to_address"]
-                                    )
-                                    from_addr = self.client.to_base58check_address(
-                                        param["owner_address"]
-                                    )
-
-                                    if to_addr == address:  # 수신 트랜잭션만
-                                        transactions.append(
-                                            {
-                                                "hash": tx["txID"],
-                                                "from": from_addr,
-                                                "to": to_addr,
-                                                "value": param["amount"],
-                                                "block_number": block_num,
-                                                "timestamp": tx["raw_data"][
-                                                    "timestamp"
-                                                ],
-                                                "transaction_index": 0,
-                                            }
-                                        )
-                except Exception as e:
-                    logger.warning(f"블록 {block_num} 조회 실패: {e}")
+                if not value:
                     continue
 
-            return transactions
+                decimals = TronConstants.TOKEN_DECIMALS.get(token, 6)
+                transfers.append(
+                    {
+                        "txID": tx["txID"],
+                        "hash": tx["txID"],
+                        "from": from_addr,
+                        "to": to_addr,
+                        "value": value,
+                        "amount": Decimal(value) / (10**decimals),
+                        "token": token,
+                        "contract_address": contracts.get(token),
+                        "block_number": block_num,
+                        "timestamp": raw_data.get("timestamp", header.get("timestamp")),
+                        "transaction_index": tx_index,
+                    }
+                )
 
-        except Exception as e:
-            logger.error(f"TRX 트랜잭션 조회 실패: {e}")
-            return []
+        return transfers
+
+    @staticmethod
+    def with_base58_addresses(transfer: Dict[str, Any]) -> Dict[str, Any]:
+        """hex 주소 전송을 base58 주소 전송으로 변환 (메모이제이션 사용)"""
+        return dict(
+            transfer,
+            **{
+                "from": address_codec.to_base58(transfer["from"]),
+                "to": address_codec.to_base58(transfer["to"]),
+            },
+        )
+
+    async def scan_range(
+        self,
+        addresses: Collection[str],
+        start_block: int,
+        end_block: int,
+        archive_shard: str = "",
+    ) -> BlockRangeScan:
+        """
+        블록 범위 연속 스캔 (실패하거나 아직 없는 블록에서 중단)
+
+        각 블록은 한 번만 조회/디코딩되며 수신 주소는 집합으로 매칭되므로
+        비용은 (블록 수)에만 비례하고 감시 주소 수와는 무관합니다.
+        조회에 실패한 블록을 건너뛰지 않으므로,
+        결과의 last_block까지는 누락 없이 스캔되었음이 보장됩니다.
+        영속 스캔 커서는 이 값까지만 전진해야 합니다.
+
+        Args:
+            addresses: 감시 대상 주소 집합 (Base58) 또는 hex 주소 인덱스
+            start_block: 시작 블록 번호 (포함)
+            end_block: 종료 블록 번호 (포함)
+            archive_shard: 전송 아카이브 샤드 키 (샤드 모니터만 지정)
+
+        Returns:
+            연속 스캔 결과
+        """
+        result = BlockRangeScan(start_block=start_block, last_block=start_block - 1)
+        targets = _hex_targets(addresses)
+        # 설정 시 스캔한 블록의 전송을 로컬 아카이브에 추가 (재처리/감사용)
+        archive = get_transfer_archive(self.network, archive_shard)
+        archive_all = settings.TRON_TRANSFER_ARCHIVE_SCOPE == "all"
+
+        # 블록은 병렬로 조회하고 디코딩/매칭은 블록 순서대로 수행
+        async with aclosing(
+            block_range_fetcher.iter_range(
+                start_block, end_block, self._fetch_block_data, return_exceptions=True
+            )
+        ) as blocks:
+            async for block_num, data in blocks:
+                if isinstance(data, Exception):
+                    logger.warning(f"블록 {block_num} 조회 실패, 스캔 중단: {data}")
+                    break
+                if data is None:
+                    logger.info(f"블록 {block_num}이 아직 없어 스캔을 중단합니다")
+                    break
+
+                transfers = self._decode_block_data(*data)
+                matched = (
+                    [transfer for transfer in transfers if transfer["to"] in targets]
+                    if addresses
+                    else []
+                )
+                block_id = data[0].block.get("blockID")
+                result.transfers.extend(
+                    dict(self.with_base58_addresses(transfer), block_hash=block_id)
+                    for transfer in matched
+                )
+                result.last_block = block_num
+                result.last_block_hash = block_id
+
+                if archive is not None:
+                    header = data[0].block.get("block_header", {}).get("raw_data", {})
+                    archive.append_block(
+                        block_num,
+                        result.last_block_hash,
+                        header.get("timestamp", 0),
+                        transfers if archive_all else matched,
+                    )
+
+        if archive is not None:
+            archive.flush()
+        return result
+
+    def scan_archive(
+        self,
+        addresses: Collection[str],
+        start_block: int,
+        end_block: int,
+        archive_shard: str = "",
+    ) -> BlockRangeScan:
+        """
+        로컬 전송 아카이브에서 블록 범위 재생 (노드 조회 없음)
+
+        기록되지 않은 블록에서 중단하며, 결과 형식은 scan_range와 같습니다.
+        아카이브가 설정되지 않았으면 빈 결과를 반환합니다.
+        """
+        result = BlockRangeScan(start_block=start_block, last_block=start_block - 1)
+        archive = get_transfer_archive(self.network, archive_shard)
+        if archive is None:
+            logger.warning("전송 아카이브가 설정되지 않았습니다")
+            return result
+
+        targets = _hex_targets(addresses)
+        contracts = TronConstants.get_contracts(self.network)
+        for block in archive.replay(start_block, end_block, contracts):
+            if addresses:
+                result.transfers.extend(
+                    dict(
+                        self.with_base58_addresses(transfer), block_hash=block.block_id
+                    )
+                    for transfer in block.transfers
+                    if transfer["to"] in targets
+                )
+            result.last_block = block.number
+            result.last_block_hash = block.block_id
+        return result
+
+    async def get_trx_transactions(
+        self, address: str, start_block: int, end_block: int
+    ) -> List[Dict[str, Any]]:
+        """TRX 트랜잭션 조회"""
+        return await self._get_incoming_transfers(
+            address, "TRX", None, start_block, end_block
+        )
 
-    def get_trc20_transactions(
+    async def get_trc20_transactions(
         self, address: str, contract_address: str, start_block: int, end_block: int
     ) -> List[Dict[str, Any]]:
         """TRC20 토큰 트랜잭션 조회"""
+        return await self._get_incoming_transfers(
+            address, None, contract_address, start_block, end_block
+        )
+
+    async def _get_incoming_transfers(
+        self,
+        address: str,
+        token: Optional[str],
+        contract_address: Optional[str],
+        start_block: int,
+        end_block: int,
+    ) -> List[Dict[str, Any]]:
+        """단일 주소 수신 전송 조회 (블록 병렬 조회, hex 공간 매칭)"""
         try:
-            self.ensure_connection()
-            transactions = []
+            target = address_codec.to_hex(address)
+            contracts = TronConstants.get_contracts(self.network)
+            if contract_address is not None:
+                contracts = {
+                    symbol: contract
+                    for symbol, contract in contracts.items()
+                    if contract == contract_address
+                }
+        except ValueError as e:
+            logger.error(f"트랜잭션 조회 실패: {e}")
+            return []
 
-            # TRC20 트랜잭션 조회 (간단한 구현)
-            for block_num in range(start_block, min(end_block + 1, start_block + 50)):
-                try:
-                    block = self.client.get_block(block_num)
-                    if not block or "transactions" not in block:
+        max_blocks = settings.TRON_ADDRESS_SCAN_MAX_BLOCKS
+        if end_block - start_block + 1 > max_blocks:
+            logger.warning(
+                f"주소 트랜잭션 조회 범위 {start_block}~{end_block}를 "
+                f"최근 {max_blocks}개 블록으로 제한합니다"
+            )
+            start_block = end_block - max_blocks + 1
+
+        transactions = []
+        async with aclosing(
+            block_range_fetcher.iter_range(
+                start_block, end_block, self.get_block, return_exceptions=True
+            )
+        ) as blocks:
+            async for block_num, block in blocks:
+                if isinstance(block, Exception):
+                    logger.warning(f"블록 {block_num} 조회 실패: {block}")
+                    continue
+                if not block:
+                    continue
+
+                for transfer in self.decode_block_transfers(
+                    block, contracts, include_trc20=contract_address is not None
+                ):
+                    if transfer["to"] != target:
+                        continue
+                    if token is not None and transfer["token"] != token:
                         continue
+                    if contract_address is not None and transfer["token"] == "TRX":
+                        continue
+                    transfer = self.with_base58_addresses(transfer)
+                    transactions.append(
+                        {
+                            "hash": transfer["hash"],
+                            "from": transfer["from"],
+                            "to": transfer["to"],
+                            "value": transfer["value"],
+                            "block_number": block_num,
+                            "timestamp": transfer["timestamp"],
+                            "transaction_index": transfer["transaction_index"],
+                        }
+                    )
 
-                    for tx in block["transactions"]:
-                        if "raw_data" not in tx or "contract" not in tx["raw_data"]:
-                            continue
+        return transactions
 
-                        for contract in tx["raw_data"]["contract"]:
-                            if contract["type"] == "TriggerSmartContract":
-                                param = contract["parameter"]["value"]
-                                if param.get("contract_address") == contract_address:
-                                    # TRC20 Transfer 이벤트 파싱 (간단한 구현)
-                                    data = param.get("data", "")
-                                    if (
-                                        len(data) >= 136
-                                    ):  # transfer(address,uint256) 호출 데이터
-                                        try:
-                                            # 수신 주소 추출 (24바이트 오프셋 + 20바이트 주소)
-                                            to_hex = "41" + data[32:72]
-                                            to_addr = (
-                                                self.client.to_base58check_address(
-                                                    to_hex
-                                                )
-                                            )
-
-                                            # 금액 추출 (64바이트)
-                                            amount_hex = data[72:136]
-                                            amount = int(amount_hex, 16)
-
-                                            if to_addr == address and amount > 0:
-                                                from_addr = (
-                                                    self.client.to_base58check_address(
-                                                        param["owner_address"]
-                                                    )
-                                                )
-
-                                                transactions.append(
-                                                    {
-                                                        "hash": tx["txID"],
-                                                        "from": from_addr,
-                                                        "to": to_addr,
-                                                        "value": amount,
-                                                        "block_number": block_num,
-                                                        "timestamp": tx["raw_data"][
-                                                            "timestamp"
-                                                        ],
-                                                        "transaction_index": 0,
-                                                    }
-                                                )
-                                        except:
-                                            continue
-                except Exception as e:
-                    logger.warning(f"블록 {block_num} TRC20 조회 실패: {e}")
-                    continue
 
-            return transactions
+# =============================================================================
+# 로컬 트랜잭션 빌더
+# =============================================================================
 
-        except Exception as e:
-            logger.error(f"TRC20 트랜잭션 조회 실패: {e}")
+# protocol.Transaction.Contract.ContractType
+TRANSFER_CONTRACT = 1
+TRIGGER_SMART_CONTRACT = 31
+_TYPE_URL = "type.googleapis.com/protocol."
+
+
+def _pb_varint(value: int) -> bytes:
+    """protobuf varint 인코딩 (음수는 64비트 2의 보수)"""
+    value &= 0xFFFFFFFFFFFFFFFF
+    out = bytearray()
+    while value > 0x7F:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+    return bytes(out)
+
+
+def _pb_int(field_number: int, value: int) -> bytes:
+    """varint 필드 (기본값 0은 생략)"""
+    if not value:
+        return b""
+    return _pb_varint(field_number << 3) + _pb_varint(value)
+
+
+def _pb_bytes(field_number: int, value: bytes) -> bytes:
+    """길이 구분 필드 (빈 값은 생략)"""
+    if not value:
+        return b""
+    return _pb_varint(field_number << 3 | 2) + _pb_varint(len(value)) + value
+
+
+def encode_trc20_transfer(to_address: str, value: int) -> str:
+    """TRC20 transfer(address,uint256) 호출 데이터 (ABI 인코딩, hex)"""
+    if value < 0 or value >= 1 << 256:
+        raise ValueError(f"Invalid TRC20 transfer amount: {value}")
+    # 주소 인자는 0x41 접두어를 뺀 20바이트를 32바이트로 채움
+    address = address_codec.to_bytes(to_address)[1:]
+    return (
+        TronConstants.TRC20_TRANSFER_SELECTOR
+        + address.rjust(32, b"\0").hex()
+        + value.to_bytes(32, "big").hex()
+    )
+
+
+def to_base_units(token: str, amount: Decimal) -> int:
+    """토큰 금액 → 최소 단위 정수 (소수점 이하 절사)"""
+    decimals = TronConstants.TOKEN_DECIMALS.get(token, 6)
+    return int(Decimal(str(amount)).scaleb(decimals))
+
+
+@dataclass
+class ReferenceBlock:
+    """트랜잭션 참조 블록 (TaPoS)"""
+
+    number: int
+    block_id: str
+    timestamp: int
+    fetched_at: float
+
+    @property
+    def ref_block_bytes(self) -> str:
+        """블록 번호 하위 2바이트 (hex)"""
+        return self.block_id[12:16]
+
+    @property
+    def ref_block_hash(self) -> str:
+        """블록 해시 8~16바이트 (hex)"""
+        return self.block_id[16:32]
+
+
+class TronTransactionBuilder:
+    """
+    로컬 TRON 트랜잭션 빌더
+
+    주기적으로 갱신하는 참조 블록 하나로 TRX/TRC20 전송 트랜잭션을 직접
+    직렬화하고 txID(raw_data의 sha256)를 계산합니다. 참조 블록 조회 외에는
+    노드 호출이 없으므로 배치 출금/Sweep에서 수백 건을 한 번에 만들 수 있습니다.
+    결과 형식은 노드 /wallet/createtransaction 응답과 같습니다 (서명 전).
+    """
+
+    def __init__(
+        self,
+        network_service: Optional[TronNetworkService] = None,
+        refresh_interval: Optional[float] = None,
+        expiration: Optional[float] = None,
+    ):
+        self._network_service = network_service
+        self.refresh_interval = (
+            refresh_interval
+            if refresh_interval is not None
+            else settings.TRON_REF_BLOCK_REFRESH_INTERVAL
+        )
+        self.expiration = (
+            expiration if expiration is not None else settings.TRON_TX_EXPIRATION
+        )
+        self._reference: Optional[ReferenceBlock] = None
+        self._refreshing: Optional[asyncio.Future] = None
+        self._last_timestamp = 0
+        self.refreshes = 0
+        self.built = 0
+
+    @property
+    def network_service(self) -> TronNetworkService:
+        if self._network_service is None:
+            self._network_service = TronNetworkService()
+        return self._network_service
+
+    async def _refresh(self) -> ReferenceBlock:
+        """최신 블록으로 참조 블록 갱신"""
+        block = await self.network_service.get_latest_block()
+        header = block.get("block_header", {}).get("raw_data", {})
+        self._reference = ReferenceBlock(
+            number=header.get("number", 0),
+            block_id=block["blockID"],
+            timestamp=header.get("timestamp", 0),
+            fetched_at=time.monotonic(),
+        )
+        self.refreshes += 1
+        return self._reference
+
+    async def get_reference_block(self, force: bool = False) -> ReferenceBlock:
+        """
+        참조 블록 조회 (갱신 주기 이내면 캐시 사용, 동시 갱신은 하나로 병합)
+        """
+        reference = self._reference
+        if (
+            not force
+            and reference is not None
+            and time.monotonic() - reference.fetched_at < self.refresh_interval
+        ):
+            return reference
+
+        if self._refreshing is None or self._refreshing.done():
+            self._refreshing = asyncio.ensure_future(self._refresh())
+        return await asyncio.shield(self._refreshing)
+
+    def _next_timestamp(self) -> int:
+        """생성 시각 (ms, 같은 내용의 트랜잭션도 txID가 겹치지 않도록 단조 증가)"""
+        self._last_timestamp = max(int(time.time() * 1000), self._last_timestamp + 1)
+        return self._last_timestamp
+
+    def _assemble(
+        self,
+        contract_type: str,
+        type_code: int,
+        value: Dict[str, Any],
+        encoded_value: bytes,
+        reference: ReferenceBlock,
+        fee_limit: int = 0,
+    ) -> Dict[str, Any]:
+        """raw_data 직렬화 및 txID 계산"""
+        timestamp = self._next_timestamp()
+        # 만료 시각은 노드와 같이 참조 블록 시각 기준
+        expiration = reference.timestamp + int(self.expiration * 1000)
+        type_url = _TYPE_URL + contract_type
+        contract = _pb_int(1, type_code) + _pb_bytes(
+            2, _pb_bytes(1, type_url.encode()) + _pb_bytes(2, encoded_value)
+        )
+        raw = b"".join(
+            (
+                _pb_bytes(1, bytes.fromhex(reference.ref_block_bytes)),
+                _pb_bytes(4, bytes.fromhex(reference.ref_block_hash)),
+                _pb_int(8, expiration),
+                _pb_bytes(11, contract),
+                _pb_int(14, timestamp),
+                _pb_int(18, fee_limit),
+            )
+        )
+
+        raw_data: Dict[str, Any] = {
+            "contract": [
+                {
+                    "parameter": {"value": value, "type_url": type_url},
+                    "type": contract_type,
+                }
+            ],
+            "ref_block_bytes": reference.ref_block_bytes,
+            "ref_block_hash": reference.ref_block_hash,
+            "expiration": expiration,
+            "timestamp": timestamp,
+        }
+        if fee_limit:
+            raw_data["fee_limit"] = fee_limit
+
+        self.built += 1
+        return {
+            "visible": False,
+            "txID": hashlib.sha256(raw).hexdigest(),
+            "raw_data": raw_data,
+            "raw_data_hex": raw.hex(),
+            "signature": [],
+        }
+
+    def build_trx_transfer(
+        self,
+        from_address: str,
+        to_address: str,
+        amount: int,
+        reference: ReferenceBlock,
+    ) -> Dict[str, Any]:
+        """
+        TRX 전송 트랜잭션 생성 (노드 호출 없음)
+
+        Args:
+            from_address: 보내는 주소 (hex 또는 base58)
+            to_address: 받는 주소 (hex 또는 base58)
+            amount: 전송 금액 (SUN)
+            reference: 참조 블록
+
+        Returns:
+            서명 전 트랜잭션
+        """
+        if amount <= 0:
+            raise ValueError(f"Invalid TRX transfer amount: {amount}")
+        owner = address_codec.to_bytes(from_address)
+        to = address_codec.to_bytes(to_address)
+        return self._assemble(
+            "TransferContract",
+            TRANSFER_CONTRACT,
+            {"amount": amount, "owner_address": owner.hex(), "to_address": to.hex()},
+            _pb_bytes(1, owner) + _pb_bytes(2, to) + _pb_int(3, amount),
+            reference,
+        )
+
+    def build_trc20_transfer(
+        self,
+        from_address: str,
+        to_address: str,
+        contract_address: str,
+        amount: int,
+        reference: ReferenceBlock,
+        fee_limit: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        """
+        TRC20 transfer 호출 트랜잭션 생성 (노드 호출 없음)
+
+        Args:
+            from_address: 보내는 주소 (hex 또는 base58)
+            to_address: 받는 주소 (hex 또는 base58)
+            contract_address: 토큰 컨트랙트 주소
+            amount: 전송 금액 (토큰 최소 단위)
+            reference: 참조 블록
+            fee_limit: 수수료 한도 (SUN, 기본값: TRON_DEFAULT_FEE_LIMIT)
+
+        Returns:
+            서명 전 트랜잭션
+        """
+        if amount <= 0:
+            raise ValueError(f"Invalid TRC20 transfer amount: {amount}")
+        owner = address_codec.to_bytes(from_address)
+        contract = address_codec.to_bytes(contract_address)
+        data = encode_trc20_transfer(to_address, amount)
+        return self._assemble(
+            "TriggerSmartContract",
+            TRIGGER_SMART_CONTRACT,
+            {
+                "data": data,
+                "owner_address": owner.hex(),
+                "contract_address": contract.hex(),
+            },
+            _pb_bytes(1, owner)
+            + _pb_bytes(2, contract)
+            + _pb_bytes(4, bytes.fromhex(data)),
+            reference,
+            fee_limit if fee_limit is not None else settings.TRON_DEFAULT_FEE_LIMIT,
+        )
+
+    def build_transfer(
+        self,
+        from_address: str,
+        to_address: str,
+        token: str,
+        amount: Decimal,
+        reference: ReferenceBlock,
+        contracts: Optional[Dict[str, str]] = None,
+    ) -> Dict[str, Any]:
+        """토큰 심볼/금액 기준 전송 트랜잭션 생성 (TRX 또는 TRC20)"""
+        value = to_base_units(token, amount)
+        if token == "TRX":
+            return self.build_trx_transfer(from_address, to_address, value, reference)
+        if contracts is None:
+            contracts = TronConstants.get_contracts(self.network_service.network)
+        contract_address = contracts.get(token)
+        if contract_address is None:
+            raise ValueError(f"Unsupported token: {token}")
+        return self.build_trc20_transfer(
+            from_address, to_address, contract_address, value, reference
+        )
+
+    async def build_transfers(
+        self, transfers: List[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """
+        전송 요청 일괄 생성 (참조 블록 조회 최대 1회)
+
+        Args:
+            transfers: {"from", "to", "token", "amount"} 목록
+
+        Returns:
+            요청 순서대로 서명 전 트랜잭션 목록
+        """
+        if not transfers:
             return []
+        reference = await self.get_reference_block()
+        contracts = TronConstants.get_contracts(self.network_service.network)
+        return [
+            self.build_transfer(
+                transfer["from"],
+                transfer["to"],
+                transfer["token"],
+                transfer["amount"],
+                reference,
+                contracts,
+            )
+            for transfer in transfers
+        ]
+
+    def stats(self) -> Dict[str, Any]:
+        """빌더 통계"""
+        reference = self._reference
+        return {
+            "reference_block": reference.number if reference else None,
+            "reference_age": (
+                time.monotonic() - reference.fetched_at if reference else None
+            ),
+            "refreshes": self.refreshes,
+            "built": self.built,
+        }
+
+
+# 프로세스 공유 트랜잭션 빌더
+transaction_builder = TronTransactionBuilder()
@@ -3,16 +3,126 @@ TRON 지갑 관리 서비스.
 지갑 생성, 주소 검증 등의 기능을 담당합니다.
 """
 
+import hashlib
 import logging
-from typing import Dict
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Set
 
 from tronpy.keys import PrivateKey
 
+from app.core.config import settings
 from app.core.tron.constants import TronAddressValidator, TronConstants
 from app.core.tron.network import TronNetworkService
 
 logger = logging.getLogger(__name__)
 
+BASE58_ALPHABET = "123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz"
+_BASE58_INDEX = {char: index for index, char in enumerate(BASE58_ALPHABET)}
+
+
+class TronAddressCodec:
+    """
+    TRON 주소 변환기 (base58check ↔ hex)
+
+    hex 주소는 '41' 접두사가 붙은 소문자 42자 형식을 사용합니다.
+    자주 보는 주소는 크기 제한 메모이제이션으로 체크섬 재계산을 피합니다.
+    """
+
+    def __init__(self, cache_size: Optional[int] = None):
+        maxsize = cache_size or settings.TRON_ADDRESS_CACHE_SIZE
+        self._encode = lru_cache(maxsize=maxsize)(self._encode_base58check)
+        self._decode = lru_cache(maxsize=maxsize)(self._decode_base58check)
+
+    @staticmethod
+    def _encode_base58check(hex_address: str) -> str:
+        """hex 주소를 base58check로 인코딩"""
+        raw = bytes.fromhex(hex_address)
+        if len(raw) != 21 or raw[0] != 0x41:
+            raise ValueError(f"Invalid hex address: {hex_address}")
+        checksum = hashlib.sha256(hashlib.sha256(raw).digest()).digest()[:4]
+        number = int.from_bytes(raw + checksum, "big")
+        chars = []
+        while number:
+            number, remainder = divmod(number, 58)
+            chars.append(BASE58_ALPHABET[remainder])
+        return "".join(reversed(chars))
+
+    @staticmethod
+    def _decode_base58check(address: str) -> str:
+        """base58check 주소를 hex로 디코딩 (체크섬 검증)"""
+        number = 0
+        for char in address:
+            index = _BASE58_INDEX.get(char)
+            if index is None:
+                raise ValueError(f"Invalid base58 address: {address}")
+            number = number * 58 + index
+        if number.bit_length() > 25 * 8:
+            raise ValueError(f"Invalid base58 address: {address}")
+        raw = number.to_bytes(25, "big")
+        payload, checksum = raw[:21], raw[21:]
+        if payload[0] != 0x41:
+            raise ValueError(f"Invalid TRON address prefix: {address}")
+        if hashlib.sha256(hashlib.sha256(payload).digest()).digest()[:4] != checksum:
+            raise ValueError(f"Invalid address checksum: {address}")
+        return payload.hex()
+
+    def to_hex(self, address: str) -> str:
+        """주소를 hex 형식으로 변환 (hex 입력은 정규화만 수행)"""
+        if len(address) == TronConstants.HEX_ADDRESS_LENGTH and address[:2] == "41":
+            return address.lower()
+        return self._decode(address)
+
+    def to_base58(self, address: str) -> str:
+        """주소를 base58check 형식으로 변환 (base58 입력은 그대로 반환)"""
+        if len(address) == TronConstants.ADDRESS_LENGTH and address[0] == "T":
+            return address
+        return self._encode(address.lower())
+
+    def to_bytes(self, address: str) -> bytes:
+        """
+        21바이트 주소 키 반환 (hex 또는 base58 입력)
+
+        대량 적재 시 메모이제이션 캐시를 밀어내지 않도록 캐시를 사용하지 않습니다.
+        """
+        if len(address) == TronConstants.HEX_ADDRESS_LENGTH and address[:2] == "41":
+            return bytes.fromhex(address)
+        return bytes.fromhex(self._decode_base58check(address))
+
+    def to_hex_many(self, addresses: Iterable[str]) -> List[str]:
+        """주소 목록 일괄 hex 변환"""
+        to_hex = self.to_hex
+        return [to_hex(address) for address in addresses]
+
+    def to_base58_many(self, addresses: Iterable[str]) -> List[str]:
+        """주소 목록 일괄 base58 변환"""
+        to_base58 = self.to_base58
+        return [to_base58(address) for address in addresses]
+
+    def hex_set(self, addresses: Iterable[str]) -> Set[str]:
+        """
+        hex 주소 집합 생성 (블록 매칭용)
+
+        유효하지 않은 주소는 건너뜁니다.
+        """
+        result = set()
+        for address in addresses:
+            try:
+                result.add(self.to_hex(address))
+            except ValueError:
+                logger.debug(f"Skipping invalid address: {address}")
+        return result
+
+    def cache_info(self) -> Dict[str, Dict[str, int]]:
+        """메모이제이션 통계"""
+        return {
+            "to_base58": self._encode.cache_info()._asdict(),
+            "to_hex": self._decode.cache_info()._asdict(),
+        }
+
+
+# 프로세스 공유 주소 변환기
+address_codec = TronAddressCodec()
+
 
 class TronWalletManager(TronNetworkService):
     """TRON 지갑 관리 클래스"""
@@ -71,8 +181,7 @@ class TronWalletManager(TronNetworkService):
     def hex_to_base58(self, hex_address: str) -> str:
         """Hex 주소를 Base58 주소로 변환"""
         try:
-            self.ensure_connection()
-            return self.client.to_base58check_address(hex_address)
+            return address_codec.to_base58(hex_address)
         except Exception as e:
             logger.error(f"Failed to convert hex to base58: {e}")
             raise
@@ -80,8 +189,7 @@ class TronWalletManager(TronNetworkService):
     def base58_to_hex(self, base58_address: str) -> str:
         """Base58 주소를 Hex 주소로 변환"""
         try:
-            self.ensure_connection()
-            return self.client.to_hex_address(base58_address)
+            return address_codec.to_hex(base58_address)
         except Exception as e:
             logger.error(f"Failed to convert base58 to hex: {e}")
             raise
@@ -100,10 +208,7 @@ class TronWalletManager(TronNetworkService):
             if not TronAddressValidator.is_valid_base58_address(address):
                 raise ValueError("Invalid base58 address")
 
-            # tronpy를 사용한 주소 변환
-            from tronpy.keys import to_hex_address
-
-            return to_hex_address(address)
+            return address_codec.to_hex(address)
 
         except Exception as e:
             logger.error(f"Failed to convert address to hex: {e}")
@@ -115,10 +220,7 @@ class TronWalletManager(TronNetworkService):
             if not TronAddressValidator.is_valid_hex_address(hex_address):
                 raise ValueError("Invalid hex address")
 
-            # tronpy를 사용한 주소 변환
-            from tronpy.keys import to_base58check_address
-
-            return to_base58check_address(hex_address)
+            return address_codec.to_base58(hex_address)
 
         except Exception as e:
             logger.error(f"Failed to convert hex to address: {e}")
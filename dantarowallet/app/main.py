@@ -18,15 +18,31 @@ from fastapi.templating import Jinja2Templates
 from app.api.v1.api import api_router
 from app.api.v1.endpoints.admin import optimization
 from app.core.config import settings
+from app.core.database import AsyncSessionLocal
 from app.core.exceptions import DantaroException
 from app.core.logging import setup_logging
 from app.core.optimization_manager import optimization_manager
+from app.core.tron import TronNetworkClient, TronService
 from app.middleware.admin_auth import AdminAuthMiddleware
 from app.middleware.exception import dantaro_exception_handler, global_exception_handler
 from app.middleware.logging import RequestIdAndLoggingMiddleware
 from app.middleware.rate_limit import RateLimitMiddleware
 from app.middleware.validation import RequestValidationMiddleware
-from app.services.deposit_monitoring_service import deposit_monitor
+from app.services.deposit_monitoring_service import (
+    deposit_monitor,
+    deposit_monitor_leader,
+    start_deposit_monitor_election,
+)
+from app.services.balance.flow_service import (
+    flow_reconciler_leader,
+    run_flow_reconciler,
+    start_flow_reconciler_election,
+)
+from app.services.balance.snapshot_service import (
+    balance_snapshot_leader,
+    run_balance_snapshots,
+    start_balance_snapshot_election,
+)
 
 # 로깅 설정
 logger = setup_logging()
@@ -51,19 +67,61 @@ async def lifespan(app: FastAPI):
     except Exception as e:
         logger.error(f"❌ Optimization system initialization failed: {e}")
 
+    # TRON 노드 하트비트 시작 (요청 경로에서는 연결 확인 호출을 하지 않음)
+    TronNetworkClient().start_heartbeat()
+
+    # TRC20 컨트랙트 메타데이터 캐시 워밍업
+    try:
+        async with AsyncSessionLocal() as db:
+            cached = await TronService().warm_up_contract_metadata(db)
+        logger.info(f"✅ Contract metadata cache warmed up ({cached} contracts)")
+    except Exception as e:
+        logger.warning(f"⚠️ Contract metadata warm-up failed: {e}")
+
     # 입금 모니터링 백그라운드 시작 (개발환경에서는 비활성화)
-    if not deposit_monitor.is_monitoring and not settings.DEBUG:
+    # 워커가 여러 개면 리더로 선출된 워커 하나만 모니터링을 실행
+    if settings.DEBUG:
+        logger.info("🔧 Development mode: Deposit monitoring disabled")
+    elif settings.LEADER_ELECTION_ENABLED:
+        logger.info("🗳️ Starting deposit monitor leader election...")
+        start_deposit_monitor_election()
+    elif not deposit_monitor.is_monitoring:
         logger.info("🔍 Starting deposit monitoring...")
         asyncio.create_task(deposit_monitor.start_monitoring())
-    elif settings.DEBUG:
-        logger.info("🔧 Development mode: Deposit monitoring disabled")
+
+    # 원장 일 마감 잔고 스냅샷 생성 (리더 워커 하나만 실행)
+    snapshot_task = None
+    if settings.DEBUG or not settings.BALANCE_SNAPSHOT_ENABLED:
+        logger.info("🔧 Balance snapshots disabled")
+    elif settings.LEADER_ELECTION_ENABLED:
+        start_balance_snapshot_election()
+    else:
+        snapshot_task = asyncio.create_task(run_balance_snapshots())
+
+    # 거래 흐름 카운터 대사 (리더 워커 하나만 실행)
+    reconcile_task = None
+    if settings.DEBUG or not settings.FLOW_RECONCILE_ENABLED:
+        logger.info("🔧 Transaction flow reconciler disabled")
+    elif settings.LEADER_ELECTION_ENABLED:
+        start_flow_reconciler_election()
+    else:
+        reconcile_task = asyncio.create_task(run_flow_reconciler())
 
     # FastAPI에게 "준비 완료" 신호 전달
     yield
 
     # 종료 시 작업
     logger.info("🛑 Stopping deposit monitoring...")
+    await deposit_monitor_leader.stop()
     await deposit_monitor.stop_monitoring()
+    await balance_snapshot_leader.stop()
+    if snapshot_task is not None:
+        snapshot_task.cancel()
+    await flow_reconciler_leader.stop()
+    if reconcile_task is not None:
+        reconcile_task.cancel()
+    await TronNetworkClient().stop_heartbeat()
+    await TronNetworkClient().http.close()
     logger.info(f"🛑 Shutting down {settings.APP_NAME}")
 
 
@@ -20,6 +20,10 @@ from app.models.energy_supplier_price_history import EnergySupplierPriceHistory
 from app.models.withdrawal_batch import WithdrawalBatch, BatchStatus
 from app.models.withdrawal_queue import WithdrawalQueue
 from app.models.deposit import Deposit
+from app.models.deposit_scan_cursor import DepositScanCursor
+from app.models.service_lease import ServiceLease
+from app.models.ledger import BalanceSnapshot, LedgerEntry
+from app.models.transaction_flow import TransactionFlowCounter
 from app.models.fee_config import FeeCalculationLog
 from app.models.fee_policy import (
     FeeTier,
@@ -63,6 +67,7 @@ from app.models.sweep import (
     SweepQueue,
     UserDepositAddress,
 )
+from app.models.token_contract import TokenContract
 from app.models.transaction import (
     Transaction,
     TransactionDirection,
@@ -162,4 +167,14 @@ __all__ = [
     # 새로 추가된 모델
     "WithdrawalBatch",
     "BatchStatus",
+    # TRON 인프라 모델
+    "TokenContract",
+    "DepositScanCursor",
+    # 백그라운드 작업 리더 리스
+    "ServiceLease",
+    # 원장 분개 및 잔고 스냅샷
+    "LedgerEntry",
+    "BalanceSnapshot",
+    # 거래 흐름 카운터
+    "TransactionFlowCounter",
 ]
@@ -6,7 +6,16 @@
 from decimal import Decimal
 from enum import Enum
 
-from sqlalchemy import Boolean, Column, ForeignKey, Index, Integer, Numeric, String
+from sqlalchemy import (
+    Boolean,
+    Column,
+    ForeignKey,
+    Index,
+    Integer,
+    Numeric,
+    String,
+    UniqueConstraint,
+)
 from sqlalchemy.orm import relationship
 
 from app.models.base import BaseModel
@@ -30,7 +39,9 @@ class Deposit(BaseModel):
     """
 
     # 트랜잭션 정보
-    tx_hash = Column(String(64), unique=True, nullable=False, index=True)
+    tx_hash = Column(String(64), nullable=False, index=True)
+    # 트랜잭션 내 Transfer 이벤트 로그 인덱스 (TRX 전송은 0)
+    log_index = Column(Integer, nullable=False, default=0)
     from_address = Column(String(42), nullable=False, index=True)
     to_address = Column(String(42), nullable=False, index=True)
 
@@ -41,6 +52,7 @@ class Deposit(BaseModel):
 
     # 블록 정보
     block_number = Column(Integer, nullable=False, index=True)
+    block_hash = Column(String(64), nullable=True)  # 재편성 감지용 블록 ID
     block_timestamp = Column(Integer, nullable=False)
     transaction_index = Column(Integer, nullable=False)
 
@@ -71,6 +83,8 @@ class Deposit(BaseModel):
 
     # 인덱스
     __table_args__ = (
+        # 한 트랜잭션이 여러 감시 주소로 보낸 전송은 각각 별도 입금
+        UniqueConstraint("tx_hash", "log_index", name="uq_deposit_tx_log"),
         Index("idx_deposit_status", "is_confirmed", "is_processed"),
         Index("idx_deposit_block", "block_number", "transaction_index"),
         Index("idx_deposit_user_token", "user_id", "token_symbol"),
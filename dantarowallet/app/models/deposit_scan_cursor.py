@@ -0,0 +1,38 @@
+"""
+입금 스캔 커서 모델.
+체인/토큰/샤드별로 마지막으로 스캔을 완료한 블록을 영속 저장합니다.
+"""
+
+from sqlalchemy import BigInteger, Column, Integer, String, UniqueConstraint
+
+from app.models.base import BaseModel
+
+
+class DepositScanCursor(BaseModel):
+    """
+    입금 스캔 커서 모델.
+    해당 구간에서 발견된 입금과 같은 트랜잭션으로 갱신되므로,
+    재시작 시 커서 다음 블록부터 누락/중복 없이 스캔을 재개합니다.
+    샤드 모니터는 각자의 커서를 사용하며, 비샤드 모니터의 shard는 빈 문자열입니다.
+    리더 선출 시 마지막으로 갱신한 리더의 fencing_token을 기록하여, 리스를 잃은
+    이전 리더는 커서를 갱신하지 못하고 같은 트랜잭션의 입금 기록도 롤백됩니다.
+    """
+
+    __tablename__ = "deposit_scan_cursors"  # type: ignore
+
+    network = Column(String(20), nullable=False, index=True)
+    token = Column(String(20), nullable=False)
+    last_block = Column(BigInteger, nullable=False)
+    last_block_hash = Column(String(64), nullable=True)
+    shard = Column(String(16), nullable=False, default="", server_default="")
+    fencing_token = Column(Integer, nullable=False, default=0, server_default="0")
+
+    __table_args__ = (
+        UniqueConstraint("network", "token", "shard", name="uq_deposit_scan_cursor"),
+    )
+
+    def __repr__(self) -> str:
+        return (
+            f"<DepositScanCursor(network={self.network}, token={self.token}, "
+            f"shard={self.shard!r}, last_block={self.last_block})>"
+        )
@@ -0,0 +1,90 @@
+"""
+원장 분개 모델 정의.
+모든 잔고 변경을 복식부기 분개로 추가 전용 기록하고,
+사용자/자산별 일 마감 잔고 스냅샷을 저장합니다.
+"""
+
+from decimal import Decimal
+
+from sqlalchemy import (
+    Column,
+    Date,
+    DateTime,
+    ForeignKey,
+    Index,
+    Integer,
+    Numeric,
+    String,
+    UniqueConstraint,
+)
+
+from app.models.base import BaseModel
+
+# 사용자 잔고 계정 (그 외 계정은 외부/수수료 등 시스템 상대 계정)
+USER_ACCOUNT = "user"
+
+
+class LedgerEntry(BaseModel):
+    """
+    원장 분개 항목 모델.
+    한 분개(journal_id)의 항목 금액 합은 0이며, id는 기록 순서를 나타내는
+    단조 증가 시퀀스입니다. 기록 후에는 수정하지 않습니다.
+    """
+
+    __tablename__ = "ledger_entries"  # type: ignore
+
+    journal_id = Column(String(64), nullable=False, index=True)
+    entry_type = Column(String(20), nullable=False)  # deposit, withdrawal, transfer 등
+    account = Column(String(32), nullable=False)  # user 또는 시스템 계정
+    user_id = Column(Integer, ForeignKey("users.id"), nullable=True)
+    asset = Column(String(10), nullable=False)
+    amount = Column(Numeric(precision=28, scale=8), nullable=False)  # 계정 잔고 증감
+    reference = Column(String(100), nullable=True)  # 트랜잭션 해시, 참조 ID 등
+    posted_at = Column(DateTime(timezone=True), nullable=False)
+
+    __table_args__ = (
+        Index("idx_ledger_user_asset_posted", "user_id", "asset", "posted_at"),
+        Index("idx_ledger_posted", "posted_at"),
+    )
+
+    def __repr__(self) -> str:
+        return (
+            f"<LedgerEntry(id={self.id}, journal_id={self.journal_id}, "
+            f"account={self.account}, user_id={self.user_id}, amount={self.amount})>"
+        )
+
+
+class BalanceSnapshot(BaseModel):
+    """
+    일 마감 잔고 스냅샷 모델.
+    snapshot_date(UTC) 마감 시점의 사용자/자산별 잔고와 누적 입출 합계입니다.
+    분개가 있었던 날에만 기록되며, 이전 스냅샷에 그날 분개를 더해 계산합니다.
+    """
+
+    __tablename__ = "balance_snapshots"  # type: ignore
+
+    user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
+    asset = Column(String(10), nullable=False)
+    snapshot_date = Column(Date, nullable=False, index=True)
+    balance = Column(
+        Numeric(precision=28, scale=8), nullable=False, default=Decimal("0")
+    )
+    total_in = Column(
+        Numeric(precision=28, scale=8), nullable=False, default=Decimal("0")
+    )
+    total_out = Column(
+        Numeric(precision=28, scale=8), nullable=False, default=Decimal("0")
+    )
+    last_entry_id = Column(Integer, nullable=False)  # 반영된 마지막 분개 항목 id
+
+    __table_args__ = (
+        UniqueConstraint(
+            "user_id", "asset", "snapshot_date", name="uq_balance_snapshot"
+        ),
+    )
+
+    def __repr__(self) -> str:
+        return (
+            f"<BalanceSnapshot(user_id={self.user_id}, asset={self.asset}, "
+            f"date={self.snapshot_date}, balance={self.balance})>"
+        )
@@ -133,6 +133,11 @@ class Partner(Base):
         cascade="all, delete-orphan",
     )
 
+    # 출금 배치 관계
+    withdrawal_batches = relationship(
+        "app.models.withdrawal_batch.WithdrawalBatch", back_populates="partner"
+    )
+
     # Doc-29: 온보딩 자동화 관계
     onboarding = relationship(
         "PartnerOnboarding",
@@ -0,0 +1,32 @@
+"""
+서비스 리스 모델.
+여러 워커 프로세스 중 하나만 백그라운드 작업을 실행하도록
+작업별 리더 리스를 저장합니다.
+"""
+
+from sqlalchemy import Column, DateTime, Integer, String
+
+from app.models.base import BaseModel
+
+
+class ServiceLease(BaseModel):
+    """
+    서비스 리스 모델.
+    리더는 만료 전에 리스를 갱신하고, 만료된 리스는 다른 워커가 인수합니다.
+    인수할 때마다 fencing_token이 증가합니다.
+    """
+
+    __tablename__ = "service_leases"  # type: ignore
+
+    name = Column(String(64), nullable=False, unique=True, index=True)
+    holder = Column(String(128), nullable=False)
+    fencing_token = Column(Integer, nullable=False, default=1)
+    acquired_at = Column(DateTime(timezone=True), nullable=False)
+    renewed_at = Column(DateTime(timezone=True), nullable=False)
+    expires_at = Column(DateTime(timezone=True), nullable=False)
+
+    def __repr__(self) -> str:
+        return (
+            f"<ServiceLease(name={self.name}, holder={self.holder}, "
+            f"fencing_token={self.fencing_token})>"
+        )
@@ -99,8 +99,9 @@ class UserDepositAddress(Base):
     min_sweep_amount = Column(Numeric(18, 6), comment="최소 Sweep 금액 (개별 설정)")
     priority_level = Column(Integer, default=1, comment="우선순위 (1-10)")
 
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+    # 감시 주소 인덱스 변경분 조회용 인덱스
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), index=True)
+    updated_at = Column(DateTime(timezone=True), onupdate=func.now(), index=True)
 
     # 관계 설정
     hd_wallet = relationship("HDWalletMaster", back_populates="addresses")
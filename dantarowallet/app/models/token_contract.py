@@ -0,0 +1,31 @@
+"""
+토큰 컨트랙트 메타데이터 모델.
+TRC20 컨트랙트의 ABI, 소수점, 심볼 등 변하지 않는 정보를 저장합니다.
+"""
+
+from sqlalchemy import JSON, Column, Integer, String, UniqueConstraint
+
+from app.models.base import BaseModel
+
+
+class TokenContract(BaseModel):
+    """
+    토큰 컨트랙트 메타데이터 모델.
+    프로세스 시작 시 컨트랙트 메타데이터 캐시에 적재됩니다.
+    """
+
+    __tablename__ = "token_contracts"  # type: ignore
+
+    network = Column(String(20), nullable=False, index=True)
+    address = Column(String(42), nullable=False, index=True)
+    symbol = Column(String(20), nullable=False)
+    name = Column(String(100), nullable=True)
+    decimals = Column(Integer, nullable=False)
+    abi = Column(JSON, nullable=True)
+
+    __table_args__ = (
+        UniqueConstraint("network", "address", name="uq_token_contract_address"),
+    )
+
+    def __repr__(self) -> str:
+        return f"<TokenContract(symbol={self.symbol}, address={self.address})>"
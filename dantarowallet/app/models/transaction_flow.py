@@ -0,0 +1,44 @@
+"""
+거래 흐름 카운터 모델.
+사용자/자산/방향별 완료 거래 누적 합계를 거래 기록과 같은 DB 트랜잭션에서
+증분 갱신하여, 잔고 요약이 거래 내역 전체를 집계하지 않도록 합니다.
+"""
+
+from decimal import Decimal
+
+from sqlalchemy import Column, ForeignKey, Integer, Numeric, String, UniqueConstraint
+
+from app.models.base import BaseModel
+
+
+class TransactionFlowCounter(BaseModel):
+    """
+    거래 흐름 카운터 모델.
+    완료(COMPLETED) 상태의 거래만 합산하며, 거래가 완료되거나 완료 상태에서
+    벗어날 때 증감합니다. 백그라운드 대사 작업이 거래 내역과 주기적으로 비교합니다.
+    """
+
+    __tablename__ = "transaction_flow_counters"  # type: ignore
+
+    user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
+    asset = Column(String(10), nullable=False)
+    direction = Column(String(10), nullable=False)  # in, out
+    tx_count = Column(Integer, nullable=False, default=0)
+    amount_total = Column(
+        Numeric(precision=28, scale=8), nullable=False, default=Decimal("0")
+    )
+    fee_total = Column(
+        Numeric(precision=28, scale=8), nullable=False, default=Decimal("0")
+    )
+
+    __table_args__ = (
+        UniqueConstraint(
+            "user_id", "asset", "direction", name="uq_transaction_flow_counter"
+        ),
+    )
+
+    def __repr__(self) -> str:
+        return (
+            f"<TransactionFlowCounter(user_id={self.user_id}, asset={self.asset}, "
+            f"direction={self.direction}, amount_total={self.amount_total})>"
+        )
@@ -58,6 +58,7 @@ class Wallet(BaseModel):
     __table_args__ = (
         Index("idx_wallet_user_active", "user_id", "is_active"),
         Index("idx_wallet_address_active", "address", "is_active"),
+        Index("idx_wallet_updated_at", "updated_at"),  # 감시 주소 변경분 조회
     )
 
     def __repr__(self) -> str:
@@ -53,7 +53,7 @@ class WithdrawalBatch(BaseModel):
     partner = relationship("Partner", back_populates="withdrawal_batches")
     withdrawals = relationship("WithdrawalQueue",
                              foreign_keys="[WithdrawalQueue.batch_id]",
-                             primaryjoin="WithdrawalQueue.batch_id==WithdrawalBatch.batch_id")
+                             primaryjoin="WithdrawalQueue.batch_id==app.models.withdrawal_batch.WithdrawalBatch.batch_id")
 
     def __repr__(self):
         return f"<WithdrawalBatch {self.batch_id} status={self.status.value}>"
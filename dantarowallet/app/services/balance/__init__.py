@@ -6,7 +6,10 @@
 from app.services.balance.adjustment_service import BalanceAdjustmentService
 from app.services.balance.balance_service import BalanceService
 from app.services.balance.base_service import BaseBalanceService
+from app.services.balance.flow_service import TransactionFlowService
+from app.services.balance.journal_service import LedgerJournalService
 from app.services.balance.query_service import BalanceQueryService
+from app.services.balance.snapshot_service import BalanceSnapshotService
 from app.services.balance.transaction_service import BalanceTransactionService
 from app.services.balance.transfer_service import BalanceTransferService
 
@@ -17,4 +20,7 @@ __all__ = [
     "BalanceTransferService",
     "BalanceAdjustmentService",
     "BalanceService",
+    "LedgerJournalService",
+    "BalanceSnapshotService",
+    "TransactionFlowService",
 ]
@@ -21,6 +21,8 @@ from app.models.transaction import (
     TransactionType,
 )
 from app.services.balance.base_service import BaseBalanceService
+from app.services.balance.flow_service import TransactionFlowService
+from app.services.balance.journal_service import LedgerJournalService
 
 logger = logging.getLogger(__name__)
 
@@ -75,6 +77,12 @@ class BalanceAdjustmentService(BaseBalanceService):
 
         self.db.add(tx)
         await self.db.flush()
+        await TransactionFlowService(self.db).record_completed([tx])
+
+        # 원장 분개 기록 (amount 부호 그대로)
+        await LedgerJournalService(self.db).record_balance_change(
+            user_id, asset, amount, "adjustment", f"TX-{tx.id}"
+        )
 
         logger.info(
             f"Balance adjustment: user={user_id}, amount={amount}, "
@@ -0,0 +1,368 @@
+"""
+거래 흐름 카운터 서비스
+완료 거래의 사용자/자산/방향별 누적 합계를 거래 기록과 같은 DB 트랜잭션에서
+증분 갱신하고, 백그라운드 대사 작업으로 거래 내역과 비교합니다.
+"""
+
+import asyncio
+import logging
+from decimal import Decimal
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+from sqlalchemy import delete, func, insert, select
+from sqlalchemy.dialects import postgresql, sqlite
+
+from app.core.config import settings
+from app.core.leader_election import LeaderElection
+from app.models.transaction import Transaction, TransactionDirection, TransactionStatus
+from app.models.transaction_flow import TransactionFlowCounter
+from app.models.user import User
+from app.services.balance.base_service import BaseBalanceService
+
+logger = logging.getLogger(__name__)
+
+# 카운터 대상 방향 (내부 이동은 잔고 요약에 포함하지 않음)
+FLOW_DIRECTIONS = (TransactionDirection.IN.value, TransactionDirection.OUT.value)
+
+# 대사 비교 정밀도 (Transaction.amount/fee 소수 자릿수)
+AMOUNT_QUANTUM = Decimal("0.000001")
+
+# 카운터 키: (사용자 ID, 자산, 방향) / 값: (건수, 금액 합, 수수료 합)
+FlowKey = Tuple[int, str, str]
+FlowTotals = Tuple[int, Decimal, Decimal]
+
+
+def _enum_value(value: Any) -> str:
+    """Enum 또는 문자열 상태/방향 값을 소문자 문자열로 변환"""
+    return str(getattr(value, "value", value)).lower()
+
+
+def _field(transaction: Any, key: str) -> Any:
+    """Transaction 객체 또는 같은 키의 행 dict에서 값 조회"""
+    if isinstance(transaction, dict):
+        return transaction.get(key)
+    return getattr(transaction, key, None)
+
+
+class TransactionFlowService(BaseBalanceService):
+    """거래 흐름 카운터 갱신/조회/대사 서비스"""
+
+    # =============================================================================
+    # 카운터 갱신 (거래 기록과 같은 DB 트랜잭션)
+    # =============================================================================
+
+    async def apply_changes(
+        self, changes: Iterable[Tuple[int, str, str, int, Decimal, Decimal]]
+    ) -> None:
+        """
+        카운터 일괄 증감 (커밋하지 않음, 키별 합산 후 UPSERT 한 번)
+
+        Args:
+            changes: (사용자 ID, 자산, 방향, 건수, 금액, 수수료) 증감 목록
+        """
+        totals: Dict[FlowKey, List[Any]] = {}
+        for user_id, asset, direction, count, amount, fee in changes:
+            direction = _enum_value(direction)
+            if direction not in FLOW_DIRECTIONS:
+                continue
+            total = totals.setdefault(
+                (user_id, asset, direction), [0, Decimal("0"), Decimal("0")]
+            )
+            total[0] += count
+            total[1] += amount
+            total[2] += fee
+        if not totals:
+            return
+
+        rows = [
+            {
+                "user_id": user_id,
+                "asset": asset,
+                "direction": direction,
+                "tx_count": count,
+                "amount_total": amount,
+                "fee_total": fee,
+            }
+            for (user_id, asset, direction), (count, amount, fee) in totals.items()
+        ]
+
+        table = TransactionFlowCounter.__table__
+        dialect = self.db.get_bind().dialect.name
+        if dialect in ("postgresql", "sqlite"):
+            # 행 생성과 증가를 문장 하나로 처리 (동시 첫 기록도 안전)
+            module = postgresql if dialect == "postgresql" else sqlite
+            stmt = module.insert(table)
+            stmt = stmt.on_conflict_do_update(
+                index_elements=["user_id", "asset", "direction"],
+                set_={
+                    "tx_count": table.c.tx_count + stmt.excluded.tx_count,
+                    "amount_total": table.c.amount_total + stmt.excluded.amount_total,
+                    "fee_total": table.c.fee_total + stmt.excluded.fee_total,
+                    "updated_at": func.now(),
+                },
+            )
+            await self.db.execute(stmt, rows)
+            return
+
+        # 그 외 DB는 행을 잠그고 건별 갱신
+        for row in rows:
+            result = await self.db.execute(
+                select(TransactionFlowCounter)
+                .filter(
+                    TransactionFlowCounter.user_id == row["user_id"],
+                    TransactionFlowCounter.asset == row["asset"],
+                    TransactionFlowCounter.direction == row["direction"],
+                )
+                .with_for_update()
+            )
+            counter = result.scalar_one_or_none()
+            if counter is None:
+                self.db.add(TransactionFlowCounter(**row))
+            else:
+                counter.tx_count += row["tx_count"]
+                counter.amount_total += row["amount_total"]
+                counter.fee_total += row["fee_total"]
+        await self.db.flush()
+
+    async def record_completed(
+        self, transactions: Iterable[Any], sign: int = 1
+    ) -> None:
+        """
+        완료 거래를 카운터에 반영 (커밋하지 않음)
+
+        Args:
+            transactions: Transaction 객체 또는 같은 키의 행 dict 목록
+            sign: 1이면 더하고 -1이면 뺌
+        """
+        await self.apply_changes(
+            (
+                _field(tx, "user_id"),
+                _field(tx, "asset"),
+                _field(tx, "direction"),
+                sign,
+                sign * Decimal(str(_field(tx, "amount"))),
+                sign * Decimal(str(_field(tx, "fee") or 0)),
+            )
+            for tx in transactions
+        )
+
+    async def record_status_change(
+        self, transaction: Any, previous_status: Any, new_status: Any = None
+    ) -> None:
+        """
+        거래 상태 변경 반영 (완료가 되면 더하고, 완료에서 벗어나면 뺌)
+
+        Args:
+            transaction: 상태가 바뀐 거래
+            previous_status: 변경 전 상태
+            new_status: 변경 후 상태 (기본값: transaction.status)
+        """
+        if new_status is None:
+            new_status = _field(transaction, "status")
+        completed = TransactionStatus.COMPLETED.value
+        was_completed = _enum_value(previous_status) == completed
+        is_completed = _enum_value(new_status) == completed
+        if was_completed != is_completed:
+            await self.record_completed([transaction], 1 if is_completed else -1)
+
+    # =============================================================================
+    # 조회
+    # =============================================================================
+
+    async def get_totals(self, user_id: int) -> Dict[str, Dict[str, Dict[str, Any]]]:
+        """
+        사용자 카운터 조회 (자산 수 × 방향 수 행만 읽음)
+
+        Returns:
+            자산 → 방향 → {"tx_count", "amount_total", "fee_total"}
+        """
+        result = await self.db.execute(
+            select(TransactionFlowCounter).filter(
+                TransactionFlowCounter.user_id == user_id
+            )
+        )
+        totals: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        for counter in result.scalars().all():
+            totals.setdefault(counter.asset, {})[counter.direction] = {
+                "tx_count": counter.tx_count,
+                "amount_total": Decimal(str(counter.amount_total)),
+                "fee_total": Decimal(str(counter.fee_total)),
+            }
+        return totals
+
+    # =============================================================================
+    # 대사 (거래 내역과 비교)
+    # =============================================================================
+
+    async def _raw_totals(self, user_ids: Set[int]) -> Dict[FlowKey, FlowTotals]:
+        """거래 내역에서 직접 집계한 완료 거래 합계"""
+        result = await self.db.execute(
+            select(
+                Transaction.user_id,
+                Transaction.asset,
+                Transaction.direction,
+                func.count(Transaction.id),
+                func.sum(Transaction.amount),
+                func.sum(Transaction.fee),
+            )
+            .filter(
+                Transaction.user_id.in_(user_ids),
+                Transaction.status == TransactionStatus.COMPLETED,
+                Transaction.direction.in_(
+                    [TransactionDirection.IN, TransactionDirection.OUT]
+                ),
+            )
+            .group_by(Transaction.user_id, Transaction.asset, Transaction.direction)
+        )
+        return {
+            (user_id, asset, _enum_value(direction)): (
+                count,
+                Decimal(str(amount or 0)).quantize(AMOUNT_QUANTUM),
+                Decimal(str(fee or 0)).quantize(AMOUNT_QUANTUM),
+            )
+            for user_id, asset, direction, count, amount, fee in result.all()
+        }
+
+    async def _counter_totals(
+        self, user_ids: Set[int], lock: bool = False
+    ) -> Dict[FlowKey, FlowTotals]:
+        """카운터 합계 (lock이면 행 잠금)"""
+        query = select(TransactionFlowCounter).filter(
+            TransactionFlowCounter.user_id.in_(user_ids)
+        )
+        if lock:
+            query = query.with_for_update()
+        result = await self.db.execute(query)
+        return {
+            (counter.user_id, counter.asset, counter.direction): (
+                counter.tx_count,
+                Decimal(str(counter.amount_total)).quantize(AMOUNT_QUANTUM),
+                Decimal(str(counter.fee_total)).quantize(AMOUNT_QUANTUM),
+            )
+            for counter in result.scalars().all()
+        }
+
+    @staticmethod
+    def _mismatches(
+        raw: Dict[FlowKey, FlowTotals], counters: Dict[FlowKey, FlowTotals]
+    ) -> List[FlowKey]:
+        """값이 다른 카운터 키 (0건 카운터와 없는 카운터는 같게 봄)"""
+        empty: FlowTotals = (0, Decimal("0"), Decimal("0"))
+        return [
+            key
+            for key in raw.keys() | counters.keys()
+            if raw.get(key, empty) != counters.get(key, empty)
+        ]
+
+    async def reconcile_users(self, user_ids: Sequence[int]) -> int:
+        """
+        사용자 카운터를 거래 내역과 비교하여 어긋난 카운터 교정 (커밋하지 않음)
+
+        먼저 잠금 없이 비교하고, 어긋난 사용자만 카운터 행을 잠근 뒤 다시 집계하여
+        진행 중인 거래 기록과의 일시적 차이를 불일치로 오인하지 않습니다.
+
+        Args:
+            user_ids: 대사할 사용자 ID 목록
+
+        Returns:
+            교정된 카운터 키 수
+        """
+        users = set(user_ids)
+        if not users:
+            return 0
+        drifted = {
+            key[0]
+            for key in self._mismatches(
+                await self._raw_totals(users), await self._counter_totals(users)
+            )
+        }
+        if not drifted:
+            return 0
+
+        counters = await self._counter_totals(drifted, lock=True)
+        raw = await self._raw_totals(drifted)
+        mismatches = self._mismatches(raw, counters)
+        if not mismatches:
+            return 0
+
+        for key in mismatches:
+            logger.warning(
+                f"거래 흐름 카운터 불일치 교정: {key} 카운터 {counters.get(key)} "
+                f"→ 거래 내역 {raw.get(key)}"
+            )
+        fixed_users = {key[0] for key in mismatches}
+        await self.db.execute(
+            delete(TransactionFlowCounter).where(
+                TransactionFlowCounter.user_id.in_(fixed_users)
+            )
+        )
+        rows = [
+            {
+                "user_id": user_id,
+                "asset": asset,
+                "direction": direction,
+                "tx_count": count,
+                "amount_total": amount,
+                "fee_total": fee,
+            }
+            for (user_id, asset, direction), (count, amount, fee) in raw.items()
+            if user_id in fixed_users
+        ]
+        if rows:
+            await self.db.execute(insert(TransactionFlowCounter), rows)
+        return len(mismatches)
+
+    async def reconcile(self, batch_size: Optional[int] = None) -> Dict[str, int]:
+        """
+        전체 사용자 카운터 대사 (사용자 ID 순 배치, 배치마다 커밋)
+
+        Args:
+            batch_size: 배치당 사용자 수 (기본값: FLOW_RECONCILE_BATCH_SIZE)
+
+        Returns:
+            {"users": 대사한 사용자 수, "mismatches": 교정된 카운터 키 수}
+        """
+        batch_size = batch_size or settings.FLOW_RECONCILE_BATCH_SIZE
+        stats = {"users": 0, "mismatches": 0}
+        last_id = 0
+        while True:
+            result = await self.db.execute(
+                select(User.id)
+                .filter(User.id > last_id)
+                .order_by(User.id)
+                .limit(batch_size)
+            )
+            user_ids = list(result.scalars().all())
+            if not user_ids:
+                break
+            stats["mismatches"] += await self.reconcile_users(user_ids)
+            await self.db.commit()
+            stats["users"] += len(user_ids)
+            last_id = user_ids[-1]
+        return stats
+
+
+async def run_flow_reconciler() -> None:
+    """거래 흐름 카운터 주기 대사 (리더 워커에서 실행)"""
+    from app.core.database import AsyncSessionLocal
+
+    while True:
+        try:
+            async with AsyncSessionLocal() as db:
+                stats = await TransactionFlowService(db).reconcile()
+            if stats["mismatches"]:
+                logger.warning(f"거래 흐름 카운터 대사: 불일치 교정 {stats}")
+            else:
+                logger.info(f"거래 흐름 카운터 대사 완료: {stats}")
+        except Exception as e:
+            logger.error(f"거래 흐름 카운터 대사 중 오류 발생: {e}")
+        await asyncio.sleep(settings.FLOW_RECONCILE_INTERVAL)
+
+
+# 워커 중 리더 하나만 대사 실행
+flow_reconciler_leader = LeaderElection("transaction_flow_reconciler")
+
+
+def start_flow_reconciler_election() -> None:
+    """거래 흐름 대사 리더 선출 시작 (리더가 되면 주기 대사 실행)"""
+    flow_reconciler_leader.start(run_flow_reconciler)
@@ -0,0 +1,321 @@
+"""
+원장 분개 서비스
+모든 잔고 변경을 복식부기 분개로 기록하고, 일 마감 스냅샷과 그 이후 분개만으로
+일별 잔고 이력을 조회합니다.
+"""
+
+import logging
+import uuid
+from collections import defaultdict
+from datetime import date, datetime, time, timedelta, timezone
+from decimal import Decimal
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from sqlalchemy import and_, func, insert, select
+
+from app.core.exceptions import ValidationError
+from app.models.ledger import USER_ACCOUNT, BalanceSnapshot, LedgerEntry
+from app.services.balance.base_service import BaseBalanceService
+
+logger = logging.getLogger(__name__)
+
+# 거래 유형별 상대 계정 (사용자 잔고 증감의 반대편)
+COUNTERPART_ACCOUNTS = {
+    "deposit": "external",
+    "withdrawal": "external",
+    "bonus": "bonus",
+    "adjustment": "adjustment",
+    "fee": "fee",
+}
+
+# 분개 항목: (계정, 사용자 ID, 금액)
+Leg = Tuple[str, Optional[int], Decimal]
+
+
+def _utcnow() -> datetime:
+    """분개 기록 시각 기준 (UTC)"""
+    return datetime.now(timezone.utc)
+
+
+def day_start(day: date) -> datetime:
+    """UTC 기준 하루 시작 시각"""
+    return datetime.combine(day, time.min, tzinfo=timezone.utc)
+
+
+def _as_utc(value: datetime) -> datetime:
+    """DB에서 읽은 시각을 UTC aware로 변환 (SQLite는 시간대 정보 없음)"""
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value
+
+
+class LedgerJournalService(BaseBalanceService):
+    """원장 분개 기록 및 일별 잔고 조회 서비스"""
+
+    # =============================================================================
+    # 분개 기록
+    # =============================================================================
+
+    async def post_journals(
+        self, journals: Sequence[Tuple[str, str, Sequence[Leg], Optional[str]]]
+    ) -> List[str]:
+        """
+        분개 일괄 기록 (커밋하지 않음, INSERT 한 번)
+
+        Args:
+            journals: (거래 유형, 자산, 분개 항목 목록, 참조) 목록
+
+        Returns:
+            분개 ID 목록
+
+        Raises:
+            ValidationError: 분개 항목 금액 합이 0이 아닌 경우
+        """
+        posted_at = _utcnow()
+        journal_ids = []
+        rows: List[Dict[str, Any]] = []
+        for entry_type, asset, legs, reference in journals:
+            if sum((amount for _, _, amount in legs), Decimal("0")) != 0:
+                raise ValidationError(f"Unbalanced journal: {entry_type} {asset}")
+            journal_id = uuid.uuid4().hex
+            journal_ids.append(journal_id)
+            rows.extend(
+                {
+                    "journal_id": journal_id,
+                    "entry_type": entry_type,
+                    "account": account,
+                    "user_id": user_id,
+                    "asset": asset,
+                    "amount": amount,
+                    "reference": reference,
+                    "posted_at": posted_at,
+                }
+                for account, user_id, amount in legs
+            )
+
+        if rows:
+            await self.db.execute(insert(LedgerEntry), rows)
+        return journal_ids
+
+    async def record_balance_changes(
+        self, changes: Sequence[Tuple[int, str, Decimal, str, Optional[str]]]
+    ) -> List[str]:
+        """
+        사용자 잔고 증감 일괄 분개 (사용자 계정 ↔ 거래 유형별 상대 계정)
+
+        Args:
+            changes: (사용자 ID, 자산, 증감 금액, 거래 유형, 참조) 목록
+        """
+        return await self.post_journals(
+            [
+                (
+                    entry_type,
+                    asset,
+                    [
+                        (USER_ACCOUNT, user_id, amount),
+                        (
+                            COUNTERPART_ACCOUNTS.get(entry_type, entry_type),
+                            None,
+                            -amount,
+                        ),
+                    ],
+                    reference,
+                )
+                for user_id, asset, amount, entry_type, reference in changes
+            ]
+        )
+
+    async def record_balance_change(
+        self,
+        user_id: int,
+        asset: str,
+        amount: Decimal,
+        entry_type: str,
+        reference: Optional[str] = None,
+    ) -> str:
+        """사용자 잔고 증감 분개 (입금은 양수, 차감은 음수)"""
+        [journal_id] = await self.record_balance_changes(
+            [(user_id, asset, amount, entry_type, reference)]
+        )
+        return journal_id
+
+    async def record_transfer(
+        self,
+        sender_id: int,
+        receiver_id: int,
+        asset: str,
+        amount: Decimal,
+        reference: Optional[str] = None,
+    ) -> str:
+        """내부 이체 분개 (보낸 사용자 → 받은 사용자)"""
+        [journal_id] = await self.post_journals(
+            [
+                (
+                    "transfer",
+                    asset,
+                    [
+                        (USER_ACCOUNT, sender_id, -amount),
+                        (USER_ACCOUNT, receiver_id, amount),
+                    ],
+                    reference,
+                )
+            ]
+        )
+        return journal_id
+
+    async def record_withdrawal(
+        self,
+        user_id: int,
+        asset: str,
+        amount: Decimal,
+        fee: Decimal,
+        reference: Optional[str] = None,
+    ) -> str:
+        """출금 분개 (사용자 → 외부 출금액 + 수수료 계정)"""
+        legs: List[Leg] = [
+            (USER_ACCOUNT, user_id, -(amount + fee)),
+            (COUNTERPART_ACCOUNTS["withdrawal"], None, amount),
+        ]
+        if fee:
+            legs.append((COUNTERPART_ACCOUNTS["fee"], None, fee))
+        [journal_id] = await self.post_journals(
+            [("withdrawal", asset, legs, reference)]
+        )
+        return journal_id
+
+    # =============================================================================
+    # 일별 잔고 조회 (스냅샷 + 이후 분개)
+    # =============================================================================
+
+    async def _latest_snapshots(
+        self, user_id: int, before: date, asset: Optional[str] = None
+    ) -> Dict[str, BalanceSnapshot]:
+        """자산별로 해당 날짜 이전의 마지막 스냅샷 조회"""
+        filters = [
+            BalanceSnapshot.user_id == user_id,
+            BalanceSnapshot.snapshot_date < before,
+        ]
+        if asset is not None:
+            filters.append(BalanceSnapshot.asset == asset)
+        latest = (
+            select(
+                BalanceSnapshot.asset,
+                func.max(BalanceSnapshot.snapshot_date).label("snapshot_date"),
+            )
+            .filter(*filters)
+            .group_by(BalanceSnapshot.asset)
+            .subquery()
+        )
+        result = await self.db.execute(
+            select(BalanceSnapshot)
+            .join(
+                latest,
+                and_(
+                    BalanceSnapshot.asset == latest.c.asset,
+                    BalanceSnapshot.snapshot_date == latest.c.snapshot_date,
+                ),
+            )
+            .filter(BalanceSnapshot.user_id == user_id)
+        )
+        return {snapshot.asset: snapshot for snapshot in result.scalars().all()}
+
+    async def _journal_tail(
+        self,
+        user_id: int,
+        after: Optional[date],
+        asset: Optional[str] = None,
+    ) -> List[Tuple[str, Decimal, datetime]]:
+        """
+        스냅샷 이후 사용자 분개 항목 조회
+
+        Args:
+            after: 스냅샷 날짜 (이 날짜 다음 날 0시부터, None이면 처음부터)
+
+        Returns:
+            (자산, 금액, 기록 시각) 목록
+        """
+        query = select(LedgerEntry.asset, LedgerEntry.amount, LedgerEntry.posted_at)
+        query = query.filter(
+            LedgerEntry.user_id == user_id, LedgerEntry.account == USER_ACCOUNT
+        )
+        if after is not None:
+            query = query.filter(
+                LedgerEntry.posted_at >= day_start(after + timedelta(days=1))
+            )
+        if asset is not None:
+            query = query.filter(LedgerEntry.asset == asset)
+        result = await self.db.execute(query)
+        return [
+            (row_asset, Decimal(str(amount)), _as_utc(posted_at))
+            for row_asset, amount, posted_at in result.all()
+        ]
+
+    async def get_daily_balances(
+        self, user_id: int, days: int = 30, asset: Optional[str] = None
+    ) -> List[Tuple[date, Dict[str, Decimal]]]:
+        """
+        일별 마감 잔고 이력 (오늘 포함 최근 days일)
+
+        기간 시작 전 스냅샷, 기간 내 스냅샷, 마지막 스냅샷 이후 분개만 읽습니다.
+
+        Args:
+            user_id: 사용자 ID
+            days: 조회 일수
+            asset: 자산 (None이면 전체 자산)
+
+        Returns:
+            (날짜, 자산별 마감 잔고) 목록 (날짜 오름차순, 오늘은 현재 잔고)
+        """
+        today = _utcnow().date()
+        first_day = today - timedelta(days=max(1, days) - 1)
+
+        # 기간 시작 시점 잔고
+        opening = await self._latest_snapshots(user_id, first_day, asset)
+        balances = {
+            snapshot_asset: Decimal(str(snapshot.balance))
+            for snapshot_asset, snapshot in opening.items()
+        }
+
+        # 기간 내 일 마감 스냅샷
+        filters = [
+            BalanceSnapshot.user_id == user_id,
+            BalanceSnapshot.snapshot_date >= first_day,
+        ]
+        if asset is not None:
+            filters.append(BalanceSnapshot.asset == asset)
+        result = await self.db.execute(select(BalanceSnapshot).filter(*filters))
+        closing: Dict[date, Dict[str, Decimal]] = defaultdict(dict)
+        covered: Dict[str, date] = {
+            snapshot_asset: snapshot.snapshot_date
+            for snapshot_asset, snapshot in opening.items()
+        }
+        for snapshot in result.scalars().all():
+            closing[snapshot.snapshot_date][snapshot.asset] = Decimal(
+                str(snapshot.balance)
+            )
+            covered[snapshot.asset] = max(
+                covered.get(snapshot.asset, snapshot.snapshot_date),
+                snapshot.snapshot_date,
+            )
+
+        # 마지막 스냅샷 이후 분개 (아직 스냅샷이 없는 날)
+        changes: Dict[date, Dict[str, Decimal]] = defaultdict(
+            lambda: defaultdict(Decimal)
+        )
+        after = min(covered.values(), default=None)
+        for entry_asset, amount, posted_at in await self._journal_tail(
+            user_id, after, asset=asset
+        ):
+            snapshot_date = covered.get(entry_asset)
+            if snapshot_date and posted_at.date() <= snapshot_date:
+                continue
+            changes[max(posted_at.date(), first_day)][entry_asset] += amount
+
+        history = []
+        for offset in range((today - first_day).days + 1):
+            day = first_day + timedelta(days=offset)
+            balances.update(closing.get(day, {}))
+            for entry_asset, amount in changes.get(day, {}).items():
+                balances[entry_asset] = balances.get(entry_asset, Decimal("0")) + amount
+            history.append((day, dict(balances)))
+        return history
@@ -7,12 +7,13 @@ import logging
 from decimal import Decimal
 from typing import Any, Dict, List
 
-from sqlalchemy import and_, func, select
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.balance import Balance
-from app.models.transaction import Transaction, TransactionDirection, TransactionStatus
+from app.models.transaction import Transaction
 from app.services.balance.base_service import BaseBalanceService
+from app.services.balance.flow_service import TransactionFlowService
 
 logger = logging.getLogger(__name__)
 
@@ -31,28 +32,17 @@ class BalanceQueryService(BaseBalanceService):
         # 최근 트랜잭션
         recent_txs = await self._get_recent_transactions(user_id, limit=10)
 
-        # 통계 계산
-        total_in = await self.db.execute(
-            select(func.sum(Transaction.amount)).filter(
-                and_(
-                    Transaction.user_id == user_id,
-                    Transaction.direction == TransactionDirection.IN,
-                    Transaction.status == TransactionStatus.COMPLETED,
+        # 통계 계산 (거래 흐름 카운터, 전체 자산 합계)
+        flows = await TransactionFlowService(self.db).get_totals(user_id)
+        total_in = Decimal("0")
+        total_out = Decimal("0")
+        for directions in flows.values():
+            if "in" in directions:
+                total_in += directions["in"]["amount_total"]
+            if "out" in directions:
+                total_out += (
+                    directions["out"]["amount_total"] + directions["out"]["fee_total"]
                 )
-            )
-        )
-        total_in = total_in.scalar() or Decimal("0")
-
-        total_out = await self.db.execute(
-            select(func.sum(Transaction.amount + Transaction.fee)).filter(
-                and_(
-                    Transaction.user_id == user_id,
-                    Transaction.direction == TransactionDirection.OUT,
-                    Transaction.status == TransactionStatus.COMPLETED,
-                )
-            )
-        )
-        total_out = total_out.scalar() or Decimal("0")
 
         return {
             "balances": [
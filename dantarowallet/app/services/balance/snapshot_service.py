@@ -0,0 +1,173 @@
+"""
+잔고 스냅샷 서비스
+원장 분개로부터 사용자/자산별 일 마감 잔고 스냅샷을 증분 생성합니다.
+"""
+
+import asyncio
+import logging
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+from typing import Dict, Optional, Tuple
+
+from sqlalchemy import and_, case, delete, func, insert, select
+
+from app.core.config import settings
+from app.core.leader_election import LeaderElection
+from app.models.ledger import USER_ACCOUNT, BalanceSnapshot, LedgerEntry
+from app.services.balance.base_service import BaseBalanceService
+from app.services.balance.journal_service import _as_utc, _utcnow, day_start
+
+logger = logging.getLogger(__name__)
+
+
+class BalanceSnapshotService(BaseBalanceService):
+    """일 마감 잔고 스냅샷 생성 서비스"""
+
+    async def build_day(self, day: date) -> int:
+        """
+        하루치 잔고 스냅샷 생성 (커밋하지 않음, 다시 실행하면 그날 스냅샷 교체)
+
+        그날 분개가 있는 (사용자, 자산)만 직전 스냅샷에 그날 분개 합을 더해
+        기록하므로, 비용은 전체 원장이 아니라 그날 분개 수에 비례합니다.
+
+        Args:
+            day: 스냅샷 날짜 (UTC)
+
+        Returns:
+            기록된 스냅샷 수
+        """
+        amount = LedgerEntry.amount
+        result = await self.db.execute(
+            select(
+                LedgerEntry.user_id,
+                LedgerEntry.asset,
+                func.sum(amount),
+                func.sum(case((amount > 0, amount), else_=0)),
+                func.sum(case((amount < 0, -amount), else_=0)),
+                func.max(LedgerEntry.id),
+            )
+            .filter(
+                LedgerEntry.account == USER_ACCOUNT,
+                LedgerEntry.posted_at >= day_start(day),
+                LedgerEntry.posted_at < day_start(day + timedelta(days=1)),
+            )
+            .group_by(LedgerEntry.user_id, LedgerEntry.asset)
+        )
+        daily = result.all()
+
+        await self.db.execute(
+            delete(BalanceSnapshot).where(BalanceSnapshot.snapshot_date == day)
+        )
+        if not daily:
+            return 0
+
+        # (사용자, 자산)별 직전 스냅샷
+        latest = (
+            select(
+                BalanceSnapshot.user_id,
+                BalanceSnapshot.asset,
+                func.max(BalanceSnapshot.snapshot_date).label("snapshot_date"),
+            )
+            .filter(
+                BalanceSnapshot.user_id.in_({row[0] for row in daily}),
+                BalanceSnapshot.snapshot_date < day,
+            )
+            .group_by(BalanceSnapshot.user_id, BalanceSnapshot.asset)
+            .subquery()
+        )
+        result = await self.db.execute(
+            select(BalanceSnapshot).join(
+                latest,
+                and_(
+                    BalanceSnapshot.user_id == latest.c.user_id,
+                    BalanceSnapshot.asset == latest.c.asset,
+                    BalanceSnapshot.snapshot_date == latest.c.snapshot_date,
+                ),
+            )
+        )
+        previous: Dict[Tuple[int, str], BalanceSnapshot] = {
+            (snapshot.user_id, snapshot.asset): snapshot
+            for snapshot in result.scalars().all()
+        }
+
+        def carried(prior: Optional[BalanceSnapshot], field: str) -> Decimal:
+            return Decimal(str(getattr(prior, field))) if prior else Decimal("0")
+
+        rows = []
+        for user_id, asset, change, day_in, day_out, last_entry_id in daily:
+            prior = previous.get((user_id, asset))
+            rows.append(
+                {
+                    "user_id": user_id,
+                    "asset": asset,
+                    "snapshot_date": day,
+                    "balance": carried(prior, "balance") + Decimal(str(change)),
+                    "total_in": carried(prior, "total_in") + Decimal(str(day_in)),
+                    "total_out": carried(prior, "total_out") + Decimal(str(day_out)),
+                    "last_entry_id": last_entry_id,
+                }
+            )
+        await self.db.execute(insert(BalanceSnapshot), rows)
+        return len(rows)
+
+    async def catch_up(self, now: Optional[datetime] = None) -> int:
+        """
+        마지막 스냅샷 다음 날부터 마감된 날까지 스냅샷 생성 (하루 단위 커밋)
+
+        분개가 있는 날만 찾아 생성하며, 늦게 커밋되는 분개를 위해 자정 후
+        BALANCE_SNAPSHOT_LAG초가 지난 날만 마감된 것으로 봅니다.
+
+        Args:
+            now: 기준 시각 (기본값: 현재 UTC)
+
+        Returns:
+            스냅샷을 생성한 날 수
+        """
+        now = now or _utcnow()
+        closed = (now - timedelta(seconds=settings.BALANCE_SNAPSHOT_LAG)).date()
+        end = day_start(closed)
+
+        built = await self.db.scalar(select(func.max(BalanceSnapshot.snapshot_date)))
+        cursor = day_start(built + timedelta(days=1)) if built else None
+
+        days = 0
+        while True:
+            # 다음으로 분개가 있는 날 (분개가 없는 날은 건너뜀)
+            query = select(func.min(LedgerEntry.posted_at)).filter(
+                LedgerEntry.account == USER_ACCOUNT, LedgerEntry.posted_at < end
+            )
+            if cursor is not None:
+                query = query.filter(LedgerEntry.posted_at >= cursor)
+            first = await self.db.scalar(query)
+            if first is None:
+                break
+
+            day = _as_utc(first).date()
+            count = await self.build_day(day)
+            await self.db.commit()
+            logger.info(f"잔고 스냅샷 생성: {day} ({count}건)")
+            days += 1
+            cursor = day_start(day + timedelta(days=1))
+        return days
+
+
+async def run_balance_snapshots() -> None:
+    """잔고 스냅샷 주기 생성 (리더 워커에서 실행)"""
+    from app.core.database import AsyncSessionLocal
+
+    while True:
+        try:
+            async with AsyncSessionLocal() as db:
+                await BalanceSnapshotService(db).catch_up()
+        except Exception as e:
+            logger.error(f"잔고 스냅샷 생성 중 오류 발생: {e}")
+        await asyncio.sleep(settings.BALANCE_SNAPSHOT_INTERVAL)
+
+
+# 워커 중 리더 하나만 스냅샷 생성
+balance_snapshot_leader = LeaderElection("balance_snapshots")
+
+
+def start_balance_snapshot_election() -> None:
+    """잔고 스냅샷 리더 선출 시작 (리더가 되면 주기 생성 실행)"""
+    balance_snapshot_leader.start(run_balance_snapshots)
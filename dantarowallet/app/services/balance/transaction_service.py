@@ -21,6 +21,8 @@ from app.models.transaction import (
     TransactionType,
 )
 from app.services.balance.base_service import BaseBalanceService
+from app.services.balance.flow_service import TransactionFlowService
+from app.services.balance.journal_service import LedgerJournalService
 
 logger = logging.getLogger(__name__)
 
@@ -123,6 +125,16 @@ class BalanceTransactionService(BaseBalanceService):
 
             # 변경사항 플러시
             await self.db.flush()
+            await TransactionFlowService(self.db).record_completed([transaction])
+
+            # 원장 분개 기록
+            await LedgerJournalService(self.db).record_balance_change(
+                user_id,
+                asset,
+                amount,
+                transaction.type.value,
+                f"TX-{transaction.id}",
+            )
 
             logger.info(f"잔고 증가: 사용자 {user_id}, {amount} {asset}")
 
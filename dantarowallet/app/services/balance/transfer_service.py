@@ -20,6 +20,8 @@ from app.models.transaction import (
     TransactionType,
 )
 from app.services.balance.base_service import BaseBalanceService
+from app.services.balance.flow_service import TransactionFlowService
+from app.services.balance.journal_service import LedgerJournalService
 
 logger = logging.getLogger(__name__)
 
@@ -111,6 +113,14 @@ class BalanceTransferService(BaseBalanceService):
             self.db.add(receiver_tx)
 
             await self.db.flush()
+            await TransactionFlowService(self.db).record_completed(
+                [sender_tx, receiver_tx]
+            )
+
+            # 원장 분개 기록 (보낸 사용자 → 받은 사용자)
+            await LedgerJournalService(self.db).record_transfer(
+                sender_id, receiver_id, asset, amount, reference_id
+            )
 
         # 커밋은 상위 레벨에서 처리
         logger.info(
@@ -2,7 +2,7 @@
 대시보드 관련 비즈니스 로직
 """
 
-from datetime import datetime, timedelta
+from datetime import datetime, time
 from decimal import Decimal
 from typing import Any, Dict, List
 
@@ -19,6 +19,7 @@ from app.schemas.dashboard import (
     RecentTransactionResponse,
     WalletStatsResponse,
 )
+from app.services.balance.journal_service import LedgerJournalService
 
 
 class DashboardService:
@@ -121,43 +122,25 @@ class DashboardService:
     async def get_balance_history(
         self, user_id: int, days: int = 30
     ) -> List[BalanceHistoryResponse]:
-        """잔고 변화 이력 조회"""
+        """잔고 변화 이력 조회 (원장 일 마감 스냅샷 + 이후 분개, 전체 자산 합계)"""
 
-        start_date = datetime.now() - timedelta(days=days)
-
-        # 일별 잔고 변화 계산
-        result = await self.db.execute(
-            select(
-                func.date(Balance.created_at).label("date"),
-                func.sum(Balance.amount).label("balance"),
-            )
-            .filter(Balance.user_id == user_id, Balance.created_at >= start_date)
-            .group_by(func.date(Balance.created_at))
-            .order_by("date")
+        # 첫날 변화량 계산을 위해 하루 더 조회
+        daily = await LedgerJournalService(self.db).get_daily_balances(
+            user_id, days + 1
         )
-        balance_history = result.all()
 
         response = []
-        previous_balance = Decimal("0")
-
-        for record in balance_history:
-            current_balance = record.balance or Decimal("0")
-            change = current_balance - previous_balance
-
-            # 날짜를 datetime으로 변환
-            if isinstance(record.date, str):
-                # 문자열 날짜를 datetime으로 변환
-                date_obj = datetime.strptime(record.date, "%Y-%m-%d")
-            else:
-                # 이미 datetime 객체인 경우
-                date_obj = record.date
+        previous_balance = sum(daily[0][1].values(), Decimal("0"))
 
+        for day, balances in daily[1:]:
+            current_balance = sum(balances.values(), Decimal("0"))
             response.append(
                 BalanceHistoryResponse(
-                    date=date_obj, balance=current_balance, change=change
+                    date=datetime.combine(day, time.min),
+                    balance=current_balance,
+                    change=current_balance - previous_balance,
                 )
             )
-
             previous_balance = current_balance
 
         return response
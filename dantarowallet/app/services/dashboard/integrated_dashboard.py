@@ -108,6 +108,11 @@ class IntegratedDashboard:
             result = await self.db.execute(stmt)
             wallets = result.scalars().all()
 
+            # 지갑 잔고를 한 번에 병렬 조회하여 캐시에 적재
+            await self.prefetch_wallet_balances(
+                [safe_get_value(wallet, "address", "") for wallet in wallets]
+            )
+
             total_balance = Decimal("0")
             wallet_distribution = {
                 "hot": {"balance": Decimal("0"), "percentage": 0, "wallets": []},
@@ -376,6 +381,23 @@ class IntegratedDashboard:
             return {}
 
     # 헬퍼 메서드들
+    async def prefetch_wallet_balances(self, addresses: List[str]) -> None:
+        """여러 지갑의 USDT 잔고를 대량 조회하여 잔액 캐시에 적재"""
+        addresses = [a for a in addresses if a and a not in self.balance_cache]
+        if not addresses:
+            return
+
+        try:
+            result = await self.wallet_service.tron.get_balances_bulk(
+                addresses, ["USDT"]
+            )
+        except Exception as e:
+            logger.warning(f"지갑 잔고 대량 조회 실패: {e}")
+            return
+
+        for address, balances in result["balances"].items():
+            self.balance_cache[address] = balances.get("USDT", Decimal("0"))
+
     async def get_wallet_balance(self, address: str) -> Decimal:
         """지갑 잔액 조회"""
         try:
@@ -0,0 +1,328 @@
+"""
+입금 감시 주소 인덱스
+"""
+
+import logging
+import time
+import zlib
+from array import array
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.tron.wallet import address_codec
+
+from .query_service import DepositQueryService
+
+logger = logging.getLogger(__name__)
+
+# 주소 출처 (같은 주소가 양쪽에 있으면 지갑이 우선)
+SOURCE_WALLET = 1
+SOURCE_DEPOSIT_ADDRESS = 2
+
+
+def address_shard(address: str, shard_count: int) -> int:
+    """
+    주소가 속한 샤드 번호 (hex/base58 형식과 무관하게 같은 값)
+
+    Args:
+        address: hex 또는 base58 주소
+        shard_count: 전체 샤드 수
+
+    Returns:
+        0 ~ shard_count-1 샤드 번호
+    """
+    return zlib.crc32(address_codec.to_bytes(address)) % shard_count
+
+
+class MonitoredAddressIndex:
+    """
+    감시 주소 인메모리 인덱스
+
+    주소는 21바이트 키로 저장하고 소유자 정보(user_id, wallet_id, partner_id)는
+    행 번호로 참조하는 정수 배열에 보관합니다. 블록 디코딩 결과(hex 주소)를
+    ORM 객체 없이 O(1)로 매칭하며, 변경분은 updated_at 기준으로 증분 반영합니다.
+    샤드가 지정되면 주소 해시가 그 샤드에 속하는 주소만 보관합니다.
+    """
+
+    def __init__(
+        self,
+        full_refresh_interval: Optional[float] = None,
+        overlap: Optional[float] = None,
+        shard_index: int = 0,
+        shard_count: int = 1,
+    ):
+        self.full_refresh_interval = (
+            full_refresh_interval
+            if full_refresh_interval is not None
+            else settings.DEPOSIT_ADDRESS_INDEX_FULL_REFRESH
+        )
+        self.overlap = timedelta(
+            seconds=(
+                overlap
+                if overlap is not None
+                else settings.DEPOSIT_ADDRESS_INDEX_OVERLAP
+            )
+        )
+        self.shard_index = shard_index
+        self.shard_count = max(1, shard_count)
+        self.query_service = DepositQueryService()
+        self._reset()
+        self.loaded_at: Optional[float] = None
+        self.full_refreshes = 0
+        self.incremental_refreshes = 0
+        self.applied_changes = 0
+
+    def _reset(self) -> None:
+        """저장소 초기화"""
+        self._rows: Dict[bytes, int] = {}
+        self._user_ids = array("q")
+        self._wallet_ids = array("q")  # 0이면 없음
+        self._partner_codes = array("l")  # 0이면 없음
+        self._sources = array("b")
+        self._free: List[int] = []
+        # 파트너 ID(UUID 문자열)는 정수 코드로 한 번만 저장
+        self._partners: List[Optional[str]] = [None]
+        self._partner_codes_by_id: Dict[str, int] = {}
+        self.wallet_watermark: Optional[datetime] = None
+        self.deposit_address_watermark: Optional[datetime] = None
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def __contains__(self, hex_address: object) -> bool:
+        """hex 주소 포함 여부 (블록 디코딩 매칭용)"""
+        try:
+            return bytes.fromhex(hex_address) in self._rows  # type: ignore[arg-type]
+        except (TypeError, ValueError):
+            return False
+
+    def _partner_code(self, partner_id: Optional[str]) -> int:
+        """파트너 ID → 정수 코드"""
+        if partner_id is None:
+            return 0
+        code = self._partner_codes_by_id.get(partner_id)
+        if code is None:
+            code = len(self._partners)
+            self._partners.append(partner_id)
+            self._partner_codes_by_id[partner_id] = code
+        return code
+
+    def _owns_key(self, key: bytes) -> bool:
+        """21바이트 주소 키가 이 인덱스의 샤드에 속하는지 여부"""
+        return (
+            self.shard_count == 1
+            or zlib.crc32(key) % self.shard_count == self.shard_index
+        )
+
+    def owns(self, address: str) -> bool:
+        """주소가 이 인덱스의 샤드에 속하는지 여부"""
+        try:
+            return self._owns_key(address_codec.to_bytes(address))
+        except ValueError:
+            return False
+
+    def get(self, address: str) -> Optional[Dict[str, Any]]:
+        """
+        주소 소유자 조회
+
+        Args:
+            address: hex 또는 base58 주소
+
+        Returns:
+            {"user_id", "wallet_id", "partner_id"} 또는 None
+        """
+        try:
+            row = self._rows.get(address_codec.to_bytes(address))
+        except ValueError:
+            return None
+        if row is None:
+            return None
+        return {
+            "user_id": self._user_ids[row],
+            "wallet_id": self._wallet_ids[row] or None,
+            "partner_id": self._partners[self._partner_codes[row]],
+        }
+
+    def upsert(
+        self,
+        address: str,
+        user_id: int,
+        wallet_id: Optional[int] = None,
+        partner_id: Optional[str] = None,
+        source: int = SOURCE_WALLET,
+    ) -> bool:
+        """
+        감시 주소 추가/갱신
+
+        Returns:
+            반영 여부 (유효하지 않은 주소, 다른 샤드 주소이거나 우선순위가 낮으면 False)
+        """
+        try:
+            key = address_codec.to_bytes(address)
+        except ValueError:
+            logger.debug(f"Skipping invalid monitored address: {address}")
+            return False
+        if not self._owns_key(key):
+            return False
+
+        row = self._rows.get(key)
+        if row is None:
+            if self._free:
+                row = self._free.pop()
+            else:
+                row = len(self._user_ids)
+                self._user_ids.append(0)
+                self._wallet_ids.append(0)
+                self._partner_codes.append(0)
+                self._sources.append(0)
+            self._rows[key] = row
+        elif self._sources[row] < source:
+            return False
+
+        self._user_ids[row] = user_id
+        self._wallet_ids[row] = wallet_id or 0
+        self._partner_codes[row] = self._partner_code(partner_id)
+        self._sources[row] = source
+        return True
+
+    def remove(self, address: str, source: Optional[int] = None) -> bool:
+        """
+        감시 주소 제거
+
+        source가 주어지면 같은 출처로 등록된 경우에만 제거합니다.
+        """
+        try:
+            key = address_codec.to_bytes(address)
+        except ValueError:
+            return False
+        row = self._rows.get(key)
+        if row is None or (source is not None and self._sources[row] != source):
+            return False
+        del self._rows[key]
+        self._free.append(row)
+        return True
+
+    def _apply_wallet(self, row: Any) -> None:
+        """지갑 행 반영"""
+        hex_address, user_id, wallet_id, is_active, is_monitored, updated_at = row
+        if is_active and is_monitored:
+            self.upsert(hex_address, user_id, wallet_id, None, SOURCE_WALLET)
+        else:
+            self.remove(hex_address, SOURCE_WALLET)
+        if updated_at and (
+            self.wallet_watermark is None or updated_at > self.wallet_watermark
+        ):
+            self.wallet_watermark = updated_at
+
+    def _apply_deposit_address(self, row: Any) -> None:
+        """HD 입금 주소 행 반영"""
+        address, user_id, wallet_id, partner_id, is_active, is_monitored, changed = row
+        if is_active and is_monitored:
+            self.upsert(address, user_id, wallet_id, partner_id, SOURCE_DEPOSIT_ADDRESS)
+        else:
+            self.remove(address, SOURCE_DEPOSIT_ADDRESS)
+        if changed and (
+            self.deposit_address_watermark is None
+            or changed > self.deposit_address_watermark
+        ):
+            self.deposit_address_watermark = changed
+
+    async def _load_full(self, db: AsyncSession) -> None:
+        """전체 재적재 (새 인덱스를 만든 뒤 교체)"""
+        fresh = MonitoredAddressIndex(
+            self.full_refresh_interval,
+            self.overlap.total_seconds(),
+            self.shard_index,
+            self.shard_count,
+        )
+        async for row in self.query_service.stream_monitored_wallets(db):
+            fresh._apply_wallet(row)
+        async for row in self.query_service.stream_monitored_deposit_addresses(db):
+            fresh._apply_deposit_address(row)
+
+        for name in (
+            "_rows",
+            "_user_ids",
+            "_wallet_ids",
+            "_partner_codes",
+            "_sources",
+            "_free",
+            "_partners",
+            "_partner_codes_by_id",
+            "wallet_watermark",
+            "deposit_address_watermark",
+        ):
+            setattr(self, name, getattr(fresh, name))
+        self.full_refreshes += 1
+        logger.info(f"감시 주소 인덱스 전체 적재: {len(self)}개 주소")
+
+    async def _load_changes(self, db: AsyncSession) -> int:
+        """
+        워터마크 이후 변경분 반영 (겹침 구간은 멱등하게 재적용)
+
+        워터마크가 없는 출처(적재 시 비어 있던 테이블)는 감시 대상 전체를 다시 조회합니다.
+        """
+        changes = 0
+        since = self.wallet_watermark - self.overlap if self.wallet_watermark else None
+        async for row in self.query_service.stream_monitored_wallets(db, since):
+            self._apply_wallet(row)
+            changes += 1
+
+        since = (
+            self.deposit_address_watermark - self.overlap
+            if self.deposit_address_watermark
+            else None
+        )
+        async for row in self.query_service.stream_monitored_deposit_addresses(
+            db, since
+        ):
+            self._apply_deposit_address(row)
+            changes += 1
+
+        self.incremental_refreshes += 1
+        self.applied_changes += changes
+        return changes
+
+    async def refresh(
+        self, db: AsyncSession, full: bool = False
+    ) -> "MonitoredAddressIndex":
+        """
+        인덱스 갱신
+
+        최초 호출이나 전체 재적재 주기가 지나면 전체를 적재하고,
+        그 외에는 변경분만 반영합니다. 행 삭제는 변경분으로 보이지 않으므로
+        전체 재적재 주기에 정리됩니다.
+        """
+        now = time.monotonic()
+        if (
+            full
+            or self.loaded_at is None
+            or now - self.loaded_at >= self.full_refresh_interval
+        ):
+            await self._load_full(db)
+            self.loaded_at = now
+        else:
+            await self._load_changes(db)
+        return self
+
+    def stats(self) -> Dict[str, Any]:
+        """인덱스 통계"""
+        return {
+            "addresses": len(self),
+            "shard": f"{self.shard_index}/{self.shard_count}",
+            "partners": len(self._partners) - 1,
+            "full_refreshes": self.full_refreshes,
+            "incremental_refreshes": self.incremental_refreshes,
+            "applied_changes": self.applied_changes,
+            "wallet_watermark": (
+                self.wallet_watermark.isoformat() if self.wallet_watermark else None
+            ),
+            "deposit_address_watermark": (
+                self.deposit_address_watermark.isoformat()
+                if self.deposit_address_watermark
+                else None
+            ),
+        }
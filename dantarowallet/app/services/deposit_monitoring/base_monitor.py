@@ -18,7 +18,8 @@ class BaseMonitorService:
         self.tron = TronService()
         self.is_monitoring = False
         self.monitoring_interval = 30  # 30초마다 확인
-        self.last_checked_block = None
+        self.last_checked_block = None  # 영속 스캔 커서의 메모리 사본 (상태 표시용)
+        self.is_backfilling = False
 
     async def start_monitoring(self):
         """모니터링 시작"""
@@ -42,6 +43,7 @@ class BaseMonitorService:
         """모니터링 중지"""
         logger.info("입금 모니터링 중지")
         self.is_monitoring = False
+        self.is_backfilling = False
 
     async def _monitor_deposits(self):
         """실제 모니터링 로직 - 자식 클래스에서 구현"""
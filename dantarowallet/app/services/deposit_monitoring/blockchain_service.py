@@ -4,9 +4,9 @@
 
 import logging
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Collection, Dict, List, Optional
 
-from app.core.tron import TronService
+from app.core.tron import BlockRangeScan, TronService, get_transfer_archive
 
 logger = logging.getLogger(__name__)
 
@@ -63,6 +63,45 @@ class DepositBlockchainService:
             logger.error(f"주소 {address}에 대한 트랜잭션 조회 실패: {e}")
             return []
 
+    async def scan_deposit_range(
+        self,
+        addresses: Collection[str],
+        start_block: int,
+        end_block: int,
+        from_archive: bool = False,
+        shard: str = "",
+    ) -> Optional[BlockRangeScan]:
+        """
+        블록 범위 연속 스캔 (스캔 커서 전진용)
+
+        Args:
+            addresses: 감시 대상 주소 집합 또는 감시 주소 인덱스
+            start_block: 시작 블록 번호 (포함)
+            end_block: 종료 블록 번호 (포함)
+            from_archive: True면 노드 대신 로컬 전송 아카이브에서 재생
+            shard: 입금 모니터 샤드 키 (샤드별 전송 아카이브 선택)
+
+        Returns:
+            연속 스캔 결과 (스캔 자체가 실패하면 None)
+        """
+        try:
+            if from_archive:
+                return self.tron.scan_archive(addresses, start_block, end_block, shard)
+            return await self.tron.scan_range(addresses, start_block, end_block, shard)
+        except Exception as e:
+            logger.error(f"블록 {start_block}~{end_block} 연속 스캔 실패: {e}")
+            return None
+
+    def sync_transfer_archive(self, shard: str = "") -> None:
+        """전송 아카이브 디스크 동기화 (미설정 시 무시)"""
+        archive = get_transfer_archive(self.tron.network, shard)
+        if archive is None:
+            return
+        try:
+            archive.sync()
+        except OSError as e:
+            logger.error(f"전송 아카이브 동기화 실패: {e}")
+
     async def get_transaction_by_hash(self, tx_hash: str) -> Optional[Dict[str, Any]]:
         """
         트랜잭션 해시로 트랜잭션 조회
@@ -78,3 +117,38 @@ class DepositBlockchainService:
         except Exception as e:
             logger.error(f"트랜잭션 {tx_hash} 조회 실패: {e}")
             return None
+
+    async def get_canonical_block_id(self, block_num: int) -> Optional[str]:
+        """
+        노드의 현재 정식 블록 ID 조회 (캐시 우회, 재편성 감지용)
+
+        Args:
+            block_num: 블록 번호
+
+        Returns:
+            블록 ID (조회 실패 시 None)
+        """
+        try:
+            return await self.tron.get_canonical_block_id(block_num)
+        except Exception as e:
+            logger.error(f"블록 {block_num} ID 조회 실패: {e}")
+            return None
+
+    async def get_transaction_block_number(self, tx_hash: str) -> Optional[int]:
+        """
+        트랜잭션이 현재 정식 체인에서 포함된 블록 번호 조회
+
+        Args:
+            tx_hash: 트랜잭션 해시
+
+        Returns:
+            블록 번호 (체인에 없으면 None)
+
+        Raises:
+            Exception: 노드 조회 실패 (체인에 없는 것과 구분)
+        """
+        return await self.tron.get_transaction_block_number(tx_hash)
+
+    def discard_cached_blocks(self, from_block: int) -> int:
+        """해당 블록 이후 캐시 블록 폐기 (재편성 후 재스캔용)"""
+        return self.tron.discard_cached_blocks(from_block)
@@ -0,0 +1,237 @@
+"""
+입금 확인 수 추적 서비스
+"""
+
+import logging
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
+
+from sqlalchemy import update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.models.deposit import Deposit
+
+if TYPE_CHECKING:
+    from .monitor_service import DepositMonitoringService
+
+logger = logging.getLogger(__name__)
+
+
+class DepositConfirmationTracker:
+    """
+    블록 높이 기반 대기 입금 확정
+
+    대기 입금은 기록된 블록 번호와 최신 블록의 차이로 확인 수를 계산하여
+    min_confirmations를 채우면 일괄 확정하므로, 주기당 노드 조회는 스캔 커서
+    블록의 정식 블록 ID 한 건뿐입니다. 그 ID가 커서에 저장된 해시와 다르면
+    (체인 재편성) 재편성 범위의 대기 입금만 다시 확인하고 커서를 되감습니다.
+    """
+
+    def __init__(self, monitor: "DepositMonitoringService"):
+        self.monitor = monitor
+        self.confirmed = 0
+        self.reorgs = 0
+        self.reverified = 0
+        self.orphaned = 0
+        self.last_reorg: Optional[Dict[str, Any]] = None
+
+    async def process(self, db: AsyncSession, head_block: int) -> int:
+        """
+        대기 입금 확인 수 갱신 및 확정 (재편성 감지 포함)
+
+        Args:
+            db: 데이터베이스 세션
+            head_block: 확인 수 계산 기준 최신 블록
+
+        Returns:
+            확정된 입금 수
+        """
+        monitor = self.monitor
+        pending = await monitor.query_service.get_pending_deposits(db)
+        if monitor.shard_count > 1:
+            # 다른 샤드의 입금은 그 샤드가 확정 처리
+            pending = [
+                deposit
+                for deposit in pending
+                if monitor.address_index.owns(deposit.to_address)
+            ]
+
+        reorg_block = await self.detect_reorg(db)
+        if reorg_block is not None:
+            pending = await self.handle_reorg(db, pending, reorg_block)
+            if pending is None:
+                # 재확인 실패: 재편성 구간이 확정되지 않도록 이번 주기는 건너뜀
+                return 0
+
+        if not pending:
+            return 0
+
+        ready = [
+            deposit
+            for deposit in pending
+            if deposit.block_number + deposit.min_confirmations <= head_block
+        ]
+        waiting = [
+            deposit.id
+            for deposit in pending
+            if deposit.block_number + deposit.min_confirmations > head_block
+            and deposit.block_number <= head_block
+        ]
+
+        # 확인 수는 문장 하나로 갱신 (노드 조회 없음)
+        if waiting:
+            await db.execute(
+                update(Deposit)
+                .where(Deposit.id.in_(waiting))
+                .values(confirmations=head_block - Deposit.block_number)
+                .execution_options(synchronize_session=False)
+            )
+
+        confirmed = await monitor.processing_service.confirm_deposits_batch(
+            db, ready, head_block
+        )
+        await db.commit()
+
+        self.confirmed += confirmed
+        if confirmed:
+            logger.info(
+                f"{confirmed}개의 대기 입금을 확정했습니다 "
+                f"(기준 블록 {head_block}, 대기 {len(waiting)}건)"
+            )
+        return confirmed
+
+    async def detect_reorg(self, db: AsyncSession) -> Optional[int]:
+        """
+        스캔 커서 블록 해시와 노드 정식 블록 ID 비교 (노드 조회 1건)
+
+        블록은 이전 블록 해시로 연결되므로, 커서 블록 이하에서 일어난 재편성은
+        모두 커서 블록 ID의 변경으로 드러납니다.
+
+        Returns:
+            해시가 달라진 커서 블록 번호 (재편성이 없거나 확인할 수 없으면 None)
+        """
+        monitor = self.monitor
+        cursors = await monitor.cursor_service.get_cursors(
+            db, monitor._cursor_network(), monitor._cursor_tokens(), monitor.shard_key
+        )
+        hashed = [cursor for cursor in cursors.values() if cursor.last_block_hash]
+        if not hashed:
+            return None
+
+        cursor = min(hashed, key=lambda cursor: cursor.last_block)
+        canonical = await monitor.blockchain_service.get_canonical_block_id(
+            cursor.last_block
+        )
+        if canonical is None or canonical == cursor.last_block_hash:
+            return None
+
+        logger.warning(
+            f"⚠️ 체인 재편성 감지: 블록 {cursor.last_block} "
+            f"({cursor.last_block_hash} → {canonical})"
+        )
+        return cursor.last_block
+
+    async def handle_reorg(
+        self, db: AsyncSession, pending: List[Deposit], reorg_block: int
+    ) -> Optional[List[Deposit]]:
+        """
+        재편성 범위의 대기 입금 재확인 및 스캔 커서 되감기
+
+        기록된 블록 해시가 정식 블록 ID와 다른 입금만 트랜잭션을 다시 조회하여,
+        새 포크에 포함되었으면 블록 정보를 갱신하고 없으면 입금을 삭제합니다.
+        대기 입금은 아직 잔고에 반영되지 않았으므로 삭제해도 잔고는 그대로이고,
+        트랜잭션이 다시 포함되면 재스캔에서 새로 기록됩니다.
+
+        Args:
+            db: 데이터베이스 세션
+            pending: 이 모니터가 담당하는 대기 입금 목록
+            reorg_block: 해시가 달라진 커서 블록 번호
+
+        Returns:
+            재확인 후 남은 대기 입금 목록 (노드 조회 실패 시 None)
+        """
+        monitor = self.monitor
+        blockchain_service = monitor.blockchain_service
+        rewind_to = max(0, reorg_block - settings.DEPOSIT_REORG_DEPTH)
+
+        canonical: Dict[int, Optional[str]] = {}
+
+        async def block_id(block_number: int) -> Optional[str]:
+            if block_number not in canonical:
+                found = await blockchain_service.get_canonical_block_id(block_number)
+                canonical[block_number] = found
+            return canonical[block_number]
+
+        orphaned: List[Deposit] = []
+        reverified = 0
+        for deposit in pending:
+            if deposit.block_number <= rewind_to:
+                continue
+            if deposit.block_hash and deposit.block_hash == await block_id(
+                deposit.block_number
+            ):
+                continue
+
+            try:
+                block_number = await blockchain_service.get_transaction_block_number(
+                    deposit.tx_hash
+                )
+            except Exception as e:
+                logger.error(f"재편성 입금 재확인 실패 ({deposit.tx_hash}): {e}")
+                await db.rollback()
+                return None
+
+            if block_number is None:
+                orphaned.append(deposit)
+                continue
+            deposit.block_number = block_number
+            deposit.block_hash = await block_id(block_number)
+            reverified += 1
+
+        for deposit in orphaned:
+            logger.warning(
+                f"재편성으로 사라진 대기 입금 삭제: {deposit.tx_hash} (블록 {deposit.block_number})"
+            )
+            await db.delete(deposit)
+
+        await monitor.cursor_service.rewind(
+            db,
+            monitor._cursor_network(),
+            monitor._cursor_tokens(),
+            rewind_to,
+            monitor.shard_key,
+            monitor.fencing_token,
+        )
+        await db.commit()
+
+        # 다른 포크의 블록과 삭제된 입금 해시는 재스캔 전에 폐기
+        blockchain_service.discard_cached_blocks(rewind_to + 1)
+        for deposit in orphaned:
+            monitor.recent_hashes.discard((deposit.tx_hash, deposit.log_index))
+
+        self.reorgs += 1
+        self.reverified += reverified
+        self.orphaned += len(orphaned)
+        self.last_reorg = {
+            "block": reorg_block,
+            "rewound_to": rewind_to,
+            "reverified": reverified,
+            "orphaned": len(orphaned),
+        }
+        logger.warning(
+            f"재편성 처리 완료: 커서 {reorg_block} → {rewind_to}, "
+            f"재확인 {reverified}건, 삭제 {len(orphaned)}건"
+        )
+        removed = {deposit.id for deposit in orphaned}
+        return [deposit for deposit in pending if deposit.id not in removed]
+
+    def stats(self) -> Dict[str, Any]:
+        """확인 수 추적 통계"""
+        return {
+            "confirmed": self.confirmed,
+            "reorgs": self.reorgs,
+            "reverified": self.reverified,
+            "orphaned": self.orphaned,
+            "last_reorg": self.last_reorg,
+            "reorg_depth": settings.DEPOSIT_REORG_DEPTH,
+        }
@@ -0,0 +1,187 @@
+"""
+입금 스캔 커서 서비스
+"""
+
+import logging
+from typing import Dict, List, Optional
+
+from sqlalchemy import func, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.exceptions import ConflictError
+from app.models.deposit_scan_cursor import DepositScanCursor
+
+logger = logging.getLogger(__name__)
+
+
+class DepositScanCursorService:
+    """체인/토큰/샤드별 입금 스캔 커서 관리 서비스"""
+
+    @staticmethod
+    async def get_cursors(
+        db: AsyncSession, network: str, tokens: List[str], shard: str = ""
+    ) -> Dict[str, DepositScanCursor]:
+        """
+        토큰별 스캔 커서 조회
+
+        Args:
+            db: 데이터베이스 세션
+            network: 체인 네트워크 (mainnet, nile 등)
+            tokens: 토큰 심볼 목록
+            shard: 샤드 키 (비샤드 모니터는 빈 문자열)
+
+        Returns:
+            토큰 → 커서 매핑 (없는 토큰은 제외)
+        """
+        result = await db.execute(
+            select(DepositScanCursor).filter(
+                DepositScanCursor.network == network,
+                DepositScanCursor.token.in_(tokens),
+                DepositScanCursor.shard == shard,
+            )
+        )
+        return {cursor.token: cursor for cursor in result.scalars().all()}
+
+    @staticmethod
+    async def get_resume_block(
+        db: AsyncSession, network: str, tokens: List[str], shard: str = ""
+    ) -> Optional[int]:
+        """
+        스캔 재개 기준 블록 조회
+
+        여러 토큰을 한 번에 스캔하므로 가장 뒤처진 토큰의 커서를 기준으로
+        재개합니다. 커서가 하나도 없으면 None을 반환합니다.
+        """
+        cursors = await DepositScanCursorService.get_cursors(db, network, tokens, shard)
+        if not cursors:
+            return None
+        return min(cursor.last_block for cursor in cursors.values())
+
+    @staticmethod
+    async def get_lowest_block(
+        db: AsyncSession, network: str, tokens: List[str]
+    ) -> Optional[int]:
+        """
+        모든 샤드 중 가장 뒤처진 커서 블록 조회
+
+        샤드 구성이 바뀌어 새 샤드 커서를 만들 때 기준으로 사용합니다.
+        이전 구성의 어떤 샤드보다도 앞서지 않으므로 누락 구간이 생기지 않고,
+        다시 스캔하는 구간의 입금은 트랜잭션 해시로 중복 제거됩니다.
+        """
+        return await db.scalar(
+            select(func.min(DepositScanCursor.last_block)).filter(
+                DepositScanCursor.network == network,
+                DepositScanCursor.token.in_(tokens),
+            )
+        )
+
+    @staticmethod
+    async def _fence(
+        db: AsyncSession,
+        cursors: Dict[str, DepositScanCursor],
+        fencing_token: Optional[int],
+    ) -> None:
+        """
+        리더 fencing_token 확인 (커밋하지 않음)
+
+        커서에 기록된 토큰보다 작지 않을 때만 조건부 UPDATE로 토큰을 기록합니다.
+        UPDATE가 잡은 행 잠금은 커밋까지 유지되므로, 새 리더가 먼저 커서를
+        갱신했다면 이전 리더의 트랜잭션은 ConflictError로 중단됩니다.
+        """
+        if fencing_token is None or not cursors:
+            return
+        result = await db.execute(
+            update(DepositScanCursor)
+            .where(
+                DepositScanCursor.id.in_([cursor.id for cursor in cursors.values()]),
+                DepositScanCursor.fencing_token <= fencing_token,
+            )
+            .values(fencing_token=fencing_token)
+        )
+        if result.rowcount != len(cursors):
+            raise ConflictError(
+                f"입금 스캔 커서가 새 리더에게 넘어갔습니다 (fencing_token={fencing_token})"
+            )
+
+    @staticmethod
+    async def claim(
+        db: AsyncSession,
+        network: str,
+        tokens: List[str],
+        shard: str = "",
+        fencing_token: Optional[int] = None,
+    ) -> None:
+        """
+        구간 처리 전 스캔 커서 선점 (커밋하지 않음)
+
+        입금을 기록하기 전에 호출하여, 리스를 잃은 이전 리더는 아무것도
+        기록하지 않고 중단되며 새 리더와의 동시 갱신은 커밋까지 직렬화됩니다.
+        """
+        if fencing_token is None:
+            return
+        cursors = await DepositScanCursorService.get_cursors(db, network, tokens, shard)
+        await DepositScanCursorService._fence(db, cursors, fencing_token)
+
+    @staticmethod
+    async def advance(
+        db: AsyncSession,
+        network: str,
+        tokens: List[str],
+        block_number: int,
+        block_hash: Optional[str] = None,
+        shard: str = "",
+        fencing_token: Optional[int] = None,
+    ) -> None:
+        """
+        스캔 커서 전진 (커밋하지 않음)
+
+        호출자가 같은 구간의 입금 기록과 함께 커밋해야 합니다.
+        커서는 뒤로 이동하지 않으며, 없는 토큰의 커서는 새로 생성합니다.
+        fencing_token이 주어지면 더 새로운 리더가 갱신한 커서는 전진하지 않고
+        ConflictError를 발생시킵니다.
+        """
+        cursors = await DepositScanCursorService.get_cursors(db, network, tokens, shard)
+        await DepositScanCursorService._fence(db, cursors, fencing_token)
+
+        for token in tokens:
+            cursor = cursors.get(token)
+            if cursor is None:
+                db.add(
+                    DepositScanCursor(
+                        network=network,
+                        token=token,
+                        last_block=block_number,
+                        last_block_hash=block_hash,
+                        shard=shard,
+                        fencing_token=fencing_token or 0,
+                    )
+                )
+            elif block_number > cursor.last_block:
+                cursor.last_block = block_number
+                cursor.last_block_hash = block_hash
+
+        await db.flush()
+
+    @staticmethod
+    async def rewind(
+        db: AsyncSession,
+        network: str,
+        tokens: List[str],
+        block_number: int,
+        shard: str = "",
+        fencing_token: Optional[int] = None,
+    ) -> None:
+        """
+        스캔 커서 되감기 (체인 재편성 시, 커밋하지 않음)
+
+        해당 블록보다 앞선 커서만 되감고 블록 해시는 비웁니다.
+        다시 스캔하는 구간의 입금은 트랜잭션 해시로 중복 제거됩니다.
+        """
+        cursors = await DepositScanCursorService.get_cursors(db, network, tokens, shard)
+        await DepositScanCursorService._fence(db, cursors, fencing_token)
+        for cursor in cursors.values():
+            if cursor.last_block > block_number:
+                cursor.last_block = block_number
+                cursor.last_block_hash = None
+
+        await db.flush()
@@ -3,32 +3,121 @@
 """
 
 import logging
-from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional
+import time
+from typing import Any, Dict, List, Optional, Set
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.config import settings
 from app.core.database import AsyncSessionLocal
+from app.core.tron import BlockRangeScan
+from app.core.tron.constants import TronConstants
 from app.models.deposit import Deposit
 from app.models.wallet import Wallet
 
+from .address_index import MonitoredAddressIndex
 from .base_monitor import BaseMonitorService
 from .blockchain_service import DepositBlockchainService
+from .confirmation_tracker import DepositConfirmationTracker
+from .cursor_service import DepositScanCursorService
+from .pipeline import DepositIngestionPipeline
 from .processing_service import DepositProcessingService
 from .query_service import DepositQueryService
+from .recent_hashes import DepositKey, RecentHashSet, deposit_key
 
 logger = logging.getLogger(__name__)
 
 
 class DepositMonitoringService(BaseMonitorService):
-    """입금 모니터링 메인 서비스"""
+    """
+    입금 모니터링 메인 서비스
 
-    def __init__(self):
+    shard_count가 2 이상이면 주소 해시가 shard_index에 속하는 감시 주소만
+    담당합니다. 샤드마다 스캔 커서와 리더 리스가 따로 있으므로 샤드별 프로세스를
+    여러 호스트에서 함께 실행할 수 있고, 주소가 겹치지 않아 이중 입금이 없습니다.
+    """
+
+    def __init__(
+        self, shard_index: Optional[int] = None, shard_count: Optional[int] = None
+    ):
         super().__init__()
+        self.shard_count = max(1, shard_count or settings.DEPOSIT_MONITOR_SHARD_COUNT)
+        self.shard_index = (
+            shard_index
+            if shard_index is not None
+            else settings.DEPOSIT_MONITOR_SHARD_INDEX
+        )
+        if not 0 <= self.shard_index < self.shard_count:
+            raise ValueError(
+                f"shard_index must be in [0, {self.shard_count}): {self.shard_index}"
+            )
         self.query_service = DepositQueryService()
         self.processing_service = DepositProcessingService()
         self.blockchain_service = DepositBlockchainService()
+        self.cursor_service = DepositScanCursorService()
+        self.address_index = MonitoredAddressIndex(
+            shard_index=self.shard_index, shard_count=self.shard_count
+        )
+        self.recent_hashes = RecentHashSet()
+        self.pipeline = DepositIngestionPipeline(self)
+        self.confirmation_tracker = DepositConfirmationTracker(self)
+        # 리더 선출 시 리스의 fencing_token (커서 갱신 시 확인, 미사용 시 None)
+        self.fencing_token: Optional[int] = None
+
+    @property
+    def shard_key(self) -> str:
+        """스캔 커서 샤드 키 (비샤드 모니터는 빈 문자열)"""
+        if self.shard_count == 1:
+            return ""
+        return f"{self.shard_index}/{self.shard_count}"
+
+    @property
+    def lease_name(self) -> str:
+        """리더 리스 이름 (샤드마다 리더 하나)"""
+        if self.shard_count == 1:
+            return "deposit_monitor"
+        return f"deposit_monitor:{self.shard_key}"
+
+    def _cursor_network(self) -> str:
+        """스캔 커서 네트워크 키"""
+        return self.tron.network.value
+
+    def _cursor_tokens(self) -> List[str]:
+        """블록 스캔 한 번으로 함께 처리되는 토큰 목록"""
+        return ["TRX"] + list(TronConstants.get_contracts(self.tron.network))
+
+    async def _load_cursor(self, db: AsyncSession, current_block: int) -> int:
+        """
+        영속 스캔 커서 조회 (없으면 초기화)
+
+        Returns:
+            마지막으로 스캔을 완료한 블록 번호
+        """
+        network = self._cursor_network()
+        tokens = self._cursor_tokens()
+        cursor = await self.cursor_service.get_resume_block(
+            db, network, tokens, self.shard_key
+        )
+        if cursor is None:
+            # 샤드 구성 변경: 기존 커서 중 가장 뒤처진 블록부터 이어서 스캔
+            cursor = await self.cursor_service.get_lowest_block(db, network, tokens)
+            if cursor is None:
+                # 최초 실행: 최근 블록 일부만 확인
+                cursor = max(1, current_block - settings.BLOCKS_TO_CHECK_ON_START)
+            await self.cursor_service.advance(
+                db,
+                network,
+                tokens,
+                cursor,
+                shard=self.shard_key,
+                fencing_token=self.fencing_token,
+            )
+            await db.commit()
+            logger.info(
+                f"입금 스캔 커서 초기화: {network} 블록 {cursor} "
+                f"(샤드 {self.shard_key or '없음'})"
+            )
+        return cursor
 
     async def _monitor_deposits(self):
         """입금 모니터링 수행"""
@@ -40,122 +129,313 @@ class DepositMonitoringService(BaseMonitorService):
                     logger.error("최신 블록 번호를 조회할 수 없습니다")
                     return
 
-                # 첫 실행 시 마지막 확인 블록 설정
-                if self.last_checked_block is None:
-                    self.last_checked_block = max(
-                        1, current_block - settings.BLOCKS_TO_CHECK_ON_START
-                    )
+                # 1. 대기 중인 입금 트랜잭션 처리 (재편성 시 커서 되감기)
+                await self._process_pending_deposits(db, current_block)
 
-                logger.info(
-                    f"블록 확인 중: {self.last_checked_block} → {current_block}"
-                )
+                # 재시작 후에도 영속 커서 다음 블록부터 재개
+                cursor = await self._load_cursor(db, current_block)
+                self.last_checked_block = cursor
 
-                # 1. 대기 중인 입금 트랜잭션 처리
-                await self._process_pending_deposits(db)
+                logger.info(f"블록 확인 중: {cursor} → {current_block}")
 
-                # 2. 새로운 입금 트랜잭션 확인
-                await self._check_new_deposits(
-                    db, self.last_checked_block, current_block
-                )
+                # 2. 새로운 입금 트랜잭션 확인 (크게 뒤처졌으면 백필 모드)
+                if current_block - cursor > settings.DEPOSIT_BACKFILL_THRESHOLD:
+                    cursor = await self.backfill(db, cursor, current_block)
+                else:
+                    cursor = await self._check_new_deposits(
+                        db, cursor + 1, current_block
+                    )
 
                 # 처리 완료된 블록 업데이트
-                self.last_checked_block = current_block
+                self.last_checked_block = cursor
 
         except Exception as e:
             logger.error(f"입금 모니터링 중 오류 발생: {e}")
 
-    async def _process_pending_deposits(self, db: AsyncSession):
-        """대기 중인 입금 트랜잭션 처리"""
-        # 최근 24시간 내의 대기 중인 입금 조회
-        cutoff_time = datetime.utcnow() - timedelta(hours=24)
-        pending_deposits = await self.query_service.get_pending_deposits(
-            db, cutoff_time
+    async def backfill(self, db: AsyncSession, cursor: int, target_block: int) -> int:
+        """
+        백필 모드: 대기 주기 없이 큰 구간 단위로 목표 블록까지 따라잡기
+
+        구간마다 입금과 커서를 함께 커밋하므로 중간에 중단되어도
+        다음 실행에서 이어서 진행합니다.
+
+        Args:
+            db: 데이터베이스 세션
+            cursor: 마지막으로 스캔을 완료한 블록 번호
+            target_block: 목표 블록 번호 (현재 최신 블록)
+
+        Returns:
+            백필 후 커서 블록 번호
+        """
+        batch = max(1, settings.DEPOSIT_BACKFILL_BATCH_BLOCKS)
+        logger.warning(
+            f"입금 스캔 백필 모드 시작: 블록 {cursor + 1}~{target_block} "
+            f"({target_block - cursor}개 블록 지연)"
         )
 
-        if not pending_deposits:
-            return
+        self.is_backfilling = True
+        started = time.monotonic()
+        start_cursor = cursor
+        try:
+            while self.is_backfilling and cursor < target_block:
+                end_block = min(cursor + batch, target_block)
+                advanced = await self._check_new_deposits(
+                    db, cursor + 1, end_block, head_block=target_block
+                )
+                if advanced <= cursor:
+                    logger.warning(f"백필이 블록 {cursor + 1}에서 진행하지 못했습니다")
+                    break
+                cursor = advanced
+                self.last_checked_block = cursor
 
-        logger.info(f"{len(pending_deposits)}개의 대기 중인 입금 트랜잭션을 처리합니다")
+                elapsed = time.monotonic() - started
+                rate = (cursor - start_cursor) / elapsed if elapsed else 0.0
+                logger.info(
+                    f"백필 진행: 블록 {cursor}/{target_block} ({rate:.1f} blocks/sec)"
+                )
+        finally:
+            self.is_backfilling = False
 
-        # 각 입금에 대해 블록체인에서 상태 확인
-        confirmed_tx_hashes = []
+        logger.info(f"입금 스캔 백필 종료: 커서 블록 {cursor}")
+        return cursor
 
-        for deposit in pending_deposits:
-            tx_info = await self.blockchain_service.get_transaction_by_hash(
-                deposit.transaction_hash
-            )
-            if tx_info and tx_info.get("confirmed", False):
-                confirmed_tx_hashes.append(deposit.transaction_hash)
+    async def _process_pending_deposits(self, db: AsyncSession, current_block: int):
+        """
+        대기 중인 입금 트랜잭션 처리
 
-        # 확인된 트랜잭션 처리
-        if confirmed_tx_hashes:
-            processed = await self.processing_service.confirm_pending_deposits(
-                db, pending_deposits, confirmed_tx_hashes
-            )
-            logger.info(f"{processed}개의 대기 중인 입금 트랜잭션을 완료 처리했습니다")
-            await db.commit()
+        블록 높이로 확인 수를 계산하여 일괄 확정하므로 입금별 노드 조회가 없고,
+        체인 재편성이 감지된 경우에만 해당 구간의 입금을 다시 확인합니다.
+        """
+        try:
+            await self.confirmation_tracker.process(db, current_block)
+        except Exception as e:
+            logger.error(f"대기 입금 확정 처리 중 오류 발생: {e}")
+            await db.rollback()
 
     async def _check_new_deposits(
-        self, db: AsyncSession, start_block: int, end_block: int
-    ):
-        """새로운 입금 트랜잭션 확인"""
-        # 활성화된 지갑 조회
-        active_wallets = await self.query_service.get_active_wallets(db)
+        self,
+        db: AsyncSession,
+        start_block: int,
+        end_block: int,
+        head_block: Optional[int] = None,
+        from_archive: bool = False,
+    ) -> int:
+        """
+        새로운 입금 트랜잭션 확인 (블록 단일 스캔)
 
-        if not active_wallets:
-            logger.info("활성화된 지갑이 없습니다")
-            return
+        발견된 입금과 스캔 커서를 같은 트랜잭션으로 커밋합니다.
+        블록 조회나 입금 처리가 실패하면 그 직전 블록까지만 커서를 전진하여
+        다음 실행에서 실패한 블록부터 다시 스캔합니다.
+        노드 스캔은 단계별 수집 파이프라인으로 수행하여, 커밋하는 동안에도
+        다음 블록 조회/디코딩이 계속 진행됩니다.
+
+        Args:
+            db: 데이터베이스 세션
+            start_block: 시작 블록 번호 (포함)
+            end_block: 종료 블록 번호 (포함)
+            head_block: 확정 여부 판단 기준 최신 블록 (기본값: end_block)
+            from_archive: True면 노드 대신 로컬 전송 아카이브에서 재생
+
+        Returns:
+            커서가 전진한 마지막 블록 번호 (진행이 없으면 start_block - 1)
+        """
+        if start_block > end_block:
+            return start_block - 1
+
+        network = self._cursor_network()
+        tokens = self._cursor_tokens()
+
+        # 감시 주소 인덱스 갱신 (Wallet + UserDepositAddress 변경분만 반영)
+        monitored = await self.address_index.refresh(db)
+
+        # 아카이브 재생은 아카이브에 기록된 블록까지만 커서를 전진 (바로 건너뛰지 않음)
+        if not monitored and not from_archive:
+            logger.info("감시 대상 주소가 없습니다")
+            await self.cursor_service.advance(
+                db,
+                network,
+                tokens,
+                end_block,
+                shard=self.shard_key,
+                fencing_token=self.fencing_token,
+            )
+            await db.commit()
+            return end_block
 
         logger.info(
-            f"{len(active_wallets)}개의 활성화된 지갑에 대해 새로운 입금을 확인합니다"
+            f"{len(monitored)}개의 감시 주소에 대해 블록 {start_block}~{end_block}을 스캔합니다"
         )
 
-        for wallet in active_wallets:
-            # 각 지갑 주소에 대한 새로운 트랜잭션 조회
-            transactions = await self.blockchain_service.get_transactions_for_address(
-                wallet.address, start_block=start_block, end_block=end_block
+        if settings.DEPOSIT_PIPELINE_ENABLED and not from_archive:
+            return await self.pipeline.run(
+                db, monitored, start_block, end_block, head_block
             )
 
-            if not transactions:
+        # 블록 범위를 한 번만 조회하여 모든 감시 주소와 매칭 (실패 블록에서 중단)
+        scan = await self.blockchain_service.scan_deposit_range(
+            monitored,
+            start_block,
+            end_block,
+            from_archive=from_archive,
+            shard=self.shard_key,
+        )
+        if scan is None or scan.last_block < start_block:
+            return start_block - 1
+
+        return await self._persist_scan(db, scan, head_block or end_block)
+
+    async def _persist_scan(
+        self, db: AsyncSession, scan: BlockRangeScan, head_block: int
+    ) -> int:
+        """
+        연속 스캔 결과의 입금 기록과 스캔 커서 커밋
+
+        Args:
+            db: 데이터베이스 세션
+            scan: 연속 스캔 결과 (start_block~last_block, 감시 주소 입금만 포함)
+            head_block: 확정 여부 판단 기준 최신 블록
+
+        Returns:
+            커서가 전진한 마지막 블록 번호 (입금 처리 실패 시 그 직전 블록)
+        """
+        start_block = scan.start_block
+        network = self._cursor_network()
+        tokens = self._cursor_tokens()
+        monitored = self.address_index
+
+        # 입금 기록 전에 커서 선점 (새 리더가 커서를 가져갔으면 여기서 중단)
+        await self.cursor_service.claim(
+            db, network, tokens, self.shard_key, self.fencing_token
+        )
+
+        last_block = scan.last_block
+        last_block_hash = scan.last_block_hash
+
+        if scan.transfers:
+            logger.info(f"{len(scan.transfers)}개의 새로운 입금 트랜잭션이 있습니다")
+
+        confirmed_block = head_block - settings.BLOCK_CONFIRMATION_COUNT
+
+        # 중복 확인: 최근 처리 입금 키 집합 → 구간당 한 번의 IN 조회
+        # (한 트랜잭션의 여러 Transfer 이벤트는 로그 인덱스로 구분)
+        candidates = [
+            tx for tx in scan.transfers if deposit_key(tx) not in self.recent_hashes
+        ]
+        known: Set[DepositKey] = set()
+        if candidates:
+            known = await self.query_service.get_existing_tx_hashes(
+                db, [tx["txID"] for tx in candidates]
+            )
+            self.recent_hashes.update(known)
+
+        new_deposits = []
+        for tx in candidates:
+            # 이미 처리된 트랜잭션인지 확인 (같은 구간의 중복 포함)
+            if deposit_key(tx) in known:
+                logger.debug(f"트랜잭션 {tx['txID']}는 이미 처리되었습니다")
                 continue
 
+            owner = monitored.get(tx["to"])
+            if owner is None:
+                continue
+            known.add(deposit_key(tx))
+            tx["confirmed"] = tx["block_number"] <= confirmed_block
+            tx["confirmations"] = max(0, head_block - tx["block_number"])
+            new_deposits.append((tx, owner))
+
+        # 입금 급증 시 일괄 기록/잔고 반영 (실패하면 건별 처리로 전환)
+        committed: List[DepositKey] = []
+        if len(new_deposits) >= settings.DEPOSIT_BATCH_MIN_SIZE:
+            try:
+                async with db.begin_nested():
+                    await self.processing_service.process_deposits_batch(
+                        db, new_deposits
+                    )
+                committed = [deposit_key(tx) for tx, _ in new_deposits]
+                new_deposits = []
+            except Exception as e:
+                logger.error(f"입금 일괄 처리 실패, 건별 처리로 전환합니다: {e}")
+
+        for tx, owner in new_deposits:
             logger.info(
-                f"지갑 {wallet.address}에 {len(transactions)}개의 새로운 트랜잭션이 있습니다"
+                f"새로운 입금 발견: {tx['amount']} {tx['token']}, 트랜잭션 {tx['txID']}"
             )
 
-            # 각 트랜잭션 처리
-            for tx in transactions:
-                # 이미 처리된 트랜잭션인지 확인
-                existing_deposits = await self.query_service.get_deposits_by_tx_hash(
-                    db, tx.get("txID")
+            # 입금 처리 (실패 시 해당 입금만 되돌리고 커서는 직전 블록에서 정지)
+            try:
+                async with db.begin_nested():
+                    await self.processing_service.process_deposit(
+                        db,
+                        user_id=owner["user_id"],
+                        asset=tx["token"],
+                        amount=tx["amount"],
+                        tx_data=tx,
+                        wallet_id=owner["wallet_id"],
+                    )
+            except Exception as e:
+                logger.error(
+                    f"입금 처리 중 오류 발생, 블록 {tx['block_number']}부터 재시도: {e}"
                 )
-                if existing_deposits:
-                    logger.debug(f"트랜잭션 {tx.get('txID')}는 이미 처리되었습니다")
-                    continue
+                last_block = tx["block_number"] - 1
+                last_block_hash = None
+                break
+            committed.append(deposit_key(tx))
 
-                # 트랜잭션이 유효한지 확인
-                if tx.get("confirmed", False) and tx.get("to") == wallet.address:
-                    amount = tx.get("value", 0)
-                    asset = tx.get("token", "TRX")
+        if last_block >= start_block:
+            await self.cursor_service.advance(
+                db,
+                network,
+                tokens,
+                last_block,
+                last_block_hash,
+                self.shard_key,
+                self.fencing_token,
+            )
+        await db.commit()
+        self.recent_hashes.update(committed)
+        # 커서 커밋 후 아카이브 동기화 (아카이브 누락 구간은 재생 시 중단 지점이 됨)
+        self.blockchain_service.sync_transfer_archive(self.shard_key)
+        return max(last_block, start_block - 1)
 
-                    logger.info(
-                        f"새로운 입금 발견: {amount} {asset}, 트랜잭션 {tx.get('txID')}"
-                    )
+    async def replay_archive(
+        self, db: AsyncSession, start_block: int, end_block: int
+    ) -> int:
+        """
+        로컬 전송 아카이브에서 입금 재처리 (노드 조회 없음)
+
+        이미 기록된 입금은 (해시, 로그 인덱스)로 건너뛰고, 커서는 뒤로 이동하지
+        않으며 아카이브에 연속 기록된 블록을 넘어 전진하지 않으므로 누락 입금
+        복구나 새 DB 재구성에 반복 실행해도 안전합니다. 리더 모니터에서 실행하면
+        커서 갱신은 리더의 fencing_token으로 보호됩니다.
+
+        Args:
+            db: 데이터베이스 세션
+            start_block: 시작 블록 번호 (포함)
+            end_block: 종료 블록 번호 (포함)
+
+        Returns:
+            재생을 완료한 마지막 블록 번호 (아카이브가 끊긴 블록 직전에서 중단)
+        """
+        batch = max(1, settings.DEPOSIT_BACKFILL_BATCH_BLOCKS)
+        started = time.monotonic()
+        block = start_block - 1
 
-                    # 입금 처리
-                    try:
-                        await self.processing_service.process_deposit(
-                            db,
-                            user_id=wallet.user_id,
-                            asset=asset,
-                            amount=amount,
-                            tx_data=tx,
-                        )
-                        await db.commit()
-                        logger.info(
-                            f"입금 처리 완료: {amount} {asset}, 트랜잭션 {tx.get('txID')}"
-                        )
-                    except Exception as e:
-                        await db.rollback()
-                        logger.error(f"입금 처리 중 오류 발생: {e}")
-                        continue
+        while block < end_block:
+            replayed = await self._check_new_deposits(
+                db,
+                block + 1,
+                min(block + batch, end_block),
+                head_block=end_block,
+                from_archive=True,
+            )
+            if replayed <= block:
+                logger.warning(f"아카이브 재생이 블록 {block + 1}에서 중단되었습니다")
+                break
+            block = replayed
+
+        elapsed = time.monotonic() - started
+        rate = (block - start_block + 1) / elapsed if elapsed else 0.0
+        logger.info(
+            f"아카이브 재생 완료: 블록 {start_block}~{block} ({rate:.1f} blocks/sec)"
+        )
+        return block
@@ -0,0 +1,435 @@
+"""
+입금 수집 파이프라인
+"""
+
+import asyncio
+import logging
+import math
+import time
+from contextlib import aclosing
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Awaitable, Dict, List, Optional, Sequence
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.tron import (
+    BlockRangeScan,
+    TronTransactionService,
+    block_range_fetcher,
+    get_transfer_archive,
+)
+
+from .address_index import MonitoredAddressIndex
+
+if TYPE_CHECKING:
+    from .monitor_service import DepositMonitoringService
+
+logger = logging.getLogger(__name__)
+
+# 단계 지연 시간 히스토그램 구간 (초)
+LATENCY_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+
+
+class LatencyHistogram:
+    """누적 구간 지연 시간 히스토그램"""
+
+    def __init__(self, buckets: Sequence[float] = LATENCY_BUCKETS):
+        self.buckets = tuple(buckets) + (math.inf,)
+        self.counts = [0] * len(self.buckets)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def observe(self, seconds: float) -> None:
+        """관측값 추가"""
+        for index, bound in enumerate(self.buckets):
+            if seconds <= bound:
+                self.counts[index] += 1
+                break
+        self.count += 1
+        self.total += seconds
+        self.max = max(self.max, seconds)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """히스토그램 (구간별 누적 건수, 상한 "+Inf" 포함)"""
+        cumulative = 0
+        buckets = {}
+        for bound, count in zip(self.buckets, self.counts):
+            cumulative += count
+            buckets["+Inf" if math.isinf(bound) else str(bound)] = cumulative
+        return {
+            "count": self.count,
+            "sum": self.total,
+            "max": self.max,
+            "mean": self.total / self.count if self.count else None,
+            "buckets": buckets,
+        }
+
+
+class StageMetrics:
+    """파이프라인 단계 지표 (입력 큐 깊이, 처리 건수, 처리 지연 시간)"""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.queue: Optional[asyncio.Queue] = None
+        self.max_queue_depth = 0
+        self.processed = 0
+        self.latency = LatencyHistogram()
+
+    def observe(self, seconds: float) -> None:
+        """항목 하나의 처리 지연 시간 기록"""
+        self.processed += 1
+        self.latency.observe(seconds)
+
+    def sample_depth(self) -> None:
+        """입력 큐 깊이 최댓값 갱신"""
+        if self.queue is not None:
+            self.max_queue_depth = max(self.max_queue_depth, self.queue.qsize())
+
+    def snapshot(self) -> Dict[str, Any]:
+        """단계 지표"""
+        return {
+            "queue_depth": self.queue.qsize() if self.queue is not None else 0,
+            "max_queue_depth": self.max_queue_depth,
+            "processed": self.processed,
+            "latency": self.latency.snapshot(),
+        }
+
+
+@dataclass
+class PipelineBlock:
+    """파이프라인을 흐르는 블록 (deposits만 Base58 주소, 나머지는 hex 주소)"""
+
+    number: int
+    block_id: Optional[str]
+    timestamp: int
+    transfers: List[Dict[str, Any]] = field(default_factory=list)
+    matched: List[Dict[str, Any]] = field(default_factory=list)
+    deposits: List[Dict[str, Any]] = field(default_factory=list)
+
+
+class DepositIngestionPipeline:
+    """
+    단계별 입금 수집 파이프라인
+
+    조회 → 디코딩 → 매칭 → 기록 단계를 크기 제한 큐로 연결합니다.
+    단계마다 코루틴 하나가 같은 이벤트 루프에서 실행되므로, 디코딩/매칭은
+    병렬로 실행되지 않고 노드 조회와 DB 커밋을 기다리는 시간에 겹쳐 진행됩니다.
+    큐가 차면 앞 단계가 기다리므로 처리량은 가장 느린 단계에 맞춰집니다.
+    기록 단계는 블록 번호 순으로 재정렬하여 연속 구간만 커밋하며,
+    스캔 커서 순서를 지키기 위해 항상 하나만 실행됩니다.
+    """
+
+    def __init__(
+        self,
+        monitor: "DepositMonitoringService",
+        queue_size: Optional[int] = None,
+        commit_blocks: Optional[int] = None,
+    ):
+        self.monitor = monitor
+        self.queue_size = max(1, queue_size or settings.DEPOSIT_PIPELINE_QUEUE_SIZE)
+        self.commit_blocks = max(
+            1, commit_blocks or settings.DEPOSIT_PIPELINE_COMMIT_BLOCKS
+        )
+        self.stages = {
+            name: StageMetrics(name) for name in ("fetch", "decode", "match", "persist")
+        }
+        self.runs = 0
+        self.commits = 0
+        self.blocks = 0
+        self.last_run: Optional[Dict[str, Any]] = None
+
+    # =============================================================================
+    # 실행
+    # =============================================================================
+
+    async def run(
+        self,
+        db: AsyncSession,
+        monitored: MonitoredAddressIndex,
+        start_block: int,
+        end_block: int,
+        head_block: Optional[int] = None,
+    ) -> int:
+        """
+        블록 범위 수집 (조회/디코딩 실패 블록 직전까지 커밋)
+
+        Args:
+            db: 데이터베이스 세션 (기록 단계 전용)
+            monitored: 감시 주소 인덱스
+            start_block: 시작 블록 번호 (포함)
+            end_block: 종료 블록 번호 (포함)
+            head_block: 확정 여부 판단 기준 최신 블록 (기본값: end_block)
+
+        Returns:
+            커서가 전진한 마지막 블록 번호 (진행이 없으면 start_block - 1)
+        """
+        started = time.monotonic()
+        halted = asyncio.Event()
+        queues = {
+            name: asyncio.Queue(maxsize=self.queue_size)
+            for name in ("decode", "match", "persist")
+        }
+        for name, queue in queues.items():
+            self.stages[name].queue = queue
+
+        stages = [
+            asyncio.create_task(
+                self._stage(
+                    self._fetch(start_block, end_block, queues["decode"], halted),
+                    queues["decode"],
+                )
+            ),
+            asyncio.create_task(
+                self._stage(
+                    self._decode(queues["decode"], queues["match"], halted),
+                    queues["match"],
+                )
+            ),
+            asyncio.create_task(
+                self._stage(
+                    self._match(queues["match"], queues["persist"], monitored, halted),
+                    queues["persist"],
+                )
+            ),
+        ]
+
+        committed = start_block - 1
+        try:
+            committed = await self._persist(
+                db, queues["persist"], start_block, head_block or end_block
+            )
+        finally:
+            for task in stages:
+                task.cancel()
+            await asyncio.gather(*stages, return_exceptions=True)
+            for name in queues:
+                self.stages[name].queue = None
+
+            elapsed = time.monotonic() - started
+            blocks = max(0, committed - start_block + 1)
+            self.runs += 1
+            self.blocks += blocks
+            self.last_run = {
+                "start_block": start_block,
+                "end_block": end_block,
+                "committed_block": committed,
+                "blocks": blocks,
+                "seconds": elapsed,
+                "blocks_per_second": blocks / elapsed if elapsed else None,
+                "bottleneck": self.bottleneck(),
+            }
+        return committed
+
+    async def _stage(self, worker: Awaitable[None], out_queue: asyncio.Queue) -> None:
+        """단계 작업 실행 후 다음 단계에 종료 신호 전달"""
+        await worker
+        await out_queue.put(None)
+
+    async def _put(self, stage: str, queue: asyncio.Queue, item: Any) -> None:
+        """다음 단계 큐에 추가 (가득 차면 대기하여 앞 단계 속도를 제한)"""
+        await queue.put(item)
+        self.stages[stage].sample_depth()
+
+    # =============================================================================
+    # 단계
+    # =============================================================================
+
+    async def _fetch(
+        self,
+        start_block: int,
+        end_block: int,
+        out_queue: asyncio.Queue,
+        halted: asyncio.Event,
+    ) -> None:
+        """조회 단계: 블록을 병렬 조회하여 번호 순서대로 전달 (실패 블록에서 중단)"""
+        metrics = self.stages["fetch"]
+        tron = self.monitor.tron
+        try:
+            async with aclosing(
+                block_range_fetcher.iter_range(
+                    start_block,
+                    end_block,
+                    tron.fetch_block_data,
+                    return_exceptions=True,
+                )
+            ) as blocks:
+                waited = time.monotonic()
+                async for block_num, data in blocks:
+                    if halted.is_set():
+                        break
+                    if isinstance(data, Exception):
+                        logger.warning(f"블록 {block_num} 조회 실패, 스캔 중단: {data}")
+                        break
+                    if data is None:
+                        logger.info(f"블록 {block_num}이 아직 없어 스캔을 중단합니다")
+                        break
+                    metrics.observe(time.monotonic() - waited)
+                    await self._put("decode", out_queue, (block_num, data))
+                    waited = time.monotonic()
+        except Exception as e:
+            logger.error(f"블록 조회 단계 오류, 스캔 중단: {e}")
+            halted.set()
+
+    async def _decode(
+        self, in_queue: asyncio.Queue, out_queue: asyncio.Queue, halted: asyncio.Event
+    ) -> None:
+        """디코딩 단계: 블록 → 전송 목록 (hex 주소)"""
+        metrics = self.stages["decode"]
+        tron = self.monitor.tron
+        while (item := await in_queue.get()) is not None:
+            block_num, data = item
+            if halted.is_set():
+                continue
+            started = time.monotonic()
+            try:
+                transfers = tron.decode_block_data(data)
+            except Exception as e:
+                # 이후 블록은 연속 구간이 끊기므로 커밋되지 않음
+                logger.error(f"블록 {block_num} 디코딩 실패, 스캔 중단: {e}")
+                halted.set()
+                continue
+            entry = data[0]
+            header = entry.block.get("block_header", {}).get("raw_data", {})
+            metrics.observe(time.monotonic() - started)
+            await self._put(
+                "match",
+                out_queue,
+                PipelineBlock(
+                    number=block_num,
+                    block_id=entry.block.get("blockID"),
+                    timestamp=header.get("timestamp", 0),
+                    transfers=transfers,
+                ),
+            )
+            # CPU 단계가 이벤트 루프를 독점하지 않도록 양보
+            await asyncio.sleep(0)
+
+    async def _match(
+        self,
+        in_queue: asyncio.Queue,
+        out_queue: asyncio.Queue,
+        monitored: MonitoredAddressIndex,
+        halted: asyncio.Event,
+    ) -> None:
+        """매칭 단계: 감시 주소로 들어온 전송만 선별 (Base58 주소로 변환)"""
+        metrics = self.stages["match"]
+        while (block := await in_queue.get()) is not None:
+            if halted.is_set():
+                continue
+            started = time.monotonic()
+            if monitored:
+                block.matched = [
+                    transfer
+                    for transfer in block.transfers
+                    if transfer["to"] in monitored
+                ]
+                block.deposits = [
+                    dict(
+                        TronTransactionService.with_base58_addresses(transfer),
+                        block_hash=block.block_id,
+                    )
+                    for transfer in block.matched
+                ]
+            metrics.observe(time.monotonic() - started)
+            await self._put("persist", out_queue, block)
+            await asyncio.sleep(0)
+
+    async def _persist(
+        self,
+        db: AsyncSession,
+        in_queue: asyncio.Queue,
+        start_block: int,
+        head_block: int,
+    ) -> int:
+        """
+        기록 단계: 블록 번호 순으로 재정렬하여 commit_blocks 단위로 커밋
+
+        Returns:
+            커서가 전진한 마지막 블록 번호
+        """
+        ready: Dict[int, PipelineBlock] = {}
+        window: List[PipelineBlock] = []
+        next_block = start_block
+        committed = start_block - 1
+
+        while (block := await in_queue.get()) is not None:
+            ready[block.number] = block
+            while next_block in ready:
+                window.append(ready.pop(next_block))
+                next_block += 1
+                if len(window) >= self.commit_blocks:
+                    committed = await self._commit(db, window, head_block)
+                    if committed < window[-1].number:
+                        return committed
+                    window = []
+
+        if window:
+            committed = await self._commit(db, window, head_block)
+        return committed
+
+    async def _commit(
+        self, db: AsyncSession, window: List[PipelineBlock], head_block: int
+    ) -> int:
+        """연속 블록 구간의 입금과 스캔 커서 커밋"""
+        started = time.monotonic()
+        scan = BlockRangeScan(
+            start_block=window[0].number,
+            last_block=window[-1].number,
+            last_block_hash=window[-1].block_id,
+            transfers=[transfer for block in window for transfer in block.deposits],
+        )
+        committed = await self.monitor._persist_scan(db, scan, head_block)
+
+        # 커밋된 블록만 아카이브에 기록 (커밋 실패/이전 리더 구간은 스캔 완료로 남기지 않음)
+        shard = self.monitor.shard_key
+        archive = get_transfer_archive(self.monitor.tron.network, shard)
+        if archive is not None:
+            archive_all = settings.TRON_TRANSFER_ARCHIVE_SCOPE == "all"
+            for block in window:
+                if block.number > committed:
+                    break
+                archive.append_block(
+                    block.number,
+                    block.block_id,
+                    block.timestamp,
+                    block.transfers if archive_all else block.matched,
+                )
+            self.monitor.blockchain_service.sync_transfer_archive(shard)
+
+        # 기록 단계 지연 시간은 블록당 값으로 기록하여 다른 단계와 비교 가능하게 함
+        elapsed = time.monotonic() - started
+        metrics = self.stages["persist"]
+        for _ in window:
+            metrics.observe(elapsed / len(window))
+        self.commits += 1
+        return committed
+
+    # =============================================================================
+    # 지표
+    # =============================================================================
+
+    def bottleneck(self) -> Optional[str]:
+        """누적 처리 시간이 가장 긴 단계"""
+        busy = {
+            name: metrics.latency.total
+            for name, metrics in self.stages.items()
+            if metrics.processed
+        }
+        return max(busy, key=busy.get) if busy else None
+
+    def stats(self) -> Dict[str, Any]:
+        """파이프라인 지표 (단계별 큐 깊이와 지연 시간 히스토그램)"""
+        return {
+            "queue_size": self.queue_size,
+            "commit_blocks": self.commit_blocks,
+            "runs": self.runs,
+            "commits": self.commits,
+            "blocks": self.blocks,
+            "bottleneck": self.bottleneck(),
+            "stages": {
+                name: metrics.snapshot() for name, metrics in self.stages.items()
+            },
+            "last_run": self.last_run,
+        }
@@ -2,15 +2,28 @@
 입금 처리 서비스
 """
 
+import json
 import logging
+from collections import defaultdict
 from decimal import Decimal
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional, Tuple
 
+from sqlalchemy import and_, bindparam, func, insert, select, update
+from sqlalchemy.dialects import postgresql, sqlite
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.config import settings
 from app.models.balance import Balance
-from app.models.deposit import Deposit
-from app.services.balance_service import BalanceService
+from app.models.deposit import Deposit, DepositStatus
+from app.models.transaction import (
+    Transaction,
+    TransactionDirection,
+    TransactionStatus,
+    TransactionType,
+)
+from app.services.balance.flow_service import TransactionFlowService
+from app.services.balance.journal_service import LedgerJournalService
+from app.services.balance.transaction_service import BalanceTransactionService
 
 logger = logging.getLogger(__name__)
 
@@ -25,56 +38,78 @@ class DepositProcessingService:
         asset: str,
         amount: Decimal,
         tx_data: Dict[str, Any],
+        wallet_id: Optional[int] = None,
     ) -> Deposit:
         """
         새로운 입금 처리
 
+        확인(confirmed)된 트랜잭션은 즉시 잔고에 반영하고,
+        아직 확인되지 않은 트랜잭션은 대기 상태로만 기록합니다.
+
         Args:
             db: 데이터베이스 세션
             user_id: 사용자 ID
             asset: 자산 유형
             amount: 입금 금액
             tx_data: 트랜잭션 데이터
+            wallet_id: 수신 지갑 ID
 
         Returns:
             처리된 입금 내역
         """
+        confirmed = tx_data.get("confirmed", False)
+
         # 입금 레코드 생성
         deposit = Deposit(
-            user_id=user_id,
-            asset=asset,
+            tx_hash=tx_data.get("txID"),
+            log_index=tx_data.get("log_index", 0),
+            from_address=tx_data.get("from") or "",
+            to_address=tx_data.get("to"),
             amount=amount,
-            transaction_hash=tx_data.get("txID"),
-            block_number=tx_data.get("blockNumber"),
-            status="pending",
-            raw_data=tx_data,
+            token_symbol=asset,
+            token_contract=tx_data.get("contract_address"),
+            block_number=tx_data.get("block_number", 0),
+            block_hash=tx_data.get("block_hash"),
+            block_timestamp=tx_data.get("timestamp", 0),
+            transaction_index=tx_data.get("transaction_index", 0),
+            confirmations=tx_data.get("confirmations", 0),
+            is_confirmed=confirmed,
+            min_confirmations=settings.BLOCK_CONFIRMATION_COUNT,
+            status=DepositStatus.PENDING,
+            user_id=user_id,
+            wallet_id=wallet_id,
         )
         db.add(deposit)
         await db.flush()
 
+        if not confirmed:
+            logger.info(
+                f"입금 대기 등록: 사용자 {user_id}, {amount} {asset}, 트랜잭션 {deposit.tx_hash}"
+            )
+            return deposit
+
         try:
             # 잔액 업데이트
-            balance_service = BalanceService()
-            await balance_service.add_balance(
-                db,
+            await BalanceTransactionService(db).add_balance(
                 user_id=user_id,
                 asset=asset,
                 amount=amount,
-                reference_id=deposit.id,
-                reference_type="deposit",
+                transaction_type="deposit",
+                description=f"Deposit: {deposit.tx_hash}",
             )
 
             # 입금 상태 업데이트
-            deposit.status = "completed"
+            deposit.status = DepositStatus.COMPLETED
+            deposit.is_processed = True
             await db.flush()
 
             logger.info(
-                f"입금 처리 완료: 사용자 {user_id}, {amount} {asset}, 트랜잭션 {tx_data.get('txID')}"
+                f"입금 처리 완료: 사용자 {user_id}, {amount} {asset}, 트랜잭션 {deposit.tx_hash}"
             )
 
         except Exception as e:
             logger.error(f"입금 처리 중 오류 발생: {e}")
-            deposit.status = "failed"
+            deposit.status = DepositStatus.FAILED
             deposit.error_message = str(e)
             await db.flush()
             raise
@@ -82,51 +117,304 @@ class DepositProcessingService:
         return deposit
 
     @staticmethod
-    async def confirm_pending_deposits(
-        db: AsyncSession, deposits: List[Deposit], confirmed_tx_hashes: List[str]
+    async def _insert_ignore_duplicates(
+        db: AsyncSession,
+        table: Any,
+        rows: List[Dict[str, Any]],
+        key: List[str],
+        returning: Optional[List[Any]] = None,
+    ) -> List[Any]:
+        """
+        중복 키 행을 무시하는 일괄 INSERT (PostgreSQL/SQLite ON CONFLICT DO NOTHING)
+
+        Returns:
+            returning 컬럼 목록이 주어지면 실제로 기록된 행의 값 튜플 목록
+        """
+        dialect = db.get_bind().dialect.name
+        if dialect == "postgresql":
+            stmt = postgresql.insert(table).values(rows)
+            stmt = stmt.on_conflict_do_nothing(index_elements=key)
+        elif dialect == "sqlite":
+            stmt = sqlite.insert(table).values(rows)
+            stmt = stmt.on_conflict_do_nothing(index_elements=key)
+        else:
+            # 그 외 DB는 충돌 시 오류 (호출자가 건별 처리로 전환)
+            stmt = insert(table).values(rows)
+            await db.execute(stmt)
+            if returning is None:
+                return []
+            return [tuple(row[column.key] for column in returning) for row in rows]
+
+        if returning is None:
+            await db.execute(stmt)
+            return []
+        result = await db.execute(stmt.returning(*returning))
+        return [tuple(row) for row in result]
+
+    @staticmethod
+    async def _credit_deposits(
+        db: AsyncSession, credits: List[Dict[str, Any]], chunk_size: int = 200
+    ) -> None:
+        """
+        입금 잔고 일괄 반영 (커밋하지 않음)
+
+        (사용자, 자산)별로 합산하여 잔고를 한 번씩 갱신하고,
+        입금별 거래 내역(Transaction), 거래 흐름 카운터, 원장 분개를 일괄 기록합니다.
+
+        Args:
+            db: 데이터베이스 세션
+            credits: 입금 행 목록 (user_id, token_symbol, amount, tx_hash)
+            chunk_size: INSERT 문당 최대 행 수
+        """
+        totals: Dict[Tuple[int, str], Decimal] = defaultdict(Decimal)
+        for row in credits:
+            totals[(row["user_id"], row["token_symbol"])] += Decimal(str(row["amount"]))
+
+        await DepositProcessingService._insert_ignore_duplicates(
+            db,
+            Balance.__table__,
+            [
+                {
+                    "user_id": user_id,
+                    "asset": asset,
+                    "amount": Decimal("0"),
+                    "locked_amount": Decimal("0"),
+                }
+                for user_id, asset in totals
+            ],
+            ["user_id", "asset"],
+        )
+        result = await db.execute(
+            select(Balance.user_id, Balance.asset, Balance.amount)
+            .filter(
+                Balance.user_id.in_({user_id for user_id, _ in totals}),
+                Balance.asset.in_({asset for _, asset in totals}),
+            )
+            .with_for_update()
+        )
+        balances = {
+            (user_id, asset): Decimal(str(amount))
+            for user_id, asset, amount in result.all()
+        }
+
+        await db.execute(
+            Balance.__table__.update()
+            .where(
+                and_(
+                    Balance.user_id == bindparam("b_user_id"),
+                    Balance.asset == bindparam("b_asset"),
+                )
+            )
+            .values(
+                amount=Balance.amount + bindparam("b_delta"), updated_at=func.now()
+            ),
+            [
+                {"b_user_id": user_id, "b_asset": asset, "b_delta": delta}
+                for (user_id, asset), delta in totals.items()
+            ],
+        )
+
+        # 입금별 거래 내역 일괄 기록 (입금 순서대로 잔고 전후 값 계산)
+        ledger = []
+        for row in credits:
+            key = (row["user_id"], row["token_symbol"])
+            previous = balances[key]
+            balances[key] = previous + Decimal(str(row["amount"]))
+            ledger.append(
+                {
+                    "user_id": row["user_id"],
+                    "type": TransactionType.DEPOSIT,
+                    "direction": TransactionDirection.IN,
+                    "status": TransactionStatus.COMPLETED,
+                    "asset": row["token_symbol"],
+                    "amount": row["amount"],
+                    "tx_hash": row["tx_hash"],
+                    "description": f"Deposit: {row['tx_hash']}",
+                    "transaction_metadata": json.dumps(
+                        {
+                            "previous_balance": str(previous),
+                            "new_balance": str(balances[key]),
+                            "transaction_type": "deposit",
+                        }
+                    ),
+                }
+            )
+        for i in range(0, len(ledger), chunk_size):
+            await db.execute(insert(Transaction), ledger[i : i + chunk_size])
+        await TransactionFlowService(db).record_completed(ledger)
+
+        # 원장 분개 일괄 기록 (사용자 계정 ↔ 외부 계정)
+        await LedgerJournalService(db).record_balance_changes(
+            [
+                (
+                    row["user_id"],
+                    row["token_symbol"],
+                    Decimal(str(row["amount"])),
+                    "deposit",
+                    row["tx_hash"],
+                )
+                for row in credits
+            ]
+        )
+
+    @staticmethod
+    async def process_deposits_batch(
+        db: AsyncSession,
+        deposits: List[Tuple[Dict[str, Any], Dict[str, Any]]],
+        chunk_size: int = 200,
+    ) -> List[Tuple[str, int]]:
+        """
+        입금 일괄 처리 (커밋하지 않음)
+
+        입금은 (tx_hash, log_index) 충돌을 무시하는 일괄 INSERT로 기록하고, 새로 기록된
+        확인 입금만 (사용자, 자산)별로 합산하여 잔고에 한 번씩 반영합니다.
+        잔고 변경과 같은 거래 내역(Transaction)도 일괄 기록합니다.
+        호출자가 스캔 커서와 함께 한 번만 커밋합니다.
+
+        Args:
+            db: 데이터베이스 세션
+            deposits: (트랜잭션 데이터, 주소 소유자) 목록
+            chunk_size: INSERT 문당 최대 행 수
+
+        Returns:
+            새로 기록된 입금 (해시, 로그 인덱스) 키 목록 (이미 있던 입금 제외)
+        """
+        rows: Dict[Tuple[str, int], Dict[str, Any]] = {}
+        for tx_data, owner in deposits:
+            confirmed = tx_data.get("confirmed", False)
+            log_index = tx_data.get("log_index", 0)
+            rows.setdefault(
+                (tx_data["txID"], log_index),
+                {
+                    "tx_hash": tx_data["txID"],
+                    "log_index": log_index,
+                    "from_address": tx_data.get("from") or "",
+                    "to_address": tx_data.get("to"),
+                    "amount": tx_data["amount"],
+                    "token_symbol": tx_data["token"],
+                    "token_contract": tx_data.get("contract_address"),
+                    "block_number": tx_data.get("block_number", 0),
+                    "block_hash": tx_data.get("block_hash"),
+                    "block_timestamp": tx_data.get("timestamp", 0),
+                    "transaction_index": tx_data.get("transaction_index", 0),
+                    "confirmations": tx_data.get("confirmations", 0),
+                    "is_confirmed": confirmed,
+                    "min_confirmations": settings.BLOCK_CONFIRMATION_COUNT,
+                    "status": (
+                        DepositStatus.COMPLETED if confirmed else DepositStatus.PENDING
+                    ),
+                    "is_processed": confirmed,
+                    "retry_count": 0,
+                    "max_retries": 3,
+                    "user_id": owner["user_id"],
+                    "wallet_id": owner["wallet_id"],
+                },
+            )
+        if not rows:
+            return []
+
+        # 1. 입금 일괄 기록 (이미 있는 입금 키는 무시하고 기록된 키만 반환)
+        keys = list(rows)
+        items = list(rows.values())
+        inserted = set()
+        for i in range(0, len(items), chunk_size):
+            inserted.update(
+                await DepositProcessingService._insert_ignore_duplicates(
+                    db,
+                    Deposit.__table__,
+                    items[i : i + chunk_size],
+                    ["tx_hash", "log_index"],
+                    returning=[
+                        Deposit.__table__.c.tx_hash,
+                        Deposit.__table__.c.log_index,
+                    ],
+                )
+            )
+
+        # 이번 배치가 기록한 확인 입금만 잔고에 반영
+        credits = [rows[k] for k in keys if k in inserted and rows[k]["is_confirmed"]]
+
+        # 2. (사용자, 자산)별 합산 후 잔고/거래 내역 일괄 반영
+        if credits:
+            await DepositProcessingService._credit_deposits(db, credits, chunk_size)
+
+        logger.info(
+            f"입금 일괄 처리: {len(inserted)}건 기록, {len(credits)}건 잔고 반영 "
+            f"(중복 {len(rows) - len(inserted)}건 제외)"
+        )
+        return [k for k in keys if k in inserted]
+
+    @staticmethod
+    async def confirm_deposits_batch(
+        db: AsyncSession,
+        deposits: List[Deposit],
+        head_block: int,
+        chunk_size: int = 200,
     ) -> int:
         """
-        대기 중인 입금 확인 처리
+        확인 수를 채운 대기 입금 일괄 확정 (커밋하지 않음)
+
+        입금 상태는 UPDATE 한 번으로 확정하고, 그 UPDATE가 실제로 대기 상태에서
+        바꾼 입금만 (사용자, 자산)별로 합산하여 잔고에 한 번씩 반영합니다.
+        노드 조회는 하지 않습니다.
 
         Args:
             db: 데이터베이스 세션
-            deposits: 대기 중인 입금 목록
-            confirmed_tx_hashes: 확인된 트랜잭션 해시 목록
+            deposits: 확정할 대기 입금 목록
+            head_block: 확인 수 계산 기준 최신 블록
+            chunk_size: 문장당 최대 행 수
 
         Returns:
-            처리된 입금 수
+            확정된 입금 수
         """
-        processed_count = 0
-        balance_service = BalanceService()
-
-        for deposit in deposits:
-            if deposit.transaction_hash in confirmed_tx_hashes:
-                try:
-                    # 잔액 업데이트
-                    await balance_service.add_balance(
-                        db,
-                        user_id=deposit.user_id,
-                        asset=deposit.asset,
-                        amount=deposit.amount,
-                        reference_id=deposit.id,
-                        reference_type="deposit",
-                    )
-
-                    # 입금 상태 업데이트
-                    deposit.status = "completed"
-                    await db.flush()
-
-                    processed_count += 1
-                    logger.info(
-                        f"대기 입금 처리 완료: ID {deposit.id}, {deposit.amount} {deposit.asset}"
-                    )
-
-                except Exception as e:
-                    logger.error(
-                        f"대기 입금 처리 중 오류 발생: ID {deposit.id}, 오류: {e}"
-                    )
-                    deposit.status = "failed"
-                    deposit.error_message = str(e)
-                    await db.flush()
-
-        return processed_count
+        if not deposits:
+            return 0
+
+        # 아직 대기 상태인 입금만 확정 (다른 모니터가 먼저 확정한 입금은 제외)
+        ids = [deposit.id for deposit in deposits]
+        claimed = set()
+        for i in range(0, len(ids), chunk_size):
+            result = await db.execute(
+                update(Deposit)
+                .where(
+                    Deposit.id.in_(ids[i : i + chunk_size]),
+                    Deposit.status == DepositStatus.PENDING,
+                )
+                .values(
+                    status=DepositStatus.COMPLETED,
+                    is_confirmed=True,
+                    is_processed=True,
+                    confirmations=head_block - Deposit.block_number,
+                )
+                .returning(Deposit.id)
+                .execution_options(synchronize_session=False)
+            )
+            claimed.update(result.scalars().all())
+
+        confirmed = [deposit for deposit in deposits if deposit.id in claimed]
+        if confirmed:
+            await DepositProcessingService._credit_deposits(
+                db,
+                [
+                    {
+                        "user_id": deposit.user_id,
+                        "token_symbol": deposit.token_symbol,
+                        "amount": deposit.amount,
+                        "tx_hash": deposit.tx_hash,
+                    }
+                    for deposit in confirmed
+                ],
+                chunk_size,
+            )
+        for deposit in confirmed:
+            deposit.status = DepositStatus.COMPLETED
+            deposit.is_confirmed = True
+            deposit.is_processed = True
+            deposit.confirmations = head_block - deposit.block_number
+
+        skipped = len(deposits) - len(confirmed)
+        logger.info(
+            f"대기 입금 일괄 확정: {len(confirmed)}건 (기준 블록 {head_block}, "
+            f"이미 확정 {skipped}건 제외)"
+        )
+        return len(confirmed)
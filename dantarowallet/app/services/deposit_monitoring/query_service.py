@@ -3,16 +3,19 @@
 """
 
 from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional
+from typing import Any, AsyncIterator, Collection, Dict, List, Optional, Set
 
-from sqlalchemy import and_, or_, select
+from sqlalchemy import Row, and_, func, or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
 from app.models.deposit import Deposit
+from app.models.sweep import HDWalletMaster, UserDepositAddress
 from app.models.user import User
 from app.models.wallet import Wallet
 
+from .recent_hashes import DepositKey
+
 
 class DepositQueryService:
     """입금 트랜잭션 조회 서비스"""
@@ -59,6 +62,92 @@ class DepositQueryService:
         result = await db.execute(query)
         return list(result.scalars().all())
 
+    @staticmethod
+    async def stream_monitored_wallets(
+        db: AsyncSession, since: Optional[datetime] = None, batch_size: int = 10000
+    ) -> AsyncIterator[Row]:
+        """
+        감시 주소 인덱스용 지갑 행 스트리밍
+
+        since가 없으면 감시 중인 지갑 전체를, 있으면 그 이후 변경된 지갑을
+        (비활성화된 지갑 포함) 반환합니다.
+
+        Yields:
+            (hex_address, user_id, wallet_id, is_active, is_monitored, updated_at)
+        """
+        query = select(
+            Wallet.hex_address,
+            Wallet.user_id,
+            Wallet.id,
+            Wallet.is_active,
+            Wallet.is_monitored,
+            Wallet.updated_at,
+        )
+        if since is None:
+            query = query.filter(
+                and_(Wallet.is_active == True, Wallet.is_monitored == True)
+            )
+        else:
+            query = query.filter(Wallet.updated_at >= since)
+
+        result = await db.stream(query.execution_options(yield_per=batch_size))
+        async for row in result:
+            yield row
+
+    @staticmethod
+    async def stream_monitored_deposit_addresses(
+        db: AsyncSession, since: Optional[datetime] = None, batch_size: int = 10000
+    ) -> AsyncIterator[Row]:
+        """
+        감시 주소 인덱스용 HD 입금 주소 행 스트리밍
+
+        updated_at은 생성 시 비어 있으므로 created_at으로 보완합니다.
+
+        Yields:
+            (address, user_id, wallet_id, partner_id, is_active, is_monitored,
+            changed_at)
+        """
+        changed_at = func.coalesce(
+            UserDepositAddress.updated_at, UserDepositAddress.created_at
+        )
+        query = (
+            select(
+                UserDepositAddress.address,
+                UserDepositAddress.user_id,
+                Wallet.id,
+                HDWalletMaster.partner_id,
+                UserDepositAddress.is_active,
+                UserDepositAddress.is_monitored,
+                changed_at,
+            )
+            .outerjoin(Wallet, Wallet.user_id == UserDepositAddress.user_id)
+            .outerjoin(
+                HDWalletMaster, HDWalletMaster.id == UserDepositAddress.hd_wallet_id
+            )
+        )
+        if since is None:
+            query = query.filter(
+                and_(
+                    UserDepositAddress.is_active == True,
+                    UserDepositAddress.is_monitored == True,
+                )
+            )
+        else:
+            # 각 컬럼의 인덱스를 사용할 수 있도록 coalesce 대신 OR 조건 사용
+            query = query.filter(
+                or_(
+                    UserDepositAddress.updated_at >= since,
+                    and_(
+                        UserDepositAddress.updated_at.is_(None),
+                        UserDepositAddress.created_at >= since,
+                    ),
+                )
+            )
+
+        result = await db.stream(query.execution_options(yield_per=batch_size))
+        async for row in result:
+            yield row
+
     @staticmethod
     async def get_deposits_by_tx_hash(db: AsyncSession, tx_hash: str) -> List[Deposit]:
         """
@@ -71,10 +160,36 @@ class DepositQueryService:
         Returns:
             입금 내역 목록
         """
-        query = select(Deposit).filter(Deposit.transaction_hash == tx_hash)
+        query = select(Deposit).filter(Deposit.tx_hash == tx_hash)
         result = await db.execute(query)
         return list(result.scalars().all())
 
+    @staticmethod
+    async def get_existing_tx_hashes(
+        db: AsyncSession, tx_hashes: Collection[str], chunk_size: int = 500
+    ) -> Set[DepositKey]:
+        """
+        이미 기록된 입금 키 일괄 조회 (스캔 구간당 IN 조회)
+
+        Args:
+            db: 데이터베이스 세션
+            tx_hashes: 확인할 트랜잭션 해시 목록
+            chunk_size: IN 조회당 최대 해시 수
+
+        Returns:
+            해당 트랜잭션들의 기록된 입금 (해시, 로그 인덱스) 키 집합
+        """
+        hashes = list(set(tx_hashes))
+        existing: Set[DepositKey] = set()
+        for i in range(0, len(hashes), chunk_size):
+            result = await db.execute(
+                select(Deposit.tx_hash, Deposit.log_index).filter(
+                    Deposit.tx_hash.in_(hashes[i : i + chunk_size])
+                )
+            )
+            existing.update((tx_hash, log_index) for tx_hash, log_index in result)
+        return existing
+
     @staticmethod
     async def get_user_wallets(db: AsyncSession, user_id: int) -> List[Wallet]:
         """
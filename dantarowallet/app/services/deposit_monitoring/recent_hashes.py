@@ -0,0 +1,73 @@
+"""
+최근 처리 입금 키 집합
+"""
+
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+from app.core.config import settings
+
+# 입금 식별 키 (트랜잭션 해시, Transfer 이벤트 로그 인덱스)
+DepositKey = Tuple[str, int]
+
+
+def deposit_key(tx: Dict[str, Any]) -> DepositKey:
+    """스캔 전송의 입금 키 (TRX 전송은 이벤트 로그가 없어 인덱스 0)"""
+    return tx["txID"], tx.get("log_index", 0)
+
+
+class RecentHashSet:
+    """
+    크기 제한 최근 입금 키 집합 (LRU)
+
+    커밋된 입금의 (해시, 로그 인덱스) 키를 보관하여 재스캔/겹침 구간의 중복 확인이
+    대부분 DB 조회 없이 끝나도록 합니다. 집합에 없다고 처리되지 않은
+    것은 아니므로 미스는 반드시 DB로 확인해야 합니다.
+    """
+
+    def __init__(self, max_size: Optional[int] = None):
+        self.max_size = max_size or settings.DEPOSIT_RECENT_HASH_CACHE_SIZE
+        self._hashes: "OrderedDict[DepositKey, None]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._hashes)
+
+    def __contains__(self, key: object) -> bool:
+        if key in self._hashes:
+            self._hashes.move_to_end(key)  # type: ignore[arg-type]
+            self.hits += 1
+            return True
+        self.misses += 1
+        return False
+
+    def add(self, key: DepositKey) -> None:
+        """키 추가 (가장 오래된 항목부터 제거)"""
+        self._hashes[key] = None
+        self._hashes.move_to_end(key)
+        while len(self._hashes) > self.max_size:
+            self._hashes.popitem(last=False)
+
+    def update(self, keys: Iterable[DepositKey]) -> None:
+        """키 일괄 추가"""
+        for key in keys:
+            self.add(key)
+
+    def discard(self, key: DepositKey) -> None:
+        """키 제거 (재편성으로 삭제된 입금)"""
+        self._hashes.pop(key, None)
+
+    def clear(self) -> None:
+        self._hashes.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """집합 통계"""
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._hashes),
+            "max_size": self.max_size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else None,
+        }
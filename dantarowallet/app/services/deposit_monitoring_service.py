@@ -3,12 +3,35 @@
 TRON 블록체인에서 입금 트랜잭션을 감지하고 처리합니다.
 """
 
+from app.core.leader_election import LeaderElection
+
 from .deposit_monitoring.monitor_service import DepositMonitoringService
 
-__all__ = ["DepositMonitoringService", "deposit_monitor"]
+__all__ = [
+    "DepositMonitoringService",
+    "deposit_monitor",
+    "deposit_monitor_leader",
+    "start_deposit_monitor_election",
+]
 
 # 이 파일은 하위 모듈을 가져오는 역할만 합니다.
 # 모든 구현은 deposit_monitoring/ 패키지 내부에 있습니다.
 
 # 전역 모니터링 인스턴스
 deposit_monitor = DepositMonitoringService()
+
+# 워커 중 리더 하나만 입금 모니터링을 실행 (샤드마다 리더 하나)
+deposit_monitor_leader = LeaderElection(deposit_monitor.lease_name)
+
+
+async def _run_deposit_monitor_as_leader() -> None:
+    """리더 리스의 fencing_token으로 입금 모니터링 실행"""
+    deposit_monitor.fencing_token = deposit_monitor_leader.fencing_token
+    await deposit_monitor.start_monitoring()
+
+
+def start_deposit_monitor_election() -> None:
+    """입금 모니터 리더 선출 시작 (리더가 되면 모니터링 실행)"""
+    deposit_monitor_leader.start(
+        _run_deposit_monitor_as_leader, deposit_monitor.stop_monitoring
+    )
@@ -14,6 +14,8 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.core.exceptions import NotFoundError, ValidationError
 from app.models.transaction import Transaction, TransactionStatus
 from app.models.withdrawal import Withdrawal, WithdrawalStatus
+from app.services.balance.flow_service import TransactionFlowService
+from app.services.balance.journal_service import LedgerJournalService
 from app.services.withdrawal.base_service import BaseWithdrawalService
 
 logger = logging.getLogger(__name__)
@@ -84,7 +86,11 @@ class WithdrawalProcessingService(BaseWithdrawalService):
             tx_result = await self.db.execute(tx_query)
             transaction = tx_result.scalar_one_or_none()
             if transaction:
+                previous_status = transaction.status
                 transaction.status = TransactionStatus.FAILED.value
+                await TransactionFlowService(self.db).record_status_change(
+                    transaction, previous_status
+                )
 
             logger.info(
                 f"출금 거부: ID {withdrawal_id}, 관리자 {admin_id}, 사유: {rejection_reason}"
@@ -202,6 +208,15 @@ class WithdrawalProcessingService(BaseWithdrawalService):
         balance.amount -= withdrawal.total_amount
         balance.locked_amount -= withdrawal.total_amount
 
+        # 원장 분개 기록 (출금액 + 수수료)
+        await LedgerJournalService(self.db).record_withdrawal(
+            withdrawal.user_id,
+            withdrawal.asset,
+            Decimal(str(withdrawal.amount)),
+            Decimal(str(withdrawal.fee)),
+            f"WD-{withdrawal.id}",
+        )
+
         # 트랜잭션 완료
         tx_query = select(Transaction).filter(
             Transaction.reference_id == f"WD-{withdrawal.id}"
@@ -209,8 +224,12 @@ class WithdrawalProcessingService(BaseWithdrawalService):
         tx_result = await self.db.execute(tx_query)
         transaction = tx_result.scalar_one_or_none()
         if transaction:
+            previous_status = transaction.status
             transaction.status = TransactionStatus.COMPLETED.value
             transaction.tx_hash = tx_hash
+            await TransactionFlowService(self.db).record_status_change(
+                transaction, previous_status
+            )
 
         logger.info(f"출금 완료: ID {withdrawal_id}, TX {tx_hash}")
 
@@ -19,6 +19,7 @@ from app.models.transaction import (
     TransactionType,
 )
 from app.models.withdrawal import Withdrawal, WithdrawalStatus
+from app.services.balance.flow_service import TransactionFlowService
 from app.services.withdrawal.validation_service import WithdrawalValidationService
 
 logger = logging.getLogger(__name__)
@@ -130,12 +131,16 @@ class WithdrawalRequestService(WithdrawalValidationService):
         tx_result = await self.db.execute(tx_query)
         transaction = tx_result.scalar_one_or_none()
         if transaction:
+            previous_status = transaction.status
             # DB에서 직접 업데이트
             await self.db.execute(
                 update(Transaction)
                 .where(Transaction.id == transaction.id)
                 .values(status="cancelled")
             )
+            await TransactionFlowService(self.db).record_status_change(
+                transaction, previous_status, TransactionStatus.CANCELLED
+            )
 
         logger.info(f"출금 취소: ID {withdrawal_id}, 사용자 {user_id}")
 
@@ -0,0 +1 @@
+"""로컬 TRON 노드 시뮬레이터 및 입금 스캐너 벤치마크"""
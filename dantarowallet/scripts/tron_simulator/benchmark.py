@@ -0,0 +1,214 @@
+#!/usr/bin/env python3
+"""
+입금 스캐너 벤치마크.
+로컬 TRON 노드 시뮬레이터에 대해 블록 스캔(blocks/sec)과
+DepositMonitoringService 입금 처리(deposits/sec)를 측정합니다.
+
+사용 예:
+    python -m scripts.tron_simulator.benchmark --blocks 100 --txs-per-block 2000
+    python -m scripts.tron_simulator.benchmark --latency-ms 20 --json
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import time
+from typing import Any, Dict, List, Optional
+
+import httpx
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from app.core.tron import TronNetworkClient, TronService, block_cache
+from app.models.base import Base
+from app.models.deposit import Deposit
+from app.models.user import User
+from app.models.wallet import Wallet
+from app.services.deposit_monitoring.monitor_service import DepositMonitoringService
+from scripts.tron_simulator.chain import SimulatedChain, deposit_addresses
+from scripts.tron_simulator.node import create_node_app
+
+# 입금 처리 경로에 필요한 테이블만 생성 (SQLite 인메모리)
+BENCHMARK_TABLES = [
+    "users",
+    "wallets",
+    "deposits",
+    "balances",
+    "transactions",
+    "user_deposit_addresses",
+    "deposit_scan_cursors",
+    "partners",
+    "hd_wallet_masters",
+    "service_leases",
+    "ledger_entries",
+    "balance_snapshots",
+    "transaction_flow_counters",
+]
+
+
+async def prepare_database(addresses: List[str]):
+    """벤치마크용 인메모리 DB 생성 및 감시 지갑 등록"""
+    from app.core.tron.wallet import address_codec
+
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        await conn.run_sync(
+            Base.metadata.create_all,
+            tables=[Base.metadata.tables[name] for name in BENCHMARK_TABLES],
+        )
+
+    session_factory = async_sessionmaker(engine, expire_on_commit=False)
+    async with session_factory() as db:
+        for index, address in enumerate(addresses):
+            user = User(email=f"bench{index}@example.com", password_hash="x")
+            db.add(user)
+            await db.flush()
+            db.add(
+                Wallet(
+                    user_id=user.id,
+                    address=address,
+                    hex_address=address_codec.to_hex(address),
+                    encrypted_private_key="-",
+                    encryption_salt="-",
+                )
+            )
+        await db.commit()
+    return engine, session_factory
+
+
+async def run_benchmark(
+    blocks: int = 50,
+    txs_per_block: int = 500,
+    monitored: int = 100,
+    deposit_ratio: float = 0.01,
+    trc20_ratio: float = 0.6,
+    latency: float = 0.0,
+    error_rate: float = 0.0,
+    seed: int = 0,
+) -> Dict[str, Any]:
+    """
+    벤치마크 실행
+
+    Returns:
+        측정 결과 (스캔/입금 처리 처리량 및 노드 요청 수)
+    """
+    addresses = deposit_addresses(monitored, seed)
+    end_block = 10_000
+    start_block = end_block - blocks + 1
+    chain = SimulatedChain(
+        head=end_block,
+        txs_per_block=txs_per_block,
+        trc20_ratio=trc20_ratio,
+        deposit_ratio=deposit_ratio,
+        monitored_addresses=addresses,
+        seed=seed,
+    )
+    app = create_node_app(chain, latency=latency, error_rate=error_rate, seed=seed)
+    network_client = TronNetworkClient()
+    await network_client.configure_nodes(
+        ["http://tron-sim"], transport=httpx.ASGITransport(app=app)
+    )
+
+    expected = chain.expected_deposits(start_block, end_block)
+    tron = TronService()
+
+    # 1. 블록 스캔 (노드 조회 + 디코딩 + 주소 매칭)
+    started = time.perf_counter()
+    scan = await tron.scan_range(set(addresses), start_block, end_block)
+    matched = scan.transfers
+    scan_elapsed = time.perf_counter() - started
+
+    # 2. 입금 처리 전체 경로 (스캔 + 중복 확인 + DB 기록 + 잔고 반영)
+    block_cache.clear()
+    engine, session_factory = await prepare_database(addresses)
+    monitor = DepositMonitoringService()
+    started = time.perf_counter()
+    async with session_factory() as db:
+        await monitor._check_new_deposits(db, start_block, end_block)
+        recorded = (await db.execute(select(func.count(Deposit.id)))).scalar_one()
+    monitor_elapsed = time.perf_counter() - started
+    await engine.dispose()
+
+    result = {
+        "blocks": blocks,
+        "txs_per_block": txs_per_block,
+        "monitored_addresses": monitored,
+        "latency_ms": latency * 1000,
+        "error_rate": error_rate,
+        "expected_deposits": expected,
+        "scan": {
+            "seconds": round(scan_elapsed, 3),
+            "blocks_per_sec": round(blocks / scan_elapsed, 1),
+            "txs_per_sec": round(blocks * txs_per_block / scan_elapsed, 1),
+            "matched": len(matched),
+        },
+        "monitor": {
+            "seconds": round(monitor_elapsed, 3),
+            "blocks_per_sec": round(blocks / monitor_elapsed, 1),
+            "deposits_per_sec": round(recorded / monitor_elapsed, 1),
+            "recorded": recorded,
+            "bottleneck": monitor.pipeline.bottleneck(),
+        },
+        "node_requests": dict(app.state.request_counts),
+    }
+    await network_client.http.close()
+    return result
+
+
+def main(argv: Optional[list] = None) -> None:
+    """CLI 진입점"""
+    parser = argparse.ArgumentParser(description="Deposit scanner benchmark")
+    parser.add_argument("--blocks", type=int, default=50)
+    parser.add_argument("--txs-per-block", type=int, default=500)
+    parser.add_argument("--monitored", type=int, default=100)
+    parser.add_argument("--deposit-ratio", type=float, default=0.01)
+    parser.add_argument("--trc20-ratio", type=float, default=0.6)
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--json", action="store_true", help="JSON으로 출력")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.WARNING)
+    logging.getLogger("app").setLevel(logging.WARNING)
+
+    result = asyncio.run(
+        run_benchmark(
+            blocks=args.blocks,
+            txs_per_block=args.txs_per_block,
+            monitored=args.monitored,
+            deposit_ratio=args.deposit_ratio,
+            trc20_ratio=args.trc20_ratio,
+            latency=args.latency_ms / 1000,
+            error_rate=args.error_rate,
+            seed=args.seed,
+        )
+    )
+
+    if args.json:
+        print(json.dumps(result, indent=2))
+        return
+
+    print("📊 입금 스캐너 벤치마크")
+    print(
+        f"   블록 {result['blocks']}개 × 트랜잭션 {result['txs_per_block']}건, "
+        f"감시 주소 {result['monitored_addresses']}개, "
+        f"지연 {result['latency_ms']:.0f}ms"
+    )
+    print(
+        f"   스캔: {result['scan']['blocks_per_sec']} blocks/sec, "
+        f"{result['scan']['txs_per_sec']} txs/sec "
+        f"(매칭 {result['scan']['matched']}/{result['expected_deposits']})"
+    )
+    print(
+        f"   입금 처리: {result['monitor']['blocks_per_sec']} blocks/sec, "
+        f"{result['monitor']['deposits_per_sec']} deposits/sec "
+        f"(기록 {result['monitor']['recorded']}, "
+        f"병목 단계 {result['monitor']['bottleneck']})"
+    )
+    print(f"   노드 요청: {result['node_requests']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,290 @@
+"""
+시뮬레이션 TRON 체인.
+시드 기반으로 블록/트랜잭션/영수증을 결정적으로 생성하거나,
+실제 노드에서 녹화한 블록을 재생합니다.
+"""
+
+import hashlib
+import json
+import random
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from app.core.tron.constants import TronConstants, TronNetwork
+from app.core.tron.events import TRANSFER_EVENT_TOPIC
+from app.core.tron.wallet import address_codec
+
+GENESIS_TIMESTAMP = 1_700_000_000_000  # ms
+BLOCK_INTERVAL_MS = TronConstants.BLOCK_TIME_SECONDS * 1000
+
+
+def random_hex_address(rng: random.Random) -> str:
+    """임의의 hex 주소 생성"""
+    return "41" + format(rng.getrandbits(160), "040x")
+
+
+def deposit_addresses(count: int, seed: int = 0) -> List[str]:
+    """감시 대상 입금 주소 목록 생성 (base58)"""
+    rng = random.Random(f"deposit-addresses:{seed}")
+    return address_codec.to_base58_many(random_hex_address(rng) for _ in range(count))
+
+
+class SimulatedChain:
+    """
+    결정적 시뮬레이션 체인
+
+    같은 시드와 설정이면 항상 같은 블록을 생성하므로 벤치마크 결과를
+    실행 간에 비교할 수 있습니다. 블록 데이터는 hex 주소 형식입니다.
+    """
+
+    def __init__(
+        self,
+        head: int = 1_000,
+        txs_per_block: int = 200,
+        trc20_ratio: float = 0.6,
+        deposit_ratio: float = 0.01,
+        monitored_addresses: Optional[List[str]] = None,
+        seed: int = 0,
+        network: TronNetwork = TronNetwork.NILE,
+        cache_size: int = 512,
+    ):
+        self.head = head
+        self.txs_per_block = txs_per_block
+        self.trc20_ratio = trc20_ratio
+        self.deposit_ratio = deposit_ratio
+        self.seed = seed
+        self.monitored_hex = address_codec.to_hex_many(monitored_addresses or [])
+        self.token_contracts = {
+            symbol: address_codec.to_hex(address)
+            for symbol, address in TronConstants.get_contracts(network).items()
+        }
+        self._usdt = self.token_contracts["USDT"]
+        self._cache_size = cache_size
+        self._generated: "OrderedDict[int, Tuple[Dict, List[Dict]]]" = OrderedDict()
+        self._recorded: Dict[int, Tuple[Dict, List[Dict]]] = {}
+        self._tx_index: Dict[str, int] = {}
+        self._forks: List[int] = []  # 재편성 시작 블록 (순서대로)
+
+    # =============================================================================
+    # 블록 생성 / 녹화 재생
+    # =============================================================================
+
+    def advance(self, blocks: int = 1) -> int:
+        """체인 헤드 전진"""
+        self.head += blocks
+        return self.head
+
+    def reorg(self, from_block: int) -> None:
+        """
+        체인 재편성 (from_block 이후 블록을 다른 포크의 블록으로 교체)
+
+        교체된 블록은 블록 ID와 트랜잭션이 모두 달라지며,
+        이전 포크의 트랜잭션은 더 이상 조회되지 않습니다.
+        """
+        self._forks.append(from_block)
+        for number in [n for n in self._generated if n >= from_block]:
+            del self._generated[number]
+        for txid in [t for t, n in self._tx_index.items() if n >= from_block]:
+            del self._tx_index[txid]
+
+    def _seed_key(self, number: int) -> str:
+        """블록 생성 시드 (재편성된 블록은 포크 번호 포함)"""
+        fork = sum(1 for start in self._forks if start <= number)
+        return f"{self.seed}~{fork}" if fork else str(self.seed)
+
+    def load_recording(self, path: str) -> int:
+        """
+        녹화 파일 적재 (JSONL: {"block": ..., "transaction_info": [...]})
+
+        Returns:
+            적재된 블록 수
+        """
+        loaded = 0
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                record = json.loads(line)
+                block = record["block"]
+                number = block["block_header"]["raw_data"]["number"]
+                self._recorded[number] = (block, record.get("transaction_info", []))
+                for tx in block.get("transactions") or []:
+                    self._tx_index[tx["txID"]] = number
+                self.head = max(self.head, number)
+                loaded += 1
+        return loaded
+
+    def _block_data(self, number: int) -> Tuple[Dict[str, Any], List[Dict[str, Any]]]:
+        """블록 및 영수증 조회 (녹화 우선, 없으면 생성 후 캐시)"""
+        if number in self._recorded:
+            return self._recorded[number]
+        data = self._generated.get(number)
+        if data is None:
+            data = self._generate(number)
+            self._generated[number] = data
+            if len(self._generated) > self._cache_size:
+                self._generated.popitem(last=False)
+        else:
+            self._generated.move_to_end(number)
+        return data
+
+    def _generate(self, number: int) -> Tuple[Dict[str, Any], List[Dict[str, Any]]]:
+        """블록 번호 기반 결정적 블록 생성"""
+        seed = self._seed_key(number)
+        rng = random.Random(f"{seed}:{number}")
+        timestamp = GENESIS_TIMESTAMP + number * BLOCK_INTERVAL_MS
+        transactions = []
+        tx_infos = []
+
+        for index in range(self.txs_per_block):
+            txid = hashlib.sha256(f"{seed}:{number}:{index}".encode()).hexdigest()
+            sender = random_hex_address(rng)
+            if self.monitored_hex and rng.random() < self.deposit_ratio:
+                recipient = rng.choice(self.monitored_hex)
+            else:
+                recipient = random_hex_address(rng)
+            amount = rng.randint(1, 10_000) * 1_000_000
+            info = {"id": txid, "blockNumber": number, "blockTimeStamp": timestamp}
+
+            if rng.random() < self.trc20_ratio:
+                contract = {
+                    "type": "TriggerSmartContract",
+                    "parameter": {
+                        "value": {
+                            "owner_address": sender,
+                            "contract_address": self._usdt,
+                            "data": TronConstants.TRC20_TRANSFER_SELECTOR
+                            + recipient[2:].rjust(64, "0")
+                            + format(amount, "064x"),
+                        }
+                    },
+                }
+                info["receipt"] = {"result": "SUCCESS", "energy_usage_total": 14_650}
+                info["log"] = [
+                    {
+                        "address": self._usdt[2:],
+                        "topics": [
+                            TRANSFER_EVENT_TOPIC,
+                            sender[2:].rjust(64, "0"),
+                            recipient[2:].rjust(64, "0"),
+                        ],
+                        "data": format(amount, "064x"),
+                    }
+                ]
+            else:
+                contract = {
+                    "type": "TransferContract",
+                    "parameter": {
+                        "value": {
+                            "owner_address": sender,
+                            "to_address": recipient,
+                            "amount": amount,
+                        }
+                    },
+                }
+                info["receipt"] = {"net_usage": 268}
+
+            transactions.append(
+                {
+                    "txID": txid,
+                    "ret": [{"contractRet": "SUCCESS"}],
+                    "raw_data": {"contract": [contract], "timestamp": timestamp},
+                }
+            )
+            tx_infos.append(info)
+            self._tx_index[txid] = number
+
+        block = {
+            "blockID": format(number, "016x")
+            + hashlib.sha256(f"{seed}:block:{number}".encode()).hexdigest()[16:],
+            "block_header": {
+                "raw_data": {
+                    "number": number,
+                    "timestamp": timestamp,
+                    "parentHash": format(max(number - 1, 0), "064x"),
+                }
+            },
+            "transactions": transactions,
+        }
+        return block, tx_infos
+
+    # =============================================================================
+    # 노드 API 데이터
+    # =============================================================================
+
+    def get_block(self, number: int) -> Dict[str, Any]:
+        """블록 조회 (헤드 이후 블록은 빈 dict)"""
+        if number < 0 or number > self.head:
+            return {}
+        return self._block_data(number)[0]
+
+    def get_transaction_infos(self, number: int) -> List[Dict[str, Any]]:
+        """블록 영수증 목록 조회"""
+        if number < 0 or number > self.head:
+            return []
+        return self._block_data(number)[1]
+
+    def find_transaction(
+        self, txid: str
+    ) -> Optional[Tuple[Dict[str, Any], Dict[str, Any]]]:
+        """트랜잭션 및 영수증 조회 (이미 생성/녹화된 블록 범위)"""
+        number = self._tx_index.get(txid)
+        if number is None:
+            return None
+        block, tx_infos = self._block_data(number)
+        for tx, info in zip(block["transactions"], tx_infos):
+            if tx["txID"] == txid:
+                return tx, info
+        return None
+
+    def is_solidified(self, number: int) -> bool:
+        """확정 블록 여부"""
+        return number <= self.head - TronConstants.CONFIRMATION_BLOCKS
+
+    @staticmethod
+    def balance_of(address: str, token: str = "TRX") -> int:
+        """주소별 결정적 잔고 (최소 단위)"""
+        digest = hashlib.sha256(f"{token}:{address}".encode()).digest()
+        return int.from_bytes(digest[:4], "big") * 1_000
+
+    def expected_deposits(
+        self, start: int, end: int, addresses: Optional[Iterable[str]] = None
+    ) -> int:
+        """구간 내 감시 주소 입금 건수 (벤치마크 검증용)"""
+        targets = address_codec.hex_set(addresses or [])
+        targets = targets or set(self.monitored_hex)
+        count = 0
+        for number in range(start, end + 1):
+            for tx in self.get_block(number).get("transactions", []):
+                value = tx["raw_data"]["contract"][0]["parameter"]["value"]
+                recipient = value.get("to_address") or "41" + value["data"][32:72]
+                if recipient in targets:
+                    count += 1
+        return count
+
+
+async def record_blocks(http, start: int, end: int, path: str) -> int:
+    """
+    실제 노드에서 블록과 영수증을 녹화 (재생용 JSONL)
+
+    Args:
+        http: TronHttpClient 또는 TronNodePool
+        start: 시작 블록 (포함)
+        end: 종료 블록 (포함)
+        path: 저장 경로
+
+    Returns:
+        녹화된 블록 수
+    """
+    Path(path).parent.mkdir(parents=True, exist_ok=True)
+    recorded = 0
+    with open(path, "w", encoding="utf-8") as f:
+        for number in range(start, end + 1):
+            block = await http.get_block_by_num(number)
+            if not block:
+                continue
+            tx_infos = await http.get_transaction_info_by_block_num(number)
+            f.write(json.dumps({"block": block, "transaction_info": tx_infos}) + "\n")
+            recorded += 1
+    return recorded
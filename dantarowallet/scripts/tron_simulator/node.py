@@ -0,0 +1,208 @@
+#!/usr/bin/env python3
+"""
+로컬 TRON 노드 시뮬레이터.
+TRON 풀노드/솔리디티 노드 HTTP API 일부를 시뮬레이션 체인으로 응답합니다.
+
+인프로세스 사용 (httpx ASGITransport):
+    app = create_node_app(SimulatedChain(...))
+    await TronNetworkClient().configure_nodes(
+        ["http://tron-sim"], transport=httpx.ASGITransport(app=app)
+    )
+
+독립 실행 (TRON_FULL_NODE_URL=http://127.0.0.1:8090 으로 연결):
+    python -m scripts.tron_simulator.node --port 8090 --txs-per-block 2000
+"""
+
+import argparse
+import asyncio
+import random
+from collections import Counter
+from typing import Any, Callable, Dict, Optional
+
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse
+
+from app.core.tron.constants import TronConstants
+from app.core.tron.wallet import address_codec
+from scripts.tron_simulator.chain import SimulatedChain, deposit_addresses
+
+
+def _word(value: int) -> str:
+    """uint256 ABI 인코딩"""
+    return format(value, "064x")
+
+
+def _abi_string(value: str) -> str:
+    """string ABI 인코딩"""
+    data = value.encode()
+    return _word(32) + _word(len(data)) + data.hex().ljust(64, "0")
+
+
+def create_node_app(
+    chain: SimulatedChain,
+    latency: float = 0.0,
+    jitter: float = 0.0,
+    error_rate: float = 0.0,
+    seed: int = 0,
+) -> FastAPI:
+    """
+    시뮬레이터 FastAPI 앱 생성
+
+    Args:
+        chain: 응답에 사용할 시뮬레이션 체인
+        latency: 요청당 기본 지연 시간 (초)
+        jitter: 추가 무작위 지연 시간 상한 (초)
+        error_rate: 503 오류 응답 비율 (0~1)
+        seed: 지연/오류 난수 시드
+    """
+    app = FastAPI(title="TRON Node Simulator")
+    rng = random.Random(seed)
+    app.state.chain = chain
+    app.state.request_counts = Counter()
+
+    def now_block(body: Dict[str, Any]) -> Dict[str, Any]:
+        return chain.get_block(chain.head)
+
+    def solidity_now_block(body: Dict[str, Any]) -> Dict[str, Any]:
+        return chain.get_block(chain.head - TronConstants.CONFIRMATION_BLOCKS)
+
+    def block_by_num(body: Dict[str, Any]) -> Dict[str, Any]:
+        return chain.get_block(int(body.get("num", -1)))
+
+    def tx_infos_by_block(body: Dict[str, Any]) -> Any:
+        return chain.get_transaction_infos(int(body.get("num", -1)))
+
+    def tx_by_id(body: Dict[str, Any]) -> Dict[str, Any]:
+        found = chain.find_transaction(body.get("value", ""))
+        return found[0] if found else {}
+
+    def tx_info_by_id(body: Dict[str, Any]) -> Dict[str, Any]:
+        found = chain.find_transaction(body.get("value", ""))
+        return found[1] if found else {}
+
+    def solidity_tx_info_by_id(body: Dict[str, Any]) -> Dict[str, Any]:
+        found = chain.find_transaction(body.get("value", ""))
+        if not found or not chain.is_solidified(found[1]["blockNumber"]):
+            return {}
+        return found[1]
+
+    def account(body: Dict[str, Any]) -> Dict[str, Any]:
+        address = address_codec.to_base58(body.get("address", ""))
+        return {"address": address, "balance": chain.balance_of(address)}
+
+    def constant_contract(body: Dict[str, Any]) -> Dict[str, Any]:
+        selector = body.get("function_selector", "")
+        contract = address_codec.to_hex(body.get("contract_address", ""))
+        symbol = next(
+            (s for s, c in chain.token_contracts.items() if c == contract), "UNKNOWN"
+        )
+        if selector == "balanceOf(address)":
+            owner = address_codec.to_base58("41" + body.get("parameter", "")[-40:])
+            result = _word(chain.balance_of(owner, symbol))
+        elif selector == "decimals()":
+            result = _word(6)
+        elif selector == "symbol()":
+            result = _abi_string(symbol)
+        else:
+            return {"result": {"result": False, "message": "unsupported selector"}}
+        return {"result": {"result": True}, "constant_result": [result]}
+
+    def contract_info(body: Dict[str, Any]) -> Dict[str, Any]:
+        return {"name": "TetherToken", "abi": {"entrys": []}}
+
+    def chain_parameters(body: Dict[str, Any]) -> Dict[str, Any]:
+        return {
+            "chainParameter": [
+                {"key": "getEnergyFee", "value": 420},
+                {"key": "getTransactionFee", "value": 1000},
+                {"key": "getTotalEnergyLimit", "value": 90_000_000_000},
+            ]
+        }
+
+    def node_info(body: Dict[str, Any]) -> Dict[str, Any]:
+        return {
+            "beginSyncNum": chain.head,
+            "configNodeInfo": {"codeVersion": "simulator"},
+            "machineInfo": {},
+        }
+
+    handlers: Dict[str, Callable[[Dict[str, Any]], Any]] = {
+        "/wallet/getnowblock": now_block,
+        "/walletsolidity/getnowblock": solidity_now_block,
+        "/wallet/getblockbynum": block_by_num,
+        "/walletsolidity/getblockbynum": block_by_num,
+        "/wallet/gettransactioninfobyblocknum": tx_infos_by_block,
+        "/wallet/gettransactionbyid": tx_by_id,
+        "/wallet/gettransactioninfobyid": tx_info_by_id,
+        "/walletsolidity/gettransactioninfobyid": solidity_tx_info_by_id,
+        "/wallet/getaccount": account,
+        "/wallet/triggerconstantcontract": constant_contract,
+        "/wallet/getcontract": contract_info,
+        "/wallet/getchainparameters": chain_parameters,
+        "/wallet/getnodeinfo": node_info,
+    }
+
+    @app.post("/{api}/{method}")
+    async def handle(api: str, method: str, request: Request):
+        path = f"/{api}/{method}"
+        app.state.request_counts[path] += 1
+
+        delay = latency + (rng.uniform(0, jitter) if jitter else 0.0)
+        if delay:
+            await asyncio.sleep(delay)
+        if error_rate and rng.random() < error_rate:
+            return JSONResponse({"Error": "simulated outage"}, status_code=503)
+
+        handler = handlers.get(path)
+        if handler is None:
+            return JSONResponse({"Error": f"unsupported api {path}"}, status_code=404)
+
+        body = await request.body()
+        payload = await request.json() if body else {}
+        return JSONResponse(handler(payload))
+
+    return app
+
+
+def main(argv: Optional[list] = None) -> None:
+    """독립 실행 진입점 (uvicorn)"""
+    import uvicorn
+
+    parser = argparse.ArgumentParser(description="Local TRON node simulator")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8090)
+    parser.add_argument("--head", type=int, default=1_000)
+    parser.add_argument("--txs-per-block", type=int, default=200)
+    parser.add_argument("--trc20-ratio", type=float, default=0.6)
+    parser.add_argument("--deposit-ratio", type=float, default=0.01)
+    parser.add_argument("--monitored", type=int, default=100)
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    parser.add_argument("--jitter-ms", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--recording", help="녹화된 블록 JSONL 파일")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    chain = SimulatedChain(
+        head=args.head,
+        txs_per_block=args.txs_per_block,
+        trc20_ratio=args.trc20_ratio,
+        deposit_ratio=args.deposit_ratio,
+        monitored_addresses=deposit_addresses(args.monitored, args.seed),
+        seed=args.seed,
+    )
+    if args.recording:
+        chain.load_recording(args.recording)
+
+    app = create_node_app(
+        chain,
+        latency=args.latency_ms / 1000,
+        jitter=args.jitter_ms / 1000,
+        error_rate=args.error_rate,
+        seed=args.seed,
+    )
+    uvicorn.run(app, host=args.host, port=args.port, log_level="warning")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,135 @@
+"""
+입금 감시 주소 인덱스 테스트.
+21바이트 키 매칭, 출처 우선순위, DB 변경분 증분 반영을 확인합니다.
+"""
+
+import random
+import tracemalloc
+
+import pytest
+from sqlalchemy import update
+
+from app.core.tron.wallet import address_codec
+from app.models.sweep import HDWalletMaster, UserDepositAddress
+from app.models.wallet import Wallet
+from app.services.deposit_monitoring.address_index import (
+    SOURCE_DEPOSIT_ADDRESS,
+    SOURCE_WALLET,
+    MonitoredAddressIndex,
+)
+from scripts.tron_simulator.benchmark import prepare_database
+from scripts.tron_simulator.chain import deposit_addresses
+
+WALLET_ADDRESSES = deposit_addresses(3, seed=1)
+HD_ADDRESSES = deposit_addresses(3, seed=2)
+
+
+def test_index_matches_hex_and_base58_keys():
+    """hex/base58 조회, 출처 우선순위, 삭제 행 재사용 테스트"""
+    index = MonitoredAddressIndex()
+    wallet, hd_address = WALLET_ADDRESSES[0], HD_ADDRESSES[0]
+
+    assert index.upsert(wallet, user_id=1, wallet_id=10)
+    assert index.upsert(hd_address, 2, 20, "partner-a", SOURCE_DEPOSIT_ADDRESS)
+    assert address_codec.to_hex(wallet) in index
+    assert wallet not in index  # 블록 매칭은 hex 주소만 사용
+    assert "not-an-address" not in index
+    assert index.get(address_codec.to_hex(hd_address)) == {
+        "user_id": 2,
+        "wallet_id": 20,
+        "partner_id": "partner-a",
+    }
+
+    # 지갑으로 등록된 주소는 HD 입금 주소 변경으로 덮어쓰지 않음
+    assert not index.upsert(wallet, 3, 30, "partner-b", SOURCE_DEPOSIT_ADDRESS)
+    assert not index.remove(wallet, SOURCE_DEPOSIT_ADDRESS)
+    assert index.get(wallet)["user_id"] == 1
+
+    assert index.remove(wallet, SOURCE_WALLET)
+    assert index.get(wallet) is None
+    assert index.upsert(WALLET_ADDRESSES[1], 4)
+    assert len(index) == 2
+    assert len(index._user_ids) == 2  # 삭제된 행 재사용
+    assert not index.upsert("T-invalid", 5)
+
+
+def test_index_memory_per_address_is_compact():
+    """대량 주소 적재 시 주소당 메모리 사용량 테스트"""
+    rng = random.Random(0)
+    addresses = ["41" + format(rng.getrandbits(160), "040x") for _ in range(100_000)]
+
+    tracemalloc.start()
+    index = MonitoredAddressIndex()
+    for number, address in enumerate(addresses):
+        index.upsert(address, number, number, f"partner-{number % 10}")
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    assert len(index) == 100_000
+    assert index.stats()["partners"] == 10
+    assert all(address in index for address in addresses[:1000])
+    # dict 키(21바이트) + 정수 배열 행만 사용 (ORM 객체 대비 수십 분의 일)
+    assert current / len(index) < 200
+
+
+@pytest.mark.asyncio
+async def test_index_refreshes_incrementally_from_change_feed():
+    """전체 적재 후 지갑/HD 주소 변경분만 증분 반영하는지 테스트"""
+    engine, session_factory = await prepare_database(WALLET_ADDRESSES)
+    async with session_factory() as db:
+        db.add(
+            HDWalletMaster(
+                id=1, partner_id="partner-1", encrypted_seed="-", public_key="-"
+            )
+        )
+        db.add(
+            UserDepositAddress(
+                hd_wallet_id=1,
+                user_id=1,
+                address=HD_ADDRESSES[0],
+                derivation_index=0,
+                encrypted_private_key="-",
+            )
+        )
+        await db.commit()
+
+    index = MonitoredAddressIndex()
+    async with session_factory() as db:
+        await index.refresh(db)
+    assert len(index) == 4
+    assert index.get(HD_ADDRESSES[0])["partner_id"] == "partner-1"
+    assert index.get(WALLET_ADDRESSES[1])["partner_id"] is None
+
+    async with session_factory() as db:
+        # 새 HD 주소 발급, 지갑 감시 해제, 기존 HD 주소 비활성화
+        db.add(
+            UserDepositAddress(
+                hd_wallet_id=1,
+                user_id=2,
+                address=HD_ADDRESSES[1],
+                derivation_index=1,
+                encrypted_private_key="-",
+            )
+        )
+        await db.execute(
+            update(Wallet)
+            .where(Wallet.address == WALLET_ADDRESSES[2])
+            .values(is_monitored=False)
+        )
+        await db.execute(
+            update(UserDepositAddress)
+            .where(UserDepositAddress.address == HD_ADDRESSES[0])
+            .values(is_active=False)
+        )
+        await db.commit()
+
+        await index.refresh(db)
+
+    assert index.stats()["full_refreshes"] == 1
+    assert index.stats()["incremental_refreshes"] == 1
+    assert index.get(HD_ADDRESSES[1])["user_id"] == 2
+    assert index.get(HD_ADDRESSES[1])["wallet_id"] is not None
+    assert index.get(WALLET_ADDRESSES[2]) is None
+    assert index.get(HD_ADDRESSES[0]) is None
+    assert len(index) == 3
+    await engine.dispose()
@@ -0,0 +1,82 @@
+"""
+TRON 배치 서명기 테스트.
+프로세스 풀 서명 결과가 입력 순서와 tronpy 서명과 일치하고,
+서명 중에도 이벤트 루프가 계속 동작하는지 확인합니다.
+"""
+
+import asyncio
+import hashlib
+
+import pytest
+from tronpy.keys import PrivateKey
+
+from app.core.encryption import EncryptionService
+from app.core.tron import BatchSigner, key_reference
+
+
+@pytest.mark.asyncio
+async def test_batch_signing_in_process_pool_preserves_order():
+    """여러 키로 섞인 배치 서명이 입력 순서대로 tronpy 서명과 같은지 테스트"""
+    keys = [PrivateKey(hashlib.sha256(bytes([i])).digest()) for i in range(3)]
+    references = [key_reference(*EncryptionService.encrypt(key.hex())) for key in keys]
+    items = [
+        (hashlib.sha256(i.to_bytes(4, "big")).digest(), references[i % 3])
+        for i in range(1_500)
+    ]
+
+    signer = BatchSigner(workers=2, chunk_size=128)
+    ticks = 0
+
+    async def ticker():
+        nonlocal ticks
+        while True:
+            ticks += 1
+            await asyncio.sleep(0.01)
+
+    ticking = asyncio.create_task(ticker())
+    try:
+        signatures = await signer.sign_digests(items)
+        again = await signer.sign_digests(items[:10])
+    finally:
+        ticking.cancel()
+        signer.shutdown()
+
+    assert len(signatures) == len(items)
+    for index in (0, 1, 2, 737, 1_499):
+        digest = items[index][0]
+        assert signatures[index] == keys[index % 3].sign_msg_hash(digest).hex()
+    assert again == signatures[:10]
+    # 서명은 워커에서 수행되므로 이벤트 루프가 멈추지 않음
+    assert ticks > 1
+
+    stats = signer.stats()
+    assert stats["batches"] == 2 and stats["signatures"] == 1_510
+    assert stats["last_batch"]["size"] == 10
+    assert stats["running"] is False
+
+
+@pytest.mark.asyncio
+async def test_sign_transactions_sets_signature_field():
+    """트랜잭션 txID 서명이 signature 필드에 추가되고 주소가 복원되는지 테스트"""
+    key = PrivateKey(b"\x07" * 32)
+    reference = key_reference(*EncryptionService.encrypt(key.hex()))
+    transactions = [
+        {"txID": hashlib.sha256(bytes([i])).hexdigest(), "signature": []}
+        for i in range(4)
+    ]
+
+    signer = BatchSigner(workers=1)
+    try:
+        signed = await signer.sign_transactions(transactions, [reference] * 4)
+        with pytest.raises(ValueError):
+            await signer.sign_transactions(transactions, [reference])
+    finally:
+        signer.shutdown()
+
+    for tx in signed:
+        signature = key.sign_msg_hash(bytes.fromhex(tx["txID"]))
+        assert tx["signature"] == [signature.hex()]
+        recovered = signature.recover_public_key_from_msg_hash(
+            bytes.fromhex(tx["txID"])
+        )
+        assert recovered == key.public_key
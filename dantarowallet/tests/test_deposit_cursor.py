@@ -0,0 +1,565 @@
+"""
+입금 스캔 커서 테스트.
+재시작 시 영속 커서에서 정확히 재개하고, 크게 뒤처지면 백필 모드로
+따라잡는지 시뮬레이터와 인메모리 DB로 확인합니다.
+"""
+
+import asyncio
+from collections import Counter
+from decimal import Decimal
+
+import httpx
+import pytest
+from sqlalchemy import func, select
+
+from app.core.config import settings
+from app.core.tron import TronNetworkClient, archive, block_cache
+from app.core.tron.wallet import address_codec
+from app.models.balance import Balance
+from app.models.deposit import Deposit, DepositStatus
+from app.models.deposit_scan_cursor import DepositScanCursor
+from app.models.transaction import Transaction
+from app.services.deposit_monitoring import monitor_service
+from app.services.deposit_monitoring.address_index import address_shard
+from app.services.deposit_monitoring.monitor_service import DepositMonitoringService
+from app.services.deposit_monitoring.pipeline import DepositIngestionPipeline
+from scripts.tron_simulator.benchmark import prepare_database
+from scripts.tron_simulator.chain import SimulatedChain, deposit_addresses
+from scripts.tron_simulator.node import create_node_app
+
+ADDRESSES = deposit_addresses(10, seed=7)
+
+
+@pytest.fixture
+async def environment(monkeypatch):
+    """시뮬레이터 노드 + 인메모리 DB 연결 (테스트 후 노드 풀 복원)"""
+    chain = SimulatedChain(
+        head=1_000,
+        txs_per_block=10,
+        deposit_ratio=0.05,
+        monitored_addresses=ADDRESSES,
+        seed=7,
+    )
+    network_client = TronNetworkClient()
+    monkeypatch.setattr(network_client, "_http", network_client._http)
+    await network_client.configure_nodes(
+        ["http://tron-sim"],
+        transport=httpx.ASGITransport(app=create_node_app(chain)),
+    )
+
+    engine, session_factory = await prepare_database(ADDRESSES)
+    monkeypatch.setattr(monitor_service, "AsyncSessionLocal", session_factory)
+
+    yield chain, session_factory
+
+    await engine.dispose()
+    await network_client.http.close()
+    block_cache.clear()
+
+
+async def _state(session_factory):
+    """(기록된 입금 수, 토큰별 커서 블록) 조회"""
+    async with session_factory() as db:
+        deposits = (await db.execute(select(func.count(Deposit.id)))).scalar_one()
+        rows = (await db.execute(select(DepositScanCursor))).scalars().all()
+        return deposits, {row.token: row.last_block for row in rows}
+
+
+@pytest.mark.asyncio
+async def test_restart_resumes_from_persisted_cursor(environment):
+    """재시작한 모니터가 영속 커서 다음 블록부터 재개하는지 테스트"""
+    chain, session_factory = environment
+    first_block = chain.head - settings.BLOCKS_TO_CHECK_ON_START
+
+    monitor = DepositMonitoringService()
+    await monitor._monitor_deposits()
+    deposits, cursors = await _state(session_factory)
+    assert set(cursors) == set(monitor._cursor_tokens()) >= {"TRX", "USDT"}
+    assert set(cursors.values()) == {1_000}
+    assert deposits == chain.expected_deposits(first_block + 1, 1_000)
+
+    # 재시작 (메모리 상태 없음) 후 체인이 50블록 전진
+    chain.advance(50)
+    restarted = DepositMonitoringService()
+    assert restarted.last_checked_block is None
+    await restarted._monitor_deposits()
+
+    deposits, cursors = await _state(session_factory)
+    assert set(cursors.values()) == {1_050}
+    assert restarted.last_checked_block == 1_050
+    assert deposits == chain.expected_deposits(first_block + 1, 1_050)
+
+
+@pytest.mark.asyncio
+async def test_deposed_leader_cannot_advance_cursor(environment):
+    """새 리더가 갱신한 커서를 이전 리더(낮은 fencing_token)가 갱신/기록하지 못하는지 테스트"""
+    chain, session_factory = environment
+    first_block = chain.head - settings.BLOCKS_TO_CHECK_ON_START
+
+    leader = DepositMonitoringService()
+    leader.fencing_token = 2
+    await leader._monitor_deposits()
+
+    # 리스를 잃은 줄 모르는 이전 리더가 다음 구간을 처리하면 입금과 커서 모두 롤백
+    chain.advance(50)
+    deposed = DepositMonitoringService()
+    deposed.fencing_token = 1
+    await deposed._monitor_deposits()
+    deposits, cursors = await _state(session_factory)
+    assert set(cursors.values()) == {1_000}
+    assert deposits == chain.expected_deposits(first_block + 1, 1_000)
+
+    await leader._monitor_deposits()
+    deposits, cursors = await _state(session_factory)
+    assert set(cursors.values()) == {1_050}
+    assert deposits == chain.expected_deposits(first_block + 1, 1_050)
+    async with session_factory() as db:
+        tokens = await db.scalars(select(DepositScanCursor.fencing_token))
+        assert set(tokens) == {2}
+
+
+@pytest.mark.asyncio
+async def test_long_outage_catches_up_in_backfill_mode(environment, monkeypatch):
+    """커서 지연이 임계값을 넘으면 백필 모드로 구간 단위 커밋하며 따라잡는지 테스트"""
+    chain, session_factory = environment
+    monkeypatch.setattr(settings, "DEPOSIT_BACKFILL_THRESHOLD", 100)
+    monkeypatch.setattr(settings, "DEPOSIT_BACKFILL_BATCH_BLOCKS", 120)
+
+    monitor = DepositMonitoringService()
+    await monitor._monitor_deposits()
+    chain.advance(500)
+
+    windows = []
+    original = monitor._check_new_deposits
+
+    async def record_window(db, start_block, end_block, head_block=None):
+        windows.append((start_block, end_block))
+        return await original(db, start_block, end_block, head_block)
+
+    monkeypatch.setattr(monitor, "_check_new_deposits", record_window)
+    await monitor._monitor_deposits()
+
+    assert windows == [
+        (1_001, 1_120),
+        (1_121, 1_240),
+        (1_241, 1_360),
+        (1_361, 1_480),
+        (1_481, 1_500),
+    ]
+    assert monitor.is_backfilling is False
+    deposits, cursors = await _state(session_factory)
+    assert set(cursors.values()) == {1_500}
+    first_block = 1_000 - settings.BLOCKS_TO_CHECK_ON_START
+    assert deposits == chain.expected_deposits(first_block + 1, 1_500)
+
+
+@pytest.mark.asyncio
+async def test_cursor_stops_before_missing_block_and_failed_deposit(
+    environment, monkeypatch
+):
+    """블록 조회/입금 처리 실패 시 커서가 실패 지점 직전에서 멈추는지 테스트"""
+    chain, session_factory = environment
+    monitor = DepositMonitoringService()
+
+    # 노드에 아직 없는 블록(1,001~)은 스캔하지 않음
+    async with session_factory() as db:
+        assert await monitor._check_new_deposits(db, 981, 1_010) == 1_000
+    _, cursors = await _state(session_factory)
+    assert set(cursors.values()) == {1_000}
+
+    # 입금 처리 실패 시 해당 블록부터 다시 스캔하도록 직전 블록에서 정지
+    chain.advance(20)
+    failing_block = next(
+        number
+        for number in range(1_001, 1_021)
+        if chain.expected_deposits(number, number)
+    )
+    process_deposit = monitor.processing_service.process_deposit
+
+    async def fail_on_block(db, user_id, asset, amount, tx_data, wallet_id=None):
+        if tx_data["block_number"] == failing_block:
+            raise RuntimeError("balance service unavailable")
+        return await process_deposit(db, user_id, asset, amount, tx_data, wallet_id)
+
+    monkeypatch.setattr(monitor.processing_service, "process_deposit", fail_on_block)
+    before, _ = await _state(session_factory)
+    async with session_factory() as db:
+        advanced = await monitor._check_new_deposits(db, 1_001, 1_020)
+
+    assert advanced == failing_block - 1
+    deposits, cursors = await _state(session_factory)
+    assert set(cursors.values()) == {failing_block - 1}
+    assert deposits - before == chain.expected_deposits(1_001, failing_block - 1)
+
+
+@pytest.mark.asyncio
+async def test_rescan_dedupes_with_one_query_per_window(environment, monkeypatch):
+    """재스캔 중복 확인이 구간당 IN 조회 한 번, 이후에는 최근 해시 집합으로 끝나는지 테스트"""
+    chain, session_factory = environment
+    first_block = 1_000 - settings.BLOCKS_TO_CHECK_ON_START + 1
+    await DepositMonitoringService()._monitor_deposits()
+    recorded, _ = await _state(session_factory)
+    assert recorded
+
+    # 재시작한 모니터가 같은 구간을 다시 스캔 (최근 해시 집합 비어 있음)
+    monitor = DepositMonitoringService()
+    lookups = []
+    get_existing = monitor.query_service.get_existing_tx_hashes
+
+    async def count_lookups(db, tx_hashes, chunk_size=500):
+        lookups.append(len(tx_hashes))
+        return await get_existing(db, tx_hashes, chunk_size)
+
+    async def per_transaction_lookup(*args, **kwargs):
+        raise AssertionError("per-transaction dedupe query")
+
+    monkeypatch.setattr(monitor.query_service, "get_existing_tx_hashes", count_lookups)
+    monkeypatch.setattr(
+        monitor.query_service, "get_deposits_by_tx_hash", per_transaction_lookup
+    )
+    async with session_factory() as db:
+        await monitor._check_new_deposits(db, first_block, 1_000)
+        assert lookups == [recorded]
+        assert len(monitor.recent_hashes) == recorded
+
+        # 최근 해시 집합으로 DB 조회 없이 중복 제외
+        await monitor._check_new_deposits(db, first_block, 1_000)
+        assert lookups == [recorded]
+
+    deposits, _ = await _state(session_factory)
+    assert deposits == recorded
+    assert monitor.recent_hashes.stats()["hits"] == recorded
+
+
+@pytest.mark.asyncio
+async def test_batch_persistence_credits_once_per_user_asset(environment, monkeypatch):
+    """일괄 처리가 확인 입금만 (사용자, 자산)별로 합산 반영하고 재처리에 멱등한지 테스트"""
+    chain, session_factory = environment
+    monkeypatch.setattr(settings, "DEPOSIT_BATCH_MIN_SIZE", 1)
+    monkeypatch.setattr(settings, "BLOCK_CONFIRMATION_COUNT", 5)
+    monitor = DepositMonitoringService()
+
+    async def no_single_path(*args, **kwargs):
+        raise AssertionError("per-deposit processing")
+
+    monkeypatch.setattr(monitor.processing_service, "process_deposit", no_single_path)
+    await monitor._monitor_deposits()
+
+    async def ledger():
+        async with session_factory() as db:
+            deposits = (await db.execute(select(Deposit))).scalars().all()
+            balances = (await db.execute(select(Balance))).scalars().all()
+            entries = (await db.execute(select(Transaction))).scalars().all()
+        return deposits, balances, entries
+
+    deposits, balances, entries = await ledger()
+    first_block = 1_000 - settings.BLOCKS_TO_CHECK_ON_START
+    assert len(deposits) == chain.expected_deposits(first_block + 1, 1_000)
+
+    confirmed = [deposit for deposit in deposits if deposit.is_confirmed]
+    assert confirmed and len(confirmed) < len(deposits)
+    assert all(deposit.status == DepositStatus.COMPLETED for deposit in confirmed)
+    assert sorted(entry.tx_hash for entry in entries) == sorted(
+        deposit.tx_hash for deposit in confirmed
+    )
+    expected = {}
+    for deposit in confirmed:
+        key = (deposit.user_id, deposit.token_symbol)
+        expected[key] = expected.get(key, Decimal("0")) + Decimal(str(deposit.amount))
+    assert {
+        (balance.user_id, balance.asset): Decimal(str(balance.amount))
+        for balance in balances
+    } == expected
+
+    # 같은 입금을 다시 일괄 처리해도 기록/잔고 변화 없음
+    replay = [
+        (
+            {
+                "txID": deposit.tx_hash,
+                "log_index": deposit.log_index,
+                "from": deposit.from_address,
+                "to": deposit.to_address,
+                "amount": deposit.amount,
+                "token": deposit.token_symbol,
+                "block_number": deposit.block_number,
+                "confirmed": True,
+            },
+            {"user_id": deposit.user_id, "wallet_id": deposit.wallet_id},
+        )
+        for deposit in deposits
+    ]
+    async with session_factory() as db:
+        inserted = await monitor.processing_service.process_deposits_batch(db, replay)
+        await db.commit()
+    assert inserted == []
+    _, balances_after, entries_after = await ledger()
+    assert len(entries_after) == len(entries)
+    assert [balance.amount for balance in balances_after] == [
+        balance.amount for balance in balances
+    ]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("batch_min_size", [1, 1_000])
+async def test_one_transaction_paying_two_addresses_credits_both(
+    environment, monkeypatch, batch_min_size
+):
+    """한 트랜잭션의 Transfer 이벤트 두 건이 각각 입금으로 기록/반영되는지 테스트"""
+    chain, session_factory = environment
+    monkeypatch.setattr(settings, "DEPOSIT_BATCH_MIN_SIZE", batch_min_size)
+    monkeypatch.setattr(settings, "BLOCKS_TO_CHECK_ON_START", 50)
+
+    # 확정 구간 블록의 TRC20 트랜잭션 하나를 감시 주소 두 곳으로 보내는 일괄 지급으로 변경
+    block_number = 960
+    block, tx_infos = chain._block_data(block_number)
+    info = next(info for info in tx_infos if info.get("log"))
+    transfer_log = info["log"][0]
+    recipients = [address_codec.to_hex(address) for address in ADDRESSES[:2]]
+    info["log"] = [
+        {
+            **transfer_log,
+            "topics": transfer_log["topics"][:2] + [recipient[2:].rjust(64, "0")],
+            "data": format(amount * 1_000_000, "064x"),
+        }
+        for recipient, amount in zip(recipients, (3, 4))
+    ]
+
+    await DepositMonitoringService()._monitor_deposits()
+
+    async with session_factory() as db:
+        paid = await db.scalars(
+            select(Deposit)
+            .filter(Deposit.tx_hash == info["id"])
+            .order_by(Deposit.log_index)
+        )
+        paid = paid.all()
+        deposits = (await db.execute(select(Deposit))).scalars().all()
+        credited = await db.scalar(
+            select(func.sum(Balance.amount)).filter(Balance.asset == "USDT")
+        )
+
+    assert [(d.log_index, d.to_address, d.amount) for d in paid] == [
+        (0, ADDRESSES[0], Decimal("3")),
+        (1, ADDRESSES[1], Decimal("4")),
+    ]
+    assert all(d.status == DepositStatus.COMPLETED for d in paid)
+    assert Decimal(str(credited)) == sum(
+        Decimal(str(d.amount))
+        for d in deposits
+        if d.is_confirmed and d.token_symbol == "USDT"
+    )
+
+
+@pytest.mark.asyncio
+async def test_address_shards_split_deposits_and_inherit_cursor(environment):
+    """샤드가 감시 주소를 나눠 기록하고, 샤드 전환 시 기존 커서에서 이어가는지 테스트"""
+    chain, session_factory = environment
+    await DepositMonitoringService()._monitor_deposits()
+    before, _ = await _state(session_factory)
+    chain.advance(50)
+
+    owned = [[a for a in ADDRESSES if address_shard(a, 2) == i] for i in range(2)]
+    assert all(owned)
+    shards = [DepositMonitoringService(index, 2) for index in range(2)]
+    assert [shard.lease_name for shard in shards] == [
+        "deposit_monitor:0/2",
+        "deposit_monitor:1/2",
+    ]
+
+    for shard, addresses in zip(shards, owned):
+        await shard._monitor_deposits()
+        assert len(shard.address_index) == len(addresses)
+        deposits, _ = await _state(session_factory)
+        assert deposits - before == chain.expected_deposits(1_001, 1_050, addresses)
+        before = deposits
+
+    # 다시 실행해도 다른 샤드 입금을 중복 기록하지 않음
+    for shard in shards:
+        await shard._monitor_deposits()
+    async with session_factory() as db:
+        rows = (await db.execute(select(DepositScanCursor))).scalars().all()
+    assert {(row.shard, row.last_block) for row in rows} == {
+        ("", 1_000),
+        ("0/2", 1_050),
+        ("1/2", 1_050),
+    }
+    deposits, _ = await _state(session_factory)
+    first_block = 1_000 - settings.BLOCKS_TO_CHECK_ON_START
+    assert deposits == chain.expected_deposits(first_block + 1, 1_050)
+
+    with pytest.raises(ValueError):
+        DepositMonitoringService(2, 2)
+
+
+@pytest.mark.asyncio
+async def test_pipeline_keeps_fetching_while_persist_commits(environment, monkeypatch):
+    """기록 단계 커밋 중에도 조회가 진행되고, 큐 크기로 앞 단계가 제한되는지 테스트"""
+    chain, session_factory = environment
+    await DepositMonitoringService()._monitor_deposits()
+    chain.advance(120)
+
+    monitor = DepositMonitoringService()
+    pipeline = DepositIngestionPipeline(monitor, queue_size=4, commit_blocks=20)
+    monitor.pipeline = pipeline
+    persist_scan = monitor._persist_scan
+    fetched_at_commit = []
+
+    async def slow_persist(db, scan, head_block):
+        fetched_at_commit.append(pipeline.stages["fetch"].processed)
+        await asyncio.sleep(0.05)
+        return await persist_scan(db, scan, head_block)
+
+    monkeypatch.setattr(monitor, "_persist_scan", slow_persist)
+    async with session_factory() as db:
+        assert await monitor._check_new_deposits(db, 1_001, 1_120) == 1_120
+
+    deposits, cursors = await _state(session_factory)
+    first_block = 1_000 - settings.BLOCKS_TO_CHECK_ON_START
+    assert deposits == chain.expected_deposits(first_block + 1, 1_120)
+    assert set(cursors.values()) == {1_120}
+
+    stats = pipeline.stats()
+    assert stats["commits"] == len(fetched_at_commit) == 6
+    # 두 번째 커밋 시작 시점에 조회 단계는 이미 다음 구간을 진행 중
+    assert 40 < fetched_at_commit[1]
+    # 큐가 가득 차면 조회가 멈추므로 커밋 중인 구간보다
+    # (큐 3개 + 단계별 처리 중인 블록) 이상 앞서지 않음
+    for index, fetched in enumerate(fetched_at_commit):
+        assert fetched <= 20 * (index + 1) + 3 * (4 + 1)
+    for name in ("fetch", "decode", "match", "persist"):
+        stage = stats["stages"][name]
+        assert stage["processed"] == 120
+        assert stage["latency"]["buckets"]["+Inf"] == 120
+        assert stage["max_queue_depth"] <= 4
+    assert stats["bottleneck"] == "persist"
+    assert stats["last_run"]["blocks"] == 120
+
+
+@pytest.mark.asyncio
+async def test_pipeline_archives_only_committed_windows(
+    environment, monkeypatch, tmp_path
+):
+    """기록 단계 커밋이 실패한 구간은 전송 아카이브에 남지 않는지 테스트"""
+    chain, session_factory = environment
+    await DepositMonitoringService()._monitor_deposits()
+    chain.advance(60)
+    monkeypatch.setattr(settings, "TRON_TRANSFER_ARCHIVE_DIR", str(tmp_path))
+    monkeypatch.setattr(archive, "_archives", {})
+
+    monitor = DepositMonitoringService()
+    monitor.pipeline = DepositIngestionPipeline(monitor, queue_size=4, commit_blocks=20)
+    persist_scan = monitor._persist_scan
+
+    async def failing_persist(db, scan, head_block):
+        if scan.start_block > 1_020:
+            raise RuntimeError("commit failed")
+        return await persist_scan(db, scan, head_block)
+
+    monkeypatch.setattr(monitor, "_persist_scan", failing_persist)
+    async with session_factory() as db:
+        with pytest.raises(RuntimeError):
+            await monitor._check_new_deposits(db, 1_001, 1_060)
+
+    _, cursors = await _state(session_factory)
+    assert set(cursors.values()) == {1_020}
+    transfer_archive = archive.get_transfer_archive(monitor.tron.network)
+    assert transfer_archive.last_contiguous_block(1_001, 1_060) == 1_020
+
+
+@pytest.mark.asyncio
+async def test_pending_deposits_confirm_by_height_and_reverify_on_reorg(environment):
+    """대기 입금이 입금별 노드 조회 없이 확정되고, 재편성 시에만 재확인되는지 테스트"""
+    chain, session_factory = environment
+    monitor = DepositMonitoringService()
+    calls = Counter()
+
+    def counted(name):
+        original = getattr(monitor.blockchain_service, name)
+
+        def call(*args):
+            calls[name] += 1
+            return original(*args)
+
+        return call
+
+    for name in ("get_canonical_block_id", "get_transaction_block_number"):
+        setattr(monitor.blockchain_service, name, counted(name))
+
+    async def deposits():
+        async with session_factory() as db:
+            return (await db.execute(select(Deposit))).scalars().all()
+
+    await monitor._monitor_deposits()
+    assert all(deposit.status == DepositStatus.PENDING for deposit in await deposits())
+
+    # 체인 전진: 확인 수를 채운 입금만 일괄 확정 (커서 블록 ID 조회 1건)
+    chain.advance(15)
+    await monitor._monitor_deposits()
+    confirmed_block = 1_015 - settings.BLOCK_CONFIRMATION_COUNT
+    rows = await deposits()
+    assert any(deposit.block_number <= confirmed_block for deposit in rows)
+    for deposit in rows:
+        if deposit.block_number <= confirmed_block:
+            assert deposit.status == DepositStatus.COMPLETED and deposit.is_confirmed
+        else:
+            assert deposit.status == DepositStatus.PENDING
+            assert deposit.confirmations == 1_015 - deposit.block_number
+        assert deposit.block_hash == chain.get_block(deposit.block_number)["blockID"]
+    assert calls == {"get_canonical_block_id": 1}
+
+    # 블록 1,005부터 재편성: 사라진 트랜잭션의 대기 입금만 재확인 후 삭제
+    orphaned = chain.expected_deposits(1_005, 1_015)
+    assert orphaned > 0
+    chain.reorg(1_005)
+    await monitor._monitor_deposits()
+
+    rows = await deposits()
+    first_block = 1_000 - settings.BLOCKS_TO_CHECK_ON_START
+    assert len(rows) == chain.expected_deposits(first_block + 1, 1_015)
+    for deposit in rows:
+        assert deposit.block_hash == chain.get_block(deposit.block_number)["blockID"]
+    assert calls["get_transaction_block_number"] == orphaned
+    stats = monitor.confirmation_tracker.stats()
+    assert (stats["reorgs"], stats["orphaned"], stats["reverified"]) == (1, orphaned, 0)
+    assert stats["last_reorg"]["rewound_to"] == 1_015 - settings.DEPOSIT_REORG_DEPTH
+
+    async with session_factory() as db:
+        cursors = (await db.execute(select(DepositScanCursor))).scalars().all()
+        entries = (await db.execute(select(Transaction.tx_hash))).scalars().all()
+    assert {cursor.last_block_hash for cursor in cursors} == {
+        chain.get_block(1_015)["blockID"]
+    }
+    # 잔고에는 확정된 입금만 반영
+    assert sorted(entries) == sorted(
+        deposit.tx_hash for deposit in rows if deposit.status == DepositStatus.COMPLETED
+    )
+
+
+@pytest.mark.asyncio
+async def test_concurrent_confirmation_credits_each_deposit_once(environment):
+    """두 모니터가 같은 대기 입금을 확정해도 한 번만 잔고에 반영되는지 테스트"""
+    chain, session_factory = environment
+    monitor = DepositMonitoringService()
+    await monitor._monitor_deposits()
+
+    async def pending(db):
+        return await monitor.query_service.get_pending_deposits(db)
+
+    # 장애 조치 중 두 모니터가 같은 대기 입금 목록을 읽은 상황
+    async with session_factory() as first, session_factory() as second:
+        first_pending = await pending(first)
+        second_pending = await pending(second)
+        assert first_pending and len(first_pending) == len(second_pending)
+
+        head = chain.head + settings.BLOCK_CONFIRMATION_COUNT
+        confirm = monitor.processing_service.confirm_deposits_batch
+        assert await confirm(first, first_pending, head) == len(first_pending)
+        await first.commit()
+        assert await confirm(second, second_pending, head) == 0
+        await second.commit()
+
+    async with session_factory() as db:
+        entries = (await db.execute(select(Transaction))).scalars().all()
+        assert sorted(entry.tx_hash for entry in entries) == sorted(
+            deposit.tx_hash for deposit in first_pending
+        )
@@ -0,0 +1,252 @@
+"""
+입금 블록 스캐너 테스트.
+블록을 한 번만 조회/디코딩하여 감시 주소 집합과 매칭하는지 확인합니다.
+"""
+
+import time
+from decimal import Decimal
+
+import pytest
+from tronpy.keys import to_hex_address
+
+from app.core.tron.cache import block_cache
+from app.core.tron.constants import TronConstants, TronNetwork
+from app.core.tron.events import TRANSFER_EVENT_TOPIC, decode_transfer_logs
+from app.core.tron.transaction import TronTransactionService
+from app.core.tron.wallet import TronAddressCodec
+
+SENDER = "TJRabPrwbZy45sbavfcjinPJC18kjpRTv8"
+RECIPIENT = "TPL66VK2gCXNCD7EJg9pgJRfqcRazjhUZY"
+OTHER = "TMuA6YqfCeX8EhbfYEg5y7S4DqzSJireY9"
+USDT = TronConstants.get_contracts(TronNetwork.NILE)["USDT"]
+
+
+def _trc20_data(to_address: str, amount: int) -> str:
+    """transfer(address,uint256) 호출 데이터 생성"""
+    to_hex = to_hex_address(to_address)[2:]
+    return (
+        TronConstants.TRC20_TRANSFER_SELECTOR
+        + to_hex.rjust(64, "0")
+        + format(amount, "x").rjust(64, "0")
+    )
+
+
+def _block(number: int) -> dict:
+    """TRX 전송 1건, USDT 전송 1건, 비감시 주소 전송 1건을 가진 블록"""
+    return {
+        "block_header": {"raw_data": {"number": number, "timestamp": 1_700_000_000}},
+        "transactions": [
+            {
+                "txID": f"trx{number}",
+                "raw_data": {
+                    "timestamp": 1_700_000_000,
+                    "contract": [
+                        {
+                            "type": "TransferContract",
+                            "parameter": {
+                                "value": {
+                                    "owner_address": SENDER,
+                                    "to_address": RECIPIENT,
+                                    "amount": 2_500_000,
+                                }
+                            },
+                        }
+                    ],
+                },
+            },
+            {
+                "txID": f"usdt{number}",
+                "raw_data": {
+                    "contract": [
+                        {
+                            "type": "TriggerSmartContract",
+                            "parameter": {
+                                "value": {
+                                    "owner_address": SENDER,
+                                    "contract_address": USDT,
+                                    "data": _trc20_data(RECIPIENT, 10_000_000),
+                                }
+                            },
+                        }
+                    ],
+                },
+            },
+            {
+                "txID": f"other{number}",
+                "ret": [{"contractRet": "SUCCESS"}],
+                "raw_data": {
+                    "contract": [
+                        {
+                            "type": "TransferContract",
+                            "parameter": {
+                                "value": {
+                                    "owner_address": SENDER,
+                                    "to_address": OTHER,
+                                    "amount": 1,
+                                }
+                            },
+                        }
+                    ],
+                },
+            },
+        ],
+    }
+
+
+def _topic(address: str) -> str:
+    """주소를 32바이트 이벤트 토픽으로 인코딩"""
+    return to_hex_address(address)[2:].rjust(64, "0")
+
+
+def _receipts(number: int) -> list:
+    """USDT Transfer 이벤트 1건을 가진 블록 영수증"""
+    return [
+        {
+            "id": f"usdt{number}",
+            "blockNumber": number,
+            "blockTimeStamp": 1_700_000_000,
+            "receipt": {"result": "SUCCESS"},
+            "log": [
+                {
+                    "address": to_hex_address(USDT)[2:],
+                    "topics": [TRANSFER_EVENT_TOPIC, _topic(SENDER), _topic(RECIPIENT)],
+                    "data": format(10_000_000, "x").rjust(64, "0"),
+                }
+            ],
+        }
+    ]
+
+
+def test_decode_block_transfers():
+    """TRX/TRC20 전송 디코딩 테스트"""
+    contracts = TronConstants.get_contracts(TronNetwork.NILE)
+    transfers = TronTransactionService.decode_block_transfers(_block(10), contracts)
+
+    assert [t["txID"] for t in transfers] == ["trx10", "usdt10", "other10"]
+    assert transfers[0]["token"] == "TRX"
+    assert transfers[0]["amount"] == Decimal("2.5")
+    assert transfers[1]["token"] == "USDT"
+    assert transfers[1]["to"] == to_hex_address(RECIPIENT).lower()
+    assert transfers[1]["amount"] == Decimal("10")
+    assert TronTransactionService.with_base58_addresses(transfers[1])["to"] == RECIPIENT
+
+
+def test_decode_skips_failed_transactions():
+    """실행 실패 트랜잭션 제외 테스트"""
+    block = _block(10)
+    block["transactions"][1]["ret"] = [{"contractRet": "REVERT"}]
+    contracts = TronConstants.get_contracts(TronNetwork.NILE)
+
+    transfers = TronTransactionService.decode_block_transfers(block, contracts)
+    assert "usdt10" not in [t["txID"] for t in transfers]
+
+
+@pytest.mark.asyncio
+async def test_scan_range_fetches_each_block_once(monkeypatch):
+    """주소 수와 무관하게 블록당 한 번만 조회하는지 테스트"""
+    service = TronTransactionService()
+    fetched = []
+
+    async def fake_get_block_by_num(block_num):
+        fetched.append(block_num)
+        return _block(block_num)
+
+    async def fake_get_transaction_info_by_block_num(block_num):
+        return _receipts(block_num)
+
+    monkeypatch.setattr(service.http, "get_block_by_num", fake_get_block_by_num)
+    monkeypatch.setattr(
+        service.http,
+        "get_transaction_info_by_block_num",
+        fake_get_transaction_info_by_block_num,
+    )
+    block_cache.clear()
+
+    addresses = {RECIPIENT} | {f"T{i:033d}" for i in range(1000)}
+    scan = await service.scan_range(addresses, 100, 104)
+    matched = scan.transfers
+
+    assert fetched == [100, 101, 102, 103, 104]
+    assert len(matched) == 10
+    assert all(tx["to"] == RECIPIENT for tx in matched)
+
+    # 두 번째 스캔은 블록 캐시에서 처리
+    assert (await service.scan_range(addresses, 100, 104)).last_block == 104
+    assert len(fetched) == 5
+
+
+def test_decode_transfer_logs():
+    """Transfer 이벤트 디코딩 (실패 트랜잭션 제외) 테스트"""
+    contracts = TronConstants.get_contracts(TronNetwork.NILE)
+    receipts = _receipts(7) + [dict(_receipts(7)[0], id="failed", result="FAILED")]
+
+    batch = decode_transfer_logs(7, receipts, contracts)
+
+    assert len(batch) == 1
+    assert batch.txids == ["usdt7"]
+    assert batch.to_addresses == [to_hex_address(RECIPIENT).lower()]
+    assert batch.amounts == [10_000_000]
+    assert batch.log_indexes == [0]
+
+    transfer = next(batch.to_transfers(contracts))
+    assert TronTransactionService.with_base58_addresses(transfer)["to"] == RECIPIENT
+    assert transfer["amount"] == Decimal("10")
+
+
+def test_address_codec_round_trip_and_memo():
+    """주소 변환 결과가 tronpy와 일치하고 메모이제이션되는지 테스트"""
+    codec = TronAddressCodec(cache_size=16)
+    hex_addresses = codec.to_hex_many([SENDER, RECIPIENT, OTHER])
+
+    assert hex_addresses == [
+        to_hex_address(a).lower() for a in (SENDER, RECIPIENT, OTHER)
+    ]
+    assert codec.to_base58_many(hex_addresses) == [SENDER, RECIPIENT, OTHER]
+    assert codec.to_base58(hex_addresses[0].upper()) == SENDER
+
+    codec.to_base58(hex_addresses[0])
+    assert codec.cache_info()["to_base58"]["hits"] >= 1
+
+    assert codec.hex_set([RECIPIENT, "T" + "0" * 33, "invalid"]) == {hex_addresses[1]}
+    with pytest.raises(ValueError):
+        codec.to_hex(RECIPIENT[:-1] + ("A" if RECIPIENT[-1] != "A" else "B"))
+
+
+def test_decode_large_block_stays_in_hex_space():
+    """2,000건 블록 디코딩이 트랜잭션당 마이크로초 단위인지 테스트"""
+    contracts = TronConstants.get_contracts(TronNetwork.NILE)
+    sender = to_hex_address(SENDER).lower()
+    usdt = to_hex_address(USDT).lower()
+    transactions = []
+    for i in range(2000):
+        to_hex = "41" + format(i, "x").rjust(40, "0")
+        transactions.append(
+            {
+                "txID": f"tx{i}",
+                "raw_data": {
+                    "contract": [
+                        {
+                            "type": "TriggerSmartContract",
+                            "parameter": {
+                                "value": {
+                                    "owner_address": sender,
+                                    "contract_address": usdt,
+                                    "data": TronConstants.TRC20_TRANSFER_SELECTOR
+                                    + to_hex[2:].rjust(64, "0")
+                                    + format(i + 1, "x").rjust(64, "0"),
+                                }
+                            },
+                        }
+                    ]
+                },
+            }
+        )
+    block = {"block_header": {"raw_data": {"number": 1}}, "transactions": transactions}
+
+    started = time.perf_counter()
+    transfers = TronTransactionService.decode_block_transfers(block, contracts)
+    elapsed = time.perf_counter() - started
+
+    assert len(transfers) == 2000
+    assert transfers[5]["to"] == "41" + format(5, "x").rjust(40, "0")
+    assert elapsed / 2000 < 100e-6
@@ -0,0 +1,134 @@
+"""
+백그라운드 작업 리더 선출 테스트.
+리스를 하나의 워커만 보유하고, 반납/만료 시 인수하며 fencing_token이 증가하는지,
+리스 만료를 DB 시계로 판단하는지, 갱신이 끊긴 리더가 인수 전에 작업을 멈추는지
+확인합니다.
+"""
+
+import asyncio
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from app.core.database import Base
+from app.core import leader_election
+from app.core.leader_election import LeaderElection, get_leases
+
+
+async def _session_factory(tmp_path):
+    """워커 간 경쟁을 재현하도록 연결을 공유하지 않는 파일 DB"""
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path}/leases.db")
+    async with engine.begin() as conn:
+        await conn.run_sync(
+            Base.metadata.create_all, tables=[Base.metadata.tables["service_leases"]]
+        )
+    return engine, async_sessionmaker(engine, expire_on_commit=False)
+
+
+@pytest.mark.asyncio
+async def test_lease_is_exclusive_and_taken_over_with_new_fencing_token(tmp_path):
+    """리스 단일 보유, 반납/만료 후 인수 시 fencing_token 증가 테스트"""
+    engine, session_factory = await _session_factory(tmp_path)
+    first = LeaderElection("job", "worker-1", 0.5, 0.1, session_factory)
+    second = LeaderElection("job", "worker-2", 0.5, 0.1, session_factory)
+
+    assert await first.try_acquire() is True
+    assert await second.try_acquire() is False
+    assert await first.try_acquire() is True
+    assert first.fencing_token == 1
+
+    await first.release()
+    assert await second.try_acquire() is True
+    assert second.fencing_token == 2
+    assert await first.try_acquire() is False
+
+    # 갱신이 멈춘 리스는 만료 후 인수
+    await asyncio.sleep(0.6)
+    assert await first.try_acquire() is True
+    assert first.fencing_token == 3
+
+    async with session_factory() as db:
+        [lease] = await get_leases(db)
+    assert (lease["holder"], lease["fencing_token"], lease["expired"]) == (
+        "worker-1",
+        3,
+        False,
+    )
+    await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_lease_expiry_uses_database_clock(tmp_path, monkeypatch):
+    """워커 로컬 시계가 어긋나도 유효한 리스를 인수하지 못하는지 테스트"""
+    engine, session_factory = await _session_factory(tmp_path)
+    first = LeaderElection("job", "worker-1", 30, 1, session_factory)
+    second = LeaderElection("job", "worker-2", 30, 1, session_factory)
+
+    # 리스를 잡은 워커의 시계가 한 시간 늦음
+    skewed = datetime.now(timezone.utc) - timedelta(hours=1)
+    monkeypatch.setattr(leader_election, "_utcnow", lambda: skewed)
+    assert await first.try_acquire() is True
+    monkeypatch.undo()
+
+    assert await second.try_acquire() is False
+    async with session_factory() as db:
+        [lease] = await get_leases(db)
+    assert (lease["holder"], lease["expired"]) == ("worker-1", False)
+    await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_leader_steps_down_before_standby_takes_over(tmp_path):
+    """갱신이 끊긴 리더가 작업을 멈춘 뒤에만 대기 워커가 작업을 시작하는지 테스트"""
+    engine, session_factory = await _session_factory(tmp_path)
+    active = set()
+    overlaps = []
+
+    def worker(name):
+        async def run():
+            active.add(name)
+            if len(active) > 1:
+                overlaps.append(set(active))
+            try:
+                await asyncio.Event().wait()
+            finally:
+                active.discard(name)
+
+        return run
+
+    async def wait_for(condition, timeout=5.0):
+        deadline = asyncio.get_running_loop().time() + timeout
+        while not condition():
+            assert asyncio.get_running_loop().time() < deadline
+            await asyncio.sleep(0.02)
+
+    leader = LeaderElection("deposit_monitor", "worker-1", 1.0, 0.2, session_factory)
+    standby = LeaderElection("deposit_monitor", "worker-2", 1.0, 0.2, session_factory)
+    try:
+        leader.start(worker("worker-1"))
+        await wait_for(lambda: "worker-1" in active)
+        standby.start(worker("worker-2"))
+        await asyncio.sleep(0.5)
+        assert leader.is_leader and not standby.is_leader
+        assert active == {"worker-1"}
+
+        # 리더의 DB 연결이 끊겨 갱신 실패
+        async def unreachable():
+            raise ConnectionError("database unreachable")
+
+        leader.try_acquire = unreachable
+        await wait_for(lambda: "worker-2" in active)
+        assert not leader.is_leader and leader.renew_failures > 0
+        assert standby.status()["fencing_token"] == 2
+        assert overlaps == []
+
+        # 정상 종료 시 리스를 반납하므로 TTL을 기다리지 않고 인수
+        del leader.try_acquire
+        await standby.stop()
+        await wait_for(lambda: "worker-1" in active, timeout=1.0)
+        assert leader.fencing_token == 3
+    finally:
+        await leader.stop()
+        await standby.stop()
+        await engine.dispose()
@@ -0,0 +1,152 @@
+"""
+원장 분개 및 일 마감 잔고 스냅샷 테스트.
+분개가 균형을 이루는지, 스냅샷이 증분 생성되어 전체 분개 합과 같은지,
+스냅샷과 이후 분개로 계산한 일별 이력이 스냅샷 유무와 관계없이 같은지 확인합니다.
+"""
+
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+
+import pytest
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from app.core.database import Base
+from app.core.exceptions import ValidationError
+from app.models.ledger import USER_ACCOUNT, BalanceSnapshot, LedgerEntry
+from app.services.balance import journal_service
+from app.services.balance.journal_service import LedgerJournalService
+from app.services.balance.snapshot_service import BalanceSnapshotService
+
+START = datetime(2026, 10, 1, 9, 0, tzinfo=timezone.utc)
+
+# (경과 시간, 분개 종류, 인자)
+ACTIVITY = [
+    (timedelta(hours=0), "deposit", (1, "USDT", Decimal("100"))),
+    (timedelta(hours=2), "deposit", (2, "USDT", Decimal("50"))),
+    (timedelta(days=1), "transfer", (1, 2, "USDT", Decimal("30"))),
+    (timedelta(days=1, hours=3), "deposit", (1, "TRX", Decimal("500"))),
+    (timedelta(days=3), "withdrawal", (2, "USDT", Decimal("40"), Decimal("1"))),
+    (timedelta(days=5), "adjustment", (1, "USDT", Decimal("-5"))),
+    (timedelta(days=6, hours=1), "deposit", (1, "USDT", Decimal("12.5"))),
+]
+
+
+async def _session_factory(tmp_path):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path}/ledger.db")
+    async with engine.begin() as conn:
+        await conn.run_sync(
+            Base.metadata.create_all,
+            tables=[
+                Base.metadata.tables[name]
+                for name in ("users", "ledger_entries", "balance_snapshots")
+            ],
+        )
+    return engine, async_sessionmaker(engine, expire_on_commit=False)
+
+
+async def _post_activity(session_factory, monkeypatch):
+    """시각을 앞당겨 가며 분개 기록"""
+    for offset, kind, args in ACTIVITY:
+        monkeypatch.setattr(journal_service, "_utcnow", lambda t=START + offset: t)
+        async with session_factory() as db:
+            journal = LedgerJournalService(db)
+            if kind == "deposit":
+                await journal.record_balance_change(*args, "deposit")
+            elif kind == "transfer":
+                await journal.record_transfer(*args)
+            elif kind == "withdrawal":
+                await journal.record_withdrawal(*args)
+            else:
+                await journal.record_balance_change(*args, "adjustment")
+            await db.commit()
+
+
+async def _full_sum(db, user_id, asset, at):
+    """검증용 전체 분개 합"""
+    total = await db.scalar(
+        select(func.sum(LedgerEntry.amount)).filter(
+            LedgerEntry.account == USER_ACCOUNT,
+            LedgerEntry.user_id == user_id,
+            LedgerEntry.asset == asset,
+            LedgerEntry.posted_at <= at,
+        )
+    )
+    return Decimal(str(total or 0))
+
+
+@pytest.mark.asyncio
+async def test_snapshots_are_incremental_and_match_full_journal(tmp_path, monkeypatch):
+    """분개 균형, 스냅샷 증분 생성, 스냅샷 잔고가 전체 분개 합과 같은지 테스트"""
+    engine, session_factory = await _session_factory(tmp_path)
+    await _post_activity(session_factory, monkeypatch)
+
+    async with session_factory() as db:
+        # 모든 분개는 항목 합이 0
+        result = await db.execute(
+            select(LedgerEntry.journal_id, func.sum(LedgerEntry.amount)).group_by(
+                LedgerEntry.journal_id
+            )
+        )
+        sums = result.all()
+        assert len(sums) == len(ACTIVITY)
+        assert all(Decimal(str(total)) == 0 for _, total in sums)
+
+        with pytest.raises(ValidationError):
+            await LedgerJournalService(db).post_journals(
+                [("deposit", "USDT", [(USER_ACCOUNT, 1, Decimal("1"))], None)]
+            )
+
+        # 분개가 있는 날만 스냅샷 생성, 다시 실행하면 새로 만들 날이 없음
+        now = START + timedelta(days=4)
+        snapshots = BalanceSnapshotService(db)
+        assert await snapshots.catch_up(now) == 3
+        assert await snapshots.catch_up(now) == 0
+        assert await snapshots.catch_up(START + timedelta(days=8)) == 2
+        dates = await db.scalars(
+            select(BalanceSnapshot.snapshot_date).distinct().order_by("snapshot_date")
+        )
+        assert [d.day for d in dates] == [1, 2, 4, 6, 7]
+
+        for snapshot in await db.scalars(select(BalanceSnapshot)):
+            day_end = journal_service.day_start(
+                snapshot.snapshot_date + timedelta(days=1)
+            )
+            expected = await _full_sum(
+                db,
+                snapshot.user_id,
+                snapshot.asset,
+                day_end - timedelta(microseconds=1),
+            )
+            assert Decimal(str(snapshot.balance)) == expected
+
+    await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_daily_history_from_snapshots(tmp_path, monkeypatch):
+    """일별 잔고 이력이 스냅샷 전후로 같은지 테스트"""
+    engine, session_factory = await _session_factory(tmp_path)
+    await _post_activity(session_factory, monkeypatch)
+    monkeypatch.setattr(
+        journal_service, "_utcnow", lambda: START + timedelta(days=7, hours=2)
+    )
+
+    async with session_factory() as db:
+        journal = LedgerJournalService(db)
+        before_history = await journal.get_daily_balances(1, days=10)
+
+        # 일부 날만 스냅샷이 있는 상태와 전체 스냅샷 상태 모두 동일해야 함
+        await BalanceSnapshotService(db).catch_up(START + timedelta(days=2))
+        assert await journal.get_daily_balances(1, days=10) == before_history
+        await BalanceSnapshotService(db).catch_up(START + timedelta(days=8))
+        assert await journal.get_daily_balances(1, days=10) == before_history
+
+    closing = {day.day: balances for day, balances in before_history}
+    assert closing[30] == {}
+    assert closing[1] == {"USDT": Decimal("100")}
+    assert closing[2] == {"USDT": Decimal("70"), "TRX": Decimal("500")}
+    assert closing[6] == {"USDT": Decimal("65"), "TRX": Decimal("500")}
+    assert closing[7] == {"USDT": Decimal("77.5"), "TRX": Decimal("500")}
+
+    await engine.dispose()
@@ -0,0 +1,120 @@
+"""
+로컬 TRON 트랜잭션 빌더 테스트.
+노드가 만드는 raw_data 직렬화와 같은 결과인지, 참조 블록을 캐시해
+배치 생성 시 노드 호출이 없는지 확인합니다.
+"""
+
+import hashlib
+from decimal import Decimal
+
+import pytest
+from tronpy.keys import PrivateKey
+
+from app.core.tron import TronTransactionBuilder
+from app.core.tron.constants import TronConstants, TronNetwork
+from app.core.tron.transaction import (
+    ReferenceBlock,
+    TronTransactionService,
+    encode_trc20_transfer,
+)
+from app.core.tron.wallet import address_codec
+
+OWNER = "41608f8da72479edc7dd921e4c30bb7e7cddbe722e"
+TO = "41e9d79cc47518930bc322d9bf7cddd260a0260a8d"
+BLOCK_ID = "0000000001c95e4b47c9dc89341b300d" + "0" * 32
+
+
+class FakeNetworkService:
+    """최신 블록 조회 횟수를 세는 네트워크 서비스"""
+
+    network = TronNetwork.NILE
+
+    def __init__(self):
+        self.calls = 0
+
+    async def get_latest_block(self):
+        self.calls += 1
+        return {
+            "blockID": BLOCK_ID,
+            "block_header": {
+                "raw_data": {"number": 29974091, "timestamp": 1591089567000}
+            },
+        }
+
+
+def test_trx_transfer_matches_node_serialization():
+    """TRX 전송 raw_data_hex/txID가 노드 생성 결과와 같은지 테스트"""
+    builder = TronTransactionBuilder(network_service=FakeNetworkService())
+    builder._next_timestamp = lambda: 1591089567635
+    reference = ReferenceBlock(29974091, BLOCK_ID, 1591089567000, 0.0)
+
+    tx = builder.build_trx_transfer(OWNER, TO, 1000, reference)
+
+    # /wallet/createtransaction 응답 (TRON HTTP API 문서 예시)
+    assert tx["raw_data_hex"] == (
+        "0a025e4b220847c9dc89341b300d40f8fed3a2a72e5a66080112620a2d747970652e"
+        "676f6f676c65617069732e636f6d2f70726f746f636f6c2e5472616e73666572436f"
+        "6e747261637412310a1541608f8da72479edc7dd921e4c30bb7e7cddbe722e121541"
+        "e9d79cc47518930bc322d9bf7cddd260a0260a8d18e8077093afd0a2a72e"
+    )
+    assert tx["txID"] == hashlib.sha256(bytes.fromhex(tx["raw_data_hex"])).hexdigest()
+    assert tx["raw_data"]["ref_block_bytes"] == "5e4b"
+    assert tx["raw_data"]["expiration"] == 1591089627000
+
+
+def test_trc20_transfer_calldata_roundtrips_through_decoder():
+    """TRC20 호출 데이터가 블록 디코더에서 같은 수신 주소/금액으로 해석되는지 테스트"""
+    builder = TronTransactionBuilder(network_service=FakeNetworkService())
+    reference = ReferenceBlock(29974091, BLOCK_ID, 1591089567000, 0.0)
+    contracts = TronConstants.get_contracts(TronNetwork.NILE)
+
+    tx = builder.build_transfer(
+        OWNER, TO, "USDT", Decimal("12.345678"), reference, contracts
+    )
+    assert tx["raw_data"]["fee_limit"] > 0
+    assert tx["raw_data"]["contract"][0]["parameter"]["value"]["data"] == (
+        encode_trc20_transfer(TO, 12_345_678)
+    )
+
+    block = {
+        "block_header": {"raw_data": {"number": 1, "timestamp": 0}},
+        "transactions": [{"txID": tx["txID"], "raw_data": tx["raw_data"], "ret": [{}]}],
+    }
+    [transfer] = TronTransactionService.decode_block_transfers(block, contracts)
+    assert (transfer["token"], transfer["to"], transfer["from"]) == ("USDT", TO, OWNER)
+    assert transfer["value"] == 12_345_678
+
+    # 로컬 txID에 대한 서명이 보내는 주소로 복원되는지 확인
+    key = PrivateKey(bytes.fromhex("11" * 32))
+    signed = builder.build_trx_transfer(
+        key.public_key.to_base58check_address(), TO, 1, reference
+    )
+    signature = key.sign_msg_hash(bytes.fromhex(signed["txID"]))
+    recovered = signature.recover_public_key_from_msg_hash(
+        bytes.fromhex(signed["txID"])
+    )
+    assert address_codec.to_hex(recovered.to_base58check_address()) == (
+        signed["raw_data"]["contract"][0]["parameter"]["value"]["owner_address"]
+    )
+
+
+@pytest.mark.asyncio
+async def test_batch_build_uses_cached_reference_block():
+    """배치 생성이 참조 블록 조회 한 번으로 끝나고 txID가 모두 다른지 테스트"""
+    network = FakeNetworkService()
+    builder = TronTransactionBuilder(network_service=network, refresh_interval=60)
+    transfers = [
+        {"from": OWNER, "to": TO, "token": token, "amount": Decimal("1")}
+        for token in ("TRX", "USDT") * 250
+    ]
+
+    first = await builder.build_transfers(transfers)
+    second = await builder.build_transfers(transfers[:10])
+
+    assert network.calls == 1
+    assert len({tx["txID"] for tx in first + second}) == 510
+
+    builder.refresh_interval = 0
+    await builder.build_transfers(transfers[:1])
+    assert network.calls == 2
+    assert builder.stats()["built"] == 511
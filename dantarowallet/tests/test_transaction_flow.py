@@ -0,0 +1,182 @@
+"""
+거래 흐름 카운터 테스트.
+거래 기록/상태 변경과 함께 카운터가 갱신되어 잔고 요약 통계가 거래 내역 집계와
+같은지, 대사 작업이 어긋난 카운터만 찾아 교정하는지 확인합니다.
+"""
+
+from decimal import Decimal
+
+import pytest
+from sqlalchemy import func, select, update
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from app.core.database import Base
+from app.models.transaction import (
+    Transaction,
+    TransactionDirection,
+    TransactionStatus,
+    TransactionType,
+)
+from app.models.transaction_flow import TransactionFlowCounter
+from app.models.user import User
+from app.services.balance.adjustment_service import BalanceAdjustmentService
+from app.services.balance.flow_service import TransactionFlowService
+from app.services.balance.query_service import BalanceQueryService
+from app.services.balance.transaction_service import BalanceTransactionService
+
+TABLES = (
+    "users",
+    "balances",
+    "transactions",
+    "transaction_flow_counters",
+    "ledger_entries",
+)
+
+
+async def _session_factory(tmp_path):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path}/flow.db")
+    async with engine.begin() as conn:
+        await conn.run_sync(
+            Base.metadata.create_all,
+            tables=[Base.metadata.tables[name] for name in TABLES],
+        )
+    session_factory = async_sessionmaker(engine, expire_on_commit=False)
+    async with session_factory() as db:
+        db.add_all(
+            User(id=user_id, email=f"user{user_id}@example.com", password_hash="x")
+            for user_id in (1, 2, 3)
+        )
+        await db.commit()
+    return engine, session_factory
+
+
+async def _raw_statistics(db, user_id):
+    """검증용 거래 내역 직접 집계 (기존 요약 계산 방식)"""
+    completed = [
+        Transaction.user_id == user_id,
+        Transaction.status == TransactionStatus.COMPLETED,
+    ]
+    total_in = await db.scalar(
+        select(func.sum(Transaction.amount)).filter(
+            *completed, Transaction.direction == TransactionDirection.IN
+        )
+    )
+    total_out = await db.scalar(
+        select(func.sum(Transaction.amount + Transaction.fee)).filter(
+            *completed, Transaction.direction == TransactionDirection.OUT
+        )
+    )
+    total_in = Decimal(str(total_in or 0))
+    total_out = Decimal(str(total_out or 0))
+    return {
+        "total_received": total_in,
+        "total_sent": total_out,
+        "net_flow": total_in - total_out,
+    }
+
+
+async def _statistics(db, user_id):
+    summary = await BalanceQueryService(db).get_balance_summary(user_id)
+    return {key: Decimal(value) for key, value in summary["statistics"].items()}
+
+
+@pytest.mark.asyncio
+async def test_summary_statistics_follow_transaction_writes(tmp_path):
+    """거래 기록/상태 변경 시 카운터 기반 요약 통계가 거래 내역 집계와 같은지 테스트"""
+    engine, session_factory = await _session_factory(tmp_path)
+
+    async with session_factory() as db:
+        add = BalanceTransactionService(db).add_balance
+        await add(1, "USDT", Decimal("100"))
+        await add(1, "USDT", Decimal("7.25"), transaction_type="bonus")
+        await add(1, "TRX", Decimal("300"))
+        await add(2, "USDT", Decimal("40"))
+        await BalanceAdjustmentService(db).adjust_balance(
+            1, Decimal("-30"), "correction", "test", admin_id=1
+        )
+        await BalanceAdjustmentService(db).adjust_balance(
+            2, Decimal("-5"), "correction", "test", admin_id=1
+        )
+
+        # 출금: 대기 상태로 기록된 뒤 완료
+        withdrawal = Transaction(
+            user_id=2,
+            type=TransactionType.WITHDRAWAL,
+            direction=TransactionDirection.OUT,
+            status=TransactionStatus.PENDING,
+            asset="USDT",
+            amount=Decimal("20"),
+            fee=Decimal("1.5"),
+            reference_id="WD-1",
+        )
+        db.add(withdrawal)
+        await db.flush()
+        flows = TransactionFlowService(db)
+        await flows.record_status_change(withdrawal, withdrawal.status)
+        previous_status = withdrawal.status
+        withdrawal.status = TransactionStatus.COMPLETED.value
+        await flows.record_status_change(withdrawal, previous_status)
+        await db.commit()
+
+        for user_id in (1, 2, 3):
+            assert await _statistics(db, user_id) == await _raw_statistics(db, user_id)
+        assert await _statistics(db, 2) == {
+            "total_received": Decimal("40"),
+            "total_sent": Decimal("26.5"),
+            "net_flow": Decimal("13.5"),
+        }
+
+        totals = await flows.get_totals(1)
+        assert totals["USDT"]["in"]["tx_count"] == 2
+        assert totals["USDT"]["out"]["amount_total"] == Decimal("30")
+        assert totals["TRX"]["in"]["amount_total"] == Decimal("300")
+
+        # 완료 상태에서 벗어나면 카운터에서 빠짐
+        previous_status = withdrawal.status
+        withdrawal.status = TransactionStatus.FAILED.value
+        await flows.record_status_change(withdrawal, previous_status)
+        await db.commit()
+        assert await _statistics(db, 2) == await _raw_statistics(db, 2)
+
+        assert await flows.reconcile(batch_size=2) == {"users": 3, "mismatches": 0}
+
+    await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_reconciler_repairs_drifted_counters(tmp_path):
+    """카운터를 거치지 않은 기록/손상된 카운터를 대사 작업이 교정하는지 테스트"""
+    engine, session_factory = await _session_factory(tmp_path)
+
+    async with session_factory() as db:
+        add = BalanceTransactionService(db).add_balance
+        await add(1, "USDT", Decimal("10"))
+        await add(2, "USDT", Decimal("20"))
+        await add(3, "USDT", Decimal("30"))
+
+        # 카운터를 거치지 않은 직접 기록과 손상된 카운터
+        db.add(
+            Transaction(
+                user_id=1,
+                type=TransactionType.DEPOSIT,
+                direction=TransactionDirection.IN,
+                status=TransactionStatus.COMPLETED,
+                asset="TRX",
+                amount=Decimal("5"),
+            )
+        )
+        await db.execute(
+            update(TransactionFlowCounter)
+            .where(TransactionFlowCounter.user_id == 3)
+            .values(amount_total=Decimal("999"))
+        )
+        await db.commit()
+        assert await _statistics(db, 3) != await _raw_statistics(db, 3)
+
+        flows = TransactionFlowService(db)
+        assert await flows.reconcile(batch_size=2) == {"users": 3, "mismatches": 2}
+        for user_id in (1, 2, 3):
+            assert await _statistics(db, user_id) == await _raw_statistics(db, user_id)
+        assert await flows.reconcile() == {"users": 3, "mismatches": 0}
+
+    await engine.dispose()
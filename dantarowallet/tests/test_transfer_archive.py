@@ -0,0 +1,203 @@
+"""
+TRON 전송 아카이브 테스트.
+세그먼트 기록/재생과, 시뮬레이터 스캔으로 쌓은 아카이브를 노드 없이
+새 DB에 재생해 같은 입금이 기록되는지 확인합니다.
+"""
+
+import httpx
+import pytest
+from sqlalchemy import select
+
+from app.core.config import settings
+from app.core.tron import (
+    TransferArchive,
+    TronNetwork,
+    TronNetworkClient,
+    TronService,
+    archive,
+    block_cache,
+)
+from app.models.deposit import Deposit
+from app.models.deposit_scan_cursor import DepositScanCursor
+from app.services.deposit_monitoring import monitor_service
+from app.services.deposit_monitoring.monitor_service import DepositMonitoringService
+from scripts.tron_simulator.benchmark import prepare_database
+from scripts.tron_simulator.chain import SimulatedChain, deposit_addresses
+from scripts.tron_simulator.node import create_node_app
+
+ADDRESSES = deposit_addresses(10, seed=11)
+
+
+def _transfer(txid: str, to: str, value: int, token: str = "TRX"):
+    return {
+        "txID": txid * 64,
+        "from": "41" + "a" * 40,
+        "to": to,
+        "value": value,
+        "token": token,
+        "transaction_index": 0,
+    }
+
+
+def test_append_and_replay_segments(tmp_path):
+    """세그먼트 경계, 빈 블록, 재기록, 누락 블록 중단 테스트"""
+    store = TransferArchive(str(tmp_path), segment_blocks=10)
+    to = "41" + "b" * 40
+    store.append_block(8, "ab" * 32, 1_000, [_transfer("1", to, 5)])
+    store.append_block(9, "cd" * 32, 2_000, [])
+    store.append_block(10, None, 3_000, [_transfer("2", to, 7, "USDT")])
+    # 재스캔으로 같은 블록을 다시 기록하면 새 레코드로 교체
+    store.append_block(8, "ab" * 32, 1_000, [_transfer("3", to, 9)])
+    store.append_block(12, None, 4_000, [])
+
+    blocks = list(store.replay(8, 20, {"USDT": "TUSDT"}))
+    assert [block.number for block in blocks] == [8, 9, 10]
+    assert blocks[0].block_id == "ab" * 32
+    assert blocks[0].transfers[0]["txID"] == "3" * 64
+    assert blocks[0].transfers[0]["to"] == to
+    assert blocks[1].transfers == []
+    usdt = blocks[2].transfers[0]
+    assert (usdt["token"], usdt["value"], usdt["contract_address"]) == (
+        "USDT",
+        7,
+        "TUSDT",
+    )
+    assert usdt["timestamp"] == 3_000 and "log_index" not in usdt
+    assert store.last_contiguous_block(8, 20) == 10
+    store.close()
+
+    # 다시 열어도 토큰 목록과 레코드 유지
+    reopened = TransferArchive(str(tmp_path), segment_blocks=10)
+    assert [block.number for block in reopened.replay(12, 12)] == [12]
+    assert reopened.stats()["segments"] == 2
+
+
+def test_old_segment_handles_are_closed(tmp_path):
+    """세그먼트를 넘어가며 기록해도 열린 파일 핸들 수가 제한되는지 테스트"""
+    store = TransferArchive(str(tmp_path), segment_blocks=10)
+    to = "41" + "b" * 40
+    for block_num in range(50):
+        store.append_block(block_num, None, block_num, [_transfer("1", to, block_num)])
+        assert len(store._writers) <= archive.MAX_OPEN_SEGMENTS
+    # 닫힌 세그먼트도 다시 열어 재기록 가능
+    store.append_block(5, None, 5, [_transfer("2", to, 7)])
+    store.flush()
+
+    blocks = list(store.replay(0, 49))
+    assert [block.number for block in blocks] == list(range(50))
+    assert blocks[5].transfers[0]["value"] == 7
+    assert blocks[-1].transfers[0]["value"] == 49
+    store.close()
+
+
+def test_token_codes_stay_consistent_across_writers(tmp_path):
+    """같은 디렉터리를 쓰는 두 아카이브가 토큰 코드를 공유하는지 테스트"""
+    to = "41" + "b" * 40
+    first = TransferArchive(str(tmp_path), segment_blocks=10)
+    second = TransferArchive(str(tmp_path), segment_blocks=10)
+    first.append_block(1, None, 1_000, [_transfer("1", to, 5, "USDT")])
+    # 두 번째 아카이브는 USDT를 모르는 상태에서 새 토큰을 추가
+    second.append_block(11, None, 2_000, [_transfer("2", to, 6, "USDC")])
+    second.append_block(12, None, 3_000, [_transfer("3", to, 7, "USDT")])
+    second.flush()
+
+    # 먼저 열린 아카이브도 나중에 추가된 토큰으로 재생
+    assert [block.transfers[0]["token"] for block in first.replay(11, 12)] == [
+        "USDC",
+        "USDT",
+    ]
+    assert first._token_code("USDT") == second._token_code("USDT") == 0
+    assert [path.name for path in tmp_path.glob("tokens.json*")] == ["tokens.json"]
+    first.close()
+    second.close()
+
+
+def test_shard_monitors_use_separate_archives(tmp_path, monkeypatch):
+    """샤드별 아카이브가 같은 블록 슬롯을 서로 덮어쓰지 않는지 테스트"""
+    monkeypatch.setattr(settings, "TRON_TRANSFER_ARCHIVE_DIR", str(tmp_path))
+    monkeypatch.setattr(archive, "_archives", {})
+    network = TronNetwork.NILE
+    shards = [archive.get_transfer_archive(network, f"{i}/2") for i in range(2)]
+    assert archive.get_transfer_archive(network, "0/2") is shards[0]
+    assert archive.get_transfer_archive(network) not in shards
+
+    # 각 샤드는 같은 블록에서 담당 주소의 전송만 기록
+    targets = ["41" + "b" * 40, "41" + "c" * 40]
+    for index, store in enumerate(shards):
+        store.append_block(5, None, 1_000, [_transfer(str(index), targets[index], 1)])
+        store.flush()
+    for index, store in enumerate(shards):
+        (block,) = store.replay(5, 5)
+        assert [transfer["to"] for transfer in block.transfers] == [targets[index]]
+        store.close()
+    assert sorted(path.name for path in (tmp_path / network.value).iterdir()) == [
+        "shard-0-of-2",
+        "shard-1-of-2",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_replay_archive_rebuilds_deposits_without_node(tmp_path, monkeypatch):
+    """아카이브 재생으로 새 DB에 노드 스캔과 같은 입금이 기록되는지 테스트"""
+    monkeypatch.setattr(settings, "TRON_TRANSFER_ARCHIVE_DIR", str(tmp_path))
+    monkeypatch.setattr(archive, "_archives", {})
+    chain = SimulatedChain(
+        head=1_000,
+        txs_per_block=10,
+        deposit_ratio=0.05,
+        monitored_addresses=ADDRESSES,
+        seed=11,
+    )
+    network_client = TronNetworkClient()
+    monkeypatch.setattr(network_client, "_http", network_client._http)
+    await network_client.configure_nodes(
+        ["http://tron-sim"],
+        transport=httpx.ASGITransport(app=create_node_app(chain)),
+    )
+
+    async def recorded(session_factory):
+        async with session_factory() as db:
+            rows = (await db.execute(select(Deposit))).scalars().all()
+            return {(row.tx_hash, row.amount, row.token_symbol) for row in rows}
+
+    try:
+        engine, session_factory = await prepare_database(ADDRESSES)
+        monkeypatch.setattr(monitor_service, "AsyncSessionLocal", session_factory)
+        live = DepositMonitoringService()
+        await live._monitor_deposits()
+        expected = await recorded(session_factory)
+        await engine.dispose()
+        assert expected
+
+        # 노드 없이 새 DB에 재생
+        await network_client.http.close()
+        block_cache.clear()
+
+        async def node_unavailable(*args, **kwargs):
+            raise AssertionError("replay must not query the node")
+
+        monkeypatch.setattr(TronService, "scan_range", node_unavailable)
+
+        engine, session_factory = await prepare_database(ADDRESSES)
+        replayer = DepositMonitoringService()
+        first_block = 1_000 - settings.BLOCKS_TO_CHECK_ON_START + 1
+        async with session_factory() as db:
+            assert await replayer.replay_archive(db, first_block, 1_100) == 1_000
+            # 재실행해도 중복 기록 없음
+            assert await replayer.replay_archive(db, first_block, 1_000) == 1_000
+        assert await recorded(session_factory) == expected
+        await engine.dispose()
+
+        # 감시 주소가 없어도 커서는 아카이브에 기록된 블록까지만 전진
+        engine, session_factory = await prepare_database([])
+        async with session_factory() as db:
+            empty = DepositMonitoringService()
+            assert await empty.replay_archive(db, first_block, 1_100) == 1_000
+            cursors = await db.scalars(select(DepositScanCursor.last_block))
+            assert set(cursors) == {1_000}
+        await engine.dispose()
+    finally:
+        await network_client.http.close()
+        block_cache.clear()
+        for store in archive._archives.values():
+            store.close()
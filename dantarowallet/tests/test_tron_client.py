@@ -0,0 +1,468 @@
+"""
+TRON 비동기 HTTP 클라이언트 테스트.
+httpx MockTransport로 노드 응답을 흉내 내어 네트워크 없이 검증합니다.
+"""
+
+import asyncio
+import json
+
+import httpx
+import pytest
+
+from app.core.tron.cache import TronBlockCache
+from app.core.tron.constants import TronConstants
+from app.core.tron.http_client import TronHttpClient, TronHttpError
+
+ADDRESS = "TJRabPrwbZy45sbavfcjinPJC18kjpRTv8"
+
+
+def _client(handler) -> TronHttpClient:
+    """MockTransport를 사용하는 클라이언트 생성"""
+    client = TronHttpClient("http://tron.test")
+    client._client = httpx.AsyncClient(
+        base_url=client.base_url, transport=httpx.MockTransport(handler)
+    )
+    return client
+
+
+@pytest.mark.asyncio
+async def test_get_account_and_constant_call():
+    """계정 조회 및 상수 컨트랙트 호출 테스트"""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        body = json.loads(request.content)
+        if request.url.path == "/wallet/getaccount":
+            assert body == {"address": ADDRESS, "visible": True}
+            return httpx.Response(200, json={"balance": 1_000_000})
+        if request.url.path == "/wallet/triggerconstantcontract":
+            return httpx.Response(
+                200,
+                json={"result": {"result": True}, "constant_result": ["0" * 63 + "6"]},
+            )
+        return httpx.Response(404)
+
+    client = _client(handler)
+    assert (await client.get_account(ADDRESS))["balance"] == 1_000_000
+    result = await client.trigger_constant_contract(ADDRESS, ADDRESS, "decimals()")
+    assert int(result[0], 16) == 6
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_error_response_raises():
+    """노드 오류 응답 시 TronHttpError 발생 테스트"""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(
+            200, json={"Error": "class java.lang.NullPointerException"}
+        )
+
+    client = _client(handler)
+    with pytest.raises(TronHttpError):
+        await client.get_now_block()
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_requests_overlap():
+    """동시 요청이 순차 대기하지 않고 겹쳐서 처리되는지 테스트"""
+    in_flight = 0
+    peak = 0
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return httpx.Response(200, json={"balance": 1})
+
+    client = _client(handler)
+    await asyncio.gather(*(client.get_account(ADDRESS) for _ in range(20)))
+    assert peak > 1
+    await client.close()
+
+
+def _raw_block(number: int) -> dict:
+    return {"block_header": {"raw_data": {"number": number}}}
+
+
+def test_block_cache_lru_and_counters():
+    """블록 캐시 LRU 제거 및 적중/미스 카운터 테스트"""
+    cache = TronBlockCache(max_size=2, head_ttl=60, confirmation_blocks=19)
+    cache.observe_head(1000)
+
+    cache.put(1, _raw_block(1))
+    cache.put(2, _raw_block(2))
+    assert cache.get(1) is not None  # 1을 최근 사용으로 갱신
+    cache.put(3, _raw_block(3))  # 2가 제거됨
+
+    assert cache.get(2) is None
+    assert cache.get(3) is not None
+    stats = cache.stats()
+    assert stats["size"] == 2
+    assert stats["hits"] == 2
+    assert stats["misses"] == 1
+    assert stats["evictions"] == 1
+
+
+def test_block_cache_head_ttl():
+    """헤드 근처 블록은 TTL 후 만료, 확정 블록은 유지되는지 테스트"""
+    cache = TronBlockCache(max_size=10, head_ttl=0, confirmation_blocks=19)
+    cache.observe_head(100)
+
+    confirmed = cache.put(50, _raw_block(50))
+    near_head = cache.put(95, _raw_block(95))
+
+    assert confirmed.is_confirmed
+    assert not near_head.is_confirmed
+    assert cache.get(50) is not None
+    assert cache.get(95) is None
+
+
+@pytest.mark.asyncio
+async def test_balances_bulk_limits_concurrency_and_records_failures(monkeypatch):
+    """대량 잔고 조회의 동시성 상한 및 부분 실패 기록 테스트"""
+    from app.core.tron.balance import TronBalanceService
+
+    service = TronBalanceService()
+    in_flight = 0
+    peak = 0
+
+    async def fake_fetch_trx_balance(address: str) -> int:
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.005)
+        in_flight -= 1
+        if address == "bad":
+            raise TronHttpError("timeout")
+        return 2_000_000
+
+    monkeypatch.setattr(service, "_fetch_trx_balance", fake_fetch_trx_balance)
+
+    addresses = [f"addr{i}" for i in range(30)] + ["bad"]
+    result = await service.get_balances_bulk(addresses, ["TRX"], max_in_flight=5)
+
+    assert peak <= 5
+    assert len(result["balances"]) == 30
+    assert str(result["balances"]["addr0"]["TRX"]) == "2"
+    assert "TRX" in result["errors"]["bad"]
+
+
+@pytest.mark.asyncio
+async def test_rate_limiter_spaces_requests():
+    """노드별 속도 제한기 테스트"""
+    from app.core.tron.http_client import AsyncRateLimiter
+
+    limiter = AsyncRateLimiter(rate=100, burst=1)
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+    for _ in range(5):
+        await limiter.acquire()
+    assert loop.time() - started >= 0.035
+
+
+@pytest.mark.asyncio
+async def test_trc20_balance_uses_one_constant_call_after_warm_up(monkeypatch):
+    """컨트랙트 메타데이터 캐시 워밍업 후 잔고 조회 1회 호출 테스트"""
+    from app.core.tron.balance import TronBalanceService
+    from app.core.tron.contracts import ContractMetadataCache, decode_abi_string
+
+    calls = []
+    symbol_hex = (
+        (32).to_bytes(32, "big") + (4).to_bytes(32, "big") + b"USDT".ljust(32, b"\0")
+    ).hex()
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        body = json.loads(request.content)
+        selector = body.get("function_selector", "")
+        calls.append(selector or request.url.path)
+        if request.url.path == "/wallet/getcontract":
+            return httpx.Response(200, json={"name": "TetherToken", "abi": {}})
+        results = {
+            "decimals()": "0" * 63 + "6",
+            "symbol()": symbol_hex,
+            "balanceOf(address)": hex(5_000_000)[2:].rjust(64, "0"),
+        }
+        return httpx.Response(
+            200,
+            json={"result": {"result": True}, "constant_result": [results[selector]]},
+        )
+
+    service = TronBalanceService()
+    http = _client(handler)
+    cache = ContractMetadataCache()
+    monkeypatch.setattr(service._network_client, "_http", http)
+    monkeypatch.setattr("app.core.tron.balance.contract_metadata_cache", cache)
+
+    await service.warm_up_contract_metadata()
+    assert len(cache) == len(TronConstants.get_contracts(service.network))
+    contract_address = TronConstants.get_contracts(service.network)["USDT"]
+    metadata = cache.get(contract_address)
+    assert metadata.symbol == "USDT" and metadata.decimals == 6
+
+    calls.clear()
+    result = await service.get_trc20_balance(ADDRESS, "USDT")
+    assert calls == ["balanceOf(address)"]
+    assert result["formatted"] == 5.0
+    await http.close()
+
+    assert decode_abi_string(b"USDT".ljust(32, b"\0").hex()) == "USDT"
+
+
+@pytest.mark.asyncio
+async def test_passive_health_and_heartbeat_reconnect(monkeypatch):
+    """요청 결과 기반 상태 추적 및 하트비트 재연결 테스트"""
+    from app.core.tron.network import TronNetworkClient
+
+    requests = []
+    fail = True
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request.url.path)
+        if fail:
+            return httpx.Response(503)
+        return httpx.Response(200, json={"block_header": {"raw_data": {"number": 100}}})
+
+    network_client = TronNetworkClient()
+    http = _client(handler)
+    monkeypatch.setattr(network_client, "_http", http)
+    recovered = []
+
+    async def fake_recover():
+        recovered.append(True)
+
+    monkeypatch.setattr(network_client, "recover", fake_recover)
+
+    # 상태 확인은 네트워크 호출을 하지 않음
+    assert network_client.is_connected()
+    assert requests == []
+
+    for _ in range(http.health.failure_threshold):
+        with pytest.raises(TronHttpError):
+            await http.get_now_block()
+    assert not network_client.is_connected()
+
+    assert await network_client.heartbeat_once() is False
+    assert recovered == [True]
+
+    fail = False
+    assert await network_client.heartbeat_once() is True
+    assert network_client.is_connected()
+    assert network_client.get_health()["consecutive_failures"] == 0
+    await http.close()
+
+
+def _pool(handlers, solidity=None, hedge_delay=0.05):
+    """노드별 MockTransport를 사용하는 노드 풀 생성"""
+    from app.core.tron.node_pool import TronNodePool
+
+    solidity = solidity or {}
+    pool = TronNodePool(list(handlers), list(solidity), hedge_delay=hedge_delay)
+    handlers = {**handlers, **solidity}
+    for url, node in pool._nodes.items():
+        node._client = httpx.AsyncClient(
+            base_url=url, transport=httpx.MockTransport(handlers[url])
+        )
+    return pool
+
+
+def _block_handler(number: int, delay: float = 0.0, status: int = 200):
+    """지연/오류를 흉내 내는 비동기 노드 핸들러"""
+    calls = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request.url.path)
+        await asyncio.sleep(delay)
+        if status != 200:
+            return httpx.Response(status)
+        return httpx.Response(
+            200, json={"block_header": {"raw_data": {"number": number}}}
+        )
+
+    handler.calls = calls
+    return handler
+
+
+@pytest.mark.asyncio
+async def test_node_pool_prefers_fastest_node_and_hedges():
+    """노드 풀의 지연 시간 기반 라우팅 및 헤지 요청 테스트"""
+    slow = _block_handler(1, delay=0.3)
+    fast = _block_handler(2)
+    pool = _pool({"http://slow.test": slow, "http://fast.test": fast})
+
+    # 측정 전에는 slow가 먼저 선택되지만 헤지 요청으로 fast 응답 사용
+    block = await pool.get_now_block()
+    assert block["block_header"]["raw_data"]["number"] == 2
+    assert pool.hedged_requests == 1
+
+    # 지연 시간 측정 이후에는 fast 노드로 바로 라우팅
+    fast.calls.clear()
+    slow.calls.clear()
+    await pool.get_now_block()
+    assert fast.calls and not slow.calls
+    await pool.close()
+
+
+@pytest.mark.asyncio
+async def test_node_pool_fails_over_and_routes_solidity():
+    """노드 장애 조치 및 솔리디티 경로 라우팅 테스트"""
+    broken = _block_handler(1, status=503)
+    healthy = _block_handler(2)
+    solidity = _block_handler(3)
+    pool = _pool(
+        {"http://broken.test": broken, "http://ok.test": healthy},
+        solidity={"http://solidity.test": solidity},
+        hedge_delay=0,
+    )
+
+    block = await pool.get_now_block()
+    assert block["block_header"]["raw_data"]["number"] == 2
+    assert pool.failovers == 1
+    assert pool.full_nodes[0].health.error_rate > 0
+
+    await pool.get_transaction_info_by_id("ab" * 32, solidified=True)
+    assert solidity.calls == ["/walletsolidity/gettransactioninfobyid"]
+
+    stats = pool.stats()
+    assert stats["node"] == "http://ok.test"
+    assert len(stats["full_nodes"]) == 2
+    await pool.close()
+
+
+@pytest.mark.asyncio
+async def test_single_flight_coalesces_concurrent_requests():
+    """동시 동일 요청 병합 및 단기 캐시 테스트"""
+    from app.core.tron.singleflight import SingleFlight
+
+    flight = SingleFlight(ttl=3.0)
+    upstream = 0
+
+    async def fetch():
+        nonlocal upstream
+        upstream += 1
+        await asyncio.sleep(0.01)
+        return {"number": upstream}
+
+    results = await asyncio.gather(*(flight.do("latest", fetch) for _ in range(20)))
+    assert upstream == 1
+    assert all(result == {"number": 1} for result in results)
+    assert flight.stats()["coalesced"] == 19
+
+    # TTL 내 재요청은 캐시에서 응답
+    assert await flight.do("latest", fetch) == {"number": 1}
+    assert flight.stats()["cache_hits"] == 1
+
+    # TTL 0이면 병합만 하고 캐시하지 않음
+    assert await flight.do("uncached", fetch, ttl=lambda _: 0) == {"number": 2}
+    assert await flight.do("uncached", fetch, ttl=lambda _: 0) == {"number": 3}
+
+
+@pytest.mark.asyncio
+async def test_single_flight_shares_failure_without_caching():
+    """공유 요청 실패 전파 및 실패 결과 미캐시 테스트"""
+    from app.core.tron.singleflight import SingleFlight
+
+    flight = SingleFlight(ttl=3.0)
+    attempts = 0
+
+    async def failing():
+        nonlocal attempts
+        attempts += 1
+        await asyncio.sleep(0.01)
+        raise TronHttpError("throttled")
+
+    results = await asyncio.gather(
+        *(flight.do("params", failing) for _ in range(5)), return_exceptions=True
+    )
+    assert attempts == 1
+    assert all(isinstance(result, TronHttpError) for result in results)
+
+    with pytest.raises(TronHttpError):
+        await flight.do("params", failing)
+    assert attempts == 2
+
+
+@pytest.mark.asyncio
+async def test_range_fetcher_delivers_in_order_within_window():
+    """블록 범위 병렬 조회 순서 보장 및 동시 조회 수 제한 테스트"""
+    from app.core.tron.range_fetcher import AdaptiveWindow, BlockRangeFetcher
+
+    fetcher = BlockRangeFetcher(AdaptiveWindow(max_size=8, initial=8))
+    in_flight = 0
+    peak = 0
+
+    async def fetch(number: int):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        # 뒤 블록이 먼저 끝나도록 역순 지연
+        await asyncio.sleep(0.001 * (number % 5))
+        in_flight -= 1
+        if number == 7:
+            raise TronHttpError("node down")
+        return {"number": number}
+
+    delivered = [
+        (number, result)
+        async for number, result in fetcher.iter_range(
+            1, 40, fetch, return_exceptions=True
+        )
+    ]
+    assert [number for number, _ in delivered] == list(range(1, 41))
+    assert isinstance(delivered[6][1], TronHttpError)
+    assert delivered[0][1] == {"number": 1}
+    assert 1 < peak <= 8
+
+    # 예외 미반환 모드는 실패한 블록 차례에 예외 발생
+    seen = []
+    with pytest.raises(TronHttpError):
+        async for number, _ in fetcher.iter_range(1, 40, fetch):
+            seen.append(number)
+    assert seen == list(range(1, 7))
+
+
+@pytest.mark.asyncio
+async def test_range_fetcher_adapts_window_to_throttling_and_latency():
+    """429 응답 시 창 축소 및 재시도, 빠른 응답 시 창 확대 테스트"""
+    from app.core.tron.http_client import TronRateLimitedError
+    from app.core.tron.range_fetcher import AdaptiveWindow, BlockRangeFetcher
+
+    window = AdaptiveWindow(max_size=16, initial=16, target_latency=0.05)
+    fetcher = BlockRangeFetcher(window, retry_delay=0.001)
+    throttled = set()
+
+    async def fetch(number: int):
+        if number % 4 == 0 and number not in throttled:
+            throttled.add(number)
+            raise TronRateLimitedError("429", retry_after=0.001)
+        return number
+
+    results = [result async for _, result in fetcher.iter_range(1, 20, fetch)]
+    assert results == list(range(1, 21))
+    assert fetcher.stats()["throttled"] == 5
+    assert window.size < 16
+
+    # 목표 지연 이내 응답이 이어지면 창이 다시 커짐
+    shrunk = window.size
+    for _ in range(5):
+        window.on_success(0.01)
+    assert window.size == min(16, shrunk + 5)
+    window.on_success(1.0)
+    assert window.size == min(16, shrunk + 5) - 1
+
+
+@pytest.mark.asyncio
+async def test_http_client_raises_rate_limited_error_on_429():
+    """HTTP 429 응답을 재시도 대기 시간과 함께 구분하는지 테스트"""
+    from app.core.tron.http_client import TronRateLimitedError
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(429, headers={"Retry-After": "2"})
+
+    client = _client(handler)
+    with pytest.raises(TronRateLimitedError) as exc_info:
+        await client.get_block_by_num(1)
+    assert exc_info.value.retry_after == 2.0
+    await client.close()
@@ -0,0 +1,115 @@
+"""
+로컬 TRON 노드 시뮬레이터 테스트.
+시뮬레이터를 인프로세스로 연결하여 스캐너와 잔고 조회가 동작하는지 확인합니다.
+"""
+
+import time
+
+import httpx
+import pytest
+
+from app.core.tron import TronNetworkClient, TronService, block_cache
+from scripts.tron_simulator.benchmark import run_benchmark
+from scripts.tron_simulator.chain import SimulatedChain, deposit_addresses
+from scripts.tron_simulator.node import create_node_app
+
+
+@pytest.fixture
+def simulated_node(monkeypatch):
+    """시뮬레이터에 연결된 TronNetworkClient (테스트 후 원래 노드 풀 복원)"""
+
+    async def connect(chain: SimulatedChain, **options):
+        app = create_node_app(chain, **options)
+        network_client = TronNetworkClient()
+        monkeypatch.setattr(network_client, "_http", network_client._http)
+        await network_client.configure_nodes(
+            ["http://tron-sim"], transport=httpx.ASGITransport(app=app)
+        )
+        return app
+
+    yield connect
+    block_cache.clear()
+
+
+@pytest.mark.asyncio
+async def test_scan_range_against_simulator(simulated_node):
+    """시뮬레이터 블록 스캔 결과가 생성된 입금 수와 일치하는지 테스트"""
+    addresses = deposit_addresses(20)
+    chain = SimulatedChain(
+        head=500, txs_per_block=100, deposit_ratio=0.05, monitored_addresses=addresses
+    )
+    app = await simulated_node(chain)
+    tron = TronService()
+
+    assert await tron.get_latest_block_number() == 500
+
+    scan = await tron.scan_range(set(addresses), 491, 500)
+    matched = scan.transfers
+    assert scan.last_block == 500
+    assert len(matched) == chain.expected_deposits(491, 500) > 0
+    assert {tx["to"] for tx in matched} <= set(addresses)
+    assert {tx["token"] for tx in matched} <= {"TRX", "USDT"}
+    # 헤드 블록(500)은 최신 블록 조회 시 캐시되어 다시 요청하지 않음
+    assert app.state.request_counts["/wallet/getblockbynum"] == 9
+
+
+@pytest.mark.asyncio
+async def test_simulator_balances_and_recording(simulated_node, tmp_path):
+    """시뮬레이터 잔고 응답 및 녹화 재생 테스트"""
+    chain = SimulatedChain(head=100, txs_per_block=5)
+    await simulated_node(chain)
+    tron = TronService()
+    address = deposit_addresses(1)[0]
+
+    balance = await tron.get_trc20_balance(address, "USDT")
+    assert balance["balance"] == chain.balance_of(address, "USDT")
+
+    from scripts.tron_simulator.chain import record_blocks
+
+    path = tmp_path / "blocks.jsonl"
+    assert await record_blocks(TronNetworkClient().http, 98, 100, str(path)) == 3
+
+    replay = SimulatedChain(head=0, txs_per_block=0)
+    assert replay.load_recording(str(path)) == 3
+    assert replay.head == 100
+    assert replay.get_block(99) == chain.get_block(99)
+
+
+@pytest.mark.asyncio
+async def test_catch_up_hour_of_blocks_fetches_concurrently(simulated_node):
+    """1시간 분량(1,200블록) 따라잡기가 병렬 조회로 빠르게 끝나는지 테스트"""
+    addresses = deposit_addresses(10)
+    chain = SimulatedChain(
+        head=2_000, txs_per_block=5, deposit_ratio=0.1, monitored_addresses=addresses
+    )
+    latency = 0.05
+    await simulated_node(chain, latency=latency)
+    tron = TronService()
+
+    started = time.perf_counter()
+    scan = await tron.scan_range(set(addresses), 801, 2_000)
+    elapsed = time.perf_counter() - started
+
+    assert scan.last_block == 2_000
+    assert len(scan.transfers) == chain.expected_deposits(801, 2_000)
+    assert [tx["block_number"] for tx in scan.transfers] == sorted(
+        tx["block_number"] for tx in scan.transfers
+    )
+    # 순차 조회라면 블록당 최소 1회 지연으로 60초 이상 소요
+    assert elapsed < 1_200 * latency / 4
+
+
+@pytest.mark.asyncio
+async def test_benchmark_reports_throughput(monkeypatch):
+    """벤치마크가 처리량과 입금 기록 수를 보고하는지 테스트"""
+    network_client = TronNetworkClient()
+    monkeypatch.setattr(network_client, "_http", network_client._http)
+
+    result = await run_benchmark(
+        blocks=5, txs_per_block=50, monitored=10, deposit_ratio=0.1
+    )
+
+    assert result["scan"]["matched"] == result["expected_deposits"]
+    assert result["monitor"]["recorded"] == result["expected_deposits"]
+    assert result["scan"]["blocks_per_sec"] > 0
+    block_cache.clear()